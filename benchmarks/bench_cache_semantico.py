@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks/bench_cache_semantico.py
+
+Mede o tempo de inserção e de consulta do CacheSemantico em um cache preenchido com prompts sintéticos, e
+verifica quantas paráfrases (o prompt com pontuação e maiúsculas acrescentadas) são encontradas.
+
+Uso:
+    python benchmarks/bench_cache_semantico.py [--entradas 100000] [--consultas 500]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório raiz do projeto ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cache_semantico import CacheSemantico
+
+def gerar_prompts(quantidade: int, semente: int = 1):
+    """Gera prompts sintéticos de 4 a 9 palavras sorteadas de um vocabulário aleatório."""
+    gerador = np.random.default_rng(semente)
+    letras = list("abcdefghijklmnopqrstuvwxyz")
+    vocabulario = ["".join(gerador.choice(letras, size=gerador.integers(3, 9))) for _ in range(5000)]
+    return [" ".join(gerador.choice(vocabulario, size=gerador.integers(4, 10))) for _ in range(quantidade)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entradas", type=int, default=100000)
+    parser.add_argument("--consultas", type=int, default=500)
+    argumentos = parser.parse_args()
+
+    prompts = gerar_prompts(argumentos.entradas)
+    cache = CacheSemantico(tamanho_maximo=argumentos.entradas)
+    inicio = time.perf_counter()
+    for i, prompt in enumerate(prompts):
+        cache.armazenar(prompt, str(i))
+    insercao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    encontradas = sum(cache.obter(prompts[i].capitalize() + "?") == str(i) for i in range(argumentos.consultas))
+    consulta = (time.perf_counter() - inicio) / argumentos.consultas * 1000
+    print(f"{'inserção (s)':>14} {'consulta (ms)':>14} {'encontradas':>12}")
+    print(f"{insercao:>14.1f} {consulta:>14.3f} {encontradas:>12}")
+
+if __name__ == "__main__":
+    main()
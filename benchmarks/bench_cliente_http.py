@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks/bench_cliente_http.py
+
+Compara duas formas de trocar a chave da API durante uma sequência de chamadas a um servidor local que imita o
+endpoint de chat completions (HTTP/1.1 com keep-alive): recriar o cliente da OpenAI a cada troca, como era feito
+antes, e trocar apenas as credenciais sobre o cliente HTTP compartilhado de core.cliente_http. Para cada forma,
+mostra o número de conexões TCP abertas no servidor e a latência média. Sem TLS, a diferença de latência
+subestima o ganho real, em que cada nova conexão também paga o handshake TLS.
+
+Uso:
+    python benchmarks/bench_cliente_http.py [--chamadas 500] [--troca-a-cada 10]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+
+# Adiciona o diretório raiz do projeto ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cliente_http import fechar_cliente_http, obter_cliente_http
+
+RESPOSTA = json.dumps({
+    "id": "chatcmpl-bench", "object": "chat.completion", "created": 0, "model": "gpt-3.5-turbo",
+    "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}).encode("utf-8")
+
+class ServidorStub(ThreadingHTTPServer):
+    """Servidor local que conta as conexões recebidas."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ManipuladorStub)
+        self.conexoes = 0
+        self.lock = threading.Lock()
+
+class ManipuladorStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # cabeçalhos e corpo saem em escritas separadas
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.conexoes += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPOSTA)))
+        self.end_headers()
+        self.wfile.write(RESPOSTA)
+
+def chamar(cliente: openai.OpenAI):
+    cliente.chat.completions.create(model="gpt-3.5-turbo", messages=[{"role": "user", "content": "oi"}],
+                                    max_tokens=5)
+
+def recriando_cliente(url: str, chamadas: int, troca_a_cada: int):
+    """Cria um cliente da OpenAI, com seu próprio pool de conexões, a cada troca de chave."""
+    cliente = None
+    for i in range(chamadas):
+        if i % troca_a_cada == 0:
+            if cliente is not None:
+                cliente.close()
+            cliente = openai.OpenAI(api_key=f"chave_{i}", base_url=url, max_retries=0)
+        chamar(cliente)
+    cliente.close()
+
+def trocando_credenciais(url: str, chamadas: int, troca_a_cada: int):
+    """Troca apenas a chave, mantendo o cliente HTTP compartilhado."""
+    cliente = openai.OpenAI(api_key="chave_0", base_url=url, max_retries=0, http_client=obter_cliente_http())
+    for i in range(chamadas):
+        if i and i % troca_a_cada == 0:
+            cliente = cliente.with_options(api_key=f"chave_{i}")
+        chamar(cliente)
+    fechar_cliente_http()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chamadas", type=int, default=500)
+    parser.add_argument("--troca-a-cada", type=int, default=10)
+    argumentos = parser.parse_args()
+
+    print(f"{'cliente':>14} {'conexões':>9} {'latência (ms)':>14}")
+    for nome, funcao in (("recriado", recriando_cliente), ("compartilhado", trocando_credenciais)):
+        servidor = ServidorStub()
+        threading.Thread(target=servidor.serve_forever, args=(0.05,), daemon=True).start()
+        url = f"http://127.0.0.1:{servidor.server_address[1]}/v1"
+        inicio = time.perf_counter()
+        funcao(url, argumentos.chamadas, argumentos.troca_a_cada)
+        latencia = (time.perf_counter() - inicio) / argumentos.chamadas * 1000
+        servidor.shutdown()
+        servidor.server_close()
+        print(f"{nome:>14} {servidor.conexoes:>9} {latencia:>14.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks/bench_logging.py
+
+Compara o custo por chamada de log, na thread que loga, entre a configuração síncrona anterior (arquivo rotativo
+e console escritos na própria chamada) e a configuração atual de utils.logger, em que a chamada apenas enfileira
+o registro e a escrita acontece na thread do QueueListener.
+
+Uso:
+    python benchmarks/bench_logging.py [--chamadas 20000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+
+# Adiciona o diretório raiz do projeto ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils import logger as modulo_logger
+
+def logger_sincrono(nome: str, pasta: str, console) -> logging.Logger:
+    """Reproduz a configuração síncrona usada antes da fila: os manipuladores rodam na chamada de log."""
+    logger = logging.getLogger(nome)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = RotatingFileHandler(os.path.join(pasta, f"{nome}.log"), maxBytes=1024 * 1024, backupCount=5)
+    console_handler = logging.StreamHandler(console)
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    return logger
+
+def medir(logger: logging.Logger, chamadas: int) -> float:
+    """Retorna o tempo médio por chamada, em microssegundos, visto pela thread que loga."""
+    texto = "Lorem ipsum dolor sit amet " * 20
+    inicio = time.perf_counter()
+    for i in range(chamadas):
+        logger.info("Processando texto %d: %.50s...", i, texto)
+        logger.debug("Conteúdo completo: %s", texto)
+    return (time.perf_counter() - inicio) / chamadas * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chamadas", type=int, default=20000)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta, open(os.devnull, "w") as console:
+        sincrono = medir(logger_sincrono("bench_sincrono", pasta, console), argumentos.chamadas)
+
+        diretorio_original = os.getcwd()
+        os.chdir(pasta)
+        stderr_original = sys.stderr
+        sys.stderr = console
+        try:
+            assincrono_logger = modulo_logger.configurar_logger("bench_assincrono", logging.INFO)
+            assincrono_logger.propagate = False
+            assincrono = medir(assincrono_logger, argumentos.chamadas)
+            inicio = time.perf_counter()
+            modulo_logger.encerrar_logging()
+            drenagem = time.perf_counter() - inicio
+        finally:
+            sys.stderr = stderr_original
+            os.chdir(diretorio_original)
+
+    print(f"{'configuração':>14} {'µs/chamada':>12}")
+    print(f"{'síncrona':>14} {sincrono:>12.1f}")
+    print(f"{'fila':>14} {assincrono:>12.1f}")
+    print(f"Drenagem da fila no encerramento: {drenagem:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks/bench_memoria.py
+
+Mede o tempo de N inserções no GerenciadorMemoria com cada backend: 'json', que regrava o arquivo inteiro a cada
+inserção ou, com escrita atrasada, a cada lote de alterações; 'log', que acrescenta um registro por inserção, com
+diferentes tamanhos de lote de fsync; 'sqlite'; 'sql' (SQLAlchemy sobre um arquivo SQLite); e 'indexado', que
+acrescenta as inserções a um log e reescreve a tabela periodicamente. Também mede o tempo de reabrir a memória
+gravada e de 1000 leituras de chaves aleatórias. O limite de itens do gerenciador é elevado para N, para que o
+descarte não interfira.
+
+Uso:
+    python benchmarks/bench_memoria.py [--insercoes 10000] [--backends json log sqlite sql indexado]
+                                       [--fsync-lotes 0 32 1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório raiz do projeto ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config.config import Config
+from core.memoria import GerenciadorMemoria
+
+LEITURAS = 1000
+
+def medir(pasta: str, backend: str, insercoes: int):
+    """
+    Insere os valores, reabre a memória e lê chaves aleatórias, retornando os tempos de inserção, de abertura e
+    de leitura e o tamanho do arquivo.
+    """
+    caminho = os.path.join(pasta, f"memoria_{backend}_{time.perf_counter_ns()}")
+    memoria = GerenciadorMemoria("sqlite:///" + caminho if backend == "sql" else caminho, backend=backend)
+    memoria.tamanho_maximo = insercoes
+    inicio = time.perf_counter()
+    for i in range(insercoes):
+        memoria.adicionar_informacao(f"chave_{i}", {"texto": f"Informação número {i}", "peso": i / 7})
+    memoria.fechar()
+    insercao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    memoria = GerenciadorMemoria("sqlite:///" + caminho if backend == "sql" else caminho, backend=backend)
+    abertura = time.perf_counter() - inicio
+
+    chaves = [f"chave_{random.randrange(insercoes)}" for _ in range(LEITURAS)]
+    inicio = time.perf_counter()
+    for chave in chaves:
+        memoria.obter_informacao(chave)
+    leitura = time.perf_counter() - inicio
+    memoria.fechar()
+    return insercao, abertura, leitura, os.path.getsize(caminho)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--insercoes", type=int, default=10000)
+    parser.add_argument("--backends", nargs="+", choices=("json", "log", "sqlite", "sql", "indexado"),
+                        default=["json", "log", "sqlite", "sql", "indexado"])
+    parser.add_argument("--fsync-lotes", type=int, nargs="+", default=[0, 32, 1],
+                        help="Registros por fsync no backend 'log'; 0 deixa a gravação a cargo do sistema")
+    argumentos = parser.parse_args()
+
+    print(f"{'backend':>14} {'inserção (s)':>13} {'µs/inserção':>12} {'abertura (ms)':>14} {'µs/leitura':>11} "
+          f"{'arquivo (KB)':>13}")
+    with tempfile.TemporaryDirectory() as pasta:
+        casos = []
+        for backend in argumentos.backends:
+            if backend == "json":
+                casos.append(("json", "json", {"MEMORIA_ESCRITA_ATRASADA": False}))
+                casos.append(("json atrasado", "json", {"MEMORIA_ESCRITA_ATRASADA": True}))
+            elif backend == "log":
+                casos.extend((f"log fsync={n}", "log", {"MEMORIA_LOG_FSYNC_LOTE": n})
+                             for n in argumentos.fsync_lotes)
+            else:
+                casos.append((backend, backend, {}))
+        for nome, backend, ajustes in casos:
+            for atributo, valor in ajustes.items():
+                setattr(Config, atributo, valor)
+            insercao, abertura, leitura, tamanho = medir(pasta, backend, argumentos.insercoes)
+            print(f"{nome:>14} {insercao:>13.2f} {insercao / argumentos.insercoes * 1e6:>12.1f} "
+                  f"{abertura * 1000:>14.1f} {leitura / LEITURAS * 1e6:>11.1f} {tamanho / 1024:>13.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks/bench_memoria_indexada.py
+
+Compara a abertura de uma memória com N chaves no backend 'json', que decodifica o arquivo inteiro, e no backend
+'indexado', que mapeia a tabela com mmap e decodifica apenas os valores lidos. Para cada um, mede o tempo e o
+pico de memória alocada pelo Python ao abrir o armazenamento, o tempo de 1000 leituras de chaves aleatórias e o
+tempo e o pico de memória de abrir o GerenciadorMemoria sem orçamento de bytes (que lê apenas as expirações; no
+backend 'indexado', da seção de expirações da tabela). Também mede o tempo de conversão do memoria.json.
+
+Uso:
+    python benchmarks/bench_memoria_indexada.py [--chaves 1000000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Adiciona o diretório raiz do projeto ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.armazenamento.arquivo_json import ArmazenamentoJson
+from core.armazenamento.indexado import ArmazenamentoIndexado, converter_json
+from core.memoria import GerenciadorMemoria
+
+LEITURAS = 1000
+
+def medir_abertura(abrir):
+    """
+    Retorna o armazenamento aberto, o tempo de abertura e o pico de memória alocada. O pico é medido em uma
+    abertura separada, já que o tracemalloc torna as alocações mais lentas.
+    """
+    tracemalloc.start()
+    abrir().fechar()
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    inicio = time.perf_counter()
+    armazenamento = abrir()
+    return armazenamento, time.perf_counter() - inicio, pico
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chaves", type=int, default=1000000)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo_json = os.path.join(pasta, "memoria.json")
+        arquivo_tabela = os.path.join(pasta, "memoria.gysidx")
+        with open(arquivo_json, "w") as f:
+            json.dump({f"chave_{i}": {"texto": f"Informação número {i}", "peso": i / 7}
+                       for i in range(argumentos.chaves)}, f)
+        inicio = time.perf_counter()
+        converter_json(arquivo_json, arquivo_tabela)
+        print(f"Conversão: {time.perf_counter() - inicio:.2f} s; memoria.json: "
+              f"{os.path.getsize(arquivo_json) / 2**20:.0f} MB; tabela: {os.path.getsize(arquivo_tabela) / 2**20:.0f} MB")
+
+        print(f"{'backend':>9} {'abertura (ms)':>14} {'pico (MB)':>10} {'µs/leitura':>11} {'gerenciador (ms)':>17} "
+              f"{'pico (MB)':>10}")
+        casos = (("json", lambda: ArmazenamentoJson(arquivo_json), arquivo_json),
+                 ("indexado", lambda: ArmazenamentoIndexado(arquivo_tabela), arquivo_tabela))
+        for nome, abrir, caminho in casos:
+            armazenamento, abertura, pico = medir_abertura(abrir)
+            chaves = [f"chave_{random.randrange(argumentos.chaves)}" for _ in range(LEITURAS)]
+            inicio = time.perf_counter()
+            for chave in chaves:
+                armazenamento.obter(chave)
+            leitura = time.perf_counter() - inicio
+            armazenamento.fechar()
+
+            memoria, gerenciador, pico_gerenciador = medir_abertura(
+                lambda: GerenciadorMemoria(caminho, backend=nome, tamanho_maximo=argumentos.chaves, orcamento_bytes=0))
+            memoria.fechar()
+            print(f"{nome:>9} {abertura * 1000:>14.1f} {pico / 2**20:>10.1f} {leitura / LEITURAS * 1e6:>11.1f} "
+                  f"{gerenciador * 1000:>17.1f} {pico_gerenciador / 2**20:>10.1f}")
+
+if __name__ == "__main__":
+    main()
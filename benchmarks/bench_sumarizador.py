@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks/bench_sumarizador.py
+
+Mede o tempo do SumarizadorGrafo em textos sintéticos de tamanho crescente, para verificar que o custo por
+sentença permanece aproximadamente constante (escala linear) quando o processamento em blocos está ativo.
+
+Uso:
+    python benchmarks/bench_sumarizador.py [--tamanhos 1000 10000 100000] [--tamanho-bloco 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório raiz do projeto ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.language_model.sumarizador import SumarizadorGrafo
+
+def gerar_sentencas(quantidade: int, vocabulario: int = 5000, semente: int = 42):
+    """Gera sentenças sintéticas com lemas sorteados segundo uma distribuição de Zipf."""
+    gerador = np.random.default_rng(semente)
+    tamanhos = gerador.integers(5, 20, size=quantidade)
+    lemas = np.minimum(gerador.zipf(1.3, size=int(tamanhos.sum())), vocabulario)
+    sentencas, inicio = [], 0
+    for tamanho in tamanhos:
+        sentencas.append([f"lema{i}" for i in lemas[inicio:inicio + tamanho]])
+        inicio += tamanho
+    return sentencas
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--tamanho-bloco", type=int, default=2000)
+    argumentos = parser.parse_args()
+
+    sumarizador = SumarizadorGrafo(tamanho_bloco=argumentos.tamanho_bloco)
+    print(f"{'sentenças':>10} {'tempo (s)':>10} {'µs/sentença':>12}")
+    for quantidade in argumentos.tamanhos:
+        sentencas = gerar_sentencas(quantidade)
+        inicio = time.perf_counter()
+        sumarizador.selecionar(sentencas, 10)
+        decorrido = time.perf_counter() - inicio
+        print(f"{quantidade:>10} {decorrido:>10.3f} {decorrido / quantidade * 1e6:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,80 @@ class Config:
     # Configurações da API (para uso futuro)
     API_KEY = os.getenv('API_KEY', 'sua_chave_api_aqui')
 
+    # Configurações do cliente do ChatGPT
+    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')  # None usa o endereço padrão da OpenAI
+    CHATGPT_CONCORRENCIA = int(os.getenv('CHATGPT_CONCORRENCIA', 8))  # requisições simultâneas em lotes
+    CHATGPT_LIMITE_RPM = int(os.getenv('CHATGPT_LIMITE_RPM', 500))  # requisições por minuto; 0 desativa
+    CHATGPT_LIMITE_TPM = int(os.getenv('CHATGPT_LIMITE_TPM', 60000))  # tokens estimados por minuto; 0 desativa
+    CHATGPT_MAX_TENTATIVAS = int(os.getenv('CHATGPT_MAX_TENTATIVAS', 4))
+    CHATGPT_ESPERA_BASE = float(os.getenv('CHATGPT_ESPERA_BASE', 0.5))  # em segundos
+    CHATGPT_ESPERA_MAXIMA = float(os.getenv('CHATGPT_ESPERA_MAXIMA', 30))  # em segundos
+    CHATGPT_DISJUNTOR_LIMIAR_FALHAS = int(os.getenv('CHATGPT_DISJUNTOR_LIMIAR_FALHAS', 5))  # 0 desativa
+    CHATGPT_DISJUNTOR_TEMPO_RECUPERACAO = float(os.getenv('CHATGPT_DISJUNTOR_TEMPO_RECUPERACAO', 30))  # em segundos
+    CHATGPT_HTTP_MAX_CONEXOES = int(os.getenv('CHATGPT_HTTP_MAX_CONEXOES', 100))
+    CHATGPT_HTTP_MAX_CONEXOES_OCIOSAS = int(os.getenv('CHATGPT_HTTP_MAX_CONEXOES_OCIOSAS', 20))  # mantidas abertas
+    CHATGPT_HTTP_KEEPALIVE = float(os.getenv('CHATGPT_HTTP_KEEPALIVE', 60))  # em segundos
+    CHATGPT_HTTP2 = os.getenv('CHATGPT_HTTP2', 'True') == 'True'  # usado apenas se o pacote h2 estiver instalado
+    CHATGPT_TIMEOUT = float(os.getenv('CHATGPT_TIMEOUT', 600))  # em segundos
+    CHATGPT_TIMEOUT_CONEXAO = float(os.getenv('CHATGPT_TIMEOUT_CONEXAO', 5))  # em segundos
+
+    # Configurações do cache de respostas do ChatGPT
+    CACHE_RESPOSTAS_ATIVO = os.getenv('CACHE_RESPOSTAS_ATIVO', 'True') == 'True'
+    CACHE_RESPOSTAS_ARQUIVO = os.getenv('CACHE_RESPOSTAS_ARQUIVO', 'cache_respostas.sqlite3')
+    CACHE_RESPOSTAS_TAMANHO_MEMORIA = int(os.getenv('CACHE_RESPOSTAS_TAMANHO_MEMORIA', 256))
+    CACHE_RESPOSTAS_TAMANHO_MAXIMO = int(os.getenv('CACHE_RESPOSTAS_TAMANHO_MAXIMO', 10000))
+    CACHE_RESPOSTAS_TTL = float(os.getenv('CACHE_RESPOSTAS_TTL', 86400))  # em segundos; 0 desativa a expiração
+    CACHE_SEMANTICO_ATIVO = os.getenv('CACHE_SEMANTICO_ATIVO', 'False') == 'True'  # opcional: reutiliza respostas
+    CACHE_SEMANTICO_TAMANHO_MAXIMO = int(os.getenv('CACHE_SEMANTICO_TAMANHO_MAXIMO', 10000))
+
+    # Configurações da memória persistente (GerenciadorMemoria)
+    MEMORIA_BACKEND = os.getenv('MEMORIA_BACKEND', 'json')  # 'json', 'log', 'sqlite', 'sql' ou 'indexado'
+    MEMORIA_ARQUIVO = os.getenv('MEMORIA_ARQUIVO', 'memoria.json')
+    MEMORIA_ESCRITA_ATRASADA = os.getenv('MEMORIA_ESCRITA_ATRASADA', 'True') == 'True'  # backend 'json'
+    MEMORIA_INTERVALO_ESCRITA = float(os.getenv('MEMORIA_INTERVALO_ESCRITA', 1.0))  # em segundos
+    MEMORIA_MAX_PENDENTES = int(os.getenv('MEMORIA_MAX_PENDENTES', 100))  # alterações que antecipam a gravação
+    MEMORIA_ARQUIVO_LOG = os.getenv('MEMORIA_ARQUIVO_LOG', 'memoria.log')
+    MEMORIA_LOG_FSYNC_LOTE = int(os.getenv('MEMORIA_LOG_FSYNC_LOTE', 32))  # registros por fsync; 0 deixa ao sistema
+    MEMORIA_LOG_FRACAO_COMPACTACAO = float(os.getenv('MEMORIA_LOG_FRACAO_COMPACTACAO', 0.5))  # bytes obsoletos
+    MEMORIA_LOG_MINIMO_COMPACTACAO = int(os.getenv('MEMORIA_LOG_MINIMO_COMPACTACAO', 1048576))  # em bytes
+    MEMORIA_ARQUIVO_SQLITE = os.getenv('MEMORIA_ARQUIVO_SQLITE', 'memoria.sqlite3')
+    MEMORIA_SQL_TAMANHO_POOL = int(os.getenv('MEMORIA_SQL_TAMANHO_POOL', 5))  # backend 'sql', em get_database_url()
+    MEMORIA_SQL_MAX_OVERFLOW = int(os.getenv('MEMORIA_SQL_MAX_OVERFLOW', 10))  # conexões extras sob demanda
+    MEMORIA_ARQUIVO_INDEXADO = os.getenv('MEMORIA_ARQUIVO_INDEXADO', 'memoria.gysidx')  # fsync: MEMORIA_LOG_FSYNC_LOTE
+    MEMORIA_INDEXADO_FRACAO_COMPACTACAO = float(os.getenv('MEMORIA_INDEXADO_FRACAO_COMPACTACAO', 0.5))  # log/tabela
+    MEMORIA_INDEXADO_MINIMO_COMPACTACAO = int(os.getenv('MEMORIA_INDEXADO_MINIMO_COMPACTACAO', 1048576))  # em bytes
+    MEMORIA_POLITICA_DESCARTE = os.getenv('MEMORIA_POLITICA_DESCARTE', 'lru')  # 'fifo', 'lru' ou 'lfu'
+    MEMORIA_TAMANHO_MAXIMO = int(os.getenv('MEMORIA_TAMANHO_MAXIMO', 1000))  # 'json' e 'log'; 0 não limita
+    MEMORIA_TAMANHO_MAXIMO_DISCO = int(os.getenv('MEMORIA_TAMANHO_MAXIMO_DISCO', 0))  # nos demais backends
+    MEMORIA_CHAVES_RECENTES = int(os.getenv('MEMORIA_CHAVES_RECENTES', 256))  # acompanhadas por chaves_recentes
+    MEMORIA_DESCARTES_POR_GRAVACAO = int(os.getenv('MEMORIA_DESCARTES_POR_GRAVACAO', 16))  # excedente aos poucos
+    MEMORIA_ORCAMENTO_BYTES = int(os.getenv('MEMORIA_ORCAMENTO_BYTES', 0))  # valores em JSON; 0 não limita
+    MEMORIA_TTL_PADRAO = float(os.getenv('MEMORIA_TTL_PADRAO', 0))  # em segundos; 0 desativa a expiração
+    MEMORIA_CHAVES_FIXAS = [c.strip() for c in os.getenv('MEMORIA_CHAVES_FIXAS', 'contador_aprendizado').split(',')
+                            if c.strip()]  # separadas por vírgula; nunca descartadas
+
+    # Configurações da sessão de conversa com o ChatGPT (em tokens estimados)
+    SESSAO_ORCAMENTO_TOKENS = int(os.getenv('SESSAO_ORCAMENTO_TOKENS', 3000))  # entrada + resposta por requisição
+    SESSAO_TOKENS_RESUMO = int(os.getenv('SESSAO_TOKENS_RESUMO', 400))
+    SESSAO_TOKENS_FATOS = int(os.getenv('SESSAO_TOKENS_FATOS', 300))  # informações da memória; 0 desativa
+    SESSAO_LIMIAR_FATOS = float(os.getenv('SESSAO_LIMIAR_FATOS', 0.2))  # similaridade de cosseno mínima
+    SESSAO_MAX_FATOS = int(os.getenv('SESSAO_MAX_FATOS', 200))  # informações recentes comparadas ao prompt
+
+    # Configurações de processamento de linguagem natural
+    NLP_CACHE_TAMANHO = int(os.getenv('NLP_CACHE_TAMANHO', 256))
+    NLP_BATCH_SIZE = int(os.getenv('NLP_BATCH_SIZE', 64))
+    NLP_N_PROCESS = int(os.getenv('NLP_N_PROCESS', 1))
+    NLP_TAMANHO_BLOCO_STREAM = int(os.getenv('NLP_TAMANHO_BLOCO_STREAM', 100000))  # em caracteres
+    ORQUESTRADOR_THREADS = int(os.getenv('ORQUESTRADOR_THREADS', 2))  # análises locais executadas junto ao ChatGPT
+    LEXICO_SENTIMENTO_ARQUIVO = os.getenv('LEXICO_SENTIMENTO_ARQUIVO')  # None usa o léxico distribuído com o pacote
+    CLASSIFICADOR_SENTIMENTO_ARQUIVO = os.getenv('CLASSIFICADOR_SENTIMENTO_ARQUIVO', 'classificador_sentimento.npz')
+    CLASSIFICADOR_MINIMO_EXEMPLOS = int(os.getenv('CLASSIFICADOR_MINIMO_EXEMPLOS', 20))
+    CLASSIFICADOR_LIMIAR_CONFIANCA = float(os.getenv('CLASSIFICADOR_LIMIAR_CONFIANCA', 0.6))
+    CLASSIFICADOR_INTERVALO_SALVAMENTO = int(os.getenv('CLASSIFICADOR_INTERVALO_SALVAMENTO', 50))  # aprendizados
+    RESUMO_TAMANHO_BLOCO = int(os.getenv('RESUMO_TAMANHO_BLOCO', 2000))
+    FREQUENCIA_DOCUMENTOS_ARQUIVO = os.getenv('FREQUENCIA_DOCUMENTOS_ARQUIVO', 'frequencia_documentos.npz')
+    FREQUENCIA_DOCUMENTOS_INTERVALO_SALVAMENTO = int(os.getenv('FREQUENCIA_DOCUMENTOS_INTERVALO_SALVAMENTO', 50))
+
     @staticmethod
     def get_database_url():
         return f"postgresql://{Config.DB_USER}:{Config.DB_PASSWORD}@{Config.DB_HOST}:{Config.DB_PORT}/{Config.DB_NAME}"
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: arquivo_json
+
+Este módulo implementa o ArmazenamentoJson, o backend original do GerenciadorMemoria: todos os valores ficam em
+um dicionário em memória e são persistidos em um único arquivo JSON. Cada gravação do arquivo é atômica: o
+conteúdo é escrito em um arquivo temporário, que recebe fsync e substitui o original com os.replace, de modo que
+uma queda durante a escrita nunca deixa o arquivo corrompido.
+
+No modo de escrita atrasada, as alterações apenas marcam a memória como modificada, e uma thread grava o arquivo
+quando se passa o intervalo configurado ou quando se acumula o número máximo de alterações pendentes, agrupando
+várias alterações em uma única escrita. sincronizar() grava as pendências imediatamente, e elas também são
+gravadas ao fechar o armazenamento e ao encerrar o interpretador.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ArmazenamentoJson
+
+Exceções:
+    - MemoriaError
+
+Dependências:
+    - atexit
+    - json
+    - core.armazenamento.base
+    - utils.logger
+    - utils.exceptions
+"""
+
+import atexit
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from core.armazenamento.base import ArmazenamentoMemoria
+from utils.logger import configurar_logger
+from utils.exceptions import MemoriaError
+
+def _gravar_atomicamente(arquivo: str, dados: Dict[str, Any]):
+    """Grava o JSON em um arquivo temporário e o move sobre o arquivo de destino."""
+    temporario = arquivo + ".tmp"
+    try:
+        with open(temporario, 'w') as f:
+            json.dump(dados, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, arquivo)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    # Torna a substituição durável em caso de queda do sistema; o Windows não permite o fsync de diretórios
+    if hasattr(os, "O_DIRECTORY"):
+        descritor = os.open(os.path.dirname(os.path.abspath(arquivo)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descritor)
+        finally:
+            os.close(descritor)
+
+class ArmazenamentoJson(ArmazenamentoMemoria):
+    """
+    Armazenamento em um arquivo JSON, regravado de forma atômica a cada alteração ou, no modo de escrita
+    atrasada, em segundo plano.
+    """
+
+    valores_em_memoria = True
+
+    def __init__(self, arquivo: str, escrita_atrasada: bool = False, intervalo: float = 1.0,
+                 max_pendentes: int = 100):
+        """
+        Carrega o arquivo, se existir.
+
+        :param arquivo: Caminho do arquivo JSON
+        :param escrita_atrasada: Se True, as alterações são gravadas em segundo plano
+        :param intervalo: No modo de escrita atrasada, tempo máximo, em segundos, entre uma alteração e sua gravação
+        :param max_pendentes: No modo de escrita atrasada, número de alterações que antecipa a gravação
+        :raises ValueError: Se intervalo ou max_pendentes não forem positivos
+        :raises MemoriaError: Se o arquivo existir mas não contiver um objeto JSON
+        """
+        if intervalo <= 0:
+            raise ValueError("intervalo deve ser positivo")
+        if not isinstance(max_pendentes, int) or max_pendentes <= 0:
+            raise ValueError("max_pendentes deve ser um inteiro positivo")
+        self.arquivo = arquivo
+        self.escrita_atrasada = escrita_atrasada
+        self.intervalo = intervalo
+        self.max_pendentes = max_pendentes
+        self.logger = configurar_logger("armazenamento_json")
+        self._lock = threading.RLock()
+        # Serializa as gravações do arquivo, que acontecem fora de _lock
+        self._lock_gravacao = threading.Lock()
+        self._dados = self._carregar()
+        self._versao = 0
+        self._versao_gravada = 0
+        self._fechado = False
+        self._thread: Optional[threading.Thread] = None
+        if escrita_atrasada:
+            self._condicao = threading.Condition(self._lock)
+            self._thread = threading.Thread(target=self._gravar_em_segundo_plano, name="escrita_memoria",
+                                            daemon=True)
+            self._thread.start()
+            atexit.register(self._ao_encerrar)
+
+    def _carregar(self) -> Dict[str, Any]:
+        try:
+            with open(self.arquivo, 'r') as f:
+                dados = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            raise MemoriaError(f"Erro ao carregar a memória de '{self.arquivo}': {str(e)}")
+        if not isinstance(dados, dict):
+            raise MemoriaError(f"'{self.arquivo}' não contém um objeto JSON")
+        return dados
+
+    def _gravar_arquivo(self):
+        """Grava o estado atual, se houver alterações ainda não gravadas."""
+        with self._lock_gravacao:
+            with self._lock:
+                if self._versao == self._versao_gravada:
+                    return
+                versao = self._versao
+                # Cópia rasa: a serialização acontece fora do lock, sem bloquear leituras e alterações
+                dados = dict(self._dados)
+            try:
+                _gravar_atomicamente(self.arquivo, dados)
+            except (OSError, TypeError, ValueError) as e:
+                raise MemoriaError(f"Erro ao salvar a memória em '{self.arquivo}': {str(e)}")
+            with self._lock:
+                self._versao_gravada = versao
+
+    def _gravar_em_segundo_plano(self):
+        """Laço da thread de escrita atrasada."""
+        while True:
+            with self._condicao:
+                while not self._fechado and self._versao == self._versao_gravada:
+                    self._condicao.wait()
+                if self._fechado:
+                    return
+                # Aguarda o intervalo, a menos que as alterações pendentes atinjam o limite antes
+                self._condicao.wait_for(lambda: self._fechado or
+                                        self._versao - self._versao_gravada >= self.max_pendentes,
+                                        timeout=self.intervalo)
+                if self._fechado:
+                    return
+            try:
+                self._gravar_arquivo()
+            except MemoriaError as e:
+                self.logger.error("%s; nova tentativa em %.1f s", e, self.intervalo)
+                with self._condicao:
+                    self._condicao.wait(self.intervalo)
+
+    def _alterado(self) -> bool:
+        """
+        Registra uma alteração. Deve ser chamado com o lock adquirido.
+
+        :return: True se o arquivo deve ser gravado imediatamente, após a liberação do lock
+        """
+        self._versao += 1
+        if self.escrita_atrasada and not self._fechado:
+            self._condicao.notify()
+            return False
+        return True
+
+    def obter(self, chave: str, padrao: Any = None) -> Any:
+        with self._lock:
+            return self._dados.get(chave, padrao)
+
+    def gravar(self, chave: str, valor: Any):
+        # Valida antes de alterar, já que no modo de escrita atrasada o erro só apareceria na thread de escrita
+        try:
+            json.dumps(valor)
+        except (TypeError, ValueError) as e:
+            raise MemoriaError(f"Valor não serializável para a chave '{chave}': {str(e)}")
+        with self._lock:
+            self._dados[chave] = valor
+            gravar_agora = self._alterado()
+        if gravar_agora:
+            self._gravar_arquivo()
+
+    def remover(self, chave: str) -> bool:
+        with self._lock:
+            if chave not in self._dados:
+                return False
+            del self._dados[chave]
+            gravar_agora = self._alterado()
+        if gravar_agora:
+            self._gravar_arquivo()
+        return True
+
+    def limpar(self):
+        with self._lock:
+            self._dados.clear()
+            gravar_agora = self._alterado()
+        if gravar_agora:
+            self._gravar_arquivo()
+
+    def chaves(self) -> List[str]:
+        with self._lock:
+            return list(self._dados)
+
+    def chaves_recentes(self, quantidade: int) -> List[str]:
+        with self._lock:
+            recentes = [chave for chave, _ in zip(reversed(self._dados), range(quantidade))]
+        return recentes[::-1]
+
+    def itens(self) -> Iterator[Tuple[str, Any]]:
+        with self._lock:
+            return iter(list(self._dados.items()))
+
+    def chave_mais_antiga(self) -> Optional[str]:
+        with self._lock:
+            return next(iter(self._dados), None)
+
+    def __len__(self) -> int:
+        return len(self._dados)
+
+    def __contains__(self, chave: object) -> bool:
+        return chave in self._dados
+
+    @property
+    def pendente(self) -> bool:
+        """Indica se há alterações ainda não gravadas no arquivo."""
+        with self._lock:
+            return self._versao != self._versao_gravada
+
+    def sincronizar(self):
+        """
+        Grava imediatamente as alterações pendentes.
+
+        :raises MemoriaError: Se a gravação falhar
+        """
+        self._gravar_arquivo()
+
+    def _ao_encerrar(self):
+        """Grava as pendências ao encerrar o interpretador, registrando (sem propagar) uma eventual falha."""
+        try:
+            self.fechar()
+        except MemoriaError as e:
+            self.logger.error("Alterações da memória perdidas ao encerrar: %s", e)
+
+    def fechar(self):
+        """Encerra a thread de escrita atrasada e grava as alterações pendentes."""
+        with self._lock:
+            if self._fechado:
+                return
+            self._fechado = True
+            if self._thread is not None:
+                self._condicao.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            atexit.unregister(self._ao_encerrar)
+        self._gravar_arquivo()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: base
+
+Este módulo define a interface ArmazenamentoMemoria, implementada pelos backends de persistência usados pelo
+GerenciadorMemoria: arquivo JSON, log somente de acréscimo, SQLite, banco SQL via SQLAlchemy e tabela indexada
+mapeada em memória. As chaves são textos, os valores são serializáveis em JSON e a ordem das chaves é a de
+primeira gravação.
+
+Informações com tempo de vida são gravadas pelo GerenciadorMemoria como {CAMPO_EXPIRACAO: instante, "valor":
+valor}. Os armazenamentos não interpretam esse formato, mas informam quais chaves o usam por expiracoes(), para
+que o gerenciador conheça as expirações ao abrir a memória sem decodificar os demais valores.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ArmazenamentoMemoria
+
+Funções:
+    - desembrulhar
+
+Dependências:
+    - abc
+    - json
+"""
+
+import json
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Iterator, List, Optional, Tuple
+
+CAMPO_EXPIRACAO = "__expira_em__"
+# Início da codificação de um valor com expiração, como a produzida por json.dumps
+PREFIXO_EXPIRACAO = '{"' + CAMPO_EXPIRACAO + '"'
+
+def desembrulhar(registro: Any) -> Tuple[Any, Optional[float]]:
+    """
+    Separa o valor gravado do seu instante de expiração.
+
+    :param registro: Valor como gravado no armazenamento
+    :return: Par (valor, instante de expiração ou None se ele não expirar)
+    """
+    if type(registro) is dict and len(registro) == 2 and CAMPO_EXPIRACAO in registro and "valor" in registro:
+        return registro["valor"], registro[CAMPO_EXPIRACAO]
+    return registro, None
+
+class ArmazenamentoMemoria(ABC):
+    """
+    Interface de um armazenamento chave-valor persistente.
+
+    As implementações devem ser seguras para uso concorrente.
+    """
+
+    # Indica se os valores são mantidos em memória; define o limite padrão de informações do GerenciadorMemoria
+    valores_em_memoria = False
+
+    @abstractmethod
+    def obter(self, chave: str, padrao: Any = None) -> Any:
+        """
+        Retorna o valor de uma chave.
+
+        :param chave: Chave procurada
+        :param padrao: Valor retornado se a chave não existir
+        :return: Valor armazenado, ou padrao
+        """
+
+    @abstractmethod
+    def gravar(self, chave: str, valor: Any):
+        """
+        Grava o valor de uma chave. Uma chave existente mantém sua posição na ordem das chaves.
+
+        :param chave: Chave do valor
+        :param valor: Valor serializável em JSON
+        :raises MemoriaError: Se o valor não for serializável ou a gravação falhar
+        """
+
+    @abstractmethod
+    def remover(self, chave: str) -> bool:
+        """
+        Remove uma chave.
+
+        :param chave: Chave a remover
+        :return: True se a chave existia
+        """
+
+    @abstractmethod
+    def limpar(self):
+        """Remove todas as chaves."""
+
+    @abstractmethod
+    def chaves(self) -> List[str]:
+        """Retorna as chaves armazenadas, na ordem em que foram gravadas pela primeira vez."""
+
+    def chaves_recentes(self, quantidade: int) -> List[str]:
+        """
+        Retorna as últimas chaves na ordem das chaves, ou seja, as gravadas pela primeira vez há menos tempo. Por
+        padrão, percorre todas as chaves; os backends sobrescrevem para ler apenas as pedidas.
+
+        :param quantidade: Número máximo de chaves
+        :return: Chaves, da mais antiga para a mais recente
+        """
+        return list(deque(self.chaves(), maxlen=quantidade))
+
+    @abstractmethod
+    def itens(self) -> Iterator[Tuple[str, Any]]:
+        """Retorna os pares (chave, valor) armazenados, na ordem das chaves."""
+
+    def itens_codificados(self) -> Iterator[Tuple[str, str]]:
+        """
+        Retorna os pares (chave, valor codificado) armazenados, na ordem das chaves. A codificação é a de
+        json.dumps(valor, ensure_ascii=False); os backends que já guardam os valores assim os retornam sem
+        decodificá-los.
+        """
+        for chave, valor in self.itens():
+            yield chave, json.dumps(valor, ensure_ascii=False)
+
+    def tamanhos_codificados(self) -> Iterator[Tuple[str, int]]:
+        """Retorna os pares (chave, tamanho em bytes do valor codificado em UTF-8), na ordem das chaves."""
+        for chave, texto in self.itens_codificados():
+            yield chave, len(texto.encode("utf-8"))
+
+    def expiracoes(self) -> Iterator[Tuple[str, float]]:
+        """
+        Retorna os pares (chave, instante de expiração) dos valores gravados com expiração. Se os valores não
+        estiverem em memória, apenas os codificados que começam por PREFIXO_EXPIRACAO são decodificados.
+        """
+        if self.valores_em_memoria:
+            registros = self.itens()
+        else:
+            registros = ((chave, json.loads(texto)) for chave, texto in self.itens_codificados()
+                         if texto.startswith(PREFIXO_EXPIRACAO))
+        for chave, registro in registros:
+            expira_em = desembrulhar(registro)[1]
+            if expira_em is not None:
+                yield chave, expira_em
+
+    @abstractmethod
+    def chave_mais_antiga(self) -> Optional[str]:
+        """Retorna a primeira chave na ordem das chaves, ou None se o armazenamento estiver vazio."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Retorna o número de chaves."""
+
+    def __contains__(self, chave: object) -> bool:
+        ausente = object()
+        return isinstance(chave, str) and self.obter(chave, ausente) is not ausente
+
+    def sincronizar(self):
+        """Garante que todas as alterações estejam gravadas em disco. Por padrão, não faz nada."""
+
+    def fechar(self):
+        """Libera os recursos do armazenamento. Por padrão, não faz nada."""
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: descarte
+
+Este módulo implementa as políticas de descarte usadas pelo GerenciadorMemoria para escolher qual informação
+remover quando um limite de tamanho é atingido, e o índice de expiração das informações com tempo de vida. Todas
+as políticas mantêm apenas as chaves em memória, e todas as operações são O(1):
+
+    - DescarteFIFO: descarta a informação gravada há mais tempo (comportamento original);
+    - DescarteLRU: descarta a informação usada há mais tempo, considerando leituras e gravações;
+    - DescarteLFU: descarta a informação menos usada; entre as igualmente usadas, a usada há mais tempo. As chaves
+      ficam em grupos por frequência, encadeados em ordem crescente, como em "An O(1) algorithm for implementing
+      the LFU cache eviction scheme" (Shah, Mitra e Matani, 2010).
+
+O IndiceExpiracao combina um heap de (instante de expiração, chave) com um dicionário da expiração atual de cada
+chave; entradas do heap que não correspondem mais ao dicionário são ignoradas ao serem retiradas.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - PoliticaDescarte
+    - DescarteFIFO
+    - DescarteLRU
+    - DescarteLFU
+    - IndiceExpiracao
+
+Funções:
+    - criar_politica
+
+Dependências:
+    - abc
+    - heapq
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+class PoliticaDescarte(ABC):
+    """
+    Interface das políticas de descarte. A política acompanha apenas as chaves que podem ser descartadas.
+    """
+
+    # Indica se as leituras influenciam a escolha da vítima
+    considera_acessos = True
+
+    @abstractmethod
+    def registrar_gravacao(self, chave: str):
+        """Registra a gravação de uma chave, nova ou existente."""
+
+    @abstractmethod
+    def registrar_acesso(self, chave: str):
+        """Registra a leitura de uma chave já acompanhada."""
+
+    @abstractmethod
+    def remover(self, chave: str):
+        """Deixa de acompanhar uma chave, se ela for acompanhada."""
+
+    @abstractmethod
+    def _candidatas(self) -> Iterator[str]:
+        """Gera as chaves na ordem em que devem ser descartadas."""
+
+    @abstractmethod
+    def limpar(self):
+        """Deixa de acompanhar todas as chaves."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Retorna o número de chaves acompanhadas."""
+
+    @abstractmethod
+    def __contains__(self, chave: str) -> bool:
+        """Indica se a chave é acompanhada."""
+
+    def vitima(self, excluir: Optional[str] = None) -> Optional[str]:
+        """
+        Escolhe a próxima chave a descartar, sem removê-la.
+
+        :param excluir: Chave que não pode ser escolhida, como a que está sendo gravada
+        :return: Chave escolhida, ou None se não houver candidatas
+        """
+        for chave in self._candidatas():
+            if chave != excluir:
+                return chave
+        return None
+
+class DescarteFIFO(PoliticaDescarte):
+    """Descarta a chave gravada pela primeira vez há mais tempo."""
+
+    considera_acessos = False
+
+    def __init__(self):
+        self._chaves: "OrderedDict[str, None]" = OrderedDict()
+
+    def registrar_gravacao(self, chave: str):
+        self._chaves[chave] = None
+
+    def registrar_acesso(self, chave: str):
+        pass
+
+    def remover(self, chave: str):
+        self._chaves.pop(chave, None)
+
+    def _candidatas(self) -> Iterator[str]:
+        return iter(self._chaves)
+
+    def limpar(self):
+        self._chaves.clear()
+
+    def __len__(self) -> int:
+        return len(self._chaves)
+
+    def __contains__(self, chave: str) -> bool:
+        return chave in self._chaves
+
+class DescarteLRU(DescarteFIFO):
+    """Descarta a chave lida ou gravada há mais tempo."""
+
+    considera_acessos = True
+
+    def registrar_gravacao(self, chave: str):
+        self._chaves[chave] = None
+        self._chaves.move_to_end(chave)
+
+    def registrar_acesso(self, chave: str):
+        if chave in self._chaves:
+            self._chaves.move_to_end(chave)
+
+class _GrupoFrequencia:
+    """Chaves com a mesma frequência de uso, da usada há mais tempo para a mais recente."""
+
+    __slots__ = ("frequencia", "chaves", "anterior", "proximo")
+
+    def __init__(self, frequencia: int):
+        self.frequencia = frequencia
+        self.chaves: "OrderedDict[str, None]" = OrderedDict()
+        self.anterior: Optional["_GrupoFrequencia"] = None
+        self.proximo: Optional["_GrupoFrequencia"] = None
+
+class DescarteLFU(PoliticaDescarte):
+    """Descarta a chave menos usada (leituras e gravações); empates são desfeitos pela menos recente."""
+
+    def __init__(self):
+        # Sentinela da lista circular de grupos, em ordem crescente de frequência
+        self._cabeca = _GrupoFrequencia(0)
+        self._cabeca.anterior = self._cabeca.proximo = self._cabeca
+        self._grupos: Dict[str, _GrupoFrequencia] = {}
+
+    def _inserir_apos(self, grupo: _GrupoFrequencia, frequencia: int) -> _GrupoFrequencia:
+        novo = _GrupoFrequencia(frequencia)
+        novo.anterior, novo.proximo = grupo, grupo.proximo
+        grupo.proximo.anterior = novo
+        grupo.proximo = novo
+        return novo
+
+    def _retirar(self, chave: str, grupo: _GrupoFrequencia):
+        """Retira a chave do grupo, removendo o grupo da lista se ele ficar vazio."""
+        del grupo.chaves[chave]
+        if not grupo.chaves:
+            grupo.anterior.proximo = grupo.proximo
+            grupo.proximo.anterior = grupo.anterior
+
+    def _incrementar(self, chave: str):
+        grupo = self._grupos[chave]
+        seguinte = grupo.proximo
+        if seguinte is self._cabeca or seguinte.frequencia != grupo.frequencia + 1:
+            seguinte = self._inserir_apos(grupo, grupo.frequencia + 1)
+        seguinte.chaves[chave] = None
+        self._grupos[chave] = seguinte
+        self._retirar(chave, grupo)
+
+    def registrar_gravacao(self, chave: str):
+        if chave in self._grupos:
+            self._incrementar(chave)
+            return
+        primeiro = self._cabeca.proximo
+        if primeiro is self._cabeca or primeiro.frequencia != 1:
+            primeiro = self._inserir_apos(self._cabeca, 1)
+        primeiro.chaves[chave] = None
+        self._grupos[chave] = primeiro
+
+    def registrar_acesso(self, chave: str):
+        if chave in self._grupos:
+            self._incrementar(chave)
+
+    def remover(self, chave: str):
+        grupo = self._grupos.pop(chave, None)
+        if grupo is not None:
+            self._retirar(chave, grupo)
+
+    def _candidatas(self) -> Iterator[str]:
+        grupo = self._cabeca.proximo
+        while grupo is not self._cabeca:
+            yield from grupo.chaves
+            grupo = grupo.proximo
+
+    def frequencia(self, chave: str) -> int:
+        """Retorna o número de usos registrados de uma chave (0 se ela não for acompanhada)."""
+        grupo = self._grupos.get(chave)
+        return grupo.frequencia if grupo is not None else 0
+
+    def limpar(self):
+        self._cabeca.anterior = self._cabeca.proximo = self._cabeca
+        self._grupos.clear()
+
+    def __len__(self) -> int:
+        return len(self._grupos)
+
+    def __contains__(self, chave: str) -> bool:
+        return chave in self._grupos
+
+POLITICAS = {"fifo": DescarteFIFO, "lru": DescarteLRU, "lfu": DescarteLFU}
+
+def criar_politica(nome: str) -> PoliticaDescarte:
+    """
+    Cria uma política de descarte pelo nome.
+
+    :param nome: 'fifo', 'lru' ou 'lfu'
+    :return: Política criada
+    :raises ValueError: Se o nome for desconhecido
+    """
+    try:
+        return POLITICAS[nome]()
+    except KeyError:
+        raise ValueError(f"politica deve ser uma de: {', '.join(POLITICAS)}")
+
+class IndiceExpiracao:
+    """
+    Instantes de expiração das chaves com tempo de vida.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, str]] = []
+        self._expiracoes: Dict[str, float] = {}
+
+    def definir(self, chave: str, expira_em: float):
+        """Define (ou substitui) o instante de expiração de uma chave."""
+        self._expiracoes[chave] = expira_em
+        heapq.heappush(self._heap, (expira_em, chave))
+        # Reconstrói o heap quando as entradas obsoletas passam a ser a maioria
+        if len(self._heap) > 2 * len(self._expiracoes) + 64:
+            self._heap = [(instante, chave) for chave, instante in self._expiracoes.items()]
+            heapq.heapify(self._heap)
+
+    def remover(self, chave: str):
+        """Remove a expiração de uma chave; a entrada no heap é descartada quando chegar ao topo."""
+        self._expiracoes.pop(chave, None)
+
+    def obter(self, chave: str) -> Optional[float]:
+        """Retorna o instante de expiração de uma chave, ou None se ela não expirar."""
+        return self._expiracoes.get(chave)
+
+    def retirar_expiradas(self, agora: float) -> List[str]:
+        """
+        Remove do índice e retorna as chaves expiradas até o instante informado.
+
+        :param agora: Instante de referência, no relógio usado em definir
+        :return: Chaves expiradas
+        """
+        expiradas = []
+        while self._heap and self._heap[0][0] <= agora:
+            instante, chave = heapq.heappop(self._heap)
+            if self._expiracoes.get(chave) == instante:
+                del self._expiracoes[chave]
+                expiradas.append(chave)
+        return expiradas
+
+    def limpar(self):
+        self._heap.clear()
+        self._expiracoes.clear()
+
+    def __len__(self) -> int:
+        return len(self._expiracoes)
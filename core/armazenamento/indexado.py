@@ -0,0 +1,709 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: indexado
+
+Este módulo implementa o ArmazenamentoIndexado, em que a memória fica em uma tabela imutável, com um índice das
+chaves, lida por mmap: abrir o armazenamento não lê nem decodifica os valores, qualquer que seja o número de
+chaves, e cada leitura localiza a chave pelo índice e decodifica apenas o valor pedido. As alterações são
+acrescentadas a um log ao lado da tabela (no formato de core.armazenamento.log) e mantidas em memória; quando o
+log ultrapassa uma fração do tamanho da tabela, uma thread reescreve a tabela a partir de um instantâneo do estado,
+sem bloquear leituras e escritas, e o log passa a conter apenas as alterações feitas durante a reescrita.
+
+Formato da tabela (inteiros em little-endian):
+    cabeçalho: assinatura (8 bytes) | número de chaves (8) | fim dos registros (8) | início do índice (8) |
+               início das expirações (8)
+    registros, na ordem das chaves: tamanho da chave (4) | tamanho do valor (4) | chave | valor
+    índice, alinhado a 8 bytes: posições dos registros (8 bytes cada) | CRC-32 das chaves (4 bytes cada)
+    expirações, até o fim do arquivo: objeto JSON {chave: instante} dos valores gravados com expiração
+A chave é UTF-8 e o valor é JSON em UTF-8. O índice é ordenado pelo CRC-32 da chave, e a busca é binária, sobre
+visões do mapeamento; chaves com o mesmo CRC-32 são distinguidas pela comparação com a chave do registro. A seção
+de expirações permite ao GerenciadorMemoria conhecê-las sem percorrer os registros. As tabelas da primeira versão
+do formato (assinatura GYSIDX1, sem essa seção) continuam legíveis e são convertidas na próxima reescrita.
+
+A função converter_json cria uma tabela a partir do memoria.json do backend 'json'; ver main().
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ArmazenamentoIndexado
+
+Funções:
+    - converter_json
+    - main
+
+Exceções:
+    - MemoriaError
+
+Dependências:
+    - json
+    - mmap
+    - numpy
+    - config.config
+    - core.armazenamento.base
+    - core.armazenamento.log
+    - utils.logger
+    - utils.exceptions
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from config.config import Config
+from core.armazenamento.base import PREFIXO_EXPIRACAO, ArmazenamentoMemoria, desembrulhar
+from core.armazenamento.log import CABECALHO, OP_GRAVAR, OP_LIMPAR, OP_REMOVER, codificar_registro, \
+    percorrer_registros
+from utils.logger import configurar_logger
+from utils.exceptions import MemoriaError
+
+ASSINATURA = b"GYSIDX2\n"
+ASSINATURA_V1 = b"GYSIDX1\n"
+_CABECALHO = struct.Struct("<8sQQQQ")
+_CABECALHO_V1 = struct.Struct("<8sQQQ")
+_REGISTRO = struct.Struct("<II")
+_PREFIXO_EXPIRACAO = PREFIXO_EXPIRACAO.encode("utf-8")
+
+def _escrever_tabela(arquivo: str, itens: Iterable[Tuple[str, str]]) -> int:
+    """
+    Grava uma tabela completa, com fsync.
+
+    :param arquivo: Caminho do arquivo
+    :param itens: Pares (chave, valor codificado em JSON), com chaves distintas, na ordem das chaves
+    :return: Número de chaves gravadas
+    """
+    hashes = array("I")
+    posicoes = array("Q")
+    expiracoes: Dict[str, float] = {}
+    with open(arquivo, "wb") as f:
+        f.write(bytes(_CABECALHO.size))
+        posicao = _CABECALHO.size
+        for chave, texto in itens:
+            dados_chave = chave.encode("utf-8")
+            dados_valor = texto.encode("utf-8")
+            if texto.startswith(PREFIXO_EXPIRACAO):
+                expira_em = desembrulhar(json.loads(texto))[1]
+                if expira_em is not None:
+                    expiracoes[chave] = expira_em
+            hashes.append(zlib.crc32(dados_chave))
+            posicoes.append(posicao)
+            f.write(_REGISTRO.pack(len(dados_chave), len(dados_valor)) + dados_chave + dados_valor)
+            posicao += _REGISTRO.size + len(dados_chave) + len(dados_valor)
+        inicio_indice = (posicao + 7) // 8 * 8
+        f.write(bytes(inicio_indice - posicao))
+        ordem = np.argsort(np.asarray(hashes), kind="stable")
+        f.write(np.asarray(posicoes)[ordem].astype("<u8").tobytes())
+        f.write(np.asarray(hashes)[ordem].astype("<u4").tobytes())
+        f.write(json.dumps(expiracoes, ensure_ascii=False).encode("utf-8"))
+        f.seek(0)
+        f.write(_CABECALHO.pack(ASSINATURA, len(hashes), posicao, inicio_indice, inicio_indice + 12 * len(hashes)))
+        f.flush()
+        os.fsync(f.fileno())
+    return len(hashes)
+
+def _substituir(temporario: str, arquivo: str):
+    """Move o arquivo temporário sobre o de destino, tornando a substituição durável."""
+    os.replace(temporario, arquivo)
+    # O Windows não permite o fsync de diretórios
+    if hasattr(os, "O_DIRECTORY"):
+        descritor = os.open(os.path.dirname(os.path.abspath(arquivo)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descritor)
+        finally:
+            os.close(descritor)
+
+class _Tabela:
+    """Tabela aberta por mmap; o índice é lido diretamente do mapeamento, sem cópia."""
+
+    def __init__(self, arquivo: str):
+        if sys.byteorder != "little":
+            # O índice é lido com a ordem de bytes nativa
+            raise MemoriaError("A memória indexada exige uma plataforma little-endian")
+        with open(arquivo, "rb") as f:
+            self.mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        cabecalho = _CABECALHO_V1 if self.mapa[:len(ASSINATURA_V1)] == ASSINATURA_V1 else _CABECALHO
+        self.inicio_registros = cabecalho.size
+        self._expiracoes: Optional[Dict[str, float]] = None
+        valida = len(self.mapa) >= cabecalho.size
+        if valida:
+            assinatura, self.tamanho, self.fim_registros, inicio_indice, *resto = cabecalho.unpack_from(self.mapa)
+            # None nas tabelas da primeira versão, que não têm a seção de expirações
+            self.inicio_expiracoes = resto[0] if resto else None
+            fim_indice = len(self.mapa) if self.inicio_expiracoes is None else self.inicio_expiracoes
+            valida = (assinatura in (ASSINATURA, ASSINATURA_V1) and self.fim_registros <= inicio_indice
+                      and inicio_indice + 12 * self.tamanho == fim_indice <= len(self.mapa))
+        if not valida:
+            self.mapa.close()
+            raise MemoriaError(f"'{arquivo}' não é uma tabela de memória válida")
+        inicio_hashes = inicio_indice + 8 * self.tamanho
+        visao = memoryview(self.mapa)
+        self.posicoes = visao[inicio_indice:inicio_hashes].cast("Q")
+        self.hashes = visao[inicio_hashes:fim_indice].cast("I")
+        visao.release()
+
+    def procurar(self, chave: str) -> Optional[Tuple[int, int]]:
+        """Retorna o início e o fim do valor codificado da chave, ou None se ela não estiver na tabela."""
+        dados = chave.encode("utf-8")
+        crc = zlib.crc32(dados)
+        i = bisect_left(self.hashes, crc)
+        while i < self.tamanho and self.hashes[i] == crc:
+            posicao = self.posicoes[i]
+            tamanho_chave, tamanho_valor = _REGISTRO.unpack_from(self.mapa, posicao)
+            inicio = posicao + _REGISTRO.size + tamanho_chave
+            if self.mapa[posicao + _REGISTRO.size:inicio] == dados:
+                return inicio, inicio + tamanho_valor
+            i += 1
+        return None
+
+    def chave_em(self, posicao: int) -> str:
+        """Retorna a chave do registro que começa na posição."""
+        tamanho_chave = _REGISTRO.unpack_from(self.mapa, posicao)[0]
+        return self.mapa[posicao + _REGISTRO.size:posicao + _REGISTRO.size + tamanho_chave].decode("utf-8")
+
+    def percorrer(self) -> Iterator[Tuple[str, int, int]]:
+        """Gera (chave, início do valor, fim do valor) na ordem das chaves."""
+        posicao = self.inicio_registros
+        while posicao < self.fim_registros:
+            tamanho_chave, tamanho_valor = _REGISTRO.unpack_from(self.mapa, posicao)
+            inicio = posicao + _REGISTRO.size + tamanho_chave
+            yield self.mapa[posicao + _REGISTRO.size:inicio].decode("utf-8"), inicio, inicio + tamanho_valor
+            posicao = inicio + tamanho_valor
+
+    def expiracoes(self) -> Dict[str, float]:
+        """
+        Retorna as expirações dos valores da tabela, decodificando a seção de expirações na primeira chamada. Nas
+        tabelas da primeira versão, percorre os registros e decodifica os valores com expiração.
+        """
+        if self._expiracoes is None:
+            if self.inicio_expiracoes is not None:
+                self._expiracoes = json.loads(self.mapa[self.inicio_expiracoes:])
+            else:
+                self._expiracoes = {}
+                for chave, inicio, fim in self.percorrer():
+                    if self.mapa[inicio:inicio + len(_PREFIXO_EXPIRACAO)] == _PREFIXO_EXPIRACAO:
+                        expira_em = desembrulhar(json.loads(self.mapa[inicio:fim]))[1]
+                        if expira_em is not None:
+                            self._expiracoes[chave] = expira_em
+        return self._expiracoes
+
+    def fechar(self):
+        # As visões do índice impedem o fechamento do mapeamento
+        self.posicoes.release()
+        self.hashes.release()
+        self.mapa.close()
+
+class ArmazenamentoIndexado(ArmazenamentoMemoria):
+    """
+    Armazenamento em tabela indexada lida por mmap, com as alterações recentes em um log e em memória.
+
+    É seguro para uso concorrente.
+    """
+
+    def __init__(self, arquivo: str, fsync_lote: int = 32, fracao_compactacao: float = 0.5,
+                 minimo_compactacao: int = 1048576):
+        """
+        Abre (ou cria) a tabela e reproduz o log de alterações, em arquivo + '.log'.
+
+        :param arquivo: Caminho da tabela
+        :param fsync_lote: Número de alterações entre dois fsync do log; ver ArmazenamentoLog
+        :param fracao_compactacao: Tamanho do log, em fração do tamanho da tabela, a partir do qual a tabela é
+                                   reescrita
+        :param minimo_compactacao: Tamanho mínimo do log, em bytes, para que a tabela seja reescrita
+        :raises ValueError: Se algum parâmetro for inválido
+        :raises MemoriaError: Se a tabela ou o log não puderem ser abertos ou não forem deste formato
+        """
+        if not isinstance(fsync_lote, int) or fsync_lote < 0:
+            raise ValueError("fsync_lote deve ser um inteiro não negativo")
+        if fracao_compactacao <= 0:
+            raise ValueError("fracao_compactacao deve ser positiva")
+        self.arquivo = arquivo
+        self.arquivo_alteracoes = arquivo + ".log"
+        self.fsync_lote = fsync_lote
+        self.fracao_compactacao = fracao_compactacao
+        self.minimo_compactacao = minimo_compactacao
+        self.logger = configurar_logger("armazenamento_indexado")
+        self._lock = threading.RLock()
+        # Alterações desde a gravação da tabela: chaves fora dela (na ordem de gravação), chaves dela com novo
+        # valor e chaves dela removidas; após limpar(), a tabela inteira é desconsiderada
+        self._novas: Dict[str, Any] = {}
+        self._substituidas: Dict[str, Any] = {}
+        self._removidas: Set[str] = set()
+        self._descartada = False
+        self._bytes_alteracoes = 0
+        self._nao_sincronizados = 0
+        self._compactacoes = 0
+        self._fechando = False
+        # Durante uma reescrita, as alterações acrescentadas ao log: (operação, chave, valor, registro)
+        self._pendentes: Optional[List[Tuple[int, str, Any, bytes]]] = None
+        self._thread_compactacao: Optional[threading.Thread] = None
+        try:
+            pasta = os.path.dirname(arquivo)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            if not os.path.exists(arquivo):
+                _escrever_tabela(arquivo + ".tmp", ())
+                _substituir(arquivo + ".tmp", arquivo)
+            self._tabela = _Tabela(arquivo)
+            self._reproduzir()
+            self._arquivo = open(self.arquivo_alteracoes, "ab")
+        except (OSError, ValueError) as e:
+            raise MemoriaError(f"Erro ao abrir a memória indexada '{arquivo}': {str(e)}")
+
+    def _reproduzir(self):
+        """Aplica o log de alterações à tabela, descartando um registro final incompleto ou corrompido."""
+        if not os.path.exists(self.arquivo_alteracoes) or os.path.getsize(self.arquivo_alteracoes) == 0:
+            self._iniciar_log()
+            return
+        with open(self.arquivo_alteracoes, "rb") as f:
+            conteudo = f.read()
+        if not conteudo.startswith(CABECALHO):
+            raise MemoriaError(f"'{self.arquivo_alteracoes}' não é um log de memória válido")
+        posicao = len(CABECALHO)
+        for operacao, chave, inicio, fim in percorrer_registros(conteudo, posicao):
+            if operacao == OP_GRAVAR:
+                self._aplicar_gravacao(chave, json.loads(conteudo[inicio:fim]))
+            elif operacao == OP_REMOVER:
+                self._aplicar_remocao(chave)
+            else:
+                self._aplicar_limpeza()
+            posicao = fim
+        if posicao < len(conteudo):
+            self.logger.warning("Registro incompleto no log '%s' na posição %d; descartando o restante",
+                                self.arquivo_alteracoes, posicao)
+            with open(self.arquivo_alteracoes, "r+b") as f:
+                f.truncate(posicao)
+                os.fsync(f.fileno())
+        self._bytes_alteracoes = posicao
+
+    def _iniciar_log(self):
+        with open(self.arquivo_alteracoes, "wb") as f:
+            f.write(CABECALHO)
+            f.flush()
+            os.fsync(f.fileno())
+        self._bytes_alteracoes = len(CABECALHO)
+
+    def _na_tabela(self, chave: str) -> bool:
+        """Indica se a chave está viva na tabela (com o valor original ou substituído)."""
+        return not self._descartada and chave not in self._removidas and self._tabela.procurar(chave) is not None
+
+    def _aplicar_gravacao(self, chave: str, valor: Any):
+        if chave not in self._novas and self._na_tabela(chave):
+            self._substituidas[chave] = valor
+        else:
+            self._novas[chave] = valor
+
+    def _aplicar_remocao(self, chave: str) -> bool:
+        if chave in self._novas:
+            del self._novas[chave]
+            return True
+        if self._na_tabela(chave):
+            self._substituidas.pop(chave, None)
+            self._removidas.add(chave)
+            return True
+        return False
+
+    def _aplicar_limpeza(self):
+        self._novas.clear()
+        self._substituidas.clear()
+        self._removidas.clear()
+        self._descartada = True
+
+    def _verificar_aberto(self):
+        if self._arquivo.closed:
+            raise MemoriaError(f"A memória indexada '{self.arquivo}' está fechada")
+
+    def _acrescentar(self, registro: bytes, operacao: int, chave: str = "", valor: Any = None):
+        """Acrescenta um registro ao log de alterações. Deve ser chamado com o lock adquirido."""
+        self._verificar_aberto()
+        self._arquivo.write(registro)
+        self._arquivo.flush()
+        self._bytes_alteracoes += len(registro)
+        if self._pendentes is not None:
+            self._pendentes.append((operacao, chave, valor, registro))
+        self._nao_sincronizados += 1
+        if self.fsync_lote and self._nao_sincronizados >= self.fsync_lote:
+            self._sincronizar()
+
+    def _sincronizar(self):
+        os.fsync(self._arquivo.fileno())
+        self._nao_sincronizados = 0
+
+    def _talvez_compactar(self):
+        """
+        Inicia a reescrita da tabela em segundo plano se o log passou do limite. Deve ser chamado com o lock
+        adquirido.
+        """
+        if self._pendentes is not None or self._fechando:
+            return
+        limite = max(self.minimo_compactacao, self.fracao_compactacao * len(self._tabela.mapa))
+        if self._bytes_alteracoes >= limite:
+            self._pendentes = []
+            thread = threading.Thread(target=self._compactar_em_segundo_plano, args=(self._instantaneo(),),
+                                      name="compactacao_indexado", daemon=True)
+            # Publicada só depois de iniciada, pois _aguardar_compactacao a lê sem o lock
+            thread.start()
+            self._thread_compactacao = thread
+
+    def _compactar_em_segundo_plano(self, instantaneo: tuple):
+        try:
+            self._compactar(instantaneo)
+        except MemoriaError as e:
+            # As alterações continuam no log; a reescrita é tentada novamente na próxima alteração
+            self.logger.error("%s", e)
+
+    def _aguardar_compactacao(self):
+        thread = self._thread_compactacao
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _instantaneo(self) -> tuple:
+        """Copia o estado atual para uma iteração sem o lock. Deve ser chamado com o lock adquirido."""
+        self._verificar_aberto()
+        # Referências próprias: uma reescrita da tabela durante a iteração não a afeta
+        return (None if self._descartada else self._tabela, set(self._removidas), dict(self._substituidas),
+                list(self._novas.items()))
+
+    def _itens(self, codificados: bool) -> Iterator[Tuple[str, Any]]:
+        with self._lock:
+            instantaneo = self._instantaneo()
+        return self._percorrer(instantaneo, codificados)
+
+    @staticmethod
+    def _percorrer(instantaneo: tuple, codificados: bool) -> Iterator[Tuple[str, Any]]:
+        tabela, removidas, substituidas, novas = instantaneo
+        if tabela is not None:
+            for chave, inicio, fim in tabela.percorrer():
+                if chave in removidas:
+                    continue
+                if chave in substituidas:
+                    valor = substituidas[chave]
+                    yield chave, json.dumps(valor, ensure_ascii=False) if codificados else valor
+                else:
+                    texto = tabela.mapa[inicio:fim].decode("utf-8")
+                    yield chave, texto if codificados else json.loads(texto)
+        for chave, valor in novas:
+            yield chave, json.dumps(valor, ensure_ascii=False) if codificados else valor
+
+    def obter(self, chave: str, padrao: Any = None) -> Any:
+        """
+        Retorna o valor de uma chave, decodificando-o da tabela se ele não tiver sido alterado.
+
+        :param chave: Chave procurada
+        :param padrao: Valor retornado se a chave não existir
+        :return: Valor armazenado, ou padrao
+        :raises MemoriaError: Se o armazenamento estiver fechado
+        """
+        with self._lock:
+            self._verificar_aberto()
+            if chave in self._novas:
+                return self._novas[chave]
+            if chave in self._substituidas:
+                return self._substituidas[chave]
+            if self._descartada or chave in self._removidas:
+                return padrao
+            posicao = self._tabela.procurar(chave)
+            if posicao is None:
+                return padrao
+            dados = self._tabela.mapa[posicao[0]:posicao[1]]
+        return json.loads(dados)
+
+    def gravar(self, chave: str, valor: Any):
+        """
+        Grava o valor de uma chave, acrescentando um registro ao log de alterações.
+
+        :param chave: Chave do valor
+        :param valor: Valor serializável em JSON
+        :raises MemoriaError: Se o valor não for serializável ou o armazenamento estiver fechado
+        """
+        registro = codificar_registro(OP_GRAVAR, chave, valor)
+        with self._lock:
+            self._acrescentar(registro, OP_GRAVAR, chave, valor)
+            self._aplicar_gravacao(chave, valor)
+            self._talvez_compactar()
+
+    def remover(self, chave: str) -> bool:
+        """
+        Remove uma chave.
+
+        :param chave: Chave a remover
+        :return: True se a chave existia
+        :raises MemoriaError: Se o armazenamento estiver fechado
+        """
+        with self._lock:
+            if chave not in self:
+                return False
+            self._acrescentar(codificar_registro(OP_REMOVER, chave), OP_REMOVER, chave)
+            self._aplicar_remocao(chave)
+            self._talvez_compactar()
+            return True
+
+    def limpar(self):
+        """
+        Remove todas as chaves.
+
+        :raises MemoriaError: Se o armazenamento estiver fechado
+        """
+        with self._lock:
+            self._acrescentar(codificar_registro(OP_LIMPAR), OP_LIMPAR)
+            self._aplicar_limpeza()
+
+    def chaves(self) -> List[str]:
+        """Retorna as chaves armazenadas, na ordem em que foram gravadas pela primeira vez."""
+        with self._lock:
+            self._verificar_aberto()
+            chaves = [] if self._descartada else [chave for chave, _, _ in self._tabela.percorrer()
+                                                  if chave not in self._removidas]
+            return chaves + list(self._novas)
+
+    def chaves_recentes(self, quantidade: int) -> List[str]:
+        """Retorna as últimas chaves; as da tabela são as de maiores posições no índice, sem percorrê-la."""
+        with self._lock:
+            self._verificar_aberto()
+            novas = list(self._novas)[-quantidade:] if quantidade else []
+            restantes = quantidade - len(novas)
+            if restantes <= 0 or self._descartada or not self._tabela.tamanho:
+                return novas
+            # Chaves removidas podem estar entre as de maiores posições
+            k = min(self._tabela.tamanho, restantes + len(self._removidas))
+            posicoes = np.sort(np.partition(np.asarray(self._tabela.posicoes), -k)[-k:])
+            chaves = [chave for chave in map(self._tabela.chave_em, posicoes.tolist())
+                      if chave not in self._removidas]
+            return chaves[-restantes:] + novas
+
+    def itens(self) -> Iterator[Tuple[str, Any]]:
+        """Retorna os pares (chave, valor) armazenados, decodificando os valores um a um."""
+        return self._itens(codificados=False)
+
+    def itens_codificados(self) -> Iterator[Tuple[str, str]]:
+        """Retorna os pares (chave, valor codificado), sem decodificar os valores da tabela."""
+        return self._itens(codificados=True)
+
+    def expiracoes(self) -> Iterator[Tuple[str, float]]:
+        """Retorna os pares (chave, instante de expiração), lidos da seção de expirações e das alterações."""
+        with self._lock:
+            self._verificar_aberto()
+            na_tabela = {} if self._descartada else self._tabela.expiracoes()
+            expiracoes = [(chave, expira_em) for chave, expira_em in na_tabela.items()
+                          if chave not in self._removidas and chave not in self._substituidas]
+            for alteradas in (self._substituidas, self._novas):
+                for chave, valor in alteradas.items():
+                    expira_em = desembrulhar(valor)[1]
+                    if expira_em is not None:
+                        expiracoes.append((chave, expira_em))
+        return iter(expiracoes)
+
+    def tamanhos_codificados(self) -> Iterator[Tuple[str, int]]:
+        """Retorna os pares (chave, tamanho do valor codificado), sem decodificar os valores da tabela."""
+        with self._lock:
+            tabela, removidas, substituidas, novas = self._instantaneo()
+        if tabela is not None:
+            for chave, inicio, fim in tabela.percorrer():
+                if chave in substituidas:
+                    yield chave, len(json.dumps(substituidas[chave], ensure_ascii=False).encode("utf-8"))
+                elif chave not in removidas:
+                    yield chave, fim - inicio
+        for chave, valor in novas:
+            yield chave, len(json.dumps(valor, ensure_ascii=False).encode("utf-8"))
+
+    def chave_mais_antiga(self) -> Optional[str]:
+        with self._lock:
+            self._verificar_aberto()
+            if not self._descartada:
+                for chave, _, _ in self._tabela.percorrer():
+                    if chave not in self._removidas:
+                        return chave
+            return next(iter(self._novas), None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            na_tabela = 0 if self._descartada else self._tabela.tamanho - len(self._removidas)
+            # Chaves da tabela removidas e gravadas de novo estão em _removidas e em _novas
+            return na_tabela + len(self._novas)
+
+    def __contains__(self, chave: object) -> bool:
+        if not isinstance(chave, str):
+            return False
+        with self._lock:
+            return chave in self._novas or self._na_tabela(chave)
+
+    def compactar(self):
+        """
+        Reescreve a tabela com o estado atual e esvazia o log de alterações, aguardando uma reescrita em andamento
+        terminar.
+
+        :raises MemoriaError: Se o armazenamento estiver fechado ou a reescrita falhar
+        """
+        while True:
+            self._aguardar_compactacao()
+            with self._lock:
+                if self._pendentes is None:
+                    instantaneo = self._instantaneo()
+                    self._pendentes = []
+                    break
+        self._compactar(instantaneo)
+
+    def _compactar(self, instantaneo: tuple):
+        """
+        Grava a nova tabela a partir do instantâneo, sem o lock, e a coloca no lugar da atual. As alterações
+        acrescentadas durante a gravação passam para um novo log e são reaplicadas sobre a nova tabela.
+        """
+        temporario = self.arquivo + ".tmp"
+        try:
+            try:
+                quantidade = _escrever_tabela(temporario, self._percorrer(instantaneo, codificados=True))
+            except (OSError, ValueError) as e:
+                if os.path.exists(temporario):
+                    os.remove(temporario)
+                raise MemoriaError(f"Erro ao reescrever a memória indexada '{self.arquivo}': {str(e)}")
+            with self._lock:
+                self._trocar_tabela(temporario)
+            self.logger.info("Memória indexada '%s' reescrita: %d chaves", self.arquivo, quantidade)
+        finally:
+            with self._lock:
+                self._pendentes = None
+
+    def _trocar_tabela(self, temporario: str):
+        """Substitui a tabela e o log de alterações. Deve ser chamado com o lock adquirido."""
+        try:
+            if os.name == "nt":
+                # O Windows não permite substituir um arquivo mapeado em memória
+                self._tabela.fechar()
+            _substituir(temporario, self.arquivo)
+        except OSError as e:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            raise MemoriaError(f"Erro ao reescrever a memória indexada '{self.arquivo}': {str(e)}")
+        pendentes = self._pendentes
+        try:
+            # Se o processo parar antes do log ser substituído, reaplicar o log antigo à nova tabela leva ao mesmo
+            # estado
+            self._tabela = _Tabela(self.arquivo)
+            novo_log = self.arquivo_alteracoes + ".tmp"
+            with open(novo_log, "wb") as f:
+                f.write(CABECALHO)
+                for _, _, _, registro in pendentes:
+                    f.write(registro)
+                f.flush()
+                os.fsync(f.fileno())
+                tamanho_log = f.tell()
+            # O log antigo é fechado antes da substituição, que falha no Windows com ele aberto
+            self._arquivo.close()
+            try:
+                _substituir(novo_log, self.arquivo_alteracoes)
+            finally:
+                self._arquivo = open(self.arquivo_alteracoes, "ab")
+        except OSError as e:
+            raise MemoriaError(f"Erro ao reabrir a memória indexada '{self.arquivo}': {str(e)}")
+        self._novas.clear()
+        self._substituidas.clear()
+        self._removidas.clear()
+        self._descartada = False
+        for operacao, chave, valor, _ in pendentes:
+            if operacao == OP_GRAVAR:
+                self._aplicar_gravacao(chave, valor)
+            elif operacao == OP_REMOVER:
+                self._aplicar_remocao(chave)
+            else:
+                self._aplicar_limpeza()
+        self._bytes_alteracoes = tamanho_log
+        self._nao_sincronizados = 0
+        self._compactacoes += 1
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do armazenamento.
+
+        :return: Dicionário com o número de chaves, o número de chaves e o tamanho da tabela, o tamanho do log de
+                 alterações e o número de reescritas da tabela
+        """
+        with self._lock:
+            return {
+                "chaves": len(self),
+                "chaves_tabela": self._tabela.tamanho,
+                "bytes_tabela": len(self._tabela.mapa),
+                "bytes_alteracoes": self._bytes_alteracoes,
+                "compactacoes": self._compactacoes,
+            }
+
+    def sincronizar(self):
+        """
+        Garante que todas as alterações estejam gravadas em disco.
+
+        :raises MemoriaError: Se o armazenamento estiver fechado
+        """
+        with self._lock:
+            self._verificar_aberto()
+            self._sincronizar()
+
+    def fechar(self):
+        """Aguarda a reescrita em andamento, grava as alterações pendentes em disco e fecha o log e a tabela."""
+        with self._lock:
+            self._fechando = True
+        self._aguardar_compactacao()
+        with self._lock:
+            if not self._arquivo.closed:
+                self._sincronizar()
+                self._arquivo.close()
+                self._tabela.fechar()
+
+def converter_json(arquivo_json: str, arquivo_tabela: str) -> int:
+    """
+    Cria uma tabela indexada com o conteúdo de um arquivo JSON do backend 'json', preservando a ordem das chaves.
+    Um log de alterações existente ao lado da tabela é removido.
+
+    :param arquivo_json: Caminho do arquivo JSON
+    :param arquivo_tabela: Caminho da tabela a criar
+    :return: Número de chaves convertidas
+    :raises MemoriaError: Se o arquivo JSON não puder ser lido ou não contiver um objeto, ou se a tabela não puder
+                          ser gravada
+    """
+    try:
+        with open(arquivo_json, "r") as f:
+            dados = json.load(f)
+    except (OSError, ValueError) as e:
+        raise MemoriaError(f"Erro ao carregar a memória de '{arquivo_json}': {str(e)}")
+    if not isinstance(dados, dict):
+        raise MemoriaError(f"'{arquivo_json}' não contém um objeto JSON")
+    temporario = arquivo_tabela + ".tmp"
+    try:
+        quantidade = _escrever_tabela(temporario, ((chave, json.dumps(valor, ensure_ascii=False))
+                                                   for chave, valor in dados.items()))
+        _substituir(temporario, arquivo_tabela)
+        if os.path.exists(arquivo_tabela + ".log"):
+            os.remove(arquivo_tabela + ".log")
+    except OSError as e:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise MemoriaError(f"Erro ao gravar a memória indexada '{arquivo_tabela}': {str(e)}")
+    return quantidade
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ponto de entrada da linha de comando do conversor.
+
+    :param argv: Argumentos da linha de comando; por padrão, sys.argv[1:]
+    :return: Código de saída
+    """
+    parser = argparse.ArgumentParser(description="Converte o memoria.json em uma memória indexada.")
+    parser.add_argument("entrada", nargs="?", default=Config.MEMORIA_ARQUIVO, help="Arquivo JSON da memória")
+    parser.add_argument("saida", nargs="?", default=Config.MEMORIA_ARQUIVO_INDEXADO, help="Tabela a criar")
+    parser.add_argument("--substituir", action="store_true", help="Substitui uma memória indexada existente")
+    argumentos = parser.parse_args(argv)
+
+    if os.path.exists(argumentos.saida) and not argumentos.substituir:
+        print(f"'{argumentos.saida}' já existe; use --substituir para sobrescrevê-lo", file=sys.stderr)
+        return 1
+    quantidade = converter_json(argumentos.entrada, argumentos.saida)
+    print(f"{quantidade} chaves convertidas de '{argumentos.entrada}' para '{argumentos.saida}'")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
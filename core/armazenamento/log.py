@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: log
+
+Este módulo implementa o ArmazenamentoLog, um armazenamento chave-valor persistido em um log somente de acréscimo.
+Cada gravação ou remoção acrescenta um único registro ao final do arquivo, de modo que o custo de uma escrita é
+proporcional ao registro, e não ao tamanho da memória inteira. Ao abrir, o log é reproduzido do início para
+reconstruir o estado; um registro final incompleto (escrita interrompida) é descartado. Quando a fração de
+registros obsoletos ultrapassa um limite, uma thread reescreve o log apenas com os valores atuais, sem bloquear
+as escritas que chegam durante a compactação. O fsync pode ser feito em lotes de registros.
+
+Formato de cada registro, após o cabeçalho do arquivo:
+    crc32 (4 bytes) | tamanho da chave (4 bytes) | tamanho do valor (4 bytes) | operação (1 byte) | chave | valor
+A chave é UTF-8, o valor é JSON em UTF-8 e o CRC cobre tudo o que vem depois dele. Inteiros em little-endian.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ArmazenamentoLog
+
+Funções:
+    - codificar_registro
+    - percorrer_registros
+
+Exceções:
+    - MemoriaError
+
+Dependências:
+    - json
+    - struct
+    - zlib
+    - core.armazenamento.base
+    - utils.logger
+    - utils.exceptions
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from core.armazenamento.base import ArmazenamentoMemoria
+from utils.logger import configurar_logger
+from utils.exceptions import MemoriaError
+
+CABECALHO = b"GYSLOG1\n"
+_ESTRUTURA = struct.Struct("<IIIB")
+OP_GRAVAR = 1
+OP_REMOVER = 2
+OP_LIMPAR = 3
+_DECODIFICADOR = json.JSONDecoder()
+
+def codificar_registro(operacao: int, chave: str = "", valor: Any = None) -> bytes:
+    """
+    Monta um registro do log.
+
+    :param operacao: OP_GRAVAR, OP_REMOVER ou OP_LIMPAR
+    :param chave: Chave afetada
+    :param valor: Valor gravado, em OP_GRAVAR
+    :return: Registro codificado
+    :raises MemoriaError: Se o valor não for serializável
+    """
+    dados_chave = chave.encode("utf-8")
+    dados_valor = b""
+    if operacao == OP_GRAVAR:
+        try:
+            dados_valor = json.dumps(valor, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            raise MemoriaError(f"Valor não serializável para a chave '{chave}': {str(e)}")
+    corpo = _ESTRUTURA.pack(0, len(dados_chave), len(dados_valor), operacao)[4:] + dados_chave + dados_valor
+    return struct.pack("<I", zlib.crc32(corpo)) + corpo
+
+def percorrer_registros(conteudo: bytes, posicao: int) -> Iterator[Tuple[int, str, int, int]]:
+    """
+    Percorre os registros de um log a partir de uma posição, parando no primeiro incompleto ou corrompido; o
+    conteúdo após o fim do último registro gerado deve ser descartado.
+
+    :param conteudo: Conteúdo do arquivo de log
+    :param posicao: Posição do primeiro registro
+    :return: Gerador de (operação, chave, início do valor, fim do registro)
+    """
+    while posicao + _ESTRUTURA.size <= len(conteudo):
+        crc, tamanho_chave, tamanho_valor, operacao = _ESTRUTURA.unpack_from(conteudo, posicao)
+        inicio = posicao + _ESTRUTURA.size
+        fim = inicio + tamanho_chave + tamanho_valor
+        if (fim > len(conteudo) or operacao not in (OP_GRAVAR, OP_REMOVER, OP_LIMPAR)
+                or zlib.crc32(conteudo[posicao + 4:fim]) != crc):
+            return
+        yield operacao, conteudo[inicio:inicio + tamanho_chave].decode("utf-8"), inicio + tamanho_chave, fim
+        posicao = fim
+
+def _contabilizar(operacao: int, chave: str, tamanho: int, tamanhos: Dict[str, int]) -> int:
+    """
+    Atualiza os tamanhos dos registros vivos após uma operação.
+
+    :return: Número de bytes que deixaram de ser necessários com a operação
+    """
+    if operacao == OP_GRAVAR:
+        obsoletos = tamanhos.get(chave, 0)
+        tamanhos[chave] = tamanho
+        return obsoletos
+    if operacao == OP_REMOVER:
+        return tamanhos.pop(chave, 0) + tamanho
+    obsoletos = sum(tamanhos.values()) + tamanho
+    tamanhos.clear()
+    return obsoletos
+
+class ArmazenamentoLog(ArmazenamentoMemoria):
+    """
+    Armazenamento chave-valor em log somente de acréscimo, com os valores mantidos em memória.
+
+    É seguro para uso concorrente.
+    """
+
+    valores_em_memoria = True
+
+    def __init__(self, arquivo: str, fsync_lote: int = 32, fracao_compactacao: float = 0.5,
+                 minimo_compactacao: int = 1048576):
+        """
+        Abre (ou cria) o log e reproduz seus registros.
+
+        :param arquivo: Caminho do arquivo de log
+        :param fsync_lote: Número de registros acrescentados entre dois fsync; 1 torna cada escrita durável e 0
+                           deixa a gravação em disco a cargo do sistema (os registros ainda sobrevivem a uma queda
+                           do processo, mas não a uma queda do sistema)
+        :param fracao_compactacao: Fração de bytes obsoletos do log a partir da qual a compactação é iniciada
+        :param minimo_compactacao: Tamanho mínimo do log, em bytes, para que a compactação seja considerada
+        :raises ValueError: Se algum parâmetro for inválido
+        :raises MemoriaError: Se o arquivo não puder ser aberto ou não for um log deste formato
+        """
+        if not isinstance(fsync_lote, int) or fsync_lote < 0:
+            raise ValueError("fsync_lote deve ser um inteiro não negativo")
+        if not 0 < fracao_compactacao <= 1:
+            raise ValueError("fracao_compactacao deve estar no intervalo (0, 1]")
+        self.arquivo = arquivo
+        self.fsync_lote = fsync_lote
+        self.fracao_compactacao = fracao_compactacao
+        self.minimo_compactacao = minimo_compactacao
+        self.logger = configurar_logger("armazenamento_log")
+        self._lock = threading.RLock()
+        self._dados: Dict[str, Any] = {}
+        self._tamanhos: Dict[str, int] = {}
+        self._bytes_totais = 0
+        self._bytes_obsoletos = 0
+        self._nao_sincronizados = 0
+        self._compactacoes = 0
+        self._fechando = False
+        self._pendentes: Optional[List[Tuple[int, str, bytes]]] = None
+        self._thread_compactacao: Optional[threading.Thread] = None
+        try:
+            pasta = os.path.dirname(arquivo)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            self._reproduzir()
+            self._arquivo = open(arquivo, "ab")
+        except OSError as e:
+            raise MemoriaError(f"Erro ao abrir o log de memória '{arquivo}': {str(e)}")
+
+    def _reproduzir(self):
+        """Reconstrói o estado a partir do log, descartando um registro final incompleto ou corrompido."""
+        if not os.path.exists(self.arquivo) or os.path.getsize(self.arquivo) == 0:
+            with open(self.arquivo, "wb") as f:
+                f.write(CABECALHO)
+                f.flush()
+                os.fsync(f.fileno())
+            self._bytes_totais = len(CABECALHO)
+            return
+
+        with open(self.arquivo, "rb") as f:
+            conteudo = f.read()
+        if not conteudo.startswith(CABECALHO):
+            raise MemoriaError(f"'{self.arquivo}' não é um log de memória válido")
+        # Guarda apenas a posição do valor vivo de cada chave; valores sobrescritos nunca são decodificados
+        posicoes: Dict[str, Tuple[int, int]] = {}
+        posicao = len(CABECALHO)
+        for operacao, chave, inicio, fim in percorrer_registros(conteudo, posicao):
+            if operacao == OP_GRAVAR:
+                posicoes[chave] = (inicio, fim)
+            elif operacao == OP_REMOVER:
+                posicoes.pop(chave, None)
+            else:
+                posicoes.clear()
+            self._bytes_obsoletos += _contabilizar(operacao, chave, fim - posicao, self._tamanhos)
+            posicao = fim
+        self._dados = {chave: _DECODIFICADOR.decode(conteudo[inicio:fim].decode("utf-8"))
+                       for chave, (inicio, fim) in posicoes.items()}
+
+        if posicao < len(conteudo):
+            self.logger.warning("Registro incompleto no log '%s' na posição %d; descartando o restante",
+                                self.arquivo, posicao)
+            with open(self.arquivo, "r+b") as f:
+                f.truncate(posicao)
+                os.fsync(f.fileno())
+        self._bytes_totais = posicao
+        self.logger.info("Log de memória '%s' carregado: %d chaves, %d bytes", self.arquivo, len(self._dados),
+                         posicao)
+
+    def _acrescentar(self, operacao: int, chave: str, registro: bytes):
+        """Acrescenta um registro ao log. Deve ser chamado com o lock adquirido."""
+        if self._arquivo.closed:
+            raise MemoriaError(f"O log de memória '{self.arquivo}' está fechado")
+        self._arquivo.write(registro)
+        self._arquivo.flush()
+        self._bytes_totais += len(registro)
+        self._bytes_obsoletos += _contabilizar(operacao, chave, len(registro), self._tamanhos)
+        if self._pendentes is not None:
+            self._pendentes.append((operacao, chave, registro))
+        self._nao_sincronizados += 1
+        if self.fsync_lote and self._nao_sincronizados >= self.fsync_lote:
+            self._sincronizar()
+        if self._precisa_compactar():
+            self._iniciar_compactacao()
+
+    def _sincronizar(self):
+        os.fsync(self._arquivo.fileno())
+        self._nao_sincronizados = 0
+
+    def _precisa_compactar(self) -> bool:
+        return (self._pendentes is None and not self._fechando and self._bytes_totais >= self.minimo_compactacao
+                and self._bytes_obsoletos >= self.fracao_compactacao * self._bytes_totais)
+
+    def _iniciar_compactacao(self):
+        """Inicia a compactação em segundo plano. Deve ser chamado com o lock adquirido."""
+        self._pendentes = []
+        instantaneo = dict(self._dados)
+        self._thread_compactacao = threading.Thread(target=self._compactar, args=(instantaneo,),
+                                                    name="compactacao_log", daemon=True)
+        self._thread_compactacao.start()
+
+    def _compactar(self, instantaneo: Dict[str, Any]):
+        """
+        Reescreve o log com os valores do instantâneo e, em seguida, com os registros acrescentados durante a
+        reescrita, e substitui o arquivo original de forma atômica.
+        """
+        temporario = self.arquivo + ".compactando"
+        try:
+            tamanhos: Dict[str, int] = {}
+            with open(temporario, "wb") as f:
+                f.write(CABECALHO)
+                for chave, valor in instantaneo.items():
+                    registro = codificar_registro(OP_GRAVAR, chave, valor)
+                    f.write(registro)
+                    tamanhos[chave] = len(registro)
+                with self._lock:
+                    obsoletos = 0
+                    for operacao, chave, registro in self._pendentes:
+                        f.write(registro)
+                        obsoletos += _contabilizar(operacao, chave, len(registro), tamanhos)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    tamanho_final = f.tell()
+                    # O arquivo antigo é fechado antes da substituição, que falha no Windows com ele aberto
+                    self._arquivo.close()
+                    try:
+                        os.replace(temporario, self.arquivo)
+                    finally:
+                        self._arquivo = open(self.arquivo, "ab")
+                    self._tamanhos = tamanhos
+                    self._bytes_totais = tamanho_final
+                    self._bytes_obsoletos = obsoletos
+                    self._nao_sincronizados = 0
+                    self._compactacoes += 1
+            self.logger.info("Log de memória '%s' compactado para %d bytes", self.arquivo, tamanho_final)
+        except Exception as e:
+            self.logger.error("Erro ao compactar o log de memória '%s': %s", self.arquivo, e)
+            if os.path.exists(temporario):
+                os.remove(temporario)
+        finally:
+            with self._lock:
+                self._pendentes = None
+
+    def obter(self, chave: str, padrao: Any = None) -> Any:
+        """
+        Retorna o valor de uma chave.
+
+        :param chave: Chave procurada
+        :param padrao: Valor retornado se a chave não existir
+        :return: Valor armazenado, ou padrao
+        """
+        with self._lock:
+            return self._dados.get(chave, padrao)
+
+    def gravar(self, chave: str, valor: Any):
+        """
+        Grava o valor de uma chave, acrescentando um registro ao log.
+
+        :param chave: Chave do valor
+        :param valor: Valor serializável em JSON
+        :raises MemoriaError: Se o valor não for serializável ou o log estiver fechado
+        """
+        registro = codificar_registro(OP_GRAVAR, chave, valor)
+        with self._lock:
+            self._acrescentar(OP_GRAVAR, chave, registro)
+            self._dados[chave] = valor
+
+    def remover(self, chave: str) -> bool:
+        """
+        Remove uma chave.
+
+        :param chave: Chave a remover
+        :return: True se a chave existia
+        :raises MemoriaError: Se o log estiver fechado
+        """
+        with self._lock:
+            if chave not in self._dados:
+                return False
+            self._acrescentar(OP_REMOVER, chave, codificar_registro(OP_REMOVER, chave))
+            del self._dados[chave]
+            return True
+
+    def limpar(self):
+        """
+        Remove todas as chaves.
+
+        :raises MemoriaError: Se o log estiver fechado
+        """
+        with self._lock:
+            self._acrescentar(OP_LIMPAR, "", codificar_registro(OP_LIMPAR))
+            self._dados.clear()
+
+    def chaves(self) -> List[str]:
+        """Retorna as chaves armazenadas, na ordem em que foram gravadas pela primeira vez."""
+        with self._lock:
+            return list(self._dados)
+
+    def chaves_recentes(self, quantidade: int) -> List[str]:
+        with self._lock:
+            recentes = [chave for chave, _ in zip(reversed(self._dados), range(quantidade))]
+        return recentes[::-1]
+
+    def itens(self) -> Iterator[Tuple[str, Any]]:
+        """Retorna os pares (chave, valor) armazenados."""
+        with self._lock:
+            return iter(list(self._dados.items()))
+
+    def chave_mais_antiga(self) -> Optional[str]:
+        with self._lock:
+            return next(iter(self._dados), None)
+
+    def __len__(self) -> int:
+        return len(self._dados)
+
+    def __contains__(self, chave: object) -> bool:
+        return chave in self._dados
+
+    def sincronizar(self):
+        """
+        Garante que todos os registros acrescentados estejam gravados em disco.
+
+        :raises MemoriaError: Se o log estiver fechado
+        """
+        with self._lock:
+            if self._arquivo.closed:
+                raise MemoriaError(f"O log de memória '{self.arquivo}' está fechado")
+            self._sincronizar()
+
+    def compactar(self):
+        """Compacta o log imediatamente, aguardando uma compactação em andamento terminar."""
+        while True:
+            self._aguardar_compactacao()
+            with self._lock:
+                if self._pendentes is None:
+                    self._pendentes = []
+                    instantaneo = dict(self._dados)
+                    break
+        self._compactar(instantaneo)
+
+    def _aguardar_compactacao(self):
+        thread = self._thread_compactacao
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do log.
+
+        :return: Dicionário com o número de chaves, o tamanho do log, os bytes obsoletos e o número de
+                 compactações
+        """
+        with self._lock:
+            return {
+                "chaves": len(self._dados),
+                "bytes_totais": self._bytes_totais,
+                "bytes_obsoletos": self._bytes_obsoletos,
+                "compactacoes": self._compactacoes,
+            }
+
+    def fechar(self):
+        """Aguarda a compactação em andamento, grava os registros pendentes em disco e fecha o log."""
+        with self._lock:
+            self._fechando = True
+        self._aguardar_compactacao()
+        with self._lock:
+            if not self._arquivo.closed:
+                self._sincronizar()
+                self._arquivo.close()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: sql
+
+Este módulo implementa o ArmazenamentoSQL, que guarda a memória em um banco relacional acessado pelo SQLAlchemy,
+com um pool de conexões. Por padrão, o banco é o configurado em Config.get_database_url(); qualquer URL aceita
+pelo SQLAlchemy pode ser usada, inclusive sqlite:///arquivo para uso local. Como em ArmazenamentoSQLite, os
+valores ficam apenas no banco e as chaves são indexadas.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ArmazenamentoSQL
+
+Exceções:
+    - MemoriaError
+
+Dependências:
+    - json
+    - sqlalchemy
+    - config.config
+    - core.armazenamento.base
+    - utils.exceptions
+"""
+
+import json
+from typing import Any, Iterator, List, Optional, Tuple
+from sqlalchemy import Column, Integer, MetaData, String, Table, Text, create_engine, delete, event, func, \
+    insert, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from config.config import Config
+from core.armazenamento.base import PREFIXO_EXPIRACAO, ArmazenamentoMemoria, desembrulhar
+from utils.exceptions import MemoriaError
+
+_METADADOS = MetaData()
+# A coluna id preserva a ordem de primeira gravação; a chave tem um índice único
+_TABELA = Table(
+    "memoria", _METADADOS,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("chave", String(255), nullable=False, unique=True),
+    Column("valor", Text, nullable=False),
+)
+
+class ArmazenamentoSQL(ArmazenamentoMemoria):
+    """
+    Armazenamento em banco SQL com pool de conexões. Vários processos podem compartilhar o mesmo banco.
+    """
+
+    def __init__(self, url: Optional[str] = None, tamanho_pool: int = 5, max_overflow: int = 10):
+        """
+        Conecta ao banco e cria a tabela, se necessário.
+
+        :param url: URL do banco no formato do SQLAlchemy; por padrão, Config.get_database_url()
+        :param tamanho_pool: Número de conexões mantidas abertas no pool
+        :param max_overflow: Número de conexões extras abertas sob demanda além do pool
+        :raises MemoriaError: Se o banco não puder ser acessado
+        """
+        self.url = url or Config.get_database_url()
+        try:
+            self._engine = create_engine(self.url, pool_size=tamanho_pool, max_overflow=max_overflow,
+                                         pool_pre_ping=True)
+            if self._engine.dialect.name == "sqlite":
+                event.listen(self._engine, "connect", self._configurar_sqlite)
+            _METADADOS.create_all(self._engine)
+        except (SQLAlchemyError, ImportError) as e:
+            raise MemoriaError(f"Erro ao conectar à memória SQL: {str(e)}")
+
+    @staticmethod
+    def _configurar_sqlite(conexao_dbapi, registro_conexao):
+        """Usa WAL em bancos SQLite, como ArmazenamentoSQLite, para que cada commit não exija um fsync."""
+        cursor = conexao_dbapi.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    def obter(self, chave: str, padrao: Any = None) -> Any:
+        try:
+            with self._engine.connect() as conexao:
+                texto = conexao.execute(select(_TABELA.c.valor).where(_TABELA.c.chave == chave)).scalar()
+        except SQLAlchemyError as e:
+            raise MemoriaError(f"Erro ao ler a memória SQL: {str(e)}")
+        return padrao if texto is None else json.loads(texto)
+
+    def gravar(self, chave: str, valor: Any):
+        try:
+            texto = json.dumps(valor, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            raise MemoriaError(f"Valor não serializável para a chave '{chave}': {str(e)}")
+        atualizar = update(_TABELA).where(_TABELA.c.chave == chave).values(valor=texto)
+        try:
+            with self._engine.begin() as conexao:
+                if conexao.execute(atualizar).rowcount:
+                    return
+                conexao.execute(insert(_TABELA).values(chave=chave, valor=texto))
+        except IntegrityError:
+            # Outro processo inseriu a chave entre a atualização e a inserção
+            try:
+                with self._engine.begin() as conexao:
+                    conexao.execute(atualizar)
+            except SQLAlchemyError as e:
+                raise MemoriaError(f"Erro ao gravar na memória SQL: {str(e)}")
+        except SQLAlchemyError as e:
+            raise MemoriaError(f"Erro ao gravar na memória SQL: {str(e)}")
+
+    def remover(self, chave: str) -> bool:
+        try:
+            with self._engine.begin() as conexao:
+                return conexao.execute(delete(_TABELA).where(_TABELA.c.chave == chave)).rowcount > 0
+        except SQLAlchemyError as e:
+            raise MemoriaError(f"Erro ao remover da memória SQL: {str(e)}")
+
+    def limpar(self):
+        try:
+            with self._engine.begin() as conexao:
+                conexao.execute(delete(_TABELA))
+        except SQLAlchemyError as e:
+            raise MemoriaError(f"Erro ao limpar a memória SQL: {str(e)}")
+
+    def _consultar(self, consulta) -> List[Any]:
+        try:
+            with self._engine.connect() as conexao:
+                return conexao.execute(consulta).all()
+        except SQLAlchemyError as e:
+            raise MemoriaError(f"Erro ao ler a memória SQL: {str(e)}")
+
+    def chaves(self) -> List[str]:
+        return [linha[0] for linha in self._consultar(select(_TABELA.c.chave).order_by(_TABELA.c.id))]
+
+    def chaves_recentes(self, quantidade: int) -> List[str]:
+        linhas = self._consultar(select(_TABELA.c.chave).order_by(_TABELA.c.id.desc()).limit(quantidade))
+        return [linha[0] for linha in reversed(linhas)]
+
+    def itens(self) -> Iterator[Tuple[str, Any]]:
+        for chave, texto in self.itens_codificados():
+            yield chave, json.loads(texto)
+
+    def itens_codificados(self) -> Iterator[Tuple[str, str]]:
+        try:
+            with self._engine.connect() as conexao:
+                resultado = conexao.execution_options(stream_results=True, yield_per=1000).execute(
+                    select(_TABELA.c.chave, _TABELA.c.valor).order_by(_TABELA.c.id))
+                for chave, texto in resultado:
+                    yield chave, texto
+        except SQLAlchemyError as e:
+            raise MemoriaError(f"Erro ao ler a memória SQL: {str(e)}")
+
+    def expiracoes(self) -> Iterator[Tuple[str, float]]:
+        # Compara o início do texto no banco, sem trazer os demais valores
+        inicio = func.substr(_TABELA.c.valor, 1, len(PREFIXO_EXPIRACAO))
+        for chave, texto in self._consultar(select(_TABELA.c.chave, _TABELA.c.valor)
+                                            .where(inicio == PREFIXO_EXPIRACAO).order_by(_TABELA.c.id)):
+            expira_em = desembrulhar(json.loads(texto))[1]
+            if expira_em is not None:
+                yield chave, expira_em
+
+    def chave_mais_antiga(self) -> Optional[str]:
+        linhas = self._consultar(select(_TABELA.c.chave).order_by(_TABELA.c.id).limit(1))
+        return linhas[0][0] if linhas else None
+
+    def __len__(self) -> int:
+        return self._consultar(select(func.count()).select_from(_TABELA))[0][0]
+
+    def fechar(self):
+        """Fecha as conexões do pool."""
+        self._engine.dispose()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: sqlite
+
+Este módulo implementa o ArmazenamentoSQLite, que guarda a memória em um banco SQLite em modo WAL. Os valores
+ficam apenas em disco: cada leitura é uma consulta pela chave, que é indexada, e cada escrita altera uma única
+linha, de modo que o custo das operações e o uso de memória não crescem com o número de chaves. As instruções
+SQL são constantes e reaproveitadas pelo cache de instruções preparadas do módulo sqlite3.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ArmazenamentoSQLite
+
+Exceções:
+    - MemoriaError
+
+Dependências:
+    - json
+    - sqlite3
+    - core.armazenamento.base
+    - utils.exceptions
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Iterator, List, Optional, Tuple
+from core.armazenamento.base import PREFIXO_EXPIRACAO, ArmazenamentoMemoria, desembrulhar
+from utils.exceptions import MemoriaError
+
+# A coluna id preserva a ordem de primeira gravação; a restrição UNIQUE cria o índice das chaves
+_CRIAR_TABELA = ("CREATE TABLE IF NOT EXISTS memoria ("
+                 "id INTEGER PRIMARY KEY AUTOINCREMENT, chave TEXT NOT NULL UNIQUE, valor TEXT NOT NULL)")
+_OBTER = "SELECT valor FROM memoria WHERE chave = ?"
+_ATUALIZAR = "UPDATE memoria SET valor = ? WHERE chave = ?"
+_INSERIR = "INSERT INTO memoria (chave, valor) VALUES (?, ?)"
+_REMOVER = "DELETE FROM memoria WHERE chave = ?"
+_LIMPAR = "DELETE FROM memoria"
+_CHAVES = "SELECT chave FROM memoria ORDER BY id"
+_RECENTES = "SELECT chave FROM memoria ORDER BY id DESC LIMIT ?"
+_ITENS = "SELECT chave, valor FROM memoria ORDER BY id"
+_MAIS_ANTIGA = "SELECT chave FROM memoria ORDER BY id LIMIT 1"
+_CONTAR = "SELECT COUNT(*) FROM memoria"
+# Compara o início do texto no próprio SQLite, sem trazer os demais valores
+_EXPIRACOES = "SELECT chave, valor FROM memoria WHERE substr(valor, 1, ?) = ? ORDER BY id"
+
+class ArmazenamentoSQLite(ArmazenamentoMemoria):
+    """
+    Armazenamento em SQLite (WAL), sem cópia dos valores em memória.
+    """
+
+    def __init__(self, arquivo: str):
+        """
+        Abre (ou cria) o banco.
+
+        :param arquivo: Caminho do arquivo SQLite
+        :raises MemoriaError: Se o banco não puder ser aberto
+        """
+        self.arquivo = arquivo
+        self._lock = threading.Lock()
+        try:
+            pasta = os.path.dirname(arquivo)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            self._conexao = sqlite3.connect(arquivo, check_same_thread=False, cached_statements=32)
+            self._conexao.execute("PRAGMA journal_mode=WAL")
+            self._conexao.execute("PRAGMA synchronous=NORMAL")
+            self._conexao.execute(_CRIAR_TABELA)
+            self._conexao.commit()
+            self._tamanho = self._conexao.execute(_CONTAR).fetchone()[0]
+        except (sqlite3.Error, OSError) as e:
+            raise MemoriaError(f"Erro ao abrir a memória SQLite '{arquivo}': {str(e)}")
+
+    def _executar(self, operacao):
+        """Executa uma operação com a conexão, sob o lock, convertendo erros do SQLite em MemoriaError."""
+        with self._lock:
+            try:
+                return operacao(self._conexao)
+            except sqlite3.ProgrammingError as e:
+                raise MemoriaError(f"A memória SQLite '{self.arquivo}' está fechada: {str(e)}")
+            except sqlite3.Error as e:
+                self._conexao.rollback()
+                raise MemoriaError(f"Erro na memória SQLite '{self.arquivo}': {str(e)}")
+
+    def obter(self, chave: str, padrao: Any = None) -> Any:
+        linha = self._executar(lambda conexao: conexao.execute(_OBTER, (chave,)).fetchone())
+        return padrao if linha is None else json.loads(linha[0])
+
+    def gravar(self, chave: str, valor: Any):
+        try:
+            texto = json.dumps(valor, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            raise MemoriaError(f"Valor não serializável para a chave '{chave}': {str(e)}")
+
+        def executar(conexao: sqlite3.Connection):
+            if conexao.execute(_ATUALIZAR, (texto, chave)).rowcount == 0:
+                conexao.execute(_INSERIR, (chave, texto))
+                conexao.commit()
+                self._tamanho += 1
+            else:
+                conexao.commit()
+        self._executar(executar)
+
+    def remover(self, chave: str) -> bool:
+        def executar(conexao: sqlite3.Connection) -> bool:
+            removidas = conexao.execute(_REMOVER, (chave,)).rowcount
+            conexao.commit()
+            self._tamanho -= removidas
+            return removidas > 0
+        return self._executar(executar)
+
+    def limpar(self):
+        def executar(conexao: sqlite3.Connection):
+            conexao.execute(_LIMPAR)
+            conexao.commit()
+            self._tamanho = 0
+        self._executar(executar)
+
+    def chaves(self) -> List[str]:
+        return self._executar(lambda conexao: [linha[0] for linha in conexao.execute(_CHAVES)])
+
+    def chaves_recentes(self, quantidade: int) -> List[str]:
+        linhas = self._executar(lambda conexao: conexao.execute(_RECENTES, (quantidade,)).fetchall())
+        return [linha[0] for linha in reversed(linhas)]
+
+    def itens(self) -> Iterator[Tuple[str, Any]]:
+        for chave, texto in self.itens_codificados():
+            yield chave, json.loads(texto)
+
+    def itens_codificados(self) -> Iterator[Tuple[str, str]]:
+        # Lê em blocos, sem carregar todos os valores de uma vez; uma conexão própria evita segurar o lock
+        conexao = sqlite3.connect(self.arquivo)
+        try:
+            cursor = conexao.execute(_ITENS)
+            while True:
+                linhas = cursor.fetchmany(1000)
+                if not linhas:
+                    break
+                yield from linhas
+        finally:
+            conexao.close()
+
+    def expiracoes(self) -> Iterator[Tuple[str, float]]:
+        linhas = self._executar(lambda conexao: conexao.execute(
+            _EXPIRACOES, (len(PREFIXO_EXPIRACAO), PREFIXO_EXPIRACAO)).fetchall())
+        for chave, texto in linhas:
+            expira_em = desembrulhar(json.loads(texto))[1]
+            if expira_em is not None:
+                yield chave, expira_em
+
+    def chave_mais_antiga(self) -> Optional[str]:
+        linha = self._executar(lambda conexao: conexao.execute(_MAIS_ANTIGA).fetchone())
+        return None if linha is None else linha[0]
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def sincronizar(self):
+        """Transfere o WAL para o arquivo principal do banco."""
+        self._executar(lambda conexao: conexao.execute("PRAGMA wal_checkpoint(PASSIVE)"))
+
+    def fechar(self):
+        with self._lock:
+            self._conexao.close()
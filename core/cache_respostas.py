@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: cache_respostas
+
+Este módulo implementa a classe CacheRespostas, um cache de respostas do ChatGPT em dois níveis: um LRU em
+memória na frente de um armazenamento SQLite em disco, que sobrevive a reinicializações. As entradas são
+identificadas por um hash do modelo, de max_tokens e da lista de mensagens, expiram após um tempo de vida
+configurável e são descartadas, das menos recentemente usadas para as mais recentes, quando o limite de
+tamanho é atingido.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - CacheRespostas
+
+Exceções:
+    - ChatGPTIntegrationError
+
+Dependências:
+    - hashlib
+    - json
+    - sqlite3
+    - utils.exceptions
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from utils.exceptions import ChatGPTIntegrationError
+
+def gerar_chave(modelo: str, max_tokens: int, mensagens: List[Dict[str, Any]]) -> str:
+    """
+    Calcula a chave de cache de uma requisição.
+
+    :param modelo: Nome do modelo
+    :param max_tokens: Número máximo de tokens da resposta
+    :param mensagens: Lista de mensagens enviada à API
+    :return: Hash SHA-256 em hexadecimal
+    """
+    conteudo = json.dumps([modelo, max_tokens, mensagens], ensure_ascii=False, sort_keys=True,
+                          separators=(",", ":"))
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+
+class CacheRespostas:
+    """
+    Cache de respostas com LRU em memória e persistência em SQLite.
+    """
+
+    def __init__(self, caminho: Optional[str] = None, tamanho_memoria: int = 256, tamanho_maximo: int = 10000,
+                 ttl: float = 86400.0):
+        """
+        Inicializa o cache, abrindo (ou criando) o banco em disco e descartando as entradas expiradas.
+
+        :param caminho: Caminho do arquivo SQLite; None mantém o cache apenas em memória
+        :param tamanho_memoria: Número máximo de respostas mantidas no LRU em memória
+        :param tamanho_maximo: Número máximo de respostas mantidas em disco
+        :param ttl: Tempo de vida das respostas, em segundos; 0 desativa a expiração
+        :raises ValueError: Se algum limite for inválido
+        :raises ChatGPTIntegrationError: Se o banco não puder ser aberto
+        """
+        if not isinstance(tamanho_memoria, int) or tamanho_memoria <= 0:
+            raise ValueError("tamanho_memoria deve ser um inteiro positivo")
+        if not isinstance(tamanho_maximo, int) or tamanho_maximo <= 0:
+            raise ValueError("tamanho_maximo deve ser um inteiro positivo")
+        if ttl < 0:
+            raise ValueError("ttl não pode ser negativo")
+        self.caminho = caminho
+        self.tamanho_memoria = tamanho_memoria
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl = ttl
+        self._memoria: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._acertos_memoria = 0
+        self._acertos_disco = 0
+        self._falhas = 0
+        self._conexao: Optional[sqlite3.Connection] = None
+        if caminho:
+            self._abrir(caminho)
+
+    def _abrir(self, caminho: str):
+        """Abre o banco e cria a tabela, se necessário."""
+        try:
+            pasta = os.path.dirname(caminho)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            conexao = sqlite3.connect(caminho, check_same_thread=False)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            conexao.execute("CREATE TABLE IF NOT EXISTS respostas ("
+                            "chave TEXT PRIMARY KEY, resposta TEXT NOT NULL, "
+                            "expira_em REAL NOT NULL, acessado_em REAL NOT NULL)")
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_respostas_acessado_em ON respostas (acessado_em)")
+            conexao.execute("DELETE FROM respostas WHERE expira_em > 0 AND expira_em <= ?", (time.time(),))
+            conexao.commit()
+        except (sqlite3.Error, OSError) as e:
+            raise ChatGPTIntegrationError(f"Erro ao abrir o cache de respostas '{caminho}': {str(e)}")
+        self._conexao = conexao
+
+    def _expirado(self, expira_em: float, agora: float) -> bool:
+        return 0 < expira_em <= agora
+
+    def _guardar_em_memoria(self, chave: str, resposta: str, expira_em: float):
+        self._memoria[chave] = (resposta, expira_em)
+        self._memoria.move_to_end(chave)
+        while len(self._memoria) > self.tamanho_memoria:
+            self._memoria.popitem(last=False)
+
+    def obter(self, chave: str) -> Optional[str]:
+        """
+        Procura uma resposta, primeiro em memória e depois em disco.
+
+        :param chave: Chave gerada por gerar_chave
+        :return: Resposta armazenada, ou None se não existir ou tiver expirado
+        """
+        agora = time.time()
+        with self._lock:
+            entrada = self._memoria.get(chave)
+            if entrada is not None:
+                if not self._expirado(entrada[1], agora):
+                    self._memoria.move_to_end(chave)
+                    self._acertos_memoria += 1
+                    return entrada[0]
+                del self._memoria[chave]
+
+            if self._conexao is not None:
+                linha = self._conexao.execute("SELECT resposta, expira_em FROM respostas WHERE chave = ?",
+                                              (chave,)).fetchone()
+                if linha is not None:
+                    resposta, expira_em = linha
+                    if self._expirado(expira_em, agora):
+                        self._conexao.execute("DELETE FROM respostas WHERE chave = ?", (chave,))
+                    else:
+                        self._conexao.execute("UPDATE respostas SET acessado_em = ? WHERE chave = ?",
+                                              (agora, chave))
+                        self._conexao.commit()
+                        self._guardar_em_memoria(chave, resposta, expira_em)
+                        self._acertos_disco += 1
+                        return resposta
+                    self._conexao.commit()
+
+            self._falhas += 1
+            return None
+
+    def armazenar(self, chave: str, resposta: str):
+        """
+        Armazena uma resposta em memória e em disco, descartando as menos recentemente usadas se o limite
+        de tamanho for ultrapassado.
+
+        :param chave: Chave gerada por gerar_chave
+        :param resposta: Resposta a armazenar
+        """
+        agora = time.time()
+        expira_em = agora + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._guardar_em_memoria(chave, resposta, expira_em)
+            if self._conexao is None:
+                return
+            self._conexao.execute("INSERT OR REPLACE INTO respostas (chave, resposta, expira_em, acessado_em) "
+                                  "VALUES (?, ?, ?, ?)", (chave, resposta, expira_em, agora))
+            excesso = self._conexao.execute("SELECT COUNT(*) FROM respostas").fetchone()[0] - self.tamanho_maximo
+            if excesso > 0:
+                self._conexao.execute("DELETE FROM respostas WHERE chave IN "
+                                      "(SELECT chave FROM respostas ORDER BY acessado_em LIMIT ?)", (excesso,))
+            self._conexao.commit()
+
+    def limpar(self):
+        """Remove todas as respostas e zera as estatísticas."""
+        with self._lock:
+            self._memoria.clear()
+            if self._conexao is not None:
+                self._conexao.execute("DELETE FROM respostas")
+                self._conexao.commit()
+            self._acertos_memoria = self._acertos_disco = self._falhas = 0
+
+    def fechar(self):
+        """Fecha a conexão com o banco. O cache continua funcionando apenas em memória."""
+        with self._lock:
+            if self._conexao is not None:
+                self._conexao.close()
+                self._conexao = None
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas de uso do cache.
+
+        :return: Dicionário com acertos em memória e em disco, falhas, taxa de acerto e tamanhos
+        """
+        with self._lock:
+            acertos = self._acertos_memoria + self._acertos_disco
+            total = acertos + self._falhas
+            tamanho_disco = (self._conexao.execute("SELECT COUNT(*) FROM respostas").fetchone()[0]
+                             if self._conexao is not None else 0)
+            return {
+                "acertos_memoria": self._acertos_memoria,
+                "acertos_disco": self._acertos_disco,
+                "falhas": self._falhas,
+                "taxa_acerto": acertos / total if total else 0.0,
+                "tamanho_memoria": len(self._memoria),
+                "tamanho_disco": tamanho_disco,
+                "tamanho_maximo": self.tamanho_maximo
+            }
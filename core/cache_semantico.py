@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: cache_semantico
+
+Este módulo implementa a classe CacheSemantico, um cache de respostas que reconhece prompts quase idênticos,
+como "Qual é a capital da França?" e "qual a capital da frança". Cada prompt é reduzido às suas palavras de
+conteúdo, normalizadas (minúsculas, sem acentos e sem pontuação) e na ordem original; artigos, preposições e
+outras palavras funcionais são descartados. Dois prompts se equivalem quando essa forma canônica é a mesma, e a
+busca é uma consulta a um dicionário indexado por ela.
+
+Prompts que diferem nos números que contêm ("2 + 2" e "2 + 3"), em um termo ("café" e "chá") ou na ordem dos
+termos ("converter string em inteiro" e "converter inteiro em string") têm formas canônicas diferentes e nunca
+são considerados equivalentes.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - CacheSemantico
+
+Dependências:
+    - core.language_model.lexico_sentimento
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from core.language_model.lexico_sentimento import tokenizar
+
+# Palavras funcionais, já normalizadas, ignoradas na comparação das palavras de conteúdo. Negações e
+# conjunções como "ou" e "sem" não estão na lista, pois mudam o sentido do prompt.
+PALAVRAS_FUNCIONAIS = frozenset("""
+    o a os as um uma uns umas de do da dos das em no na nos nas num numa ao aos por pelo pela pelos pelas
+    para pra com e que se me te lhe eh
+""".split())
+
+def forma_canonica(texto: str) -> str:
+    """
+    Reduz o texto às suas palavras de conteúdo normalizadas, na ordem original.
+
+    :param texto: Texto a reduzir
+    :return: Palavras de conteúdo separadas por espaço (vazio, se o texto não tiver nenhuma)
+    """
+    return " ".join(token for token in tokenizar(texto) if token not in PALAVRAS_FUNCIONAIS)
+
+class CacheSemantico:
+    """
+    Cache de respostas indexado pela forma canônica dos prompts.
+    """
+
+    def __init__(self, tamanho_maximo: int = 10000):
+        """
+        Inicializa um cache vazio.
+
+        :param tamanho_maximo: Número máximo de entradas por contexto; ao atingi-lo, as mais antigas são
+                               substituídas
+        :raises ValueError: Se tamanho_maximo não for um inteiro positivo
+        """
+        if not isinstance(tamanho_maximo, int) or tamanho_maximo <= 0:
+            raise ValueError("tamanho_maximo deve ser um inteiro positivo")
+        self.tamanho_maximo = tamanho_maximo
+        self._contextos: Dict[Any, "OrderedDict[str, str]"] = {}
+        self._lock = threading.Lock()
+        self._acertos = 0
+        self._falhas = 0
+
+    def __len__(self) -> int:
+        return sum(len(entradas) for entradas in self._contextos.values())
+
+    def obter(self, prompt: str, contexto: Any = None) -> Optional[str]:
+        """
+        Procura a resposta de um prompt equivalente.
+
+        :param prompt: Prompt consultado
+        :param contexto: Identificador do contexto (por exemplo, modelo e max_tokens)
+        :return: Resposta do prompt armazenado com as mesmas palavras de conteúdo, na mesma ordem; senão None
+        """
+        chave = forma_canonica(prompt)
+        with self._lock:
+            entradas = self._contextos.get(contexto)
+            resposta = entradas.get(chave) if entradas is not None and chave else None
+            if resposta is not None:
+                self._acertos += 1
+            else:
+                self._falhas += 1
+            return resposta
+
+    def armazenar(self, prompt: str, resposta: str, contexto: Any = None):
+        """
+        Armazena a resposta de um prompt.
+
+        :param prompt: Prompt respondido
+        :param resposta: Resposta a armazenar
+        :param contexto: Identificador do contexto (por exemplo, modelo e max_tokens)
+        """
+        chave = forma_canonica(prompt)
+        if not chave:
+            return
+        with self._lock:
+            entradas = self._contextos.setdefault(contexto, OrderedDict())
+            entradas.pop(chave, None)
+            entradas[chave] = resposta
+            if len(entradas) > self.tamanho_maximo:
+                entradas.popitem(last=False)
+
+    def limpar(self):
+        """Remove todas as entradas e zera as estatísticas."""
+        with self._lock:
+            self._contextos.clear()
+            self._acertos = self._falhas = 0
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas de uso do cache.
+
+        :return: Dicionário com acertos, falhas, taxa de acerto e número de entradas
+        """
+        with self._lock:
+            total = self._acertos + self._falhas
+            return {
+                "acertos": self._acertos,
+                "falhas": self._falhas,
+                "taxa_acerto": self._acertos / total if total else 0.0,
+                "tamanho": len(self)
+            }
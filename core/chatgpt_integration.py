@@ -4,7 +4,12 @@ Módulo: chatgpt_integration
 
 Este módulo fornece a classe ChatGPTIntegration, que facilita a integração com a API do OpenAI ChatGPT.
 Ele permite a geração de respostas automáticas baseadas em prompts de entrada, utilizando o modelo GPT-3.5-turbo
-ou outro modelo especificado.
+ou outro modelo especificado. Respostas podem ser reaproveitadas por meio de um CacheRespostas opcional, para
+prompts idênticos, e de um CacheSemantico opcional, para prompts quase idênticos. Requisições idênticas feitas ao
+mesmo tempo são enviadas à API uma única vez. Uma interface assíncrona permite gerar respostas para muitos prompts em
+paralelo, com concorrência limitada. Todas as chamadas passam por um ExecutorResiliente, que limita a taxa, retenta
+erros transitórios e interrompe as chamadas quando a API está instável. As conexões HTTP são compartilhadas entre
+instâncias e lotes, e mantidas nas trocas de chave.
 
 Autor: Stefano Gysin - StefanoGysin@hotmail.com
 Data: 15/10/2024 13:11 (horário de Zurique)
@@ -14,69 +19,399 @@ Classes:
 
 Exceções:
     - ChatGPTIntegrationError
+    - CircuitoAbertoError
 
 Dependências:
+    - asyncio
+    - httpx
     - openai
+    - config.config
+    - core.cache_respostas
+    - core.cache_semantico
+    - core.cliente_http
+    - core.coalescencia
+    - core.resiliencia
     - utils.logger
     - utils.exceptions
 """
 
+import asyncio
+import threading
+import weakref
+import httpx
 import openai
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from config.config import Config
+from core.cache_respostas import CacheRespostas, gerar_chave
+from core.cache_semantico import CacheSemantico
+from core.cliente_http import executar_async, obter_cliente_http, obter_cliente_http_async
+from core.coalescencia import Coalescedor, CoalescedorAsync
+from core.resiliencia import ExecutorResiliente, estimar_tokens
 from utils.logger import configurar_logger
-from utils.exceptions import ChatGPTIntegrationError
+from utils.exceptions import ChatGPTIntegrationError, CircuitoAbertoError
 
 # Define constantes para o modelo e tokens
 MODEL_ENGINE = "gpt-3.5-turbo"
 DEFAULT_MAX_TOKENS = 150
 
 class ChatGPTIntegration:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[CacheRespostas] = None,
+                 cache_semantico: Optional[CacheSemantico] = None,
+                 resiliencia: Optional[ExecutorResiliente] = None,
+                 http_client: Optional[httpx.Client] = None):
         """
         Inicializa a integração com o ChatGPT, configurando a chave da API e o logger.
 
         :param api_key: Chave da API fornecida pela OpenAI para autenticação
+        :param cache: Cache de respostas consultado antes de chamar a API; None desativa o cache
+        :param cache_semantico: Cache de prompts similares, consultado quando o cache exato não tem a resposta;
+                                None o desativa
+        :param resiliencia: Executor com limite de taxa, retentativas e disjuntor; por padrão, criado a partir
+                            de Config
+        :param http_client: Cliente HTTP usado nas chamadas síncronas; por padrão, o cliente compartilhado
+                            de core.cliente_http
         """
-        self.client = openai.OpenAI(api_key=api_key)
+        self.api_key = api_key
+        self._lock_chave = threading.Lock()
+        # As retentativas são feitas pelo ExecutorResiliente, não pelo cliente da OpenAI
+        self.client = openai.OpenAI(api_key=api_key, base_url=Config.OPENAI_BASE_URL, max_retries=0,
+                                    http_client=http_client or obter_cliente_http())
+        # Um cliente assíncrono por laço de eventos, pois as conexões ficam presas ao laço em que foram abertas,
+        # guardado com o cliente HTTP sobre o qual foi criado
+        self._clientes_async: \
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[openai.AsyncOpenAI, httpx.AsyncClient]]" = \
+            weakref.WeakKeyDictionary()
+        self.cache = cache
+        self.cache_semantico = cache_semantico
+        self.resiliencia = resiliencia or ExecutorResiliente.de_config()
+        # Chamadas idênticas e simultâneas à API são feitas uma única vez e compartilham a resposta
+        self.coalescedor = Coalescedor()
+        self.coalescedor_async = CoalescedorAsync()
         self.logger = configurar_logger("chatgpt_integration")
 
-    def gerar_resposta(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> str:
+    def _consultar_cache(self, chave: str) -> Optional[str]:
+        """Consulta o cache; falhas do cache são registradas e tratadas como ausência da resposta."""
+        try:
+            return self.cache.obter(chave)
+        except Exception as e:
+            self.logger.warning("Erro ao consultar o cache de respostas: %s", e)
+            return None
+
+    def _armazenar_cache(self, chave: str, resposta: str):
+        """Armazena a resposta no cache; falhas do cache são apenas registradas."""
+        try:
+            self.cache.armazenar(chave, resposta)
+        except Exception as e:
+            self.logger.warning("Erro ao armazenar no cache de respostas: %s", e)
+
+    def _validar_parametros(self, prompt: str, max_tokens: int):
+        """Valida o prompt e max_tokens, levantando ValueError se forem inválidos."""
+        if not prompt.strip():
+            raise ValueError("O prompt não pode ser vazio")
+        
+        if not isinstance(max_tokens, int) or max_tokens <= 0:
+            raise ValueError("max_tokens deve ser um inteiro positivo")
+
+    @staticmethod
+    def _montar_mensagens(prompt: str, contexto: Optional[Sequence[Dict[str, str]]]) -> List[Dict[str, str]]:
+        """Monta as mensagens da requisição: as mensagens de contexto seguidas do prompt do usuário."""
+        return [*(contexto or ()), {"role": "user", "content": prompt}]
+
+    @staticmethod
+    def _contexto_semantico(max_tokens: int, mensagens: List[Dict[str, str]]) -> Tuple:
+        """
+        Contexto usado no cache semântico: prompts similares só compartilham a resposta se as mensagens que os
+        precedem forem idênticas.
+        """
+        if len(mensagens) == 1:
+            return (MODEL_ENGINE, max_tokens)
+        return (MODEL_ENGINE, max_tokens, gerar_chave(MODEL_ENGINE, max_tokens, mensagens[:-1]))
+
+    def _buscar_em_cache(self, prompt: str, max_tokens: int, mensagens: List[Dict[str, str]],
+                         usar_cache: bool) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Procura a resposta no cache exato e depois no semântico.
+
+        :return: Par (resposta encontrada ou None, chave do cache exato ou None se ele não for usado)
+        """
+        if not usar_cache:
+            return None, None
+        chave = None
+        if self.cache is not None:
+            chave = gerar_chave(MODEL_ENGINE, max_tokens, mensagens)
+            resposta = self._consultar_cache(chave)
+            if resposta is not None:
+                self.logger.info("Resposta obtida do cache para prompt: %.50s...", prompt)
+                return resposta, chave
+        if self.cache_semantico is not None:
+            resposta = self.cache_semantico.obter(prompt, self._contexto_semantico(max_tokens, mensagens))
+            if resposta is not None:
+                self.logger.info("Resposta obtida do cache semântico para prompt: %.50s...", prompt)
+                if chave is not None:
+                    self._armazenar_cache(chave, resposta)
+                return resposta, chave
+        return None, chave
+
+    def _guardar_em_cache(self, prompt: str, max_tokens: int, mensagens: List[Dict[str, str]], resposta: str,
+                          chave: Optional[str], usar_cache: bool):
+        """Guarda uma resposta nova nos caches ativos."""
+        if not usar_cache:
+            return
+        if chave is not None:
+            self._armazenar_cache(chave, resposta)
+        if self.cache_semantico is not None:
+            self.cache_semantico.armazenar(prompt, resposta, self._contexto_semantico(max_tokens, mensagens))
+
+    @staticmethod
+    def _extrair_resposta(response: Any) -> str:
+        """Extrai o texto da resposta da API, levantando ChatGPTIntegrationError se ele for vazio."""
+        resposta = response.choices[0].message.content.strip()
+        if not resposta:
+            raise ChatGPTIntegrationError("A API retornou uma resposta vazia")
+        return resposta
+
+    def gerar_resposta(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS, usar_cache: bool = True,
+                       contexto: Optional[Sequence[Dict[str, str]]] = None) -> str:
         """
         Gera uma resposta para um dado prompt usando a API do ChatGPT.
 
         :param prompt: Texto de entrada para o qual se deseja uma resposta
         :param max_tokens: Número máximo de tokens na resposta gerada
+        :param usar_cache: Se False, ignora o cache e sempre chama a API (a nova resposta não é armazenada)
+        :param contexto: Mensagens enviadas antes do prompt, como instruções de sistema e turnos anteriores
         :return: Resposta gerada pelo ChatGPT
         :raises ValueError: Se o prompt for vazio ou max_tokens não for um inteiro positivo
         :raises ChatGPTIntegrationError: Se ocorrer um erro durante a geração da resposta
         """
-        if not prompt.strip():
-            raise ValueError("O prompt não pode ser vazio")
-        
-        if not isinstance(max_tokens, int) or max_tokens <= 0:
-            raise ValueError("max_tokens deve ser um inteiro positivo")
-        
+        self._validar_parametros(prompt, max_tokens)
+        mensagens = self._montar_mensagens(prompt, contexto)
+        resposta, chave = self._buscar_em_cache(prompt, max_tokens, mensagens, usar_cache)
+        if resposta is not None:
+            return resposta
+
+        try:
+            self.logger.info("Gerando resposta para prompt: %.50s...", prompt)
+
+            def solicitar() -> str:
+                response = self.resiliencia.executar(lambda: self.client.chat.completions.create(
+                    model=MODEL_ENGINE,
+                    messages=mensagens,
+                    max_tokens=max_tokens
+                ), estimar_tokens(mensagens, max_tokens))
+                resposta = self._extrair_resposta(response)
+                self._guardar_em_cache(prompt, max_tokens, mensagens, resposta, chave, usar_cache)
+                return resposta
+
+            return self.coalescedor.executar(chave or gerar_chave(MODEL_ENGINE, max_tokens, mensagens), solicitar)
+        except CircuitoAbertoError as e:
+            self.logger.warning("Chamada rejeitada: %s", e)
+            raise
+        except Exception as e:
+            self.logger.error("Erro ao gerar resposta: %s", e)
+            raise ChatGPTIntegrationError(f"Erro ao gerar resposta: {str(e)}")
+        finally:
+            self.logger.info("Operação de geração de resposta concluída")
+
+    def gerar_resposta_stream(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS, usar_cache: bool = True,
+                              contexto: Optional[Sequence[Dict[str, str]]] = None) -> Iterator[str]:
+        """
+        Gera uma resposta para um dado prompt usando a API do ChatGPT em modo streaming, devolvendo os trechos
+        do texto à medida que chegam. Uma resposta encontrada em cache é devolvida em um único trecho.
+
+        :param prompt: Texto de entrada para o qual se deseja uma resposta
+        :param max_tokens: Número máximo de tokens na resposta gerada
+        :param usar_cache: Se False, ignora o cache e sempre chama a API (a nova resposta não é armazenada)
+        :param contexto: Mensagens enviadas antes do prompt, como instruções de sistema e turnos anteriores
+        :return: Iterador de trechos da resposta
+        :raises ValueError: Se o prompt for vazio ou max_tokens não for um inteiro positivo (levantado na chamada)
+        :raises ChatGPTIntegrationError: Se ocorrer um erro durante a geração da resposta (levantado durante a
+                                         iteração)
+        """
+        self._validar_parametros(prompt, max_tokens)
+        return self._trechos_resposta(prompt, max_tokens, usar_cache, self._montar_mensagens(prompt, contexto))
+
+    def _trechos_resposta(self, prompt: str, max_tokens: int, usar_cache: bool,
+                          mensagens: List[Dict[str, str]]) -> Iterator[str]:
+        """Gerador usado por gerar_resposta_stream."""
+        resposta, chave = self._buscar_em_cache(prompt, max_tokens, mensagens, usar_cache)
+        if resposta is not None:
+            yield resposta
+            return
+
+        trechos: List[str] = []
         try:
-            self.logger.info(f"Gerando resposta para prompt: {prompt[:50]}...")
-            response = self.client.chat.completions.create(
+            self.logger.info("Gerando resposta em streaming para prompt: %.50s...", prompt)
+            # Só a abertura do stream é retentada; uma falha no meio da resposta é repassada
+            stream = self.resiliencia.executar(lambda: self.client.chat.completions.create(
                 model=MODEL_ENGINE,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens
-            )
-            resposta = response.choices[0].message.content.strip()
+                messages=mensagens,
+                max_tokens=max_tokens,
+                stream=True
+            ), estimar_tokens(mensagens, max_tokens))
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                trecho = chunk.choices[0].delta.content
+                if trecho:
+                    # Espaços iniciais são descartados, como o strip() de gerar_resposta
+                    if not trechos:
+                        trecho = trecho.lstrip()
+                        if not trecho:
+                            continue
+                    trechos.append(trecho)
+                    yield trecho
+            resposta = "".join(trechos).strip()
             if not resposta:
                 raise ChatGPTIntegrationError("A API retornou uma resposta vazia")
-            return resposta
+            self._guardar_em_cache(prompt, max_tokens, mensagens, resposta, chave, usar_cache)
+        except CircuitoAbertoError as e:
+            self.logger.warning("Chamada rejeitada: %s", e)
+            raise
         except Exception as e:
-            self.logger.error(f"Erro ao gerar resposta: {str(e)}")
+            self.logger.error("Erro ao gerar resposta em streaming: %s", e)
             raise ChatGPTIntegrationError(f"Erro ao gerar resposta: {str(e)}")
         finally:
-            self.logger.info("Operação de geração de resposta concluída")
+            self.logger.info("Operação de geração de resposta em streaming concluída")
+
+    @property
+    def client_async(self) -> openai.AsyncOpenAI:
+        """
+        Cliente assíncrono do laço de eventos em execução, criado no primeiro uso em cada laço sobre o cliente
+        HTTP assíncrono compartilhado desse laço, e recriado se esse cliente HTTP tiver sido fechado e substituído.
+
+        :raises RuntimeError: Se não houver um laço de eventos em execução
+        """
+        laco = asyncio.get_running_loop()
+        cliente_http = obter_cliente_http_async()
+        with self._lock_chave:
+            guardado = self._clientes_async.get(laco)
+            if guardado is not None and guardado[1] is cliente_http:
+                return guardado[0]
+            cliente = openai.AsyncOpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL, max_retries=0,
+                                         http_client=cliente_http)
+            self._clientes_async[laco] = (cliente, cliente_http)
+            return cliente
+
+    async def gerar_resposta_async(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS, usar_cache: bool = True,
+                                   cliente: Optional[openai.AsyncOpenAI] = None) -> str:
+        """
+        Versão assíncrona de gerar_resposta.
+
+        :param prompt: Texto de entrada para o qual se deseja uma resposta
+        :param max_tokens: Número máximo de tokens na resposta gerada
+        :param usar_cache: Se False, ignora o cache e sempre chama a API (a nova resposta não é armazenada)
+        :param cliente: Cliente assíncrono a usar; por padrão, client_async
+        :return: Resposta gerada pelo ChatGPT
+        :raises ValueError: Se o prompt for vazio ou max_tokens não for um inteiro positivo
+        :raises ChatGPTIntegrationError: Se ocorrer um erro durante a geração da resposta
+        """
+        self._validar_parametros(prompt, max_tokens)
+        mensagens = [{"role": "user", "content": prompt}]
+        resposta, chave = self._buscar_em_cache(prompt, max_tokens, mensagens, usar_cache)
+        if resposta is not None:
+            return resposta
+
+        try:
+            self.logger.debug("Gerando resposta assíncrona para prompt: %.50s...", prompt)
+            cliente = cliente or self.client_async
+
+            async def solicitar() -> str:
+                response = await self.resiliencia.executar_async(lambda: cliente.chat.completions.create(
+                    model=MODEL_ENGINE,
+                    messages=mensagens,
+                    max_tokens=max_tokens
+                ), estimar_tokens(mensagens, max_tokens))
+                resposta = self._extrair_resposta(response)
+                self._guardar_em_cache(prompt, max_tokens, mensagens, resposta, chave, usar_cache)
+                return resposta
+
+            return await self.coalescedor_async.executar(chave or gerar_chave(MODEL_ENGINE, max_tokens, mensagens),
+                                                         solicitar)
+        except CircuitoAbertoError as e:
+            self.logger.warning("Chamada rejeitada: %s", e)
+            raise
+        except Exception as e:
+            self.logger.error("Erro ao gerar resposta: %s", e)
+            raise ChatGPTIntegrationError(f"Erro ao gerar resposta: {str(e)}")
+
+    async def gerar_respostas_lote_async(self, prompts: Sequence[str], concorrencia: Optional[int] = None,
+                                         max_tokens: int = DEFAULT_MAX_TOKENS,
+                                         usar_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Gera respostas para vários prompts em paralelo, com no máximo concorrencia requisições simultâneas.
+
+        :param prompts: Prompts a responder
+        :param concorrencia: Número máximo de requisições simultâneas; por padrão, Config.CHATGPT_CONCORRENCIA
+        :param max_tokens: Número máximo de tokens em cada resposta
+        :param usar_cache: Se False, ignora o cache e sempre chama a API
+        :return: Um dicionário por prompt, na mesma ordem, com as chaves "resposta" (None em caso de erro) e
+                 "erro" (a exceção ocorrida, ou None)
+        :raises ValueError: Se concorrencia não for um inteiro positivo
+        """
+        if concorrencia is None:
+            concorrencia = Config.CHATGPT_CONCORRENCIA
+        if not isinstance(concorrencia, int) or concorrencia <= 0:
+            raise ValueError("concorrencia deve ser um inteiro positivo")
+
+        semaforo = asyncio.Semaphore(concorrencia)
+        cliente = self.client_async
+
+        async def gerar(prompt: str) -> Dict[str, Any]:
+            async with semaforo:
+                try:
+                    resposta = await self.gerar_resposta_async(prompt, max_tokens, usar_cache, cliente)
+                    return {"resposta": resposta, "erro": None}
+                except (ValueError, ChatGPTIntegrationError) as e:
+                    return {"resposta": None, "erro": e}
+
+        self.logger.info("Gerando %d respostas com concorrência %d", len(prompts), concorrencia)
+        resultados = await asyncio.gather(*(gerar(prompt) for prompt in prompts))
+        erros = sum(resultado["erro"] is not None for resultado in resultados)
+        self.logger.info("Lote concluído: %d respostas, %d erros", len(resultados) - erros, erros)
+        return resultados
+
+    def gerar_respostas_lote(self, prompts: Sequence[str], concorrencia: Optional[int] = None,
+                             max_tokens: int = DEFAULT_MAX_TOKENS, usar_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Versão bloqueante de gerar_respostas_lote_async, para uso fora de um laço de eventos. O lote é executado
+        no laço de eventos compartilhado de core.cliente_http, de modo que lotes seguidos reaproveitam as conexões.
+
+        :param prompts: Prompts a responder
+        :param concorrencia: Número máximo de requisições simultâneas; por padrão, Config.CHATGPT_CONCORRENCIA
+        :param max_tokens: Número máximo de tokens em cada resposta
+        :param usar_cache: Se False, ignora o cache e sempre chama a API
+        :return: Um dicionário por prompt, na mesma ordem, com as chaves "resposta" e "erro"
+        :raises ValueError: Se concorrencia não for um inteiro positivo
+        """
+        return executar_async(self.gerar_respostas_lote_async(prompts, concorrencia, max_tokens, usar_cache))
+
+    def estatisticas_resiliencia(self) -> Dict[str, Any]:
+        """
+        Retorna os contadores do limitador de taxa, das retentativas e do disjuntor.
+
+        :return: Dicionário com as estatísticas de ExecutorResiliente
+        """
+        return self.resiliencia.estatisticas()
+
+    def estatisticas_coalescencia(self) -> Dict[str, Dict[str, int]]:
+        """
+        Retorna os contadores de chamadas à API executadas e coalescidas.
+
+        :return: Dicionário com as estatísticas dos caminhos "sincrono" e "assincrono"
+        """
+        return {"sincrono": self.coalescedor.estatisticas(), "assincrono": self.coalescedor_async.estatisticas()}
 
     def atualizar_api_key(self, nova_chave: str):
         """
-        Atualiza a chave da API usada para autenticação.
+        Atualiza a chave da API usada para autenticação. Apenas as credenciais mudam: os novos clientes, síncrono
+        e assíncronos, reaproveitam os clientes HTTP, e portanto as conexões abertas, dos anteriores. Chamadas em
+        andamento terminam com a chave antiga; as seguintes usam a nova.
 
         :param nova_chave: A nova chave da API a ser configurada
         """
-        self.client = openai.OpenAI(api_key=nova_chave)
+        with self._lock_chave:
+            self.api_key = nova_chave
+            self.client = self.client.with_options(api_key=nova_chave)
+            for laco, (cliente, cliente_http) in list(self._clientes_async.items()):
+                self._clientes_async[laco] = (cliente.with_options(api_key=nova_chave), cliente_http)
         self.logger.info("Chave da API atualizada com sucesso")
\ No newline at end of file
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: cliente_http
+
+Este módulo mantém o cliente HTTP compartilhado pelos clientes da OpenAI. O pool de conexões, com keep-alive
+e HTTP/2 quando o pacote h2 está instalado, é criado uma única vez por processo. Assim, as instâncias de
+ChatGPTIntegration e as trocas de chave da API reaproveitam as conexões já abertas, sem repetir o handshake
+TCP/TLS. Como as conexões assíncronas ficam presas ao laço de eventos em que foram abertas, há um cliente
+assíncrono compartilhado por laço, e as chamadas assíncronas feitas a partir de código síncrono são executadas
+em um laço de eventos compartilhado, mantido em uma thread própria, para que as conexões sobrevivam entre elas.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Funções:
+    - http2_disponivel
+    - obter_cliente_http
+    - obter_cliente_http_async
+    - executar_async
+    - fechar_cliente_http_async
+    - fechar_cliente_http
+
+Dependências:
+    - asyncio
+    - httpx
+    - openai
+    - config.config
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import threading
+import weakref
+import httpx
+import openai
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+from config.config import Config
+
+T = TypeVar("T")
+
+_cliente: Optional[httpx.Client] = None
+# Cliente assíncrono de cada laço de eventos; a entrada some quando o laço é coletado
+_clientes_async: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+    weakref.WeakKeyDictionary()
+_laco: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+def http2_disponivel() -> bool:
+    """
+    Indica se o HTTP/2 está ativado em Config e se o pacote h2, exigido pelo httpx para HTTP/2, está instalado.
+
+    :return: True se o HTTP/2 pode ser usado
+    """
+    return Config.CHATGPT_HTTP2 and importlib.util.find_spec("h2") is not None
+
+def _parametros() -> Dict[str, Any]:
+    """Limites do pool e tempos de espera definidos em Config."""
+    return dict(
+        limits=httpx.Limits(max_connections=Config.CHATGPT_HTTP_MAX_CONEXOES,
+                            max_keepalive_connections=Config.CHATGPT_HTTP_MAX_CONEXOES_OCIOSAS,
+                            keepalive_expiry=Config.CHATGPT_HTTP_KEEPALIVE),
+        timeout=openai.Timeout(Config.CHATGPT_TIMEOUT, connect=Config.CHATGPT_TIMEOUT_CONEXAO),
+        http2=http2_disponivel(),
+    )
+
+def obter_cliente_http() -> httpx.Client:
+    """
+    Retorna o cliente HTTP síncrono compartilhado, criando-o na primeira chamada.
+
+    :return: Cliente httpx configurado com os padrões da OpenAI e os limites de Config
+    """
+    global _cliente
+    with _lock:
+        if _cliente is None or _cliente.is_closed:
+            _cliente = openai.DefaultHttpxClient(**_parametros())
+        return _cliente
+
+def obter_cliente_http_async() -> httpx.AsyncClient:
+    """
+    Retorna o cliente HTTP assíncrono compartilhado do laço de eventos em execução, criando-o no primeiro uso
+    nesse laço.
+
+    :return: Cliente httpx assíncrono configurado com os padrões da OpenAI e os limites de Config
+    :raises RuntimeError: Se não houver um laço de eventos em execução
+    """
+    laco = asyncio.get_running_loop()
+    with _lock:
+        cliente = _clientes_async.get(laco)
+        if cliente is None or cliente.is_closed:
+            cliente = _clientes_async[laco] = openai.DefaultAsyncHttpxClient(**_parametros())
+        return cliente
+
+def _executar_laco(laco: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(laco)
+    laco.run_forever()
+    laco.close()
+
+def executar_async(corrotina: Awaitable[T]) -> T:
+    """
+    Executa uma corrotina no laço de eventos compartilhado, iniciado na primeira chamada em uma thread própria,
+    e espera o resultado. Ao contrário de asyncio.run, o laço e as conexões abertas nele são mantidos entre as
+    chamadas. Pode ser chamada de várias threads ao mesmo tempo.
+
+    :param corrotina: Corrotina a executar
+    :return: Resultado da corrotina
+    """
+    global _laco
+    with _lock:
+        if _laco is None:
+            _laco = asyncio.new_event_loop()
+            threading.Thread(target=_executar_laco, args=(_laco,), name="cliente_http_async", daemon=True).start()
+        laco = _laco
+    return asyncio.run_coroutine_threadsafe(corrotina, laco).result()
+
+async def fechar_cliente_http_async():
+    """Fecha o cliente assíncrono do laço de eventos em execução e suas conexões, se ele existir."""
+    with _lock:
+        cliente = _clientes_async.pop(asyncio.get_running_loop(), None)
+    if cliente is not None:
+        await cliente.aclose()
+
+def fechar_cliente_http():
+    """
+    Fecha o cliente compartilhado e suas conexões, e encerra o laço de eventos compartilhado junto com o seu
+    cliente assíncrono. Registrada com atexit.
+    """
+    global _cliente, _laco
+    with _lock:
+        if _cliente is not None:
+            _cliente.close()
+            _cliente = None
+        laco, _laco = _laco, None
+    if laco is not None:
+        asyncio.run_coroutine_threadsafe(fechar_cliente_http_async(), laco).result()
+        laco.call_soon_threadsafe(laco.stop)
+
+atexit.register(fechar_cliente_http)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: coalescencia
+
+Este módulo implementa a coalescência de chamadas idênticas em andamento ("single-flight"): enquanto uma
+chamada para uma chave está em execução, chamadas concorrentes com a mesma chave aguardam o resultado dela em
+vez de repetir o trabalho. O resultado, ou a exceção, é entregue a todas. Nada é guardado depois que a chamada
+termina; o reaproveitamento de resultados concluídos é papel dos caches.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - Coalescedor
+    - CoalescedorAsync
+
+Dependências:
+    - asyncio
+    - threading
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+class _ChamadaEmAndamento:
+    """Resultado compartilhado de uma chamada em execução."""
+
+    __slots__ = ("concluida", "resultado", "erro")
+
+    def __init__(self):
+        self.concluida = threading.Event()
+        self.resultado: Any = None
+        self.erro: BaseException = None
+
+class Coalescedor:
+    """
+    Coalescência de chamadas para código baseado em threads.
+    """
+
+    def __init__(self):
+        """Inicializa o coalescedor sem chamadas em andamento."""
+        self._em_andamento: Dict[Hashable, _ChamadaEmAndamento] = {}
+        self._lock = threading.Lock()
+        self._executadas = 0
+        self._coalescidas = 0
+
+    def executar(self, chave: Hashable, funcao: Callable[[], Any]) -> Any:
+        """
+        Executa a função, a menos que outra thread já esteja executando uma chamada com a mesma chave; nesse
+        caso, aguarda e devolve o resultado dela.
+
+        :param chave: Identificador das chamadas equivalentes
+        :param funcao: Função sem argumentos que produz o resultado
+        :return: Resultado da função
+        :raises Exception: A exceção levantada pela função, repassada a todas as chamadas coalescidas
+        """
+        with self._lock:
+            chamada = self._em_andamento.get(chave)
+            lider = chamada is None
+            if lider:
+                chamada = self._em_andamento[chave] = _ChamadaEmAndamento()
+                self._executadas += 1
+            else:
+                self._coalescidas += 1
+
+        if not lider:
+            chamada.concluida.wait()
+            if chamada.erro is not None:
+                raise chamada.erro
+            return chamada.resultado
+
+        try:
+            chamada.resultado = funcao()
+            return chamada.resultado
+        except BaseException as e:
+            chamada.erro = e
+            raise
+        finally:
+            with self._lock:
+                del self._em_andamento[chave]
+            chamada.concluida.set()
+
+    def estatisticas(self) -> Dict[str, int]:
+        """
+        Retorna os contadores do coalescedor.
+
+        :return: Dicionário com chamadas executadas, chamadas coalescidas e chamadas em andamento
+        """
+        with self._lock:
+            return {"executadas": self._executadas, "coalescidas": self._coalescidas,
+                    "em_andamento": len(self._em_andamento)}
+
+class CoalescedorAsync:
+    """
+    Coalescência de corrotinas. Cada laço de eventos tem suas próprias chamadas em andamento, pois uma tarefa
+    só pode ser aguardada no laço em que foi criada.
+    """
+
+    def __init__(self):
+        """Inicializa o coalescedor sem chamadas em andamento."""
+        self._em_andamento: Dict[Tuple[int, Hashable], asyncio.Task] = {}
+        self._executadas = 0
+        self._coalescidas = 0
+
+    async def executar(self, chave: Hashable, funcao: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Aguarda a corrotina produzida pela função, a menos que uma chamada com a mesma chave já esteja em
+        andamento neste laço de eventos; nesse caso, aguarda o resultado dela.
+
+        :param chave: Identificador das chamadas equivalentes
+        :param funcao: Função sem argumentos que retorna a corrotina a executar
+        :return: Resultado da corrotina
+        :raises Exception: A exceção levantada pela corrotina, repassada a todas as chamadas coalescidas
+        """
+        identificador = (id(asyncio.get_running_loop()), chave)
+        tarefa = self._em_andamento.get(identificador)
+        if tarefa is None:
+            tarefa = asyncio.ensure_future(funcao())
+            self._em_andamento[identificador] = tarefa
+            tarefa.add_done_callback(lambda _: self._em_andamento.pop(identificador, None))
+            self._executadas += 1
+        else:
+            self._coalescidas += 1
+        # shield: o cancelamento de quem aguarda não cancela a chamada compartilhada com as demais
+        return await asyncio.shield(tarefa)
+
+    def estatisticas(self) -> Dict[str, int]:
+        """
+        Retorna os contadores do coalescedor.
+
+        :return: Dicionário com chamadas executadas, chamadas coalescidas e chamadas em andamento
+        """
+        return {"executadas": self._executadas, "coalescidas": self._coalescidas,
+                "em_andamento": len(self._em_andamento)}
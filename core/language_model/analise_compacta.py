@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: analise_compacta
+
+Este módulo implementa a classe AnaliseCompacta, uma representação compacta do resultado de
+ModeloLinguagem.processar_texto. Em vez de copiar cada token como string em várias listas, ela guarda o texto
+original, os deslocamentos de tokens e entidades em arrays de inteiros e as classes gramaticais e rótulos de
+entidade como códigos de um byte. As listas de entidades, tokens, substantivos e verbos continuam disponíveis,
+derivadas sob demanda, e a classe se comporta como o dicionário devolvido anteriormente.
+
+A forma armazenada (codificar/decodificar) usa inteiros de tamanho variável com codificação delta, em base64,
+e não repete o texto, que já é salvo junto ao registro.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - AnaliseCompacta
+
+Exceções:
+    - ModeloLinguagemError
+
+Dependências:
+    - array
+    - base64
+    - utils.exceptions
+"""
+
+import base64
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from utils.exceptions import ModeloLinguagemError
+
+FORMATO = 1
+
+# Tabelas de códigos: o índice de cada rótulo é o código armazenado. Novos rótulos só podem ser acrescentados
+# ao final, para não invalidar registros já salvos. Rótulos desconhecidos usam o código 0.
+ROTULOS_POS = ("", "ADJ", "ADP", "ADV", "AUX", "CCONJ", "DET", "INTJ", "NOUN", "NUM", "PART", "PRON", "PROPN",
+               "PUNCT", "SCONJ", "SYM", "VERB", "X", "SPACE")
+ROTULOS_ENTIDADE = ("", "PER", "LOC", "ORG", "MISC", "PERSON", "GPE", "NORP", "FAC", "PRODUCT", "EVENT",
+                    "WORK_OF_ART", "LAW", "LANGUAGE", "DATE", "TIME", "PERCENT", "MONEY", "QUANTITY", "ORDINAL",
+                    "CARDINAL")
+_CODIGOS_POS = {rotulo: codigo for codigo, rotulo in enumerate(ROTULOS_POS)}
+_CODIGOS_ENTIDADE = {rotulo: codigo for codigo, rotulo in enumerate(ROTULOS_ENTIDADE)}
+_CODIGO_NOUN = _CODIGOS_POS["NOUN"]
+_CODIGO_VERB = _CODIGOS_POS["VERB"]
+
+def _codificar_varints(valores: Iterable[int]) -> str:
+    """Codifica inteiros não negativos como varints (7 bits por byte) e devolve o resultado em base64."""
+    saida = bytearray()
+    for valor in valores:
+        while valor >= 0x80:
+            saida.append((valor & 0x7F) | 0x80)
+            valor >>= 7
+        saida.append(valor)
+    return base64.b64encode(bytes(saida)).decode("ascii")
+
+def _decodificar_varints(dados: str) -> List[int]:
+    """Decodifica a saída de _codificar_varints."""
+    valores: List[int] = []
+    valor = deslocamento = 0
+    for byte in base64.b64decode(dados):
+        valor |= (byte & 0x7F) << deslocamento
+        if byte & 0x80:
+            deslocamento += 7
+        else:
+            valores.append(valor)
+            valor = deslocamento = 0
+    return valores
+
+class AnaliseCompacta(Mapping):
+    """
+    Resultado de processar_texto baseado em deslocamentos. Funciona como um mapeamento somente leitura
+    com as chaves "entidades", "tokens", "substantivos" e "verbos".
+    """
+
+    __slots__ = ("texto", "deslocamento", "_inicios", "_fins", "_pos", "_ent_inicios", "_ent_fins", "_ent_rotulos")
+
+    CHAVES = ("entidades", "tokens", "substantivos", "verbos")
+
+    def __init__(self, texto: str, inicios: array, fins: array, pos: array,
+                 ent_inicios: array, ent_fins: array, ent_rotulos: array, deslocamento: int = 0):
+        """
+        Inicializa a análise a partir dos arrays já construídos. Use de_doc ou decodificar.
+
+        :param texto: Texto analisado
+        :param inicios: Posição inicial de cada token no texto
+        :param fins: Posição final de cada token no texto
+        :param pos: Código de ROTULOS_POS de cada token
+        :param ent_inicios: Posição inicial de cada entidade no texto
+        :param ent_fins: Posição final de cada entidade no texto
+        :param ent_rotulos: Código de ROTULOS_ENTIDADE de cada entidade
+        :param deslocamento: Posição do texto dentro de um documento maior, quando for um bloco dele
+        """
+        self.texto = texto
+        self.deslocamento = deslocamento
+        self._inicios = inicios
+        self._fins = fins
+        self._pos = pos
+        self._ent_inicios = ent_inicios
+        self._ent_fins = ent_fins
+        self._ent_rotulos = ent_rotulos
+
+    @classmethod
+    def de_doc(cls, doc, deslocamento: int = 0) -> "AnaliseCompacta":
+        """
+        Constrói a análise a partir de um Doc do spaCy.
+
+        :param doc: Doc processado
+        :param deslocamento: Posição do texto dentro de um documento maior, quando for um bloco dele
+        :return: Análise compacta
+        """
+        inicios, fins, pos = array("I"), array("I"), array("B")
+        for token in doc:
+            inicios.append(token.idx)
+            fins.append(token.idx + len(token))
+            pos.append(_CODIGOS_POS.get(token.pos_, 0))
+        ent_inicios, ent_fins, ent_rotulos = array("I"), array("I"), array("B")
+        for ent in doc.ents:
+            ent_inicios.append(ent.start_char)
+            ent_fins.append(ent.end_char)
+            ent_rotulos.append(_CODIGOS_ENTIDADE.get(ent.label_, 0))
+        return cls(doc.text, inicios, fins, pos, ent_inicios, ent_fins, ent_rotulos, deslocamento)
+
+    def _fatias(self, inicios: array, fins: array) -> List[str]:
+        texto = self.texto
+        return [texto[inicio:fim] for inicio, fim in zip(inicios, fins)]
+
+    def _tokens_com_pos(self, codigo: int) -> List[str]:
+        texto = self.texto
+        return [texto[inicio:fim] for inicio, fim, pos in zip(self._inicios, self._fins, self._pos) if pos == codigo]
+
+    @property
+    def tokens(self) -> List[str]:
+        """Todos os tokens do texto."""
+        return self._fatias(self._inicios, self._fins)
+
+    @property
+    def entidades(self) -> List[str]:
+        """Entidades nomeadas encontradas no texto."""
+        return self._fatias(self._ent_inicios, self._ent_fins)
+
+    @property
+    def substantivos(self) -> List[str]:
+        """Tokens classificados como substantivos."""
+        return self._tokens_com_pos(_CODIGO_NOUN)
+
+    @property
+    def verbos(self) -> List[str]:
+        """Tokens classificados como verbos."""
+        return self._tokens_com_pos(_CODIGO_VERB)
+
+    @property
+    def inicio(self) -> int:
+        """Posição inicial do texto no documento de origem."""
+        return self.deslocamento
+
+    @property
+    def fim(self) -> int:
+        """Posição final do texto no documento de origem."""
+        return self.deslocamento + len(self.texto)
+
+    @property
+    def entidades_posicoes(self) -> List[Tuple[int, int, str]]:
+        """Tuplas (início, fim, rótulo) de cada entidade, com posições relativas ao documento de origem."""
+        return [(self.deslocamento + inicio, self.deslocamento + fim, ROTULOS_ENTIDADE[rotulo])
+                for inicio, fim, rotulo in zip(self._ent_inicios, self._ent_fins, self._ent_rotulos)]
+
+    def __getitem__(self, chave: str) -> List[str]:
+        if chave not in self.CHAVES:
+            raise KeyError(chave)
+        return getattr(self, chave)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.CHAVES)
+
+    def __len__(self) -> int:
+        return len(self.CHAVES)
+
+    def __repr__(self) -> str:
+        return (f"AnaliseCompacta(tokens={len(self._inicios)}, entidades={len(self._ent_inicios)}, "
+                f"texto={self.texto[:30]!r})")
+
+    def como_dicionario(self) -> Dict[str, List[str]]:
+        """
+        Materializa todas as listas.
+
+        :return: Dicionário contendo entidades, tokens, substantivos e verbos
+        """
+        return {chave: self[chave] for chave in self.CHAVES}
+
+    def codificar(self) -> Dict[str, Any]:
+        """
+        Gera a forma armazenável da análise, sem o texto. Cada token é salvo como (intervalo desde o fim do token
+        anterior, comprimento) e cada entidade como (intervalo, comprimento, rótulo), todos em varints.
+
+        :return: Dicionário serializável em JSON
+        """
+        def pares(inicios: array, fins: array, *extras: array) -> Iterator[int]:
+            anterior = 0
+            for i, (inicio, fim) in enumerate(zip(inicios, fins)):
+                yield inicio - anterior
+                yield fim - inicio
+                for extra in extras:
+                    yield extra[i]
+                anterior = fim
+
+        return {
+            "formato": FORMATO,
+            "tokens": _codificar_varints(pares(self._inicios, self._fins)),
+            "pos": base64.b64encode(self._pos.tobytes()).decode("ascii"),
+            "entidades": _codificar_varints(pares(self._ent_inicios, self._ent_fins, self._ent_rotulos))
+        }
+
+    @classmethod
+    def decodificar(cls, texto: str, dados: Dict[str, Any]) -> "AnaliseCompacta":
+        """
+        Reconstrói a análise a partir do texto e da forma gerada por codificar.
+
+        :param texto: Texto original
+        :param dados: Dicionário gerado por codificar
+        :return: Análise compacta
+        :raises ModeloLinguagemError: Se os dados não estiverem no formato esperado
+        """
+        try:
+            if dados.get("formato") != FORMATO:
+                raise ValueError(f"formato desconhecido: {dados.get('formato')}")
+
+            def absolutos(valores: List[int], largura: int) -> Tuple[array, array, List[array]]:
+                inicios, fins = array("I"), array("I")
+                extras = [array("B") for _ in range(largura - 2)]
+                anterior = 0
+                for i in range(0, len(valores), largura):
+                    inicio = anterior + valores[i]
+                    anterior = inicio + valores[i + 1]
+                    inicios.append(inicio)
+                    fins.append(anterior)
+                    for j, extra in enumerate(extras):
+                        extra.append(valores[i + 2 + j])
+                return inicios, fins, extras
+
+            inicios, fins, _ = absolutos(_decodificar_varints(dados["tokens"]), 2)
+            pos = array("B", base64.b64decode(dados["pos"]))
+            ent_inicios, ent_fins, (ent_rotulos,) = absolutos(_decodificar_varints(dados["entidades"]), 3)
+            if len(pos) != len(inicios) or (len(fins) and fins[-1] > len(texto)):
+                raise ValueError("dados inconsistentes com o texto")
+        except (KeyError, IndexError, ValueError, TypeError, AttributeError) as e:
+            raise ModeloLinguagemError(f"Erro ao decodificar análise compacta: {str(e)}")
+        return cls(texto, inicios, fins, pos, ent_inicios, ent_fins, ent_rotulos)
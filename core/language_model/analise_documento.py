@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: analise_documento
+
+Este módulo implementa a classe AnaliseDocumento, que guarda o Doc do spaCy de um texto e deriva dele
+entidades, tokens, substantivos, verbos, palavras-chave e sentenças, e a classe CacheAnalises, um cache LRU
+limitado que evita processar o mesmo texto mais de uma vez.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - AnaliseDocumento
+    - CacheAnalises
+
+Dependências:
+    - hashlib
+    - threading
+    - collections.OrderedDict
+    - core.language_model.analise_compacta
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+from core.language_model.analise_compacta import AnaliseCompacta
+
+# Classes gramaticais consideradas na extração de palavras-chave
+POS_PALAVRAS_CHAVE = ("NOUN", "PROPN", "ADJ")
+
+class AnaliseDocumento:
+    """
+    Resultado de uma única passagem do pipeline do spaCy sobre um texto.
+
+    Todas as listas são derivadas sob demanda do mesmo Doc e memorizadas na primeira leitura.
+    """
+
+    def __init__(self, doc, componentes: Iterable[str] = ()):
+        """
+        Inicializa a análise a partir de um Doc já processado.
+
+        :param doc: Doc do spaCy resultante do processamento do texto
+        :param componentes: Nomes dos componentes do pipeline que foram executados sobre o Doc
+        """
+        self.doc = doc
+        self.componentes: FrozenSet[str] = frozenset(componentes)
+
+    @property
+    def texto(self) -> str:
+        """Texto original analisado."""
+        return self.doc.text
+
+    @cached_property
+    def entidades(self) -> List[str]:
+        """Entidades nomeadas encontradas no texto."""
+        return [ent.text for ent in self.doc.ents]
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Todos os tokens do texto."""
+        return [token.text for token in self.doc]
+
+    @cached_property
+    def substantivos(self) -> List[str]:
+        """Tokens classificados como substantivos."""
+        return [token.text for token in self.doc if token.pos_ == "NOUN"]
+
+    @cached_property
+    def verbos(self) -> List[str]:
+        """Tokens classificados como verbos."""
+        return [token.text for token in self.doc if token.pos_ == "VERB"]
+
+    @cached_property
+    def palavras_chave(self) -> List[str]:
+        """Tokens que não são stop words e pertencem a uma das classes de POS_PALAVRAS_CHAVE."""
+        return [token.text for token in self.doc if not token.is_stop and token.pos_ in POS_PALAVRAS_CHAVE]
+
+    @cached_property
+    def termos_chave(self) -> List[str]:
+        """Palavras-chave em minúsculas, usadas como termos na contagem de frequência de documentos."""
+        return [token.lower_ for token in self.doc if not token.is_stop and token.pos_ in POS_PALAVRAS_CHAVE]
+
+    @cached_property
+    def sentencas(self) -> List[str]:
+        """Sentenças do texto."""
+        return [sent.text for sent in self.doc.sents]
+
+    @cached_property
+    def lemas_por_sentenca(self) -> List[List[str]]:
+        """Lemas em minúsculas das palavras de conteúdo de cada sentença, na mesma ordem de sentencas."""
+        return [[(token.lemma_ or token.text).lower() for token in sent if token.is_alpha and not token.is_stop]
+                for sent in self.doc.sents]
+
+    def compacta(self, deslocamento: int = 0) -> AnaliseCompacta:
+        """
+        Converte a análise para a forma compacta devolvida por ModeloLinguagem.processar_texto.
+
+        :param deslocamento: Posição do texto dentro de um documento maior, quando for um bloco dele
+        :return: Análise compacta com entidades, tokens, substantivos e verbos
+        """
+        return AnaliseCompacta.de_doc(self.doc, deslocamento)
+
+class CacheAnalises:
+    """
+    Cache LRU limitado de objetos AnaliseDocumento, indexado por um hash do conteúdo do texto.
+
+    É seguro para uso concorrente e mantém contadores de acertos e falhas.
+    """
+
+    def __init__(self, tamanho_maximo: int = 256):
+        """
+        Inicializa o cache.
+
+        :param tamanho_maximo: Número máximo de análises mantidas em memória
+        :raises ValueError: Se tamanho_maximo não for um inteiro positivo
+        """
+        if not isinstance(tamanho_maximo, int) or tamanho_maximo <= 0:
+            raise ValueError("tamanho_maximo deve ser um inteiro positivo")
+        self.tamanho_maximo = tamanho_maximo
+        self._itens: "OrderedDict[str, AnaliseDocumento]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def calcular_chave(texto: str) -> str:
+        """
+        Calcula a chave de cache de um texto a partir do seu conteúdo.
+
+        :param texto: Texto a ser indexado
+        :return: Hash hexadecimal do texto
+        """
+        return hashlib.blake2b(texto.encode("utf-8"), digest_size=16).hexdigest()
+
+    def obter(self, texto: str, componentes: Iterable[str] = ()) -> Optional[AnaliseDocumento]:
+        """
+        Recupera a análise de um texto, se presente, marcando-a como usada mais recentemente.
+
+        :param texto: Texto cuja análise se deseja recuperar
+        :param componentes: Componentes do pipeline que a análise precisa ter executado
+        :return: A análise armazenada ou None, se ausente ou processada com menos componentes que o necessário
+        """
+        chave = self.calcular_chave(texto)
+        with self._lock:
+            analise = self._itens.get(chave)
+            if analise is None or not analise.componentes.issuperset(componentes):
+                self.falhas += 1
+                return None
+            self._itens.move_to_end(chave)
+            self.acertos += 1
+            return analise
+
+    def componentes_armazenados(self, texto: str) -> FrozenSet[str]:
+        """
+        Retorna os componentes com que o texto já foi processado, sem contar como acerto ou falha.
+
+        :param texto: Texto a ser consultado
+        :return: Conjunto de componentes, vazio se o texto não estiver no cache
+        """
+        with self._lock:
+            analise = self._itens.get(self.calcular_chave(texto))
+            return analise.componentes if analise is not None else frozenset()
+
+    def armazenar(self, texto: str, analise: AnaliseDocumento):
+        """
+        Armazena a análise de um texto, removendo a menos usada recentemente se o cache estiver cheio.
+
+        :param texto: Texto analisado
+        :param analise: Análise a ser armazenada
+        """
+        chave = self.calcular_chave(texto)
+        with self._lock:
+            self._itens[chave] = analise
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.tamanho_maximo:
+                self._itens.popitem(last=False)
+
+    def limpar(self):
+        """Remove todas as análises e zera os contadores."""
+        with self._lock:
+            self._itens.clear()
+            self.acertos = 0
+            self.falhas = 0
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna os contadores do cache.
+
+        :return: Dicionário com acertos, falhas, taxa de acerto, tamanho atual e tamanho máximo
+        """
+        with self._lock:
+            total = self.acertos + self.falhas
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+                "tamanho": len(self._itens),
+                "tamanho_maximo": self.tamanho_maximo
+            }
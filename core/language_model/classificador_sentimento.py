@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: classificador_sentimento
+
+Este módulo implementa a classe ClassificadorSentimento, um classificador Naive Bayes multinomial incremental
+sobre atributos de tokens com hashing, armazenados em arrays do NumPy. Cada feedback do usuário atualiza o
+modelo em tempo proporcional ao número de tokens, e o estado é persistido de forma esparsa em um arquivo .npz.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ClassificadorSentimento
+
+Exceções:
+    - ModeloLinguagemError
+
+Dependências:
+    - numpy
+    - zlib
+    - core.language_model.lexico_sentimento
+    - utils.exceptions
+"""
+
+import os
+import zipfile
+import zlib
+import numpy as np
+from typing import Dict, Iterable, Optional, Tuple
+from core.language_model.lexico_sentimento import tokenizar
+from utils.exceptions import ModeloLinguagemError
+
+CLASSES = ("positivo", "negativo", "neutro")
+DIMENSAO_PADRAO = 2 ** 18
+
+class ClassificadorSentimento:
+    """
+    Naive Bayes multinomial com hashing de unigramas e bigramas de tokens.
+    """
+
+    def __init__(self, dimensao: int = DIMENSAO_PADRAO, alfa: float = 1.0):
+        """
+        Inicializa um classificador sem exemplos.
+
+        :param dimensao: Número de posições do espaço de atributos com hashing
+        :param alfa: Suavização de Laplace
+        :raises ValueError: Se dimensao não for um inteiro positivo ou alfa não for positivo
+        """
+        if not isinstance(dimensao, int) or dimensao <= 0:
+            raise ValueError("dimensao deve ser um inteiro positivo")
+        if alfa <= 0:
+            raise ValueError("alfa deve ser positivo")
+        self.dimensao = dimensao
+        self.alfa = alfa
+        self.contagens = np.zeros((len(CLASSES), dimensao), dtype=np.float32)
+        self.total_atributos = np.zeros(len(CLASSES), dtype=np.float64)
+        self.documentos = np.zeros(len(CLASSES), dtype=np.int64)
+        # Valor de contador_aprendizado da memória refletido neste estado e no último estado salvo
+        self.contador_aprendizado = 0
+        self._contador_salvo = 0
+
+    def _indices(self, texto: str) -> np.ndarray:
+        """
+        Converte o texto nos índices de seus atributos (unigramas e bigramas de tokens).
+
+        O crc32 é usado em vez de hash() porque precisa ser estável entre execuções.
+
+        :param texto: Texto de entrada
+        :return: Array de índices, com repetições
+        """
+        tokens = tokenizar(texto)
+        atributos = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        return np.fromiter((zlib.crc32(a.encode("utf-8")) % self.dimensao for a in atributos),
+                           dtype=np.int64, count=len(atributos))
+
+    @property
+    def pendentes(self) -> int:
+        """Número de aprendizados incorporados desde o último salvamento ou carregamento."""
+        return self.contador_aprendizado - self._contador_salvo
+
+    @property
+    def total_exemplos(self) -> int:
+        """Número de exemplos de treinamento recebidos."""
+        return int(self.documentos.sum())
+
+    def pronto(self, minimo_exemplos: int) -> bool:
+        """
+        Indica se o classificador já viu exemplos suficientes, de pelo menos duas classes, para ser usado.
+
+        :param minimo_exemplos: Número mínimo de exemplos de treinamento
+        :return: True se o classificador pode ser consultado
+        """
+        return self.total_exemplos >= minimo_exemplos and int(np.count_nonzero(self.documentos)) >= 2
+
+    def atualizar(self, texto: str, classe: str):
+        """
+        Incorpora um exemplo rotulado ao modelo.
+
+        :param texto: Texto do exemplo
+        :param classe: 'positivo', 'negativo' ou 'neutro'
+        :raises ValueError: Se a classe não for reconhecida
+        """
+        if classe not in CLASSES:
+            raise ValueError(f"Classe desconhecida: {classe}")
+        c = CLASSES.index(classe)
+        indices = self._indices(texto)
+        np.add.at(self.contagens[c], indices, 1.0)
+        self.total_atributos[c] += len(indices)
+        self.documentos[c] += 1
+
+    def prever_probabilidades(self, texto: str) -> Dict[str, float]:
+        """
+        Calcula a probabilidade de cada classe para o texto.
+
+        :param texto: Texto a ser classificado
+        :return: Dicionário de classe para probabilidade
+        """
+        total = self.documentos.sum()
+        if total == 0:
+            return {classe: 1.0 / len(CLASSES) for classe in CLASSES}
+        indices = self._indices(texto)
+        log_prior = np.log((self.documentos + 1.0) / (total + len(CLASSES)))
+        denominador = np.log(self.total_atributos + self.alfa * self.dimensao)
+        log_verossimilhanca = (np.log(self.contagens[:, indices] + self.alfa).sum(axis=1)
+                               - len(indices) * denominador)
+        log_posterior = log_prior + log_verossimilhanca
+        probabilidades = np.exp(log_posterior - log_posterior.max())
+        probabilidades /= probabilidades.sum()
+        return {classe: float(p) for classe, p in zip(CLASSES, probabilidades)}
+
+    def prever(self, texto: str) -> Tuple[str, float]:
+        """
+        Classifica o texto.
+
+        :param texto: Texto a ser classificado
+        :return: Par (classe mais provável, probabilidade)
+        """
+        probabilidades = self.prever_probabilidades(texto)
+        classe = max(probabilidades, key=probabilidades.get)
+        return classe, probabilidades[classe]
+
+    @classmethod
+    def reconstruir(cls, exemplos: Iterable[Tuple[str, str]], dimensao: int = DIMENSAO_PADRAO,
+                    contador_aprendizado: int = 0) -> "ClassificadorSentimento":
+        """
+        Treina um classificador do zero a partir de exemplos armazenados. Exemplos com classe desconhecida
+        são ignorados.
+
+        :param exemplos: Iterável de pares (texto, classe)
+        :param dimensao: Número de posições do espaço de atributos
+        :param contador_aprendizado: Valor de contador_aprendizado correspondente aos exemplos
+        :return: Classificador treinado
+        """
+        classificador = cls(dimensao=dimensao)
+        for texto, classe in exemplos:
+            if texto and classe in CLASSES:
+                classificador.atualizar(texto, classe)
+        classificador.contador_aprendizado = contador_aprendizado
+        return classificador
+
+    def salvar(self, caminho: str):
+        """
+        Salva o estado em formato esparso: apenas as posições não nulas de cada classe.
+
+        :param caminho: Caminho do arquivo .npz
+        """
+        classes, posicoes = np.nonzero(self.contagens)
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        with open(caminho, "wb") as f:
+            np.savez_compressed(
+                f,
+                dimensao=np.int64(self.dimensao),
+                alfa=np.float64(self.alfa),
+                classes=classes.astype(np.uint8),
+                posicoes=posicoes.astype(np.uint32),
+                valores=self.contagens[classes, posicoes],
+                total_atributos=self.total_atributos,
+                documentos=self.documentos,
+                contador_aprendizado=np.int64(self.contador_aprendizado)
+            )
+        self._contador_salvo = self.contador_aprendizado
+
+    @classmethod
+    def carregar(cls, caminho: str) -> Optional["ClassificadorSentimento"]:
+        """
+        Carrega um estado salvo por salvar.
+
+        :param caminho: Caminho do arquivo .npz
+        :return: Classificador carregado, ou None se o arquivo não existir
+        :raises ModeloLinguagemError: Se o arquivo existir mas estiver corrompido
+        """
+        if not os.path.exists(caminho):
+            return None
+        try:
+            with np.load(caminho) as dados:
+                classificador = cls(dimensao=int(dados["dimensao"]), alfa=float(dados["alfa"]))
+                classificador.contagens[dados["classes"], dados["posicoes"]] = dados["valores"]
+                classificador.total_atributos[:] = dados["total_atributos"]
+                classificador.documentos[:] = dados["documentos"]
+                classificador.contador_aprendizado = int(dados["contador_aprendizado"])
+                classificador._contador_salvo = classificador.contador_aprendizado
+            return classificador
+        except (OSError, ValueError, KeyError, IndexError, zipfile.BadZipFile) as e:
+            raise ModeloLinguagemError(f"Erro ao carregar classificador de sentimento '{caminho}': {str(e)}")
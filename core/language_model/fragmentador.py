@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: fragmentador
+
+Este módulo divide documentos arbitrariamente grandes em blocos de tamanho limitado, preferindo cortar em
+fronteiras de parágrafo, depois de sentença e depois de espaço. A leitura é incremental, de modo que a memória
+usada depende do tamanho do bloco e não do tamanho do documento. Cada bloco é acompanhado do seu deslocamento,
+em caracteres, dentro do documento original.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Funções:
+    - ler_pedacos
+    - fragmentar
+
+Dependências:
+    - re
+"""
+
+import os
+import re
+from typing import Iterable, Iterator, Tuple, Union
+
+# Quantidade de caracteres lida do arquivo por vez
+TAMANHO_LEITURA = 64 * 1024
+
+_FIM_PARAGRAFO = re.compile(r"\n[ \t\r]*\n")
+_FIM_SENTENCA = re.compile(r"[.!?…][\"')\]]*\s")
+_ESPACO = re.compile(r"\s")
+
+Fonte = Union[str, "os.PathLike[str]", Iterable[str]]
+
+def ler_pedacos(fonte: Fonte, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Produz o conteúdo da fonte em pedaços.
+
+    :param fonte: Caminho de um arquivo de texto ou iterável de strings (por exemplo, um arquivo aberto)
+    :param encoding: Codificação usada quando a fonte é um caminho
+    :return: Iterador de pedaços de texto
+    """
+    if isinstance(fonte, (str, os.PathLike)):
+        with open(fonte, "r", encoding=encoding) as f:
+            yield from iter(lambda: f.read(TAMANHO_LEITURA), "")
+    else:
+        yield from fonte
+
+def _ultimo_corte(padrao: "re.Pattern[str]", texto: str, minimo: int, fim: int) -> int:
+    """Retorna a posição logo após a última ocorrência do padrão entre minimo e fim, ou -1."""
+    corte = -1
+    for ocorrencia in padrao.finditer(texto, minimo, fim):
+        corte = ocorrencia.end()
+    return corte
+
+def _ponto_de_corte(texto: str, inicio: int, tamanho_maximo: int) -> int:
+    """
+    Escolhe onde cortar o trecho de texto que começa em inicio e tem mais de tamanho_maximo caracteres.
+
+    A janela é delimitada por posições, sem copiar o texto. Fronteiras na primeira metade da janela são
+    ignoradas para evitar blocos muito pequenos.
+
+    :return: Posição do corte em texto
+    """
+    fim = inicio + tamanho_maximo
+    minimo = inicio + tamanho_maximo // 2
+    for padrao in (_FIM_PARAGRAFO, _FIM_SENTENCA, _ESPACO):
+        corte = _ultimo_corte(padrao, texto, minimo, fim)
+        if corte > 0:
+            return corte
+    return fim
+
+def fragmentar(fonte: Fonte, tamanho_maximo: int, encoding: str = "utf-8") -> Iterator[Tuple[str, int]]:
+    """
+    Divide a fonte em blocos de no máximo tamanho_maximo caracteres.
+
+    :param fonte: Caminho de um arquivo de texto ou iterável de strings
+    :param tamanho_maximo: Tamanho máximo de cada bloco, em caracteres
+    :param encoding: Codificação usada quando a fonte é um caminho
+    :return: Iterador de pares (bloco, deslocamento do bloco no documento); a concatenação dos blocos
+             reproduz o documento
+    :raises ValueError: Se tamanho_maximo não for um inteiro positivo
+    """
+    if not isinstance(tamanho_maximo, int) or tamanho_maximo <= 0:
+        raise ValueError("tamanho_maximo deve ser um inteiro positivo")
+
+    # Os blocos são percorridos por posição; o resto não emitido só é copiado quando chega um novo pedaço
+    pendente = ""
+    inicio = 0
+    deslocamento = 0
+    for pedaco in ler_pedacos(fonte, encoding):
+        pendente = pendente[inicio:] + pedaco
+        inicio = 0
+        while len(pendente) - inicio > tamanho_maximo:
+            corte = _ponto_de_corte(pendente, inicio, tamanho_maximo)
+            yield pendente[inicio:corte], deslocamento
+            deslocamento += corte - inicio
+            inicio = corte
+    if len(pendente) > inicio:
+        yield pendente[inicio:], deslocamento
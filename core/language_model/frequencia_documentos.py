@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: frequencia_documentos
+
+Este módulo implementa a classe TabelaFrequenciaDocumentos, que mantém incrementalmente a frequência de
+documentos (DF) de cada termo visto pelo sistema e ranqueia palavras-chave por TF-IDF. O vocabulário é
+internado em identificadores inteiros e as frequências ficam em um array compacto de inteiros sem sinal.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TabelaFrequenciaDocumentos
+
+Exceções:
+    - ModeloLinguagemError
+
+Dependências:
+    - numpy
+    - utils.exceptions
+"""
+
+import heapq
+import math
+import os
+import threading
+import zipfile
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from utils.exceptions import ModeloLinguagemError
+
+class TabelaFrequenciaDocumentos:
+    """
+    Tabela incremental de frequência de documentos com vocabulário internado.
+    """
+
+    def __init__(self):
+        """Inicializa uma tabela vazia."""
+        self._ids: Dict[str, int] = {}
+        self._termos: List[str] = []
+        self._df = array("I")
+        self.n_documentos = 0
+        # Documentos registrados desde o último salvamento
+        self.pendentes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._termos)
+
+    def _internar(self, termo: str) -> int:
+        """Retorna o identificador do termo, criando-o se necessário."""
+        identificador = self._ids.get(termo)
+        if identificador is None:
+            identificador = len(self._termos)
+            self._ids[termo] = identificador
+            self._termos.append(termo)
+            self._df.append(0)
+        return identificador
+
+    def registrar(self, termos: Iterable[str]):
+        """
+        Registra um documento, incrementando a frequência de cada termo distinto que ele contém.
+
+        :param termos: Termos do documento (repetições são contadas uma única vez)
+        """
+        with self._lock:
+            for termo in set(termos):
+                self._df[self._internar(termo)] += 1
+            self.n_documentos += 1
+            self.pendentes += 1
+
+    def frequencia(self, termo: str) -> int:
+        """
+        Retorna o número de documentos que contêm o termo.
+
+        :param termo: Termo consultado
+        :return: Frequência de documentos
+        """
+        identificador = self._ids.get(termo)
+        return self._df[identificador] if identificador is not None else 0
+
+    def idf(self, termo: str) -> float:
+        """
+        Calcula o IDF suavizado do termo: log((1 + N) / (1 + df)) + 1.
+
+        :param termo: Termo consultado
+        :return: Valor de IDF
+        """
+        return math.log((1 + self.n_documentos) / (1 + self.frequencia(termo))) + 1.0
+
+    def ranquear(self, termos: List[str], top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Ranqueia os termos de um documento por TF-IDF. O custo depende apenas do tamanho do documento.
+
+        :param termos: Termos do documento, com repetições
+        :param top_k: Número máximo de termos devolvidos
+        :return: Lista de pares (termo, pontuação) em ordem decrescente de pontuação
+        :raises ValueError: Se top_k não for um inteiro positivo
+        """
+        if not isinstance(top_k, int) or top_k <= 0:
+            raise ValueError("top_k deve ser um inteiro positivo")
+        if not termos:
+            return []
+        contagens = Counter(termos)
+        total = len(termos)
+        pontuacoes = ((termo, contagem / total * self.idf(termo)) for termo, contagem in contagens.items())
+        return heapq.nlargest(top_k, pontuacoes, key=lambda par: par[1])
+
+    def salvar(self, caminho: str):
+        """
+        Salva a tabela: o vocabulário como texto UTF-8 separado por quebras de linha e as frequências como
+        array de inteiros.
+
+        :param caminho: Caminho do arquivo .npz
+        """
+        with self._lock:
+            vocabulario = "\n".join(self._termos).encode("utf-8")
+            frequencias = np.frombuffer(self._df, dtype=np.uint32).copy()
+            n_documentos = self.n_documentos
+            self.pendentes = 0
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        with open(caminho, "wb") as f:
+            np.savez_compressed(f, vocabulario=np.frombuffer(vocabulario, dtype=np.uint8),
+                                frequencias=frequencias, n_documentos=np.int64(n_documentos))
+
+    @classmethod
+    def carregar(cls, caminho: str) -> Optional["TabelaFrequenciaDocumentos"]:
+        """
+        Carrega uma tabela salva por salvar.
+
+        :param caminho: Caminho do arquivo .npz
+        :return: Tabela carregada, ou None se o arquivo não existir
+        :raises ModeloLinguagemError: Se o arquivo existir mas estiver corrompido
+        """
+        if not os.path.exists(caminho):
+            return None
+        try:
+            with np.load(caminho) as dados:
+                vocabulario = dados["vocabulario"].tobytes().decode("utf-8")
+                frequencias = dados["frequencias"].astype(np.uint32)
+                n_documentos = int(dados["n_documentos"])
+        except (OSError, ValueError, KeyError, UnicodeDecodeError, zipfile.BadZipFile) as e:
+            raise ModeloLinguagemError(f"Erro ao carregar frequências de documentos '{caminho}': {str(e)}")
+
+        tabela = cls()
+        tabela._termos = vocabulario.split("\n") if vocabulario else []
+        if len(tabela._termos) != len(frequencias):
+            raise ModeloLinguagemError(f"Frequências de documentos inconsistentes em '{caminho}'")
+        tabela._ids = {termo: i for i, termo in enumerate(tabela._termos)}
+        tabela._df = array("I", frequencias.tobytes())
+        tabela.n_documentos = n_documentos
+        return tabela
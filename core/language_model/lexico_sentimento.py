@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: lexico_sentimento
+
+Este módulo implementa a classe LexicoSentimento, um analisador de sentimento baseado em léxico ponderado.
+O léxico é carregado de um arquivo JSON e compilado uma única vez em tabelas de hash por token; a análise
+percorre o texto uma vez, casando termos e expressões de várias palavras, e aplica negação, a construção
+correlativa "nem ... nem" e intensificadores. O custo da análise é proporcional ao tamanho do texto,
+independentemente do tamanho do léxico.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - LexicoSentimento
+
+Funções:
+    - normalizar
+    - tokenizar
+
+Exceções:
+    - ModeloLinguagemError
+
+Dependências:
+    - json
+    - re
+    - unicodedata
+    - utils.exceptions
+"""
+
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+from utils.exceptions import ModeloLinguagemError
+
+# Arquivo de léxico distribuído com o pacote
+ARQUIVO_LEXICO_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados", "lexico_sentimento.json")
+
+# Número de tokens seguintes afetados por um negador
+JANELA_NEGACAO_PADRAO = 3
+
+# Negador que, repetido na mesma oração, forma a construção correlativa "nem A nem B"
+_CORRELATIVO = "nem"
+
+_PADRAO_TOKEN = re.compile(r"\w+|[.!?;:,]")
+_PONTUACAO = frozenset(".!?;:,")
+
+def normalizar(texto: str) -> str:
+    """
+    Converte o texto para minúsculas e remove acentos, para que "Ótimo" e "otimo" sejam o mesmo termo.
+
+    :param texto: Texto a ser normalizado
+    :return: Texto normalizado
+    """
+    return unicodedata.normalize("NFKD", texto.lower()).encode("ascii", "ignore").decode("ascii")
+
+def tokenizar(texto: str, manter_pontuacao: bool = False) -> List[str]:
+    """
+    Divide o texto normalizado em tokens de palavras.
+
+    :param texto: Texto a ser tokenizado
+    :param manter_pontuacao: Se True, mantém os sinais de pontuação que delimitam orações como tokens
+    :return: Lista de tokens normalizados
+    """
+    tokens = _PADRAO_TOKEN.findall(normalizar(texto))
+    if manter_pontuacao:
+        return tokens
+    return [token for token in tokens if token not in _PONTUACAO]
+
+class LexicoSentimento:
+    """
+    Léxico de sentimento compilado para casamento em uma única passagem por token.
+    """
+
+    def __init__(self, termos: Dict[str, float], negadores: Iterable[str] = (),
+                 intensificadores: Optional[Dict[str, float]] = None,
+                 janela_negacao: int = JANELA_NEGACAO_PADRAO):
+        """
+        Compila o léxico.
+
+        :param termos: Mapeamento de termo ou expressão para peso (positivo ou negativo)
+        :param negadores: Palavras que invertem a polaridade dos termos seguintes
+        :param intensificadores: Mapeamento de palavra para fator multiplicativo aplicado ao termo seguinte
+        :param janela_negacao: Número de tokens seguintes afetados por um negador
+        :raises ValueError: Se janela_negacao não for um inteiro positivo
+        """
+        if not isinstance(janela_negacao, int) or janela_negacao <= 0:
+            raise ValueError("janela_negacao deve ser um inteiro positivo")
+        self.janela_negacao = janela_negacao
+        self._termos: Dict[Tuple[str, ...], float] = {}
+        self._comprimentos: Dict[str, Tuple[int, ...]] = {}
+        comprimentos: Dict[str, set] = {}
+        for termo, peso in termos.items():
+            chave = tuple(tokenizar(termo))
+            if not chave:
+                continue
+            self._termos[chave] = float(peso)
+            comprimentos.setdefault(chave[0], set()).add(len(chave))
+        # Para cada token inicial, os comprimentos possíveis em ordem decrescente (casamento mais longo primeiro)
+        for inicio, tamanhos in comprimentos.items():
+            self._comprimentos[inicio] = tuple(sorted(tamanhos, reverse=True))
+        self._negadores = frozenset(normalizar(palavra) for palavra in negadores)
+        self._intensificadores = {normalizar(palavra): float(fator)
+                                  for palavra, fator in (intensificadores or {}).items()}
+
+    @classmethod
+    def carregar(cls, caminho: Optional[str] = None) -> "LexicoSentimento":
+        """
+        Carrega e compila um léxico a partir de um arquivo JSON com as chaves "termos", "negadores" e
+        "intensificadores".
+
+        :param caminho: Caminho do arquivo (padrão: léxico distribuído com o pacote)
+        :return: Léxico compilado
+        :raises ModeloLinguagemError: Se o arquivo não existir ou não for um léxico válido
+        """
+        caminho = caminho or ARQUIVO_LEXICO_PADRAO
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                dados = json.load(f)
+            return cls(dados["termos"], dados.get("negadores", ()), dados.get("intensificadores"))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise ModeloLinguagemError(f"Erro ao carregar léxico de sentimento '{caminho}': {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._termos)
+
+    def _casar(self, tokens: List[str], i: int) -> Tuple[int, float]:
+        """
+        Procura o termo mais longo do léxico que começa na posição i.
+
+        :return: Par (número de tokens casados, peso); (0, 0.0) se nenhum termo casar
+        """
+        for tamanho in self._comprimentos.get(tokens[i], ()):
+            peso = self._termos.get(tuple(tokens[i:i + tamanho]))
+            if peso is not None:
+                return tamanho, peso
+        return 0, 0.0
+
+    @staticmethod
+    def _combinar_correlativos(membros: List[float]) -> float:
+        """
+        Combina os membros negados de uma construção "nem A nem B". Membros de polaridades opostas, como em
+        "nem bom nem ruim", descrevem algo neutro e não contam; caso contrário, como em "nem bonito nem útil",
+        os membros são somados.
+        """
+        if len(membros) > 1 and min(membros) < 0 < max(membros):
+            return 0.0
+        return sum(membros)
+
+    def pontuar(self, texto: str) -> float:
+        """
+        Calcula a pontuação de sentimento do texto.
+
+        Um negador inverte o primeiro termo nos janela_negacao tokens seguintes, exceto os termos que já começam
+        por um negador, como "nada bom", cuja polaridade já inclui a negação ("não foi nada bom" é negativo).
+
+        :param texto: Texto a ser pontuado
+        :return: Soma dos pesos casados; positiva, negativa ou zero
+        """
+        tokens = tokenizar(texto, manter_pontuacao=True)
+        pontuacao = 0.0
+        negacao_restante = 0
+        # Pontuações dos termos negados por "nem" na oração atual, combinadas ao fim da oração
+        correlativos: List[float] = []
+        em_correlativo = False
+        fator = 1.0
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token in _PONTUACAO:
+                pontuacao += self._combinar_correlativos(correlativos)
+                correlativos.clear()
+                negacao_restante, em_correlativo, fator = 0, False, 1.0
+                i += 1
+                continue
+
+            tamanho, peso = self._casar(tokens, i)
+            if token in self._intensificadores and i + 1 < len(tokens) and self._casar(tokens, i + 1)[0] \
+                    and tamanho <= 1:
+                # "bem ruim": o intensificador modifica o termo seguinte em vez de contar como termo próprio
+                fator *= self._intensificadores[token]
+                i += 1
+                continue
+            if tamanho:
+                if token in self._negadores:
+                    pontuacao += peso * fator
+                elif negacao_restante and em_correlativo:
+                    correlativos.append(-peso * fator)
+                else:
+                    pontuacao += peso * fator * (-1.0 if negacao_restante else 1.0)
+                negacao_restante, em_correlativo, fator = 0, False, 1.0
+                i += tamanho
+                continue
+
+            if token in self._negadores:
+                negacao_restante = self.janela_negacao
+                em_correlativo = token == _CORRELATIVO
+            elif negacao_restante:
+                negacao_restante -= 1
+            i += 1
+        return pontuacao + self._combinar_correlativos(correlativos)
+
+    def classificar(self, texto: str) -> str:
+        """
+        Classifica o sentimento do texto.
+
+        :param texto: Texto a ser classificado
+        :return: 'positivo', 'negativo' ou 'neutro'
+        """
+        pontuacao = self.pontuar(texto)
+        if pontuacao > 0:
+            return "positivo"
+        if pontuacao < 0:
+            return "negativo"
+        return "neutro"
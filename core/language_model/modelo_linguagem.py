@@ -17,21 +17,57 @@ Exceções:
 
 Dependências:
     - spacy
+    - config.config
     - utils.logger
     - utils.exceptions
     - core.memoria
     - core.mental_map_generator
     - core.chatgpt_integration
+    - core.cache_respostas
+    - core.cache_semantico
+    - core.sessao_conversa
+    - core.language_model.analise_documento
+    - core.language_model.analise_compacta
+    - core.language_model.lexico_sentimento
+    - core.language_model.classificador_sentimento
+    - core.language_model.sumarizador
+    - core.language_model.frequencia_documentos
+    - core.language_model.fragmentador
 """
 
 # Importações necessárias
+import threading
+from collections import deque
 import spacy
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, FrozenSet, Tuple
+from config.config import Config
 from utils.logger import configurar_logger
-from utils.exceptions import ModeloLinguagemError
+from utils.exceptions import ModeloLinguagemError, ChatGPTIntegrationError
 from core.memoria import GerenciadorMemoria
 from core.mental_map_generator import GeradorMapaMental
 from core.chatgpt_integration import ChatGPTIntegration
+from core.cache_respostas import CacheRespostas
+from core.cache_semantico import CacheSemantico
+from core.sessao_conversa import SessaoConversa
+from core.language_model.analise_documento import AnaliseDocumento, CacheAnalises
+from core.language_model.analise_compacta import AnaliseCompacta
+from core.language_model.lexico_sentimento import LexicoSentimento
+from core.language_model.classificador_sentimento import ClassificadorSentimento, CLASSES
+from core.language_model.sumarizador import SumarizadorGrafo
+from core.language_model.frequencia_documentos import TabelaFrequenciaDocumentos
+from core.language_model.fragmentador import Fonte, fragmentar
+
+MODELO_SPACY = "pt_core_news_sm"
+
+# Componentes do pipeline exigidos por cada operação pública. None significa o pipeline completo;
+# nomes ausentes do modelo carregado (ex.: "tagger" em modelos que usam apenas o "morphologizer") são ignorados.
+COMPONENTES_NECESSARIOS: Dict[str, Optional[Tuple[str, ...]]] = {
+    "processar_texto": None,
+    "extrair_palavras_chave": ("tok2vec", "tagger", "morphologizer", "attribute_ruler"),
+    "resumir_texto": ("tok2vec", "parser"),
+    "resumir_texto_grafo": ("tok2vec", "morphologizer", "parser", "attribute_ruler", "lemmatizer"),
+    "analisar_sentimento": (),
+}
 
 class ModeloLinguagem:
     def __init__(self, chatgpt_api_key: str):
@@ -40,11 +76,227 @@ class ModeloLinguagem:
 
         :param chatgpt_api_key: Chave da API do ChatGPT
         """
-        self.nlp = spacy.load("pt_core_news_sm")
+        self._nlp = None
+        self._lock_nlp = threading.Lock()
+        self._variantes_pipeline: Dict[FrozenSet[str], List[Tuple[str, Any]]] = {}
         self.logger = configurar_logger("modelo_linguagem")
         self.memoria = GerenciadorMemoria()
         self.gerador_mapa = GeradorMapaMental()
-        self.chatgpt = ChatGPTIntegration(api_key=chatgpt_api_key)
+        self.chatgpt = ChatGPTIntegration(api_key=chatgpt_api_key, cache=self._criar_cache_respostas(),
+                                          cache_semantico=self._criar_cache_semantico())
+        self.sessao = SessaoConversa.de_config(self.chatgpt, self.memoria)
+        self.cache_analises = CacheAnalises(tamanho_maximo=Config.NLP_CACHE_TAMANHO)
+        self.lexico_sentimento = LexicoSentimento.carregar(Config.LEXICO_SENTIMENTO_ARQUIVO)
+        self.classificador = self._carregar_classificador()
+        self.sumarizador = SumarizadorGrafo(tamanho_bloco=Config.RESUMO_TAMANHO_BLOCO)
+        self.frequencias = self._carregar_frequencias()
+
+    def _criar_cache_respostas(self) -> Optional[CacheRespostas]:
+        """
+        Cria o cache de respostas do ChatGPT conforme a configuração. Se o arquivo não puder ser aberto,
+        o cache passa a funcionar apenas em memória.
+
+        :return: Cache de respostas, ou None se estiver desativado
+        """
+        if not Config.CACHE_RESPOSTAS_ATIVO:
+            return None
+        parametros = dict(tamanho_memoria=Config.CACHE_RESPOSTAS_TAMANHO_MEMORIA,
+                          tamanho_maximo=Config.CACHE_RESPOSTAS_TAMANHO_MAXIMO, ttl=Config.CACHE_RESPOSTAS_TTL)
+        try:
+            return CacheRespostas(Config.CACHE_RESPOSTAS_ARQUIVO, **parametros)
+        except ChatGPTIntegrationError as e:
+            self.logger.warning("Cache de respostas apenas em memória: %s", e)
+            return CacheRespostas(None, **parametros)
+
+    def _criar_cache_semantico(self) -> Optional[CacheSemantico]:
+        """
+        Cria o cache de prompts similares conforme a configuração.
+
+        :return: Cache semântico, ou None se estiver desativado
+        """
+        if not Config.CACHE_SEMANTICO_ATIVO:
+            return None
+        return CacheSemantico(tamanho_maximo=Config.CACHE_SEMANTICO_TAMANHO_MAXIMO)
+
+    def _carregar_classificador(self) -> ClassificadorSentimento:
+        """
+        Carrega o classificador de sentimento salvo ou, se ele não refletir os aprendizados da memória,
+        reconstrói-o a partir dos registros aprendizado_N.
+
+        :return: Classificador sincronizado com a memória
+        """
+        contador = self.memoria.obter_informacao("contador_aprendizado") or 0
+        try:
+            classificador = ClassificadorSentimento.carregar(Config.CLASSIFICADOR_SENTIMENTO_ARQUIVO)
+        except ModeloLinguagemError as e:
+            self.logger.warning("Descartando classificador salvo: %s", e)
+            classificador = None
+        if classificador is not None and classificador.contador_aprendizado == contador:
+            return classificador
+
+        self.logger.info("Reconstruindo classificador de sentimento a partir de %s aprendizados", contador)
+        registros = (self.memoria.obter_informacao(f"aprendizado_{i}", registrar_acesso=False)
+                     for i in range(1, contador + 1))
+        classificador = ClassificadorSentimento.reconstruir(
+            ((registro.get("texto"), registro.get("feedback")) for registro in registros
+             if isinstance(registro, dict)),
+            contador_aprendizado=contador
+        )
+        if contador:
+            classificador.salvar(Config.CLASSIFICADOR_SENTIMENTO_ARQUIVO)
+        return classificador
+
+    def _carregar_frequencias(self) -> TabelaFrequenciaDocumentos:
+        """
+        Carrega a tabela de frequência de documentos salva, ou cria uma nova se ela não existir ou estiver corrompida.
+
+        :return: Tabela de frequência de documentos
+        """
+        try:
+            tabela = TabelaFrequenciaDocumentos.carregar(Config.FREQUENCIA_DOCUMENTOS_ARQUIVO)
+        except ModeloLinguagemError as e:
+            self.logger.warning("Descartando frequências de documentos salvas: %s", e)
+            tabela = None
+        return tabela if tabela is not None else TabelaFrequenciaDocumentos()
+
+    def _registrar_frequencias(self, analise: AnaliseDocumento):
+        """
+        Contabiliza o documento na tabela de frequências e a salva periodicamente.
+
+        :param analise: Análise com as classes gramaticais disponíveis
+        """
+        self.frequencias.registrar(analise.termos_chave)
+        if self.frequencias.pendentes >= Config.FREQUENCIA_DOCUMENTOS_INTERVALO_SALVAMENTO:
+            self.frequencias.salvar(Config.FREQUENCIA_DOCUMENTOS_ARQUIVO)
+
+    def _registrar_aprendizado(self, texto: str, feedback_usuario: str, contador: int):
+        """
+        Incorpora o aprendizado ao classificador de sentimento e o salva periodicamente. Se o programa terminar
+        antes do salvamento, o classificador é reconstruído a partir da memória na próxima inicialização.
+
+        :param texto: Texto do aprendizado
+        :param feedback_usuario: Feedback do usuário; só é um exemplo de treinamento se for uma das CLASSES
+        :param contador: Novo valor de contador_aprendizado
+        """
+        if feedback_usuario in CLASSES:
+            self.classificador.atualizar(texto, feedback_usuario)
+        self.classificador.contador_aprendizado = contador
+        if self.classificador.pendentes >= Config.CLASSIFICADOR_INTERVALO_SALVAMENTO:
+            self.classificador.salvar(Config.CLASSIFICADOR_SENTIMENTO_ARQUIVO)
+
+    def salvar_estado(self):
+        """
+        Persiste o estado aprendido que é salvo de forma periódica, como a tabela de frequência de documentos e o
+        classificador de sentimento, e garante que a memória esteja gravada em disco.
+
+        :raises ModeloLinguagemError: Se ocorrer um erro ao salvar
+        """
+        try:
+            if self.frequencias.pendentes:
+                self.frequencias.salvar(Config.FREQUENCIA_DOCUMENTOS_ARQUIVO)
+            if self.classificador.pendentes:
+                self.classificador.salvar(Config.CLASSIFICADOR_SENTIMENTO_ARQUIVO)
+            self.memoria.salvar_memoria()
+            self.logger.info("Estado do modelo salvo com sucesso")
+        except Exception as e:
+            self.logger.error("Erro ao salvar estado do modelo: %s", e)
+            raise ModeloLinguagemError(f"Erro ao salvar estado do modelo: {str(e)}")
+
+    @property
+    def nlp(self):
+        """
+        Modelo do spaCy, carregado apenas no primeiro uso.
+
+        :return: Pipeline do spaCy carregado
+        """
+        if self._nlp is None:
+            with self._lock_nlp:
+                if self._nlp is None:
+                    self.logger.info("Carregando modelo spaCy: %s", MODELO_SPACY)
+                    self._nlp = spacy.load(MODELO_SPACY)
+        return self._nlp
+
+    def _resolver_componentes(self, operacao: str) -> FrozenSet[str]:
+        """
+        Determina quais componentes do pipeline carregado são necessários para uma operação.
+
+        :param operacao: Nome do método público, chave de COMPONENTES_NECESSARIOS
+        :return: Conjunto de nomes de componentes presentes no pipeline
+        """
+        componentes = COMPONENTES_NECESSARIOS[operacao]
+        if componentes is None:
+            return frozenset(self.nlp.pipe_names)
+        return frozenset(nome for nome in componentes if nome in self.nlp.pipe_names)
+
+    def _pipeline_reduzido(self, componentes: FrozenSet[str]) -> List[Tuple[str, Any]]:
+        """
+        Retorna, em ordem, os componentes a executar para um subconjunto, memorizando cada variante.
+
+        :param componentes: Conjunto de nomes de componentes
+        :return: Lista de pares (nome, componente) na ordem do pipeline original
+        """
+        variante = self._variantes_pipeline.get(componentes)
+        if variante is None:
+            variante = [(nome, pipe) for nome, pipe in self.nlp.pipeline if nome in componentes]
+            self._variantes_pipeline[componentes] = variante
+        return variante
+
+    def _executar_pipeline(self, texto: str, componentes: FrozenSet[str]):
+        """
+        Processa o texto executando apenas os componentes indicados, sem alterar o estado do pipeline.
+
+        :param texto: Texto a ser processado
+        :param componentes: Conjunto de nomes de componentes a executar
+        :return: Doc do spaCy
+        """
+        doc = self.nlp.make_doc(texto)
+        for _, pipe in self._pipeline_reduzido(componentes):
+            doc = pipe(doc)
+        return doc
+
+    def analisar_documento(self, texto: str, operacao: str = "processar_texto") -> AnaliseDocumento:
+        """
+        Retorna a análise do texto, processando-o pelo pipeline apenas se ainda não estiver no cache.
+
+        Uma análise em cache só é reaproveitada se tiver executado os componentes exigidos pela operação;
+        caso contrário, o texto é reprocessado com a união dos componentes e a nova análise a substitui.
+        Cada texto novo com classes gramaticais é contabilizado uma vez na tabela de frequência de documentos.
+
+        :param texto: Texto a ser analisado
+        :param operacao: Operação que vai consumir a análise, chave de COMPONENTES_NECESSARIOS
+        :return: Análise compartilhada por processar_texto, extrair_palavras_chave, resumir_texto e aprender
+        """
+        necessarios = self._resolver_componentes(operacao)
+        analise = self.cache_analises.obter(texto, necessarios)
+        if analise is None:
+            anteriores = self.cache_analises.componentes_armazenados(texto)
+            necessarios |= anteriores
+            analise = AnaliseDocumento(self._executar_pipeline(texto, necessarios), necessarios)
+            self.cache_analises.armazenar(texto, analise)
+            componentes_chave = self._resolver_componentes("extrair_palavras_chave")
+            if componentes_chave <= necessarios and not componentes_chave <= anteriores:
+                self._registrar_frequencias(analise)
+        return analise
+
+    def estatisticas_cache_analises(self) -> Dict[str, Any]:
+        """
+        Retorna os contadores de acertos e falhas do cache de análises.
+
+        :return: Dicionário com as estatísticas do cache
+        """
+        return self.cache_analises.estatisticas()
+
+    def estatisticas_cache_respostas(self) -> Dict[str, Any]:
+        """
+        Retorna os contadores de acertos e falhas dos caches de respostas do ChatGPT.
+
+        :return: Dicionário com as estatísticas do cache exato e, em "semantico", as do cache semântico;
+                 caches desativados são omitidos
+        """
+        estatisticas = self.chatgpt.cache.estatisticas() if self.chatgpt.cache is not None else {}
+        if self.chatgpt.cache_semantico is not None:
+            estatisticas["semantico"] = self.chatgpt.cache_semantico.estatisticas()
+        return estatisticas
 
     def atualizar_chave_api_chatgpt(self, nova_chave: str):
         """
@@ -55,30 +307,165 @@ class ModeloLinguagem:
         self.chatgpt.atualizar_api_key(nova_chave)
         self.logger.info("Chave API do ChatGPT atualizada com sucesso")
 
-    def processar_texto(self, texto: str) -> Dict[str, List[str]]:
+    def processar_texto(self, texto: str) -> AnaliseCompacta:
         """
         Processa o texto e extrai informações linguísticas.
 
         :param texto: Texto a ser processado
-        :return: Dicionário contendo entidades, tokens, substantivos e verbos extraídos do texto
+        :return: Mapeamento compacto contendo entidades, tokens, substantivos e verbos extraídos do texto
         :raises ModeloLinguagemError: Se o texto for vazio ou None
         """
         if not texto:
             raise ModeloLinguagemError("O texto não pode ser vazio ou None")
         
-        self.logger.info(f"Processando texto: {texto[:50]}...")
-        doc = self.nlp(texto)
-        
-        resultado = {
-            "entidades": [ent.text for ent in doc.ents],
-            "tokens": [token.text for token in doc],
-            "substantivos": [token.text for token in doc if token.pos_ == "NOUN"],
-            "verbos": [token.text for token in doc if token.pos_ == "VERB"]
-        }
+        self.logger.info("Processando texto: %.50s...", texto)
+        resultado = self.analisar_documento(texto).compacta()
         
         self.logger.info("Texto processado com sucesso")
         return resultado
 
+    def _textos_validados(self, textos: Iterable[str]) -> Iterator[str]:
+        """
+        Percorre os textos de entrada sob demanda, validando cada um.
+
+        :param textos: Iterável de textos
+        :return: Iterador sobre os mesmos textos
+        :raises ModeloLinguagemError: Se algum texto for vazio ou None
+        """
+        for indice, texto in enumerate(textos):
+            if not texto:
+                raise ModeloLinguagemError(f"O texto na posição {indice} não pode ser vazio ou None")
+            yield texto
+
+    def _analisar_lote(self, textos: Iterable[str], batch_size: Optional[int], n_process: Optional[int],
+                       operacao: str = "processar_texto",
+                       registrar_frequencias: bool = True) -> Iterator[AnaliseDocumento]:
+        """
+        Processa um fluxo de textos com nlp.pipe, sem acumular os resultados em memória.
+
+        :param textos: Iterável de textos, possivelmente ilimitado
+        :param batch_size: Número de textos por lote enviado ao pipeline (padrão: Config.NLP_BATCH_SIZE)
+        :param n_process: Número de processos de trabalho; -1 usa todos os núcleos (padrão: Config.NLP_N_PROCESS)
+        :param operacao: Operação que vai consumir as análises, chave de COMPONENTES_NECESSARIOS
+        :param registrar_frequencias: Se False, os textos não são contabilizados como documentos na tabela de
+                                      frequências (usado quando são fragmentos de um mesmo documento)
+        :return: Iterador de análises, na mesma ordem da entrada
+        :raises ValueError: Se batch_size não for positivo ou n_process for zero ou menor que -1
+        """
+        batch_size = Config.NLP_BATCH_SIZE if batch_size is None else batch_size
+        n_process = Config.NLP_N_PROCESS if n_process is None else n_process
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size deve ser um inteiro positivo")
+        if not isinstance(n_process, int) or n_process == 0 or n_process < -1:
+            raise ValueError("n_process deve ser um inteiro positivo ou -1")
+
+        self.logger.info("Processando textos em lote (batch_size=%s, n_process=%s)", batch_size, n_process)
+        necessarios = self._resolver_componentes(operacao)
+        desativados = [nome for nome in self.nlp.pipe_names if nome not in necessarios]
+        registrar = registrar_frequencias and self._resolver_componentes("extrair_palavras_chave") <= necessarios
+        total = 0
+        for doc in self.nlp.pipe(self._textos_validados(textos), batch_size=batch_size, n_process=n_process,
+                                 disable=desativados):
+            total += 1
+            analise = AnaliseDocumento(doc, necessarios)
+            if registrar:
+                self._registrar_frequencias(analise)
+            yield analise
+        self.logger.info("Lote concluído: %s textos processados", total)
+
+    def processar_textos(self, textos: Iterable[str], batch_size: Optional[int] = None,
+                         n_process: Optional[int] = None) -> Iterator[AnaliseCompacta]:
+        """
+        Versão em lote de processar_texto, que entrega os resultados à medida que ficam prontos.
+
+        :param textos: Iterável de textos a serem processados
+        :param batch_size: Número de textos por lote enviado ao pipeline
+        :param n_process: Número de processos de trabalho; -1 usa todos os núcleos
+        :return: Gerador de resultados no mesmo formato de processar_texto, na ordem da entrada
+        :raises ModeloLinguagemError: Se algum texto for vazio ou None
+        """
+        for analise in self._analisar_lote(textos, batch_size, n_process):
+            yield analise.compacta()
+
+    def analisar_documentos(self, textos: Iterable[str], batch_size: Optional[int] = None,
+                            n_process: Optional[int] = None) -> Iterator[AnaliseDocumento]:
+        """
+        Analisa um fluxo de textos com o pipeline completo, entregando as análises à medida que ficam prontas.
+        Cada análise serve a todas as operações (processamento, palavras-chave e resumo) sem novo processamento.
+
+        :param textos: Iterável de textos a serem analisados
+        :param batch_size: Número de textos por lote enviado ao pipeline
+        :param n_process: Número de processos de trabalho; -1 usa todos os núcleos
+        :return: Gerador de análises, na ordem da entrada
+        :raises ModeloLinguagemError: Se algum texto for vazio ou None
+        """
+        return self._analisar_lote(textos, batch_size, n_process)
+
+    def extrair_palavras_chave_lote(self, textos: Iterable[str], batch_size: Optional[int] = None,
+                                    n_process: Optional[int] = None) -> Iterator[List[str]]:
+        """
+        Versão em lote de extrair_palavras_chave, que entrega os resultados à medida que ficam prontos.
+
+        :param textos: Iterável de textos dos quais extrair palavras-chave
+        :param batch_size: Número de textos por lote enviado ao pipeline
+        :param n_process: Número de processos de trabalho; -1 usa todos os núcleos
+        :return: Gerador de listas de palavras-chave, na ordem da entrada
+        :raises ModeloLinguagemError: Se algum texto for vazio ou None
+        """
+        for analise in self._analisar_lote(textos, batch_size, n_process, "extrair_palavras_chave"):
+            yield list(analise.palavras_chave)
+
+    def processar_texto_stream(self, fonte: Fonte, tamanho_bloco: Optional[int] = None,
+                               batch_size: Optional[int] = None, n_process: Optional[int] = None,
+                               encoding: str = "utf-8") -> Iterator[AnaliseCompacta]:
+        """
+        Processa um documento de tamanho arbitrário em blocos, entregando o resultado de cada bloco assim que
+        ele fica pronto. O documento é lido de forma incremental e cortado em fronteiras de parágrafo ou
+        sentença, de modo que o pico de memória depende do tamanho do bloco e não do tamanho do documento.
+
+        :param fonte: Caminho de um arquivo de texto ou iterável de strings (para um texto já em memória, use [texto])
+        :param tamanho_bloco: Tamanho máximo de cada bloco em caracteres (padrão: Config.NLP_TAMANHO_BLOCO_STREAM)
+        :param batch_size: Número de blocos por lote enviado ao pipeline
+        :param n_process: Número de processos de trabalho; -1 usa todos os núcleos
+        :param encoding: Codificação usada quando a fonte é um caminho
+        :return: Gerador de resultados no formato de processar_texto, um por bloco; os atributos inicio, fim e
+                 entidades_posicoes trazem posições relativas ao documento inteiro
+        :raises ValueError: Se tamanho_bloco não for positivo ou exceder nlp.max_length
+        """
+        tamanho_bloco = Config.NLP_TAMANHO_BLOCO_STREAM if tamanho_bloco is None else tamanho_bloco
+        if not isinstance(tamanho_bloco, int) or not 0 < tamanho_bloco <= self.nlp.max_length:
+            raise ValueError(f"tamanho_bloco deve ser um inteiro entre 1 e {self.nlp.max_length}")
+
+        self.logger.info("Processando documento em blocos de até %s caracteres", tamanho_bloco)
+        deslocamentos = deque()
+
+        def blocos() -> Iterator[str]:
+            for bloco, deslocamento in fragmentar(fonte, tamanho_bloco, encoding):
+                deslocamentos.append(deslocamento)
+                yield bloco
+
+        # nlp.pipe preserva a ordem, então cada Doc corresponde ao deslocamento mais antigo ainda pendente
+        for analise in self._analisar_lote(blocos(), batch_size, n_process, registrar_frequencias=False):
+            yield analise.compacta(deslocamentos.popleft())
+
+    def processar_arquivo(self, fonte: Fonte, tamanho_bloco: Optional[int] = None,
+                          encoding: str = "utf-8") -> Dict[str, Any]:
+        """
+        Processa um documento de tamanho arbitrário e mescla os resultados dos blocos à medida que são produzidos.
+
+        :param fonte: Caminho de um arquivo de texto ou iterável de strings
+        :param tamanho_bloco: Tamanho máximo de cada bloco em caracteres
+        :param encoding: Codificação usada quando a fonte é um caminho
+        :return: Dicionário com as chaves de processar_texto e "entidades_posicoes" para o documento inteiro
+        """
+        mesclado: Dict[str, Any] = {chave: [] for chave in AnaliseCompacta.CHAVES}
+        mesclado["entidades_posicoes"] = []
+        for resultado in self.processar_texto_stream(fonte, tamanho_bloco, encoding=encoding):
+            for chave in AnaliseCompacta.CHAVES:
+                mesclado[chave].extend(resultado[chave])
+            mesclado["entidades_posicoes"].extend(resultado.entidades_posicoes)
+        return mesclado
+
     def analisar_sentimento(self, texto: str) -> str:
         """
         Analisa o sentimento do texto.
@@ -90,22 +477,15 @@ class ModeloLinguagem:
         if not texto:
             raise ValueError("O texto não pode ser vazio")
         
-        self.logger.info(f"Analisando sentimento do texto: {texto[:50]}...")
-        
-        palavras_positivas = ['bom', 'ótimo', 'excelente', 'maravilhoso', 'feliz', 'alegre']
-        palavras_negativas = ['ruim', 'péssimo', 'terrível', 'horrível', 'triste', 'infeliz']
-        
-        contagem_positiva = sum(1 for palavra in palavras_positivas if palavra in texto.lower())
-        contagem_negativa = sum(1 for palavra in palavras_negativas if palavra in texto.lower())
-        
-        if contagem_positiva > contagem_negativa:
-            sentimento = "positivo"
-        elif contagem_negativa > contagem_positiva:
-            sentimento = "negativo"
-        else:
-            sentimento = "neutro"
-        
-        self.logger.info(f"Sentimento analisado: {sentimento}")
+        self.logger.info("Analisando sentimento do texto: %.50s...", texto)
+        sentimento = None
+        if self.classificador.pronto(Config.CLASSIFICADOR_MINIMO_EXEMPLOS):
+            classe, confianca = self.classificador.prever(texto)
+            if confianca >= Config.CLASSIFICADOR_LIMIAR_CONFIANCA:
+                sentimento = classe
+        if sentimento is None:
+            sentimento = self.lexico_sentimento.classificar(texto)
+        self.logger.info("Sentimento analisado: %s", sentimento)
         return sentimento
 
     def extrair_palavras_chave(self, texto: str) -> List[str]:
@@ -119,50 +499,89 @@ class ModeloLinguagem:
         if not texto:
             raise ValueError("O texto não pode ser vazio")
         
-        self.logger.info(f"Extraindo palavras-chave do texto: {texto[:50]}...")
-        doc = self.nlp(texto)
-        palavras_chave = [token.text for token in doc if not token.is_stop and token.pos_ in ["NOUN", "PROPN", "ADJ"]]
-        self.logger.info(f"Palavras-chave extraídas: {palavras_chave}")
+        self.logger.info("Extraindo palavras-chave do texto: %.50s...", texto)
+        palavras_chave = list(self.analisar_documento(texto, "extrair_palavras_chave").palavras_chave)
+        self.logger.info("Palavras-chave extraídas: %d", len(palavras_chave))
+        self.logger.debug("Palavras-chave: %s", palavras_chave)
         return palavras_chave
 
-    def resumir_texto(self, texto: str, num_sentencas: int = 3) -> str:
+    def extrair_palavras_chave_ranqueadas(self, texto: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Extrai as palavras-chave mais relevantes do texto, ranqueadas por TF-IDF em relação a todos os textos
+        já processados pelo sistema.
+
+        :param texto: O texto do qual extrair palavras-chave
+        :param top_k: Número máximo de palavras-chave devolvidas
+        :return: Lista de pares (palavra-chave em minúsculas, pontuação) em ordem decrescente de pontuação
+        :raises ValueError: Se o texto estiver vazio ou top_k não for um inteiro positivo
+        """
+        if not texto:
+            raise ValueError("O texto não pode ser vazio")
+        
+        self.logger.info("Extraindo palavras-chave ranqueadas do texto: %.50s...", texto)
+        analise = self.analisar_documento(texto, "extrair_palavras_chave")
+        palavras_chave = self.frequencias.ranquear(analise.termos_chave, top_k)
+        self.logger.info("Palavras-chave ranqueadas extraídas: %d", len(palavras_chave))
+        self.logger.debug("Palavras-chave ranqueadas: %s", palavras_chave)
+        return palavras_chave
+
+    def resumir_texto(self, texto: str, num_sentencas: int = 3, modo: str = "primeiras") -> str:
         """
         Resume o texto para um número específico de sentenças.
 
         :param texto: Texto a ser resumido
         :param num_sentencas: Número de sentenças desejadas no resumo
+        :param modo: 'primeiras' mantém as primeiras sentenças; 'grafo' escolhe as sentenças mais centrais
+                     por TextRank/LexRank, mantendo a ordem original
         :return: Resumo do texto
-        :raises ValueError: Se texto for vazio ou num_sentencas não for um inteiro positivo
+        :raises ValueError: Se texto for vazio, num_sentencas não for um inteiro positivo ou o modo for inválido
         """
         if not texto:
             raise ValueError("O texto não pode ser vazio")
         if not isinstance(num_sentencas, int) or num_sentencas <= 0:
             raise ValueError("num_sentencas deve ser um inteiro positivo")
+        if modo not in ("primeiras", "grafo"):
+            raise ValueError("modo deve ser 'primeiras' ou 'grafo'")
         
-        self.logger.info(f"Resumindo texto: {texto[:50]}...")
-        doc = self.nlp(texto)
-        sentencas = [sent.text for sent in doc.sents]
-        resumo = " ".join(sentencas[:num_sentencas])
-        self.logger.info(f"Resumo gerado: {resumo}")
+        self.logger.info("Resumindo texto: %.50s...", texto)
+        operacao = "resumir_texto_grafo" if modo == "grafo" else "resumir_texto"
+        resumo = self.resumir_analise(self.analisar_documento(texto, operacao), num_sentencas, modo)
+        self.logger.info("Resumo gerado com %d caracteres", len(resumo))
+        self.logger.debug("Resumo: %s", resumo)
         return resumo
 
-    def salvar_informacao(self, chave: str, valor: Any):
+    def resumir_analise(self, analise: AnaliseDocumento, num_sentencas: int = 3, modo: str = "primeiras") -> str:
+        """
+        Resume um texto já analisado, com as mesmas regras de resumir_texto.
+
+        :param analise: Análise com as sentenças (e, no modo 'grafo', os lemas) do texto
+        :param num_sentencas: Número de sentenças desejadas no resumo
+        :param modo: 'primeiras' ou 'grafo'
+        :return: Resumo do texto
+        """
+        if modo == "grafo":
+            indices = self.sumarizador.selecionar(analise.lemas_por_sentenca, num_sentencas)
+            return " ".join(analise.sentencas[i] for i in indices)
+        return " ".join(analise.sentencas[:num_sentencas])
+
+    def salvar_informacao(self, chave: str, valor: Any, ttl: Optional[float] = None):
         """
         Salva informações na memória.
 
         :param chave: Chave para identificar a informação
         :param valor: Valor da informação a ser salva
+        :param ttl: Tempo de vida da informação, em segundos; ver GerenciadorMemoria.adicionar_informacao
         :raises ValueError: Se a chave for vazia
         :raises ModeloLinguagemError: Se ocorrer um erro ao salvar a informação
         """
         if not chave:
             raise ValueError("A chave não pode ser vazia")
         try:
-            self.logger.info(f"Salvando informação: {chave}")
-            self.memoria.adicionar_informacao(chave, valor)
-            self.logger.info(f"Informação salva com sucesso: {chave}")
+            self.logger.info("Salvando informação: %s", chave)
+            self.memoria.adicionar_informacao(chave, valor, ttl)
+            self.logger.info("Informação salva com sucesso: %s", chave)
         except Exception as e:
-            self.logger.error(f"Erro ao salvar informação: {str(e)}")
+            self.logger.error("Erro ao salvar informação: %s", e)
             raise ModeloLinguagemError(f"Erro ao salvar informação: {str(e)}")
 
     def recuperar_informacao(self, chave: str) -> Any:
@@ -177,12 +596,12 @@ class ModeloLinguagem:
         if not chave:
             raise ValueError("A chave não pode ser vazia")
         try:
-            self.logger.info(f"Recuperando informação: {chave}")
+            self.logger.info("Recuperando informação: %s", chave)
             valor = self.memoria.obter_informacao(chave)
-            self.logger.info(f"Informação recuperada: {chave}")
+            self.logger.info("Informação recuperada: %s", chave)
             return valor
         except Exception as e:
-            self.logger.error(f"Erro ao recuperar informação: {str(e)}")
+            self.logger.error("Erro ao recuperar informação: %s", e)
             raise ModeloLinguagemError(f"Erro ao recuperar informação: {str(e)}")
 
     def obter_todas_informacoes(self) -> Dict[str, Any]:
@@ -195,7 +614,7 @@ class ModeloLinguagem:
         try:
             return self.memoria.obter_todas_informacoes()
         except Exception as e:
-            self.logger.error(f"Erro ao recuperar todas as informações: {str(e)}")
+            self.logger.error("Erro ao recuperar todas as informações: %s", e)
             raise ModeloLinguagemError(f"Erro ao recuperar todas as informações: {str(e)}")
 
     def limpar_memoria(self):
@@ -204,7 +623,7 @@ class ModeloLinguagem:
             self.memoria.limpar_memoria()
             self.logger.info("Memória limpa com sucesso")
         except Exception as e:
-            self.logger.error(f"Erro ao limpar memória: {str(e)}")
+            self.logger.error("Erro ao limpar memória: %s", e)
             raise ModeloLinguagemError(f"Erro ao limpar memória: {str(e)}")
 
     def adicionar_ao_mapa_mental(self, conceito: str, relacionados: List[str]):
@@ -221,10 +640,10 @@ class ModeloLinguagem:
         if not isinstance(relacionados, list):
             raise TypeError("relacionados deve ser uma lista de strings")
         
-        self.logger.info(f"Adicionando conceito ao mapa mental: {conceito}")
-        self.logger.debug(f"Conceitos relacionados: {relacionados}")
+        self.logger.info("Adicionando conceito ao mapa mental: %s", conceito)
+        self.logger.debug("Conceitos relacionados: %s", relacionados)
         self.gerador_mapa.adicionar_conceito(conceito, relacionados)
-        self.logger.info(f"Conceito adicionado com sucesso: {conceito}")
+        self.logger.info("Conceito adicionado com sucesso: %s", conceito)
 
     def gerar_mapa_mental(self, arquivo_saida: str = "mapa_mental.png"):
         """
@@ -238,7 +657,7 @@ class ModeloLinguagem:
         
         self.logger.info("Gerando mapa mental")
         self.gerador_mapa.gerar_mapa(arquivo_saida)
-        self.logger.info(f"Mapa mental gerado com sucesso: {arquivo_saida}")
+        self.logger.info("Mapa mental gerado com sucesso: %s", arquivo_saida)
 
     def aprender(self, texto: str, feedback_usuario: str):
         """
@@ -251,7 +670,7 @@ class ModeloLinguagem:
         if not texto or not feedback_usuario:
             raise ValueError("Texto e feedback do usuário não podem ser vazios")
         
-        self.logger.info(f"Aprendendo com feedback do usuário: {feedback_usuario}")
+        self.logger.info("Aprendendo com feedback do usuário: %s", feedback_usuario)
         resultado = self.processar_texto(texto)
         
         contador = self.memoria.obter_informacao("contador_aprendizado") or 0
@@ -260,13 +679,13 @@ class ModeloLinguagem:
         self.salvar_informacao(f"aprendizado_{contador}", {
             "texto": texto,
             "feedback": feedback_usuario,
-            "analise": resultado
+            "analise": resultado.codificar()
         })
         
         self.salvar_informacao("contador_aprendizado", contador)
-        
-        # Espaço para implementar lógica adicional de ajuste do modelo
-        self.logger.info(f"Aprendizado #{contador} concluído com sucesso")
+
+        self._registrar_aprendizado(texto, feedback_usuario, contador)
+        self.logger.info("Aprendizado #%s concluído com sucesso", contador)
 
     def gerar_resposta_chatgpt(self, texto: str) -> str:
         """
@@ -277,10 +696,52 @@ class ModeloLinguagem:
         :raises ModeloLinguagemError: Se ocorrer um erro ao gerar a resposta
         """
         try:
-            self.logger.info(f"Gerando resposta ChatGPT para: {texto[:50]}...")
+            self.logger.info("Gerando resposta ChatGPT para: %.50s...", texto)
             resposta = self.chatgpt.gerar_resposta(texto)
             self.logger.info("Resposta ChatGPT gerada com sucesso")
             return resposta
         except Exception as e:
-            self.logger.error(f"Erro ao gerar resposta ChatGPT: {str(e)}")
-            raise ModeloLinguagemError(f"Erro ao gerar resposta ChatGPT: {str(e)}")
\ No newline at end of file
+            self.logger.error("Erro ao gerar resposta ChatGPT: %s", e)
+            raise ModeloLinguagemError(f"Erro ao gerar resposta ChatGPT: {str(e)}")
+
+    def gerar_resposta_chatgpt_stream(self, texto: str) -> Iterator[str]:
+        """
+        Gera uma resposta usando o ChatGPT dentro da sessão de conversa, devolvendo os trechos do texto à medida
+        que chegam. A requisição inclui os turnos recentes, o resumo dos anteriores e as informações da memória
+        relacionadas ao texto.
+
+        :param texto: Texto de entrada para o qual se deseja uma resposta
+        :return: Iterador de trechos da resposta
+        :raises ModeloLinguagemError: Se ocorrer um erro ao gerar a resposta (levantado durante a iteração)
+        """
+        try:
+            self.logger.info("Gerando resposta ChatGPT em streaming para: %.50s...", texto)
+            yield from self.sessao.gerar_resposta_stream(texto)
+            self.logger.info("Resposta ChatGPT gerada com sucesso")
+        except Exception as e:
+            self.logger.error("Erro ao gerar resposta ChatGPT: %s", e)
+            raise ModeloLinguagemError(f"Erro ao gerar resposta ChatGPT: {str(e)}")
+
+    def limpar_conversa(self):
+        """
+        Inicia uma nova sessão de conversa, descartando o histórico e o resumo.
+        """
+        self.sessao.limpar()
+        self.logger.info("Sessão de conversa reiniciada")
+
+    def gerar_respostas_chatgpt_lote(self, textos: List[str], concorrencia: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Gera respostas do ChatGPT para vários textos em paralelo, com concorrência limitada.
+
+        :param textos: Textos de entrada
+        :param concorrencia: Número máximo de requisições simultâneas; por padrão, Config.CHATGPT_CONCORRENCIA
+        :return: Um dicionário por texto, na mesma ordem, com as chaves "resposta" (None em caso de erro) e
+                 "erro" (a exceção ocorrida, ou None)
+        :raises ModeloLinguagemError: Se o lote não puder ser executado
+        """
+        try:
+            self.logger.info("Gerando respostas ChatGPT para %d textos", len(textos))
+            return self.chatgpt.gerar_respostas_lote(textos, concorrencia)
+        except Exception as e:
+            self.logger.error("Erro ao gerar respostas ChatGPT em lote: %s", e)
+            raise ModeloLinguagemError(f"Erro ao gerar respostas ChatGPT em lote: {str(e)}")
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: sumarizador
+
+Este módulo implementa a classe SumarizadorGrafo, um sumarizador extrativo no estilo TextRank/LexRank.
+Cada sentença é representada por um vetor esparso de lemas com hashing; a similaridade de cosseno entre
+sentenças forma um grafo cujos nós são pontuados por iteração de potência (PageRank). Textos longos podem
+ser processados em blocos de sentenças, o que mantém a memória limitada e o tempo aproximadamente linear.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - SumarizadorGrafo
+
+Dependências:
+    - numpy
+    - scipy.sparse
+    - zlib
+"""
+
+import zlib
+import numpy as np
+from scipy import sparse
+from typing import List, Sequence
+
+DIMENSAO_PADRAO = 2 ** 18
+TAMANHO_BLOCO_PADRAO = 2000
+
+class SumarizadorGrafo:
+    """
+    Sumarizador extrativo baseado em centralidade de sentenças em um grafo de similaridade.
+    """
+
+    def __init__(self, dimensao: int = DIMENSAO_PADRAO, amortecimento: float = 0.85,
+                 limiar_similaridade: float = 0.1, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                 tolerancia: float = 1e-6, max_iteracoes: int = 100):
+        """
+        Inicializa o sumarizador.
+
+        :param dimensao: Número de posições do espaço de lemas com hashing
+        :param amortecimento: Fator de amortecimento do PageRank
+        :param limiar_similaridade: Similaridades abaixo deste valor não geram arestas (LexRank)
+        :param tamanho_bloco: Número máximo de sentenças comparadas entre si de uma vez; 0 desativa os blocos
+        :param tolerancia: Critério de convergência da iteração de potência (norma L1)
+        :param max_iteracoes: Número máximo de iterações de potência
+        :raises ValueError: Se algum parâmetro estiver fora do intervalo válido
+        """
+        if not isinstance(dimensao, int) or dimensao <= 0:
+            raise ValueError("dimensao deve ser um inteiro positivo")
+        if not 0 < amortecimento < 1:
+            raise ValueError("amortecimento deve estar entre 0 e 1")
+        if not isinstance(tamanho_bloco, int) or tamanho_bloco < 0:
+            raise ValueError("tamanho_bloco deve ser um inteiro não negativo")
+        self.dimensao = dimensao
+        self.amortecimento = amortecimento
+        self.limiar_similaridade = limiar_similaridade
+        self.tamanho_bloco = tamanho_bloco
+        self.tolerancia = tolerancia
+        self.max_iteracoes = max_iteracoes
+
+    def vetorizar(self, sentencas: Sequence[Sequence[str]]) -> sparse.csr_matrix:
+        """
+        Converte as sentenças em uma matriz esparsa de frequências de lemas, com linhas normalizadas (L2).
+
+        :param sentencas: Sequência de sentenças, cada uma uma sequência de lemas
+        :return: Matriz CSR de formato (número de sentenças, dimensao)
+        """
+        ponteiros = np.zeros(len(sentencas) + 1, dtype=np.int64)
+        indices: List[int] = []
+        for i, lemas in enumerate(sentencas):
+            indices.extend(zlib.crc32(lema.encode("utf-8")) % self.dimensao for lema in lemas)
+            ponteiros[i + 1] = len(indices)
+        dados = np.ones(len(indices), dtype=np.float64)
+        matriz = sparse.csr_matrix((dados, np.asarray(indices, dtype=np.int64), ponteiros),
+                                   shape=(len(sentencas), self.dimensao))
+        matriz.sum_duplicates()
+        normas = np.sqrt(np.asarray(matriz.multiply(matriz).sum(axis=1)).ravel())
+        normas[normas == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1.0 / normas) @ matriz)
+
+    def _pagerank(self, similaridade: sparse.csr_matrix) -> np.ndarray:
+        """
+        Calcula a centralidade de cada nó do grafo por iteração de potência.
+
+        :param similaridade: Matriz de adjacência ponderada, simétrica e sem diagonal
+        :return: Vetor de pontuações que soma 1
+        """
+        n = similaridade.shape[0]
+        graus = np.asarray(similaridade.sum(axis=1)).ravel()
+        sem_arestas = graus == 0
+        graus[sem_arestas] = 1.0
+        # Transposta da matriz de transição normalizada por linha: p_novo = d * T @ p + teleporte
+        transicao = sparse.csr_matrix((sparse.diags(1.0 / graus) @ similaridade).T)
+        pontuacoes = np.full(n, 1.0 / n)
+        for _ in range(self.max_iteracoes):
+            massa_pendente = pontuacoes[sem_arestas].sum()
+            novas = (self.amortecimento * (transicao @ pontuacoes)
+                     + (1.0 - self.amortecimento + self.amortecimento * massa_pendente) / n)
+            convergiu = np.abs(novas - pontuacoes).sum() < self.tolerancia
+            pontuacoes = novas
+            if convergiu:
+                break
+        return pontuacoes
+
+    def _pontuar_bloco(self, sentencas: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        Pontua um bloco de sentenças, escalando o resultado para que a pontuação média seja 1.
+
+        :param sentencas: Sentenças do bloco, como sequências de lemas
+        :return: Pontuações das sentenças do bloco
+        """
+        vetores = self.vetorizar(sentencas)
+        similaridade = sparse.csr_matrix(vetores @ vetores.T)
+        similaridade = sparse.csr_matrix(similaridade - sparse.diags(similaridade.diagonal()))
+        if self.limiar_similaridade > 0:
+            similaridade.data[similaridade.data < self.limiar_similaridade] = 0.0
+        similaridade.eliminate_zeros()
+        return self._pagerank(similaridade) * len(sentencas)
+
+    def pontuar(self, sentencas: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        Pontua as sentenças por centralidade. Com tamanho_bloco > 0, o grafo é construído por blocos
+        consecutivos de sentenças, e o custo total cresce linearmente com o número de sentenças.
+
+        :param sentencas: Sequência de sentenças, cada uma uma sequência de lemas
+        :return: Pontuações, uma por sentença
+        """
+        n = len(sentencas)
+        if n == 0:
+            return np.zeros(0)
+        bloco = self.tamanho_bloco or n
+        return np.concatenate([self._pontuar_bloco(sentencas[inicio:inicio + bloco])
+                               for inicio in range(0, n, bloco)])
+
+    def selecionar(self, sentencas: Sequence[Sequence[str]], num_sentencas: int) -> List[int]:
+        """
+        Escolhe as sentenças mais centrais.
+
+        :param sentencas: Sequência de sentenças, cada uma uma sequência de lemas
+        :param num_sentencas: Número de sentenças desejadas
+        :return: Índices das sentenças escolhidas, na ordem original do texto
+        """
+        pontuacoes = self.pontuar(sentencas)
+        if num_sentencas >= len(pontuacoes):
+            return list(range(len(pontuacoes)))
+        # Ordenação estável: em caso de empate, prevalece a sentença que aparece primeiro
+        escolhidas = np.argsort(-pontuacoes, kind="stable")[:num_sentencas]
+        return sorted(int(i) for i in escolhidas)
@@ -1,51 +1,342 @@
 ﻿# core/memoria.py
 
 import json
-from typing import Dict, List, Any
-import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Any, Optional
+from config.config import Config
+from core.armazenamento.base import CAMPO_EXPIRACAO, ArmazenamentoMemoria, desembrulhar
+from core.armazenamento.arquivo_json import ArmazenamentoJson
+from core.armazenamento.descarte import IndiceExpiracao, criar_politica
+from core.armazenamento.indexado import ArmazenamentoIndexado
+from core.armazenamento.log import ArmazenamentoLog
+from core.armazenamento.sqlite import ArmazenamentoSQLite
+from utils.exceptions import MemoriaError
+from utils.logger import configurar_logger
+
+BACKENDS = ("json", "log", "sqlite", "sql", "indexado")
+_AUSENTE = object()
+
+def criar_armazenamento(backend: Optional[str] = None, destino: Optional[str] = None) -> ArmazenamentoMemoria:
+    """
+    Cria o armazenamento de um backend com os parâmetros de Config.
+
+    :param backend: 'json' regrava o arquivo inteiro a cada alteração; 'log' acrescenta um registro por alteração;
+                    'sqlite' usa um banco SQLite local; 'sql' usa um banco SQL com pool de conexões; 'indexado' lê
+                    os valores sob demanda de uma tabela mapeada em memória. Por padrão, Config.MEMORIA_BACKEND
+    :param destino: Caminho do arquivo, ou URL do banco no backend 'sql'; por padrão, o configurado em Config
+    :return: Armazenamento aberto
+    :raises ValueError: Se o backend for desconhecido
+    :raises MemoriaError: Se o armazenamento não puder ser aberto
+    """
+    backend = backend or Config.MEMORIA_BACKEND
+    if backend == "json":
+        return ArmazenamentoJson(destino or Config.MEMORIA_ARQUIVO, Config.MEMORIA_ESCRITA_ATRASADA,
+                                 Config.MEMORIA_INTERVALO_ESCRITA, Config.MEMORIA_MAX_PENDENTES)
+    if backend == "log":
+        return ArmazenamentoLog(destino or Config.MEMORIA_ARQUIVO_LOG, Config.MEMORIA_LOG_FSYNC_LOTE,
+                                Config.MEMORIA_LOG_FRACAO_COMPACTACAO, Config.MEMORIA_LOG_MINIMO_COMPACTACAO)
+    if backend == "sqlite":
+        return ArmazenamentoSQLite(destino or Config.MEMORIA_ARQUIVO_SQLITE)
+    if backend == "sql":
+        # Importado apenas quando usado, para não carregar o SQLAlchemy nos demais backends
+        from core.armazenamento.sql import ArmazenamentoSQL
+        return ArmazenamentoSQL(destino or Config.get_database_url(), Config.MEMORIA_SQL_TAMANHO_POOL,
+                                Config.MEMORIA_SQL_MAX_OVERFLOW)
+    if backend == "indexado":
+        return ArmazenamentoIndexado(destino or Config.MEMORIA_ARQUIVO_INDEXADO, Config.MEMORIA_LOG_FSYNC_LOTE,
+                                     Config.MEMORIA_INDEXADO_FRACAO_COMPACTACAO,
+                                     Config.MEMORIA_INDEXADO_MINIMO_COMPACTACAO)
+    raise ValueError(f"backend deve ser um de: {', '.join(BACKENDS)}")
 
 class GerenciadorMemoria:
-    def __init__(self, arquivo_memoria: str = 'memoria.json'):
-        self.arquivo_memoria = arquivo_memoria
-        self.memoria = self.carregar_memoria()
-        self.tamanho_maximo = 1000  # Limite máximo de itens na memória
+    def __init__(self, arquivo_memoria: Optional[str] = None, backend: Optional[str] = None,
+                 armazenamento: Optional[ArmazenamentoMemoria] = None, politica: Optional[str] = None,
+                 tamanho_maximo: Optional[int] = None, orcamento_bytes: Optional[int] = None,
+                 ttl_padrao: Optional[float] = None, chaves_fixas: Optional[Iterable[str]] = None):
+        """
+        Inicializa a memória sobre um armazenamento persistente. Ao abrir, são lidas apenas as expirações e, se
+        houver orçamento, os tamanhos das informações; nenhum valor é decodificado. A política de descarte passa a
+        acompanhar cada chave quando ela é gravada ou usada, e as chaves gravadas antes são descartadas primeiro,
+        na ordem do armazenamento.
 
-    def carregar_memoria(self) -> Dict[str, Any]:
+        :param arquivo_memoria: Caminho do arquivo (ou URL do banco no backend 'sql'); ver criar_armazenamento
+        :param backend: Backend de persistência; ver criar_armazenamento
+        :param armazenamento: Armazenamento já aberto, usado no lugar de arquivo_memoria e backend
+        :param politica: Informação descartada ao atingir um limite: 'fifo' (gravada há mais tempo), 'lru' (usada
+                         há mais tempo) ou 'lfu' (menos usada); por padrão, Config.MEMORIA_POLITICA_DESCARTE
+        :param tamanho_maximo: Número máximo de informações, 0 para não limitar; por padrão,
+                               Config.MEMORIA_TAMANHO_MAXIMO nos backends que mantêm os valores em memória ('json'
+                               e 'log') e Config.MEMORIA_TAMANHO_MAXIMO_DISCO nos demais
+        :param orcamento_bytes: Soma máxima dos tamanhos das informações codificadas em JSON, 0 para não limitar;
+                                por padrão, Config.MEMORIA_ORCAMENTO_BYTES
+        :param ttl_padrao: Tempo de vida, em segundos, das informações gravadas sem ttl, 0 para não expirarem; por
+                           padrão, Config.MEMORIA_TTL_PADRAO
+        :param chaves_fixas: Chaves nunca descartadas, mesmo que os limites sejam excedidos; por padrão,
+                             Config.MEMORIA_CHAVES_FIXAS
+        :raises ValueError: Se o backend ou a política forem desconhecidos, ou se um limite for negativo
+        :raises MemoriaError: Se o armazenamento não puder ser aberto
+        """
+        self.logger = configurar_logger("memoria")
+        self.politica = criar_politica(politica or Config.MEMORIA_POLITICA_DESCARTE)
+        # O tamanho de cada informação só é calculado se houver orçamento, definido na criação
+        self.orcamento_bytes = Config.MEMORIA_ORCAMENTO_BYTES if orcamento_bytes is None else orcamento_bytes
+        self.ttl_padrao = Config.MEMORIA_TTL_PADRAO if ttl_padrao is None else ttl_padrao
+        if (tamanho_maximo or 0) < 0 or self.orcamento_bytes < 0 or self.ttl_padrao < 0:
+            raise ValueError("tamanho_maximo, orcamento_bytes e ttl_padrao não podem ser negativos")
+        self.chaves_fixas = frozenset(Config.MEMORIA_CHAVES_FIXAS if chaves_fixas is None else chaves_fixas)
+        # Comparado com None porque um armazenamento vazio é falso
+        self.armazenamento = (armazenamento if armazenamento is not None
+                              else criar_armazenamento(backend, arquivo_memoria))
+        if tamanho_maximo is None:
+            tamanho_maximo = (Config.MEMORIA_TAMANHO_MAXIMO if self.armazenamento.valores_em_memoria
+                              else Config.MEMORIA_TAMANHO_MAXIMO_DISCO)
+        self.tamanho_maximo = tamanho_maximo
+        self._lock = threading.RLock()
+        self._tamanhos: Dict[str, int] = {}  # Tamanho codificado de cada chave, apenas se houver orçamento
+        self._total_bytes = 0
+        self._expiracoes = IndiceExpiracao()
+        # Chaves gravadas antes desta sessão, percorridas sob demanda na ordem do armazenamento
+        self._frias: Optional[Iterator[str]] = None
+        self._acima_dos_limites = False
+        # Chaves gravadas há menos tempo (ver chaves_recentes); as anteriores à sessão são lidas sob demanda
+        self._recentes: "OrderedDict[str, None]" = OrderedDict()
+        self._recentes_carregadas = False
+        self._indexar()
+
+    def _medir(self, chave: str, registro: Any) -> int:
+        # Mesma codificação de ArmazenamentoMemoria.itens_codificados, usada ao reabrir a memória
+        if not self.orcamento_bytes:
+            return 0
         try:
-            with open(self.arquivo_memoria, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}
+            return len(json.dumps(registro, ensure_ascii=False).encode("utf-8"))
+        except (TypeError, ValueError) as e:
+            raise MemoriaError(f"Valor não serializável para a chave '{chave}': {str(e)}")
+
+    def _indexar(self):
+        """Carrega as expirações e, se houver orçamento, os tamanhos, removendo as informações expiradas."""
+        agora = time.time()
+        expiradas = []
+        for chave, expira_em in self.armazenamento.expiracoes():
+            if expira_em <= agora:
+                expiradas.append(chave)
+            else:
+                self._expiracoes.definir(chave, expira_em)
+        if self.orcamento_bytes:
+            self._tamanhos = dict(self.armazenamento.tamanhos_codificados())
+            self._total_bytes = sum(self._tamanhos.values())
+        for chave in expiradas:
+            self._descartar(chave)
+
+    def _registrar(self, chave: str, tamanho: int):
+        if self.orcamento_bytes:
+            self._total_bytes += tamanho - self._tamanhos.get(chave, 0)
+            self._tamanhos[chave] = tamanho
+        if chave not in self.chaves_fixas:
+            self.politica.registrar_gravacao(chave)
+        self._recentes[chave] = None
+        self._recentes.move_to_end(chave)
+        if len(self._recentes) > Config.MEMORIA_CHAVES_RECENTES:
+            self._recentes.popitem(last=False)
+
+    def _descartar(self, chave: str) -> bool:
+        removida = self.armazenamento.remover(chave)
+        self._recentes.pop(chave, None)
+        self._total_bytes -= self._tamanhos.pop(chave, 0)
+        self.politica.remover(chave)
+        self._expiracoes.remover(chave)
+        return removida
+
+    def _remover_expiradas(self):
+        for chave in self._expiracoes.retirar_expiradas(time.time()):
+            self._descartar(chave)
+
+    def _proxima_fria(self, excluir: str) -> Optional[str]:
+        """
+        Retorna a próxima chave gravada antes desta sessão que a política ainda não acompanha, na ordem do
+        armazenamento. Essas chaves não foram usadas desde a abertura e são descartadas antes das demais.
+        """
+        if self._frias is None:
+            self._frias = iter(self.armazenamento.chaves())
+        for chave in self._frias:
+            if (chave != excluir and chave not in self.chaves_fixas and chave not in self.politica
+                    and chave in self.armazenamento):
+                return chave
+        return None
+
+    def _liberar_espaco(self, chave: str, tamanho: int):
+        """
+        Descarta informações até a gravação da chave caber nos limites, ou até restarem só chaves fixas. Cada
+        gravação descarta no máximo Config.MEMORIA_DESCARTES_POR_GRAVACAO informações, para que abrir uma memória
+        maior que os limites não descarte de uma vez todo o excedente.
+        """
+        if not self.tamanho_maximo and not self.orcamento_bytes:
+            return
+        quantidade = len(self.armazenamento) + (chave not in self.armazenamento) if self.tamanho_maximo else 0
+        total_bytes = self._total_bytes - self._tamanhos.get(chave, 0) + tamanho
+        descartes = 0
+        while ((self.tamanho_maximo and quantidade > self.tamanho_maximo) or
+               (self.orcamento_bytes and total_bytes > self.orcamento_bytes)):
+            if descartes >= Config.MEMORIA_DESCARTES_POR_GRAVACAO:
+                if not self._acima_dos_limites:
+                    self.logger.warning("A memória excede os limites (%d informações para tamanho_maximo=%s, %d "
+                                        "bytes para orcamento_bytes=%s); o excedente será descartado aos poucos, "
+                                        "%d informações por gravação", quantidade, self.tamanho_maximo,
+                                        total_bytes, self.orcamento_bytes, descartes)
+                    self._acima_dos_limites = True
+                return
+            vitima = self._proxima_fria(chave)
+            if vitima is None:
+                vitima = self.politica.vitima(excluir=chave)
+                if vitima is None:
+                    break
+            total_bytes -= self._tamanhos.get(vitima, 0)
+            quantidade -= self._descartar(vitima)
+            descartes += 1
+        self._acima_dos_limites = False
+
+    def carregar_memoria(self) -> Dict[str, Any]:
+        with self._lock:
+            self._remover_expiradas()
+            return {chave: desembrulhar(registro)[0] for chave, registro in self.armazenamento.itens()}
 
     def salvar_memoria(self):
-        with open(self.arquivo_memoria, 'w') as f:
-            json.dump(self.memoria, f, indent=2)
+        # Cada alteração já é gravada pelo armazenamento; resta garantir que esteja em disco
+        self.armazenamento.sincronizar()
+
+    def adicionar_informacao(self, chave: str, valor: Any, ttl: Optional[float] = None):
+        """
+        Grava uma informação, descartando outras pela política se um limite for atingido.
+
+        :param chave: Chave da informação
+        :param valor: Valor serializável em JSON
+        :param ttl: Tempo de vida, em segundos, 0 para não expirar; por padrão, ttl_padrao (as chaves fixas não
+                    expiram, a menos que um ttl seja informado)
+        :raises ValueError: Se ttl for negativo
+        :raises MemoriaError: Se o valor não for serializável, for maior que o orçamento ou não puder ser gravado
+        """
+        if ttl is None:
+            ttl = 0 if chave in self.chaves_fixas else self.ttl_padrao
+        if ttl < 0:
+            raise ValueError("ttl não pode ser negativo")
+        expira_em = time.time() + ttl if ttl else None
+        registro = valor if expira_em is None else {CAMPO_EXPIRACAO: expira_em, "valor": valor}
+        with self._lock:
+            self._remover_expiradas()
+            tamanho = self._medir(chave, registro)
+            if self.orcamento_bytes and tamanho > self.orcamento_bytes:
+                raise MemoriaError(f"A informação '{chave}' ocupa {tamanho} bytes, mais que o orçamento de "
+                                   f"{self.orcamento_bytes} bytes")
+            self._liberar_espaco(chave, tamanho)
+            self.armazenamento.gravar(chave, registro)
+            self._registrar(chave, tamanho)
+            if expira_em is None:
+                self._expiracoes.remover(chave)
+            else:
+                self._expiracoes.definir(chave, expira_em)
+
+    def obter_informacao(self, chave: str, registrar_acesso: bool = True) -> Any:
+        """
+        Lê uma informação.
 
-    def adicionar_informacao(self, chave: str, valor: Any):
-        if len(self.memoria) >= self.tamanho_maximo:
-            # Remove o item mais antigo
-            chave_antiga = next(iter(self.memoria))
-            del self.memoria[chave_antiga]
-        
-        self.memoria[chave] = valor
-        self.salvar_memoria()
+        :param chave: Chave da informação
+        :param registrar_acesso: Se False, a leitura não conta como uso para as políticas 'lru' e 'lfu'
+        :return: Valor gravado, ou None se a chave não existir ou tiver expirado
+        """
+        with self._lock:
+            expira_em = self._expiracoes.obter(chave)
+            if expira_em is not None and expira_em <= time.time():
+                self._descartar(chave)
+                return None
+            registro = self.armazenamento.obter(chave, _AUSENTE)
+            if registro is _AUSENTE:
+                return None
+            if registrar_acesso:
+                if chave in self.politica:
+                    self.politica.registrar_acesso(chave)
+                elif self.politica.considera_acessos and chave not in self.chaves_fixas:
+                    # Chave gravada antes desta sessão: passa a ser acompanhada a partir deste uso
+                    self.politica.registrar_gravacao(chave)
+        return desembrulhar(registro)[0]
 
-    def obter_informacao(self, chave: str) -> Any:
-        return self.memoria.get(chave)
+    def obter_todas_informacoes(self) -> Dict[str, Any]:
+        return self.carregar_memoria()
 
     def listar_chaves(self) -> List[str]:
-        return list(self.memoria.keys())
+        with self._lock:
+            self._remover_expiradas()
+            return self.armazenamento.chaves()
+
+    def chaves_recentes(self, quantidade: int) -> List[str]:
+        """
+        Retorna as chaves gravadas há menos tempo, sem percorrer a memória. As gravadas nesta sessão vêm por
+        último, na ordem da última gravação; as anteriores, na ordem do armazenamento. São acompanhadas no máximo
+        Config.MEMORIA_CHAVES_RECENTES chaves.
+
+        :param quantidade: Número máximo de chaves
+        :return: Chaves, da gravada há mais tempo para a gravada há menos tempo
+        """
+        with self._lock:
+            self._remover_expiradas()
+            if not self._recentes_carregadas:
+                recentes = OrderedDict.fromkeys(self.armazenamento.chaves_recentes(Config.MEMORIA_CHAVES_RECENTES))
+                for chave in self._recentes:
+                    recentes.pop(chave, None)
+                recentes.update(self._recentes)
+                while len(recentes) > Config.MEMORIA_CHAVES_RECENTES:
+                    recentes.popitem(last=False)
+                self._recentes = recentes
+                self._recentes_carregadas = True
+            return list(self._recentes)[-quantidade:] if quantidade > 0 else []
 
     def limpar_memoria(self):
-        self.memoria.clear()
-        self.salvar_memoria()
+        with self._lock:
+            self.armazenamento.limpar()
+            self._recentes.clear()
+            self._recentes_carregadas = True
+            self._tamanhos.clear()
+            self._total_bytes = 0
+            self.politica.limpar()
+            self._expiracoes.limpar()
+            self._frias = iter(())
 
     def tamanho_memoria(self) -> int:
-        return len(self.memoria)
+        with self._lock:
+            self._remover_expiradas()
+            return len(self.armazenamento)
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna a ocupação da memória e os limites em vigor.
+
+        :return: Dicionário com política, informações, bytes (0 sem orçamento), informações com expiração e limites
+        """
+        with self._lock:
+            self._remover_expiradas()
+            return {
+                "politica": type(self.politica).__name__,
+                "informacoes": len(self.armazenamento),
+                "bytes": self._total_bytes,
+                "com_expiracao": len(self._expiracoes),
+                "tamanho_maximo": self.tamanho_maximo,
+                "orcamento_bytes": self.orcamento_bytes
+            }
 
     def backup_memoria(self, arquivo_backup: str):
+        # Grava um item por linha, sem montar a memória inteira em um dicionário
+        with self._lock:
+            self._remover_expiradas()
         with open(arquivo_backup, 'w') as f:
-            json.dump(self.memoria, f, indent=2)
+            f.write("{")
+            for i, (chave, registro) in enumerate(self.armazenamento.itens()):
+                valor = desembrulhar(registro)[0]
+                f.write(f"{',' if i else ''}\n  {json.dumps(chave)}: {json.dumps(valor)}")
+            f.write("\n}\n")
+
+    def fechar(self):
+        """Grava em disco as alterações pendentes e libera o armazenamento."""
+        self.armazenamento.fechar()
 
 if __name__ == "__main__":
     # Teste básico
@@ -34,7 +34,7 @@ class GeradorMapaMental:
         self.grafo.add_node(conceito)
         for relacionado in relacionados:
             self.grafo.add_edge(conceito, relacionado)
-        self.logger.info(f"Adicionado conceito: {conceito} com {len(relacionados)} relações")
+        self.logger.info("Adicionado conceito: %s com %s relações", conceito, len(relacionados))
 
     def adicionar_relacao(self, conceito1: str, conceito2: str, peso: float = 1.0):
         """
@@ -45,7 +45,7 @@ class GeradorMapaMental:
         :param peso: Peso da relação entre os conceitos.
         """
         self.grafo.add_edge(conceito1, conceito2, weight=peso)
-        self.logger.info(f"Adicionada relação entre {conceito1} e {conceito2} com peso {peso}")
+        self.logger.info("Adicionada relação entre %s e %s com peso %s", conceito1, conceito2, peso)
 
     def remover_conceito(self, conceito: str):
         """
@@ -54,7 +54,7 @@ class GeradorMapaMental:
         :param conceito: Nome do conceito a ser removido.
         """
         self.grafo.remove_node(conceito)
-        self.logger.info(f"Removido conceito: {conceito}")
+        self.logger.info("Removido conceito: %s", conceito)
 
     def atualizar_peso_relacao(self, conceito1: str, conceito2: str, novo_peso: float):
         """
@@ -65,7 +65,7 @@ class GeradorMapaMental:
         :param novo_peso: Novo peso para a relação.
         """
         self.grafo[conceito1][conceito2]['weight'] = novo_peso
-        self.logger.info(f"Atualizado peso da relação entre {conceito1} e {conceito2} para {novo_peso}")
+        self.logger.info("Atualizado peso da relação entre %s e %s para %s", conceito1, conceito2, novo_peso)
 
     def obter_conceitos_relacionados(self, conceito: str) -> List[str]:
         """
@@ -101,9 +101,9 @@ class GeradorMapaMental:
             plt.axis('off')
             plt.tight_layout()
             plt.savefig(arquivo_saida, dpi=300, bbox_inches='tight')
-            self.logger.info(f"Mapa mental gerado e salvo em: {arquivo_saida}")
+            self.logger.info("Mapa mental gerado e salvo em: %s", arquivo_saida)
         except Exception as e:
-            self.logger.error(f"Erro ao gerar mapa mental: {str(e)}")
+            self.logger.error("Erro ao gerar mapa mental: %s", e)
             raise
         finally:
             plt.close()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: orquestrador
+
+Este módulo implementa o OrquestradorRequisicao, que atende uma mensagem do usuário executando ao mesmo tempo a
+chamada ao ChatGPT, limitada pela rede, e as análises locais do texto (processamento com spaCy e sentimento),
+que não dependem dela. As análises rodam em um pool de threads enquanto a resposta chega, de modo que a latência
+de cada mensagem passa a ser a maior das duas, e não a soma.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - RequisicaoEmAndamento
+    - OrquestradorRequisicao
+
+Exceções:
+    - ModeloLinguagemError
+
+Dependências:
+    - concurrent.futures
+    - config.config
+    - core.language_model.modelo_linguagem
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Tuple
+from config.config import Config
+from core.language_model.modelo_linguagem import ModeloLinguagem
+
+class RequisicaoEmAndamento:
+    """
+    Uma mensagem sendo atendida: as análises locais já foram iniciadas em segundo plano, e a resposta do
+    ChatGPT é obtida iterando trechos().
+    """
+
+    def __init__(self, modelo: ModeloLinguagem, texto: str, analise: Future, sentimento: Future):
+        self._modelo = modelo
+        self.texto = texto
+        self._analise = analise
+        self._sentimento = sentimento
+
+    def trechos(self) -> Iterator[str]:
+        """
+        Gera a resposta do ChatGPT na thread que chama, devolvendo os trechos à medida que chegam.
+
+        :return: Iterador de trechos da resposta
+        :raises ModeloLinguagemError: Se ocorrer um erro ao gerar a resposta
+        """
+        return self._modelo.gerar_resposta_chatgpt_stream(self.texto)
+
+    def analise(self, timeout: Optional[float] = None) -> Tuple[Any, str]:
+        """
+        Aguarda as análises locais.
+
+        :param timeout: Tempo máximo de espera, em segundos; None espera indefinidamente
+        :return: Par (resultado de processar_texto, sentimento)
+        :raises ModeloLinguagemError: Se o processamento do texto falhar
+        :raises ValueError: Se o texto for vazio
+        :raises TimeoutError: Se as análises não terminarem dentro do prazo
+        """
+        return self._analise.result(timeout), self._sentimento.result(timeout)
+
+    def cancelar(self):
+        """Cancela as análises que ainda não começaram."""
+        self._analise.cancel()
+        self._sentimento.cancel()
+
+class OrquestradorRequisicao:
+    """
+    Coordena a resposta do ChatGPT e as análises locais de cada mensagem.
+    """
+
+    def __init__(self, modelo: ModeloLinguagem, max_threads: Optional[int] = None):
+        """
+        Inicializa o orquestrador e seu pool de threads.
+
+        :param modelo: Modelo de linguagem que gera as respostas e as análises
+        :param max_threads: Número de threads das análises locais; por padrão, Config.ORQUESTRADOR_THREADS
+        """
+        self.modelo = modelo
+        self._executor = ThreadPoolExecutor(max_workers=max_threads or Config.ORQUESTRADOR_THREADS,
+                                            thread_name_prefix="orquestrador")
+
+    def iniciar(self, texto: str) -> RequisicaoEmAndamento:
+        """
+        Inicia as análises locais do texto em segundo plano. A resposta do ChatGPT começa quando os trechos da
+        requisição devolvida são iterados.
+
+        :param texto: Mensagem do usuário
+        :return: Requisição em andamento
+        """
+        analise = self._executor.submit(self.modelo.processar_texto, texto)
+        sentimento = self._executor.submit(self.modelo.analisar_sentimento, texto)
+        return RequisicaoEmAndamento(self.modelo, texto, analise, sentimento)
+
+    def processar(self, texto: str) -> Dict[str, Any]:
+        """
+        Atende uma mensagem por completo: a resposta do ChatGPT e as análises locais, executadas ao mesmo tempo.
+
+        :param texto: Mensagem do usuário
+        :return: Dicionário com as chaves "resposta", "analise" e "sentimento"
+        :raises ModeloLinguagemError: Se a resposta ou o processamento do texto falhar
+        :raises ValueError: Se o texto for vazio
+        """
+        requisicao = self.iniciar(texto)
+        try:
+            resposta = "".join(requisicao.trechos())
+        except BaseException:
+            requisicao.cancelar()
+            raise
+        analise, sentimento = requisicao.analise()
+        return {"resposta": resposta, "analise": analise, "sentimento": sentimento}
+
+    def encerrar(self):
+        """Encerra o pool de threads, descartando as análises que ainda não começaram."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
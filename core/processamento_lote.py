@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: processamento_lote
+
+Este módulo implementa o processamento em lote de arquivos JSONL de requisições, para reprocessar arquivos
+grandes sem a interface gráfica. Cada linha da entrada traz um texto e, opcionalmente, as operações desejadas
+(análise, sentimento, palavras-chave, resumo e resposta do ChatGPT); cada linha da saída traz os resultados e os
+erros de um item. A entrada é lida em blocos, de modo que a memória não depende do tamanho do arquivo. Em cada
+bloco, as análises usam nlp.pipe (com processos de trabalho, se configurado) enquanto as respostas do ChatGPT
+são geradas em paralelo pela interface assíncrona. Um arquivo de checkpoint registra o progresso após cada bloco,
+e uma execução interrompida continua de onde parou.
+
+Uso:
+    python -m core.processamento_lote entrada.jsonl saida.jsonl [--operacoes analise sentimento resposta]
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ProcessadorLote
+
+Funções:
+    - main
+
+Exceções:
+    - ModeloLinguagemError
+
+Dependências:
+    - argparse
+    - json
+    - concurrent.futures
+    - config.config
+    - core.language_model.modelo_linguagem
+    - utils.logger
+    - utils.exceptions
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, TextIO, Tuple
+from config.config import Config
+from core.language_model.modelo_linguagem import ModeloLinguagem
+from utils.logger import configurar_logger
+from utils.exceptions import ModeloLinguagemError
+
+OPERACOES = ("analise", "sentimento", "palavras_chave", "resumo", "resposta")
+OPERACOES_NLP = frozenset({"analise", "palavras_chave", "resumo"})
+OPERACOES_PADRAO = ("analise", "sentimento", "palavras_chave", "resumo")
+SUFIXO_CHECKPOINT = ".checkpoint"
+
+class _Item:
+    """Uma linha da entrada e seus resultados."""
+
+    __slots__ = ("linha", "identificador", "texto", "operacoes", "resultados", "erros")
+
+    def __init__(self, linha: int, identificador: Any = None, texto: Optional[str] = None,
+                 operacoes: FrozenSet[str] = frozenset()):
+        self.linha = linha
+        self.identificador = identificador
+        self.texto = texto
+        self.operacoes = operacoes
+        self.resultados: Dict[str, Any] = {}
+        self.erros: Dict[str, str] = {}
+
+    def serializar(self) -> bytes:
+        registro = {"id": self.identificador, "linha": self.linha, "resultados": self.resultados,
+                    "erros": self.erros}
+        return (json.dumps(registro, ensure_ascii=False) + "\n").encode("utf-8")
+
+class ProcessadorLote:
+    """
+    Processa um arquivo JSONL de requisições em blocos, com checkpoint após cada bloco.
+    """
+
+    def __init__(self, modelo: ModeloLinguagem, operacoes: Sequence[str] = OPERACOES_PADRAO,
+                 campo_texto: str = "texto", campo_id: str = "id", campo_operacoes: str = "operacoes",
+                 tamanho_bloco: int = 64, concorrencia: Optional[int] = None, batch_size: Optional[int] = None,
+                 n_process: Optional[int] = None, num_sentencas: int = 3, modo_resumo: str = "primeiras"):
+        """
+        Inicializa o processador.
+
+        :param modelo: Modelo de linguagem que executa as operações
+        :param operacoes: Operações aplicadas aos itens que não indicam as suas
+        :param campo_texto: Campo de cada linha com o texto a processar
+        :param campo_id: Campo de cada linha copiado para a saída como "id"
+        :param campo_operacoes: Campo opcional de cada linha com a lista de operações do item
+        :param tamanho_bloco: Número de linhas lidas, processadas e confirmadas de cada vez
+        :param concorrencia: Número máximo de chamadas simultâneas ao ChatGPT; por padrão, Config.CHATGPT_CONCORRENCIA
+        :param batch_size: Número de textos por lote enviado ao pipeline do spaCy
+        :param n_process: Número de processos de trabalho do spaCy; -1 usa todos os núcleos
+        :param num_sentencas: Número de sentenças dos resumos
+        :param modo_resumo: 'primeiras' ou 'grafo', como em ModeloLinguagem.resumir_texto
+        :raises ValueError: Se alguma operação for desconhecida ou tamanho_bloco não for positivo
+        """
+        desconhecidas = set(operacoes) - set(OPERACOES)
+        if desconhecidas:
+            raise ValueError(f"Operações desconhecidas: {', '.join(sorted(desconhecidas))}")
+        if not isinstance(tamanho_bloco, int) or tamanho_bloco <= 0:
+            raise ValueError("tamanho_bloco deve ser um inteiro positivo")
+        self.modelo = modelo
+        self.operacoes = frozenset(operacoes)
+        self.campo_texto = campo_texto
+        self.campo_id = campo_id
+        self.campo_operacoes = campo_operacoes
+        self.tamanho_bloco = tamanho_bloco
+        self.concorrencia = concorrencia
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.num_sentencas = num_sentencas
+        self.modo_resumo = modo_resumo
+        self.logger = configurar_logger("processamento_lote")
+
+    def _preparar(self, numero: int, linha: str) -> _Item:
+        """Interpreta uma linha da entrada; problemas na linha são registrados como erros do item."""
+        item = _Item(numero)
+        try:
+            dados = json.loads(linha)
+        except json.JSONDecodeError as e:
+            item.erros["entrada"] = f"JSON inválido: {e}"
+            return item
+        if not isinstance(dados, dict):
+            item.erros["entrada"] = "A linha deve conter um objeto JSON"
+            return item
+
+        item.identificador = dados.get(self.campo_id)
+        texto = dados.get(self.campo_texto)
+        if not isinstance(texto, str) or not texto.strip():
+            item.erros["entrada"] = f"O campo '{self.campo_texto}' deve conter um texto não vazio"
+            return item
+        item.texto = texto
+
+        operacoes = dados.get(self.campo_operacoes)
+        if operacoes is None:
+            item.operacoes = self.operacoes
+        elif isinstance(operacoes, list) and all(isinstance(op, str) for op in operacoes):
+            item.operacoes = frozenset(operacoes) & frozenset(OPERACOES)
+            desconhecidas = set(operacoes) - set(OPERACOES)
+            if desconhecidas:
+                item.erros["operacoes"] = f"Operações desconhecidas: {', '.join(sorted(desconhecidas))}"
+        else:
+            item.erros["operacoes"] = f"O campo '{self.campo_operacoes}' deve ser uma lista de nomes"
+        return item
+
+    def _gerar_respostas(self, itens: List[_Item]) -> List[Dict[str, Any]]:
+        """Gera as respostas do ChatGPT dos itens (executado em paralelo às análises locais)."""
+        if not itens:
+            return []
+        return self.modelo.gerar_respostas_chatgpt_lote([item.texto for item in itens], self.concorrencia)
+
+    def _analisar(self, itens: List[_Item]):
+        """Executa as operações locais dos itens, processando os textos do bloco com um único nlp.pipe."""
+        for item in itens:
+            if "sentimento" in item.operacoes:
+                try:
+                    item.resultados["sentimento"] = self.modelo.analisar_sentimento(item.texto)
+                except Exception as e:
+                    item.erros["sentimento"] = str(e)
+
+        itens_nlp = [item for item in itens if item.operacoes & OPERACOES_NLP]
+        if not itens_nlp:
+            return
+        try:
+            analises = self.modelo.analisar_documentos((item.texto for item in itens_nlp), self.batch_size,
+                                                       self.n_process)
+            for item, analise in zip(itens_nlp, analises):
+                if "analise" in item.operacoes:
+                    item.resultados["analise"] = analise.compacta().como_dicionario()
+                if "palavras_chave" in item.operacoes:
+                    item.resultados["palavras_chave"] = list(analise.palavras_chave)
+                if "resumo" in item.operacoes:
+                    item.resultados["resumo"] = self.modelo.resumir_analise(analise, self.num_sentencas,
+                                                                           self.modo_resumo)
+        except Exception as e:
+            self.logger.error("Erro nas análises do bloco: %s", e)
+            for item in itens_nlp:
+                for operacao in item.operacoes & OPERACOES_NLP:
+                    if operacao not in item.resultados:
+                        item.erros[operacao] = str(e)
+
+    def _processar_bloco(self, itens: List[_Item], executor: ThreadPoolExecutor):
+        """Processa um bloco: as respostas do ChatGPT são geradas enquanto as análises locais executam."""
+        validos = [item for item in itens if item.texto is not None]
+        itens_llm = [item for item in validos if "resposta" in item.operacoes]
+        respostas = executor.submit(self._gerar_respostas, itens_llm)
+        self._analisar(validos)
+        try:
+            for item, resultado in zip(itens_llm, respostas.result()):
+                if resultado["erro"] is None:
+                    item.resultados["resposta"] = resultado["resposta"]
+                else:
+                    item.erros["resposta"] = str(resultado["erro"])
+        except Exception as e:
+            self.logger.error("Erro ao gerar as respostas do bloco: %s", e)
+            for item in itens_llm:
+                item.erros["resposta"] = str(e)
+
+    @staticmethod
+    def _ler_checkpoint(caminho: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            raise ModeloLinguagemError(f"Checkpoint ilegível em {caminho}: {e}")
+
+    @staticmethod
+    def _gravar_checkpoint(caminho: str, estado: Dict[str, Any]):
+        """Grava o checkpoint de forma atômica: um arquivo temporário substitui o anterior."""
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(estado, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+
+    def _blocos(self, entrada: TextIO, linhas_processadas: int) -> Iterator[Tuple[int, List[_Item]]]:
+        """Lê a entrada em blocos, pulando as linhas já processadas; devolve (última linha lida, itens)."""
+        numero = 0
+        for numero, _ in zip(range(1, linhas_processadas + 1), entrada):
+            pass
+        numerado = enumerate(entrada, start=numero + 1)
+        while True:
+            linhas = list(islice(numerado, self.tamanho_bloco))
+            if not linhas:
+                return
+            itens = [self._preparar(n, linha) for n, linha in linhas if linha.strip()]
+            yield linhas[-1][0], itens
+
+    def executar(self, entrada: str, saida: str, retomar: bool = True) -> Dict[str, Any]:
+        """
+        Processa o arquivo de entrada e grava os resultados no arquivo de saída. Com retomar=True, se houver um
+        checkpoint da mesma entrada, a saída é cortada no ponto do checkpoint e o processamento continua dali;
+        caso contrário, a saída é recriada. O checkpoint é removido ao final.
+
+        :param entrada: Caminho do arquivo JSONL de requisições
+        :param saida: Caminho do arquivo JSONL de resultados
+        :param retomar: Se False, ignora o checkpoint existente e recomeça do início
+        :return: Estatísticas da execução: itens, itens_com_erro, erros_por_operacao, linha_inicial, segundos
+                 e itens_por_segundo
+        :raises ModeloLinguagemError: Se o checkpoint não puder ser lido ou os arquivos não puderem ser abertos
+        """
+        caminho_checkpoint = saida + SUFIXO_CHECKPOINT
+        estado = self._ler_checkpoint(caminho_checkpoint) if retomar else None
+        if estado is not None and estado.get("entrada") != os.path.abspath(entrada):
+            self.logger.warning("Checkpoint de outra entrada ignorado: %s", estado.get("entrada"))
+            estado = None
+        if estado is None:
+            estado = {"entrada": os.path.abspath(entrada), "linhas": 0, "bytes_saida": 0}
+        linha_inicial = estado["linhas"]
+        if linha_inicial:
+            self.logger.info("Retomando %s a partir da linha %d", entrada, linha_inicial + 1)
+
+        estatisticas: Dict[str, Any] = {"itens": 0, "itens_com_erro": 0, "erros_por_operacao": {},
+                                        "linha_inicial": linha_inicial + 1}
+        inicio = time.perf_counter()
+        try:
+            with open(entrada, "r", encoding="utf-8") as arquivo_entrada, \
+                    open(saida, "r+b" if linha_inicial else "wb") as arquivo_saida, \
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix="lote_chatgpt") as executor:
+                # Descarta resultados gravados depois do último checkpoint
+                arquivo_saida.truncate(estado["bytes_saida"])
+                arquivo_saida.seek(estado["bytes_saida"])
+                for ultima_linha, itens in self._blocos(arquivo_entrada, linha_inicial):
+                    self._processar_bloco(itens, executor)
+                    for item in itens:
+                        arquivo_saida.write(item.serializar())
+                        estatisticas["itens"] += 1
+                        if item.erros:
+                            estatisticas["itens_com_erro"] += 1
+                        for operacao in item.erros:
+                            contagem = estatisticas["erros_por_operacao"]
+                            contagem[operacao] = contagem.get(operacao, 0) + 1
+                    arquivo_saida.flush()
+                    os.fsync(arquivo_saida.fileno())
+                    estado["linhas"] = ultima_linha
+                    estado["bytes_saida"] = arquivo_saida.tell()
+                    self._gravar_checkpoint(caminho_checkpoint, estado)
+
+                    decorrido = time.perf_counter() - inicio
+                    self.logger.info("Linha %d concluída: %d itens em %.1f s (%.1f itens/s)", ultima_linha,
+                                     estatisticas["itens"], decorrido, estatisticas["itens"] / decorrido)
+        except OSError as e:
+            self.logger.error("Erro ao acessar os arquivos do lote: %s", e)
+            raise ModeloLinguagemError(f"Erro ao acessar os arquivos do lote: {str(e)}")
+
+        if os.path.exists(caminho_checkpoint):
+            os.remove(caminho_checkpoint)
+        estatisticas["segundos"] = time.perf_counter() - inicio
+        estatisticas["itens_por_segundo"] = estatisticas["itens"] / max(estatisticas["segundos"], 1e-9)
+        self.logger.info("Lote concluído: %d itens, %d com erro, %.1f itens/s", estatisticas["itens"],
+                         estatisticas["itens_com_erro"], estatisticas["itens_por_segundo"])
+        return estatisticas
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ponto de entrada da linha de comando.
+
+    :param argv: Argumentos da linha de comando; por padrão, sys.argv[1:]
+    :return: Código de saída: 0 se todos os itens foram processados sem erro, 1 caso contrário
+    """
+    parser = argparse.ArgumentParser(description="Processa um arquivo JSONL de requisições em lote.")
+    parser.add_argument("entrada", help="Arquivo JSONL com uma requisição por linha")
+    parser.add_argument("saida", help="Arquivo JSONL de resultados")
+    parser.add_argument("--operacoes", nargs="+", choices=OPERACOES, default=list(OPERACOES_PADRAO),
+                        help="Operações dos itens que não indicam as suas (padrão: todas exceto resposta)")
+    parser.add_argument("--campo-texto", default="texto")
+    parser.add_argument("--campo-id", default="id")
+    parser.add_argument("--campo-operacoes", default="operacoes")
+    parser.add_argument("--tamanho-bloco", type=int, default=64, help="Linhas por bloco e por checkpoint")
+    parser.add_argument("--concorrencia", type=int, default=None, help="Chamadas simultâneas ao ChatGPT")
+    parser.add_argument("--batch-size", type=int, default=None, help="Textos por lote do spaCy")
+    parser.add_argument("--processos", type=int, default=None, help="Processos do spaCy; -1 usa todos os núcleos")
+    parser.add_argument("--num-sentencas", type=int, default=3)
+    parser.add_argument("--modo-resumo", choices=("primeiras", "grafo"), default="primeiras")
+    parser.add_argument("--reiniciar", action="store_true", help="Ignora o checkpoint e recomeça do início")
+    parser.add_argument("--chave-api", default=Config.API_KEY, help="Chave da API do ChatGPT")
+    argumentos = parser.parse_args(argv)
+
+    modelo = ModeloLinguagem(chatgpt_api_key=argumentos.chave_api)
+    processador = ProcessadorLote(
+        modelo, argumentos.operacoes, argumentos.campo_texto, argumentos.campo_id, argumentos.campo_operacoes,
+        argumentos.tamanho_bloco, argumentos.concorrencia, argumentos.batch_size, argumentos.processos,
+        argumentos.num_sentencas, argumentos.modo_resumo)
+    estatisticas = processador.executar(argumentos.entrada, argumentos.saida, retomar=not argumentos.reiniciar)
+    modelo.salvar_estado()
+
+    print(f"Itens processados: {estatisticas['itens']} (a partir da linha {estatisticas['linha_inicial']})")
+    print(f"Itens com erro: {estatisticas['itens_com_erro']} {estatisticas['erros_por_operacao'] or ''}")
+    print(f"Tempo: {estatisticas['segundos']:.1f} s ({estatisticas['itens_por_segundo']:.1f} itens/s)")
+    return 1 if estatisticas["itens_com_erro"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: resiliencia
+
+Este módulo reúne os mecanismos que protegem as chamadas à API do ChatGPT sob carga:
+
+- LimitadorTaxa: baldes de fichas (token bucket) que limitam, no cliente, as requisições por minuto e os tokens
+  estimados por minuto;
+- PoliticaRetentativa: retentativas de erros transitórios (429, 5xx, falhas de conexão) com espera exponencial
+  aleatória, respeitando o cabeçalho Retry-After quando presente;
+- DisjuntorCircuito: após uma sequência de falhas transitórias, rejeita imediatamente novas chamadas até que
+  um período de recuperação termine e uma chamada de teste tenha sucesso;
+- ExecutorResiliente: combina os três e mantém contadores para monitoramento.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - LimitadorTaxa
+    - PoliticaRetentativa
+    - DisjuntorCircuito
+    - ExecutorResiliente
+
+Exceções:
+    - CircuitoAbertoError
+
+Dependências:
+    - openai
+    - config.config
+    - utils.exceptions
+"""
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import openai
+from config.config import Config
+from utils.exceptions import CircuitoAbertoError
+
+# Códigos HTTP que indicam falhas transitórias
+STATUS_TRANSITORIOS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+def estimar_tokens(mensagens: List[Dict[str, str]], max_tokens: int) -> int:
+    """
+    Estima os tokens consumidos por uma requisição: cerca de 4 caracteres por token na entrada, mais o máximo
+    permitido na saída.
+
+    :param mensagens: Mensagens enviadas à API
+    :param max_tokens: Número máximo de tokens da resposta
+    :return: Estimativa de tokens
+    """
+    return sum(len(mensagem.get("content", "")) for mensagem in mensagens) // 4 + max_tokens
+
+class _Balde:
+    """Balde de fichas com capacidade por minuto e reposição contínua."""
+
+    def __init__(self, por_minuto: float, agora: float):
+        self.capacidade = float(por_minuto)
+        self.taxa = por_minuto / 60.0
+        self.disponivel = float(por_minuto)
+        self.atualizado_em = agora
+
+    def repor(self, agora: float):
+        self.disponivel = min(self.capacidade, self.disponivel + (agora - self.atualizado_em) * self.taxa)
+        self.atualizado_em = agora
+
+    def espera(self, quantidade: float) -> float:
+        """Tempo, em segundos, até haver quantidade fichas disponíveis."""
+        return max(0.0, (quantidade - self.disponivel) / self.taxa)
+
+class LimitadorTaxa:
+    """
+    Limitador de taxa com um balde para requisições por minuto e outro para tokens por minuto.
+    """
+
+    def __init__(self, requisicoes_por_minuto: int, tokens_por_minuto: int,
+                 relogio: Callable[[], float] = time.monotonic):
+        """
+        Inicializa o limitador com os baldes cheios.
+
+        :param requisicoes_por_minuto: Requisições permitidas por minuto; 0 desativa o limite
+        :param tokens_por_minuto: Tokens estimados permitidos por minuto; 0 desativa o limite
+        :param relogio: Função que retorna o instante atual, em segundos
+        """
+        self._relogio = relogio
+        agora = relogio()
+        self._requisicoes = _Balde(requisicoes_por_minuto, agora) if requisicoes_por_minuto > 0 else None
+        self._tokens = _Balde(tokens_por_minuto, agora) if tokens_por_minuto > 0 else None
+        self._lock = threading.Lock()
+
+    def _reservar(self, tokens: int) -> float:
+        """
+        Consome as fichas se houver saldo em ambos os baldes.
+
+        :return: 0 se as fichas foram consumidas; senão, o tempo a esperar antes de tentar novamente
+        """
+        with self._lock:
+            agora = self._relogio()
+            pedidos = [(balde, quantidade) for balde, quantidade in ((self._requisicoes, 1), (self._tokens, tokens))
+                       if balde is not None]
+            espera = 0.0
+            for balde, quantidade in pedidos:
+                balde.repor(agora)
+                # Um pedido maior que a capacidade espera o balde encher, em vez de esperar para sempre
+                espera = max(espera, balde.espera(min(quantidade, balde.capacidade)))
+            if espera > 0:
+                return espera
+            for balde, quantidade in pedidos:
+                balde.disponivel -= quantidade
+            return 0.0
+
+    def adquirir(self, tokens: int = 0) -> float:
+        """
+        Bloqueia até que uma requisição com o número de tokens estimado possa ser feita.
+
+        :param tokens: Tokens estimados da requisição
+        :return: Tempo total esperado, em segundos
+        """
+        esperado = 0.0
+        while True:
+            espera = self._reservar(tokens)
+            if espera == 0:
+                return esperado
+            time.sleep(espera)
+            esperado += espera
+
+    async def adquirir_async(self, tokens: int = 0) -> float:
+        """
+        Versão assíncrona de adquirir: aguarda sem bloquear o laço de eventos.
+
+        :param tokens: Tokens estimados da requisição
+        :return: Tempo total esperado, em segundos
+        """
+        esperado = 0.0
+        while True:
+            espera = self._reservar(tokens)
+            if espera == 0:
+                return esperado
+            await asyncio.sleep(espera)
+            esperado += espera
+
+class PoliticaRetentativa:
+    """
+    Decide quais erros são retentados e quanto esperar antes de cada nova tentativa.
+    """
+
+    def __init__(self, max_tentativas: int = 4, espera_base: float = 0.5, espera_maxima: float = 30.0):
+        """
+        :param max_tentativas: Número total de tentativas, incluindo a primeira
+        :param espera_base: Espera de referência da primeira retentativa, em segundos
+        :param espera_maxima: Limite da espera entre tentativas, em segundos
+        :raises ValueError: Se max_tentativas for menor que 1
+        """
+        if not isinstance(max_tentativas, int) or max_tentativas < 1:
+            raise ValueError("max_tentativas deve ser um inteiro maior ou igual a 1")
+        self.max_tentativas = max_tentativas
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+
+    @staticmethod
+    def transitorio(erro: BaseException) -> bool:
+        """
+        Indica se o erro é transitório e pode ser retentado.
+
+        :param erro: Exceção levantada pela chamada
+        :return: True para limites de taxa, erros 5xx, timeouts e falhas de conexão
+        """
+        if isinstance(erro, (openai.APIConnectionError, openai.APITimeoutError)):
+            return True
+        if isinstance(erro, openai.APIStatusError):
+            return erro.status_code in STATUS_TRANSITORIOS
+        return False
+
+    @staticmethod
+    def retry_after(erro: BaseException) -> Optional[float]:
+        """
+        Lê a espera sugerida pelo servidor nos cabeçalhos retry-after-ms ou Retry-After.
+
+        :param erro: Exceção levantada pela chamada
+        :return: Espera em segundos, ou None se o servidor não indicou
+        """
+        resposta = getattr(erro, "response", None)
+        cabecalhos = getattr(resposta, "headers", None)
+        if not cabecalhos:
+            return None
+        valor = cabecalhos.get("retry-after-ms")
+        if valor:
+            try:
+                return max(0.0, float(valor) / 1000.0)
+            except ValueError:
+                pass
+        valor = cabecalhos.get("retry-after")
+        if not valor:
+            return None
+        try:
+            return max(0.0, float(valor))
+        except ValueError:
+            pass
+        try:
+            # Retry-After também pode ser uma data HTTP
+            return max(0.0, email.utils.parsedate_to_datetime(valor).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def espera(self, tentativa: int, erro: BaseException) -> float:
+        """
+        Calcula a espera antes da próxima tentativa: o Retry-After do servidor, se houver, ou uma espera
+        exponencial com variação aleatória total ("full jitter").
+
+        :param tentativa: Número da tentativa que falhou, a partir de 1
+        :param erro: Exceção levantada
+        :return: Espera em segundos
+        """
+        sugerida = self.retry_after(erro)
+        if sugerida is not None:
+            return min(sugerida, self.espera_maxima)
+        return random.uniform(0, min(self.espera_maxima, self.espera_base * 2 ** (tentativa - 1)))
+
+class DisjuntorCircuito:
+    """
+    Disjuntor com os estados fechado, aberto e meio-aberto.
+    """
+
+    FECHADO = "fechado"
+    ABERTO = "aberto"
+    MEIO_ABERTO = "meio_aberto"
+
+    def __init__(self, limiar_falhas: int = 5, tempo_recuperacao: float = 30.0,
+                 relogio: Callable[[], float] = time.monotonic):
+        """
+        :param limiar_falhas: Falhas transitórias consecutivas que abrem o circuito; 0 desativa o disjuntor
+        :param tempo_recuperacao: Tempo, em segundos, que o circuito permanece aberto antes de uma chamada de teste
+        :param relogio: Função que retorna o instante atual, em segundos
+        """
+        self.limiar_falhas = limiar_falhas
+        self.tempo_recuperacao = tempo_recuperacao
+        self._relogio = relogio
+        self._estado = self.FECHADO
+        self._falhas = 0
+        self._aberto_em = 0.0
+        self._teste_em_andamento = False
+        self._lock = threading.Lock()
+
+    @property
+    def estado(self) -> str:
+        with self._lock:
+            if self._estado == self.ABERTO and self._relogio() - self._aberto_em >= self.tempo_recuperacao:
+                return self.MEIO_ABERTO
+            return self._estado
+
+    def verificar(self) -> bool:
+        """
+        Autoriza uma chamada.
+
+        :return: True se a chamada for a chamada de teste do circuito meio-aberto; ela deve terminar com
+                 registrar_sucesso, registrar_falha ou liberar
+        :raises CircuitoAbertoError: Se o circuito estiver aberto, ou meio-aberto com uma chamada de teste
+                                     já em andamento
+        """
+        if self.limiar_falhas <= 0:
+            return False
+        with self._lock:
+            if self._estado == self.ABERTO:
+                restante = self.tempo_recuperacao - (self._relogio() - self._aberto_em)
+                if restante > 0:
+                    raise CircuitoAbertoError(f"Circuito aberto: nova tentativa em {restante:.1f} s")
+                self._estado = self.MEIO_ABERTO
+                self._teste_em_andamento = False
+            if self._estado == self.MEIO_ABERTO:
+                if self._teste_em_andamento:
+                    raise CircuitoAbertoError("Circuito meio-aberto: chamada de teste em andamento")
+                self._teste_em_andamento = True
+                return True
+            return False
+
+    def registrar_sucesso(self):
+        """Fecha o circuito e zera a contagem de falhas."""
+        with self._lock:
+            self._estado = self.FECHADO
+            self._falhas = 0
+            self._teste_em_andamento = False
+
+    def registrar_falha(self):
+        """Contabiliza uma falha transitória, abrindo o circuito ao atingir o limiar ou se a chamada de teste falhar."""
+        if self.limiar_falhas <= 0:
+            return
+        with self._lock:
+            self._falhas += 1
+            if self._estado == self.MEIO_ABERTO or self._falhas >= self.limiar_falhas:
+                self._estado = self.ABERTO
+                self._aberto_em = self._relogio()
+                self._teste_em_andamento = False
+
+    def liberar(self):
+        """
+        Libera a chamada de teste sem alterar o estado, quando ela termina com um erro não transitório ou é
+        cancelada.
+        """
+        with self._lock:
+            self._teste_em_andamento = False
+
+class ExecutorResiliente:
+    """
+    Executa chamadas à API aplicando o limitador de taxa, as retentativas e o disjuntor.
+    """
+
+    def __init__(self, limitador: Optional[LimitadorTaxa] = None, politica: Optional[PoliticaRetentativa] = None,
+                 disjuntor: Optional[DisjuntorCircuito] = None, dormir: Callable[[float], None] = time.sleep):
+        """
+        :param limitador: Limitador de taxa; None desativa o limite
+        :param politica: Política de retentativa; por padrão, uma única tentativa
+        :param disjuntor: Disjuntor; None o desativa
+        :param dormir: Função usada para esperar entre tentativas
+        """
+        self.limitador = limitador
+        self.politica = politica or PoliticaRetentativa(max_tentativas=1)
+        self.disjuntor = disjuntor
+        self._dormir = dormir
+        self._lock = threading.Lock()
+        self._contadores = {"chamadas": 0, "sucessos": 0, "falhas": 0, "retentativas": 0,
+                            "rejeicoes_circuito": 0, "espera_limitador_segundos": 0.0}
+
+    @classmethod
+    def de_config(cls) -> "ExecutorResiliente":
+        """Cria o executor com os limites definidos em Config."""
+        return cls(
+            limitador=LimitadorTaxa(Config.CHATGPT_LIMITE_RPM, Config.CHATGPT_LIMITE_TPM),
+            politica=PoliticaRetentativa(Config.CHATGPT_MAX_TENTATIVAS, Config.CHATGPT_ESPERA_BASE,
+                                         Config.CHATGPT_ESPERA_MAXIMA),
+            disjuntor=DisjuntorCircuito(Config.CHATGPT_DISJUNTOR_LIMIAR_FALHAS,
+                                        Config.CHATGPT_DISJUNTOR_TEMPO_RECUPERACAO)
+        )
+
+    def _contar(self, contador: str, valor: float = 1):
+        with self._lock:
+            self._contadores[contador] += valor
+
+    def _antes(self) -> bool:
+        """Autoriza a tentativa no disjuntor e indica se ela é a chamada de teste do circuito meio-aberto."""
+        if self.disjuntor is None:
+            return False
+        try:
+            return self.disjuntor.verificar()
+        except CircuitoAbertoError:
+            self._contar("rejeicoes_circuito")
+            raise
+
+    def _depois_do_erro(self, tentativa: int, erro: Exception) -> Optional[float]:
+        """Registra o erro e retorna a espera até a próxima tentativa, ou None se não houver nova tentativa."""
+        transitorio = self.politica.transitorio(erro)
+        if self.disjuntor is not None:
+            if transitorio:
+                self.disjuntor.registrar_falha()
+            else:
+                self.disjuntor.liberar()
+        if not transitorio or tentativa >= self.politica.max_tentativas:
+            self._contar("falhas")
+            return None
+        self._contar("retentativas")
+        return self.politica.espera(tentativa, erro)
+
+    def _depois_do_sucesso(self):
+        if self.disjuntor is not None:
+            self.disjuntor.registrar_sucesso()
+        self._contar("sucessos")
+
+    def executar(self, funcao: Callable[[], Any], tokens: int = 0) -> Any:
+        """
+        Executa a função com limite de taxa, retentativas e disjuntor.
+
+        :param funcao: Função sem argumentos que faz a chamada à API
+        :param tokens: Tokens estimados da chamada, para o limite de tokens por minuto
+        :return: Resultado da função
+        :raises CircuitoAbertoError: Se o circuito estiver aberto
+        :raises Exception: O último erro da função, se não for transitório ou as tentativas se esgotarem
+        """
+        self._contar("chamadas")
+        tentativa = 0
+        while True:
+            tentativa += 1
+            teste = self._antes()
+            registrada = False
+            try:
+                if self.limitador is not None:
+                    self._contar("espera_limitador_segundos", self.limitador.adquirir(tokens))
+                try:
+                    resultado = funcao()
+                except Exception as e:
+                    registrada = True
+                    espera = self._depois_do_erro(tentativa, e)
+                    if espera is None:
+                        raise
+                    self._dormir(espera)
+                    continue
+                registrada = True
+                self._depois_do_sucesso()
+                return resultado
+            finally:
+                if teste and not registrada:
+                    # Interrompida antes de um resultado (KeyboardInterrupt, por exemplo): não é falha nem sucesso
+                    self.disjuntor.liberar()
+
+    async def executar_async(self, funcao: Callable[[], Awaitable[Any]], tokens: int = 0) -> Any:
+        """
+        Versão assíncrona de executar.
+
+        :param funcao: Função sem argumentos que retorna a corrotina da chamada à API
+        :param tokens: Tokens estimados da chamada, para o limite de tokens por minuto
+        :return: Resultado da corrotina
+        :raises CircuitoAbertoError: Se o circuito estiver aberto
+        :raises Exception: O último erro da chamada, se não for transitório ou as tentativas se esgotarem
+        """
+        self._contar("chamadas")
+        tentativa = 0
+        while True:
+            tentativa += 1
+            teste = self._antes()
+            registrada = False
+            try:
+                if self.limitador is not None:
+                    self._contar("espera_limitador_segundos", await self.limitador.adquirir_async(tokens))
+                try:
+                    resultado = await funcao()
+                except Exception as e:
+                    registrada = True
+                    espera = self._depois_do_erro(tentativa, e)
+                    if espera is None:
+                        raise
+                    await asyncio.sleep(espera)
+                    continue
+                registrada = True
+                self._depois_do_sucesso()
+                return resultado
+            finally:
+                if teste and not registrada:
+                    # Cancelada (asyncio.CancelledError, por exemplo) antes de um resultado: não é falha nem sucesso
+                    self.disjuntor.liberar()
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna os contadores de monitoramento.
+
+        :return: Dicionário com chamadas, sucessos, falhas, retentativas, rejeições do circuito, tempo total de
+                 espera no limitador e estado do circuito
+        """
+        with self._lock:
+            estatisticas = dict(self._contadores)
+        estatisticas["estado_circuito"] = self.disjuntor.estado if self.disjuntor is not None else None
+        return estatisticas
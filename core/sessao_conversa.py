@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: sessao_conversa
+
+Este módulo implementa a SessaoConversa, que mantém o histórico de uma conversa com o ChatGPT e monta cada
+requisição dentro de um orçamento de tokens. Os turnos mais recentes são enviados na íntegra; os mais antigos,
+quando não cabem mais, são incorporados a um resumo acumulado, recalculado apenas nesse momento. Informações
+da memória relacionadas ao prompt também são incluídas, escolhidas entre as gravadas há menos tempo. Assim, o
+tamanho da requisição e o custo de montá-la ficam limitados, qualquer que seja a duração da conversa ou o
+tamanho da memória. As contagens de tokens são estimadas localmente, sem chamadas à API.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - Turno
+    - ResumidorExtrativo
+    - SessaoConversa
+
+Dependências:
+    - numpy
+    - zlib
+    - config.config
+    - core.chatgpt_integration
+    - core.memoria
+    - core.language_model.lexico_sentimento
+    - core.language_model.sumarizador
+"""
+
+import re
+import threading
+import zlib
+import numpy as np
+from collections import deque
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from config.config import Config
+from core.chatgpt_integration import ChatGPTIntegration, DEFAULT_MAX_TOKENS
+from core.memoria import GerenciadorMemoria
+from core.language_model.lexico_sentimento import tokenizar
+from core.language_model.sumarizador import SumarizadorGrafo
+
+# Tokens de formatação que a API acrescenta a cada mensagem
+TOKENS_POR_MENSAGEM = 4
+# Chaves da memória que não descrevem fatos
+CHAVES_IGNORADAS = frozenset({"contador_aprendizado"})
+TAMANHO_MAXIMO_FATO = 300  # em caracteres
+DIMENSAO_VETORES = 1024
+
+_FIM_SENTENCA = re.compile(r"(?<=[.!?])\s+")
+
+def vetorizar(texto: str, dimensao: int = DIMENSAO_VETORES) -> np.ndarray:
+    """
+    Representa o texto como um vetor normalizado (L2) de trigramas de caracteres com hashing. O texto é
+    normalizado (minúsculas, sem acentos e sem pontuação) antes da extração dos trigramas, e o sinal de cada
+    posição também é sorteado pelo hash, o que reduz o viés das colisões.
+
+    :param texto: Texto a ser representado
+    :param dimensao: Número de posições do vetor
+    :return: Vetor float32 de norma 1 (ou nulo, se o texto não tiver palavras)
+    """
+    normalizado = " " + " ".join(tokenizar(texto)) + " "
+    vetor = np.zeros(dimensao, dtype=np.float32)
+    for i in range(len(normalizado) - 2):
+        codigo = zlib.crc32(normalizado[i:i + 3].encode("utf-8"))
+        vetor[codigo % dimensao] += 1.0 if codigo & 0x80000000 else -1.0
+    norma = np.linalg.norm(vetor)
+    return vetor / norma if norma else vetor
+
+def estimar_tokens_texto(texto: str) -> int:
+    """
+    Estima os tokens de um texto com a mesma regra de resiliencia.estimar_tokens: cerca de 4 caracteres por token.
+
+    :param texto: Texto a estimar
+    :return: Estimativa de tokens
+    """
+    return len(texto) // 4
+
+def estimar_tokens_mensagens(mensagens: Sequence[Dict[str, str]]) -> int:
+    """
+    Estima os tokens de entrada de uma lista de mensagens, incluindo a formatação de cada uma.
+
+    :param mensagens: Mensagens no formato da API
+    :return: Estimativa de tokens
+    """
+    return sum(estimar_tokens_texto(m.get("content", "")) + TOKENS_POR_MENSAGEM for m in mensagens)
+
+class Turno(NamedTuple):
+    """Uma pergunta do usuário e a resposta do assistente."""
+    pergunta: str
+    resposta: str
+
+    def mensagens(self) -> List[Dict[str, str]]:
+        return [{"role": "user", "content": self.pergunta}, {"role": "assistant", "content": self.resposta}]
+
+    def tokens(self) -> int:
+        return estimar_tokens_mensagens(self.mensagens())
+
+class ResumidorExtrativo:
+    """
+    Resume a conversa localmente, escolhendo as sentenças mais centrais do resumo anterior e dos turnos
+    incorporados com o SumarizadorGrafo. Sentenças mais recentes recebem um peso maior.
+    """
+
+    def __init__(self, sumarizador: Optional[SumarizadorGrafo] = None):
+        """
+        Inicializa o resumidor.
+
+        :param sumarizador: Sumarizador usado para pontuar as sentenças; por padrão, um SumarizadorGrafo
+        """
+        self.sumarizador = sumarizador or SumarizadorGrafo(tamanho_bloco=Config.RESUMO_TAMANHO_BLOCO)
+
+    @staticmethod
+    def _sentencas(resumo: str, turnos: Sequence[Turno]) -> List[str]:
+        """Separa o resumo anterior em linhas e os turnos em sentenças identificadas pelo autor."""
+        sentencas = [linha for linha in resumo.splitlines() if linha.strip()]
+        for turno in turnos:
+            for autor, texto in (("Usuário", turno.pergunta), ("Assistente", turno.resposta)):
+                sentencas.extend(f"{autor}: {s}" for s in _FIM_SENTENCA.split(texto.strip()) if s)
+        return sentencas
+
+    def resumir(self, resumo: str, turnos: Sequence[Turno], limite_tokens: int) -> str:
+        """
+        Incorpora turnos ao resumo, respeitando o limite de tokens.
+
+        :param resumo: Resumo acumulado até agora (uma sentença por linha)
+        :param turnos: Turnos a incorporar, do mais antigo ao mais recente
+        :param limite_tokens: Número máximo de tokens estimados do novo resumo
+        :return: Novo resumo, com as sentenças escolhidas na ordem original, uma por linha
+        """
+        sentencas = self._sentencas(resumo, turnos)
+        if not sentencas:
+            return ""
+        n = len(sentencas)
+        pontuacoes = self.sumarizador.pontuar([tokenizar(s) for s in sentencas])
+        pontuacoes = pontuacoes * (0.5 + 0.5 * np.arange(1, n + 1) / n)
+
+        escolhidas: List[int] = []
+        tokens = 0
+        for i in np.argsort(-pontuacoes, kind="stable"):
+            custo = estimar_tokens_texto(sentencas[i]) + 1
+            if tokens + custo <= limite_tokens:
+                escolhidas.append(int(i))
+                tokens += custo
+        return "\n".join(sentencas[i] for i in sorted(escolhidas))
+
+class SessaoConversa:
+    """
+    Conversa com o ChatGPT com histórico limitado por um orçamento de tokens.
+    """
+
+    def __init__(self, chatgpt: ChatGPTIntegration, memoria: Optional[GerenciadorMemoria] = None,
+                 orcamento_tokens: int = 3000, max_tokens_resposta: int = DEFAULT_MAX_TOKENS,
+                 tokens_resumo: int = 400, tokens_fatos: int = 300, limiar_fatos: float = 0.2,
+                 resumidor: Optional[ResumidorExtrativo] = None, max_fatos: int = 200):
+        """
+        Inicializa a sessão.
+
+        :param chatgpt: Integração usada para gerar as respostas
+        :param memoria: Memória consultada em busca de informações relacionadas ao prompt; None desativa a consulta
+        :param orcamento_tokens: Número máximo de tokens por requisição, somando a entrada e a resposta
+        :param max_tokens_resposta: Número máximo de tokens de cada resposta
+        :param tokens_resumo: Parte do orçamento reservada ao resumo dos turnos antigos
+        :param tokens_fatos: Parte do orçamento reservada às informações da memória
+        :param limiar_fatos: Similaridade de cosseno mínima entre o prompt e uma informação para incluí-la
+        :param resumidor: Resumidor dos turnos antigos; por padrão, um ResumidorExtrativo
+        :param max_fatos: Número de informações gravadas há menos tempo comparadas ao prompt (no máximo
+                          Config.MEMORIA_CHAVES_RECENTES)
+        :raises ValueError: Se o orçamento não comportar a resposta, o resumo e as informações da memória
+        """
+        if min(max_tokens_resposta, tokens_resumo, tokens_fatos) < 0:
+            raise ValueError("As partes do orçamento não podem ser negativas")
+        if orcamento_tokens <= max_tokens_resposta + tokens_resumo + tokens_fatos:
+            raise ValueError("orcamento_tokens deve ser maior que a soma da resposta, do resumo e das informações")
+        self.chatgpt = chatgpt
+        self.memoria = memoria
+        self.orcamento_tokens = orcamento_tokens
+        self.max_tokens_resposta = max_tokens_resposta
+        self.tokens_resumo = tokens_resumo
+        self.tokens_fatos = tokens_fatos
+        self.limiar_fatos = limiar_fatos
+        self.resumidor = resumidor or ResumidorExtrativo()
+        self.max_fatos = max_fatos
+        self.turnos: deque = deque()
+        self.resumo = ""
+        self.turnos_resumidos = 0
+        self.tokens_ultima_requisicao = 0
+        # Vetores das informações candidatas, recalculados apenas quando o texto muda: chave -> (texto, vetor);
+        # limitado a max_fatos, pois as chaves que deixam de ser candidatas são removidas
+        self._vetores_fatos: Dict[str, Tuple[str, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def de_config(cls, chatgpt: ChatGPTIntegration, memoria: Optional[GerenciadorMemoria] = None) -> "SessaoConversa":
+        """
+        Cria uma sessão com os parâmetros definidos em Config.
+
+        :param chatgpt: Integração usada para gerar as respostas
+        :param memoria: Memória consultada em busca de informações relacionadas ao prompt
+        :return: Nova sessão
+        """
+        return cls(chatgpt, memoria, orcamento_tokens=Config.SESSAO_ORCAMENTO_TOKENS,
+                   tokens_resumo=Config.SESSAO_TOKENS_RESUMO, tokens_fatos=Config.SESSAO_TOKENS_FATOS,
+                   limiar_fatos=Config.SESSAO_LIMIAR_FATOS, max_fatos=Config.SESSAO_MAX_FATOS)
+
+    @staticmethod
+    def _descrever_fato(chave: str, valor: Any) -> str:
+        """Converte uma entrada da memória em uma linha de texto; campos aninhados de dicionários são omitidos."""
+        if isinstance(valor, dict):
+            texto = "; ".join(f"{k}: {v}" for k, v in valor.items() if isinstance(v, (str, int, float, bool)))
+        else:
+            texto = str(valor)
+        return f"{chave}: {texto}"[:TAMANHO_MAXIMO_FATO]
+
+    def _fatos_relevantes(self, prompt: str) -> List[str]:
+        """
+        Escolhe, entre as max_fatos informações gravadas há menos tempo, as mais similares ao prompt, dentro da
+        parte do orçamento reservada a elas.
+
+        :param prompt: Prompt do usuário
+        :return: Informações escolhidas, da mais à menos similar
+        """
+        if self.memoria is None or self.tokens_fatos == 0:
+            return []
+        textos: List[str] = []
+        vetores: List[np.ndarray] = []
+        chaves = [c for c in self.memoria.chaves_recentes(self.max_fatos) if c not in CHAVES_IGNORADAS]
+        for chave in chaves:
+            # A montagem do contexto lê as candidatas e não deve contar como uso para o descarte
+            valor = self.memoria.obter_informacao(chave, registrar_acesso=False)
+            if valor is None:
+                continue
+            texto = self._descrever_fato(chave, valor)
+            guardado = self._vetores_fatos.get(chave)
+            if guardado is None or guardado[0] != texto:
+                guardado = self._vetores_fatos[chave] = (texto, vetorizar(texto))
+            textos.append(texto)
+            vetores.append(guardado[1])
+        for chave in self._vetores_fatos.keys() - set(chaves):
+            del self._vetores_fatos[chave]
+        if not textos:
+            return []
+
+        similaridades = np.vstack(vetores) @ vetorizar(prompt)
+        fatos: List[str] = []
+        tokens = 0
+        for i in np.argsort(-similaridades, kind="stable"):
+            if similaridades[i] < self.limiar_fatos:
+                break
+            custo = estimar_tokens_texto(textos[i]) + 1
+            if tokens + custo <= self.tokens_fatos:
+                fatos.append(textos[i])
+                tokens += custo
+        return fatos
+
+    @staticmethod
+    def _mensagem_sistema(resumo: str, fatos: List[str]) -> List[Dict[str, str]]:
+        """Monta a mensagem de sistema com o resumo e as informações da memória, se houver."""
+        partes = []
+        if resumo:
+            partes.append(f"Resumo da conversa até aqui:\n{resumo}")
+        if fatos:
+            partes.append("Informações conhecidas:\n" + "\n".join(f"- {fato}" for fato in fatos))
+        return [{"role": "system", "content": "\n\n".join(partes)}] if partes else []
+
+    def montar_contexto(self, prompt: str) -> List[Dict[str, str]]:
+        """
+        Monta as mensagens que antecedem o prompt. Os turnos mais recentes que cabem no orçamento são mantidos;
+        os demais são incorporados ao resumo e removidos do histórico.
+
+        :param prompt: Prompt do usuário
+        :return: Mensagens de contexto: a mensagem de sistema, se houver, seguida dos turnos mantidos
+        """
+        with self._lock:
+            fatos = self._fatos_relevantes(prompt)
+            tokens_prompt = estimar_tokens_mensagens([{"content": prompt}])
+            disponivel = self.orcamento_tokens - self.max_tokens_resposta - tokens_prompt
+
+            def turnos_que_cabem(limite: int) -> int:
+                tokens, quantidade = 0, 0
+                for turno in reversed(self.turnos):
+                    tokens += turno.tokens()
+                    if tokens > limite:
+                        break
+                    quantidade += 1
+                return quantidade
+
+            custo_fixo = estimar_tokens_mensagens(self._mensagem_sistema(self.resumo, fatos))
+            mantidos = turnos_que_cabem(disponivel - custo_fixo)
+            if mantidos < len(self.turnos):
+                # Reserva o espaço do maior resumo possível, com os títulos da mensagem de sistema
+                resumo_maximo = " " * (4 * self.tokens_resumo)
+                custo_fixo = estimar_tokens_mensagens(self._mensagem_sistema(resumo_maximo, fatos))
+                mantidos = turnos_que_cabem(disponivel - custo_fixo)
+                antigos = [self.turnos.popleft() for _ in range(len(self.turnos) - mantidos)]
+                self.resumo = self.resumidor.resumir(self.resumo, antigos, self.tokens_resumo)
+                self.turnos_resumidos += len(antigos)
+
+            contexto = self._mensagem_sistema(self.resumo, fatos)
+            for turno in self.turnos:
+                contexto.extend(turno.mensagens())
+            self.tokens_ultima_requisicao = estimar_tokens_mensagens(contexto) + tokens_prompt
+            return contexto
+
+    def registrar_turno(self, pergunta: str, resposta: str):
+        """
+        Acrescenta um turno concluído ao histórico.
+
+        :param pergunta: Prompt do usuário
+        :param resposta: Resposta do assistente
+        """
+        with self._lock:
+            self.turnos.append(Turno(pergunta, resposta))
+
+    def gerar_resposta(self, prompt: str) -> str:
+        """
+        Gera a resposta ao prompt com o contexto da conversa e registra o turno.
+
+        :param prompt: Prompt do usuário
+        :return: Resposta gerada pelo ChatGPT
+        :raises ValueError: Se o prompt for vazio
+        :raises ChatGPTIntegrationError: Se ocorrer um erro durante a geração da resposta
+        """
+        resposta = self.chatgpt.gerar_resposta(prompt, self.max_tokens_resposta, contexto=self.montar_contexto(prompt))
+        self.registrar_turno(prompt, resposta)
+        return resposta
+
+    def gerar_resposta_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Gera a resposta ao prompt com o contexto da conversa, devolvendo os trechos à medida que chegam. O turno
+        é registrado quando a resposta termina; uma resposta interrompida não entra no histórico.
+
+        :param prompt: Prompt do usuário
+        :return: Iterador de trechos da resposta
+        :raises ValueError: Se o prompt for vazio (levantado na chamada)
+        :raises ChatGPTIntegrationError: Se ocorrer um erro durante a geração da resposta (levantado durante a
+                                         iteração)
+        """
+        trechos = self.chatgpt.gerar_resposta_stream(prompt, self.max_tokens_resposta,
+                                                     contexto=self.montar_contexto(prompt))
+        return self._registrar_ao_concluir(prompt, trechos)
+
+    def _registrar_ao_concluir(self, prompt: str, trechos: Iterator[str]) -> Iterator[str]:
+        """Repassa os trechos e registra o turno ao fim do stream."""
+        recebidos: List[str] = []
+        for trecho in trechos:
+            recebidos.append(trecho)
+            yield trecho
+        self.registrar_turno(prompt, "".join(recebidos))
+
+    def limpar(self):
+        """Descarta o histórico e o resumo, iniciando uma nova conversa."""
+        with self._lock:
+            self.turnos.clear()
+            self.resumo = ""
+            self.turnos_resumidos = 0
+            self.tokens_ultima_requisicao = 0
+
+    def estatisticas(self) -> Dict[str, int]:
+        """
+        Retorna o estado da sessão.
+
+        :return: Dicionário com os turnos mantidos e resumidos, os tokens do resumo e os tokens de entrada
+                 estimados da última requisição
+        """
+        with self._lock:
+            return {"turnos": len(self.turnos), "turnos_resumidos": self.turnos_resumidos,
+                    "tokens_resumo": estimar_tokens_texto(self.resumo),
+                    "tokens_ultima_requisicao": self.tokens_ultima_requisicao}
@@ -19,14 +19,21 @@ Exceções:
 
 Dependências:
     - tkinter
+    - queue
+    - threading
     - core.language_model.modelo_linguagem
+    - core.orquestrador
     - utils.logger
     - utils.exceptions
 """
 
+import queue
+import threading
 import tkinter as tk
+from typing import Any, Dict, List
 from tkinter import scrolledtext, filedialog, simpledialog, messagebox
 from core.language_model.modelo_linguagem import ModeloLinguagem
+from core.orquestrador import OrquestradorRequisicao
 from utils.logger import configurar_logger
 from utils.exceptions import InterfaceUsuarioError, ModeloLinguagemError
 import sys
@@ -35,8 +42,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Constantes
 TITULO_JANELA = "Gysin-IA: Assistente Virtual"
-MENSAGEM_PROCESSANDO = "Gysin-IA: Processando..."
+PREFIXO_RESPOSTA = "Gysin-IA: "
+TEXTO_PROCESSANDO = "Processando..."
+MENSAGEM_PROCESSANDO = PREFIXO_RESPOSTA + TEXTO_PROCESSANDO
 MENSAGEM_ERRO_INESPERADO = "Gysin-IA: Desculpe, ocorreu um erro inesperado."
+MENSAGEM_AGUARDE = "Gysin-IA: Aguarde a resposta anterior antes de enviar outra mensagem."
+INTERVALO_ATUALIZACAO_MS = 30  # intervalo entre as atualizações da resposta em streaming
 
 class InterfaceUsuario:
     def __init__(self, master: tk.Tk) -> None:
@@ -53,6 +64,8 @@ class InterfaceUsuario:
         self.master.title(TITULO_JANELA)
         self.master.geometry("800x600")
         self.master.protocol("WM_DELETE_WINDOW", self.fechar_aplicacao)
+        self.processando = False
+        self._fila_resposta: "queue.Queue" = queue.Queue()
 
         # Centralizar a janela
         self.centralizar_janela()
@@ -62,9 +75,9 @@ class InterfaceUsuario:
 
         # Inicializar o modelo de linguagem
         try:
-            self.modelo = ModeloLinguagem(chatgpt_api_key="sua_chave_api_aqui")
+            self.orquestrador = OrquestradorRequisicao(ModeloLinguagem(chatgpt_api_key="sua_chave_api_aqui"))
         except Exception as e:
-            self.logger.error(f"Erro ao inicializar o ModeloLinguagem: {str(e)}")
+            self.logger.error("Erro ao inicializar o ModeloLinguagem: %s", e)
             messagebox.showerror("Erro de Inicialização", f"Erro ao inicializar o ModeloLinguagem: {str(e)}")
             raise InterfaceUsuarioError(f"Erro ao inicializar o ModeloLinguagem: {str(e)}")
 
@@ -92,7 +105,7 @@ class InterfaceUsuario:
 
     def tratar_erro(self, mensagem: str, erro: Exception) -> None:
         """Trata erros de forma centralizada, logando e exibindo mensagens."""
-        self.logger.error(f"{mensagem}: {str(erro)}")
+        self.logger.error("%s: %s", mensagem, erro)
         self.inserir_mensagem(f"Gysin-IA: {mensagem}: {str(erro)}")
 
     def validar_entrada(self, texto: str) -> bool:
@@ -159,7 +172,8 @@ class InterfaceUsuario:
 
     def processar_entrada(self, event: tk.Event = None) -> None:
         """
-        Processa a entrada do usuário e gera uma resposta.
+        Processa a entrada do usuário e gera uma resposta. A resposta do ChatGPT e a análise do texto são
+        produzidas em uma thread de trabalho; os trechos da resposta são exibidos à medida que chegam.
 
         :param event: Evento de teclado (opcional)
         """
@@ -167,36 +181,124 @@ class InterfaceUsuario:
         if not self.validar_entrada(texto_usuario):
             self.inserir_mensagem("Gysin-IA: Por favor, digite algo antes de enviar.")
             return
+        if self.processando:
+            self.inserir_mensagem(MENSAGEM_AGUARDE)
+            return
 
+        self.processando = True
         self.inserir_mensagem(f"Você: {texto_usuario}")
-        self.inserir_mensagem(MENSAGEM_PROCESSANDO)
-        self.master.update_idletasks()
+        # A resposta é escrita na marca "fim_resposta", que avança a cada trecho inserido
+        self.chat_area.mark_set("inicio_resposta", "end-1c")
+        self.chat_area.mark_gravity("inicio_resposta", tk.LEFT)
+        self.chat_area.insert(tk.END, PREFIXO_RESPOSTA)
+        self.chat_area.insert(tk.END, TEXTO_PROCESSANDO, "processando")
+        self.chat_area.insert(tk.END, "\n\n")
+        self.chat_area.mark_set("fim_resposta", "processando.first")
+        self.chat_area.mark_gravity("fim_resposta", tk.RIGHT)
+        self.chat_area.see(tk.END)
+
+        self._fila_resposta = queue.Queue()
+        threading.Thread(target=self._gerar_resposta_em_segundo_plano,
+                         args=(texto_usuario, self._fila_resposta), daemon=True).start()
+        self.master.after(INTERVALO_ATUALIZACAO_MS, self._atualizar_resposta, texto_usuario)
+
+    @property
+    def modelo(self) -> ModeloLinguagem:
+        """Modelo de linguagem usado pelo orquestrador das mensagens."""
+        return self.orquestrador.modelo
+
+    @modelo.setter
+    def modelo(self, modelo: ModeloLinguagem) -> None:
+        self.orquestrador.modelo = modelo
+
+    def _gerar_resposta_em_segundo_plano(self, texto_usuario: str, fila: "queue.Queue") -> None:
+        """
+        Executada na thread de trabalho: envia à fila os trechos da resposta, depois o resultado da análise ou
+        o erro ocorrido. A análise do texto é feita pelo orquestrador enquanto a resposta chega. Não acessa
+        widgets do Tkinter.
 
+        :param texto_usuario: Texto digitado pelo usuário
+        :param fila: Fila lida por _atualizar_resposta na thread da interface
+        """
+        requisicao = None
         try:
-            resultado = self.modelo.processar_texto(texto_usuario)
-            sentimento = self.modelo.analisar_sentimento(texto_usuario)
-            resposta_chatgpt = self.modelo.gerar_resposta_chatgpt(texto_usuario)
-            
-            resposta = f"Gysin-IA: {resposta_chatgpt}\n\n"
-            resposta += f"Análise: Detectei {len(resultado['entidades'])} entidades, "
-            resposta += f"{len(resultado['substantivos'])} substantivos e {len(resultado['verbos'])} verbos. "
-            resposta += f"O sentimento do texto parece ser {sentimento}."
-            
-            self.chat_area.delete("end-2l", "end-1l")  # Remove a mensagem "Processando..."
-            self.inserir_mensagem(resposta)
+            requisicao = self.orquestrador.iniciar(texto_usuario)
+            for trecho in requisicao.trechos():
+                fila.put(("trecho", trecho))
+            fila.put(("fim", requisicao.analise()))
+        except ModeloLinguagemError as e:
+            fila.put(("erro", ("Erro no modelo de linguagem", e)))
+        except ValueError as e:
+            fila.put(("erro", ("Erro de valor", e)))
+        except Exception as e:
+            fila.put(("erro", ("Erro inesperado", e)))
+        finally:
+            # Sem efeito se as análises já terminaram; após um erro, descarta as que ainda não começaram
+            if requisicao is not None:
+                requisicao.cancelar()
+
+    def _atualizar_resposta(self, texto_usuario: str) -> None:
+        """
+        Executada na thread da interface por master.after: exibe os trechos recebidos e, ao final, a análise.
+
+        :param texto_usuario: Texto digitado pelo usuário
+        """
+        trechos = []
+        while True:
+            try:
+                tipo, conteudo = self._fila_resposta.get_nowait()
+            except queue.Empty:
+                break
+            if tipo == "trecho":
+                trechos.append(conteudo)
+                continue
+            self._exibir_trechos(trechos)
+            if tipo == "fim":
+                self._concluir_resposta(texto_usuario, *conteudo)
+            else:
+                self.chat_area.delete("inicio_resposta", tk.END)
+                self.tratar_erro(*conteudo)
+            self.processando = False
+            return
+        self._exibir_trechos(trechos)
+        self.master.after(INTERVALO_ATUALIZACAO_MS, self._atualizar_resposta, texto_usuario)
+
+    def _remover_aviso_processando(self) -> None:
+        """Remove o aviso de processamento da resposta em exibição, se ainda estiver presente."""
+        intervalo = self.chat_area.tag_ranges("processando")
+        if intervalo:
+            self.chat_area.delete(*intervalo)
+
+    def _exibir_trechos(self, trechos: List[str]) -> None:
+        """Acrescenta os trechos à resposta em exibição, removendo antes o aviso de processamento."""
+        if not trechos:
+            return
+        self._remover_aviso_processando()
+        self.chat_area.insert("fim_resposta", "".join(trechos))
+        self.chat_area.see(tk.END)
+
+    def _concluir_resposta(self, texto_usuario: str, resultado: Dict[str, Any], sentimento: str) -> None:
+        """
+        Completa a resposta com a análise do texto e atualiza o mapa mental.
 
+        :param texto_usuario: Texto digitado pelo usuário
+        :param resultado: Resultado de processar_texto
+        :param sentimento: Sentimento detectado
+        """
+        analise = f"\n\nAnálise: Detectei {len(resultado['entidades'])} entidades, "
+        analise += f"{len(resultado['substantivos'])} substantivos e {len(resultado['verbos'])} verbos. "
+        analise += f"O sentimento do texto parece ser {sentimento}."
+        self._remover_aviso_processando()
+        self.chat_area.insert("fim_resposta", analise)
+        self.chat_area.see(tk.END)
+
+        try:
             if resultado['substantivos']:
                 self.modelo.adicionar_ao_mapa_mental(resultado['substantivos'][0], resultado['substantivos'][1:])
-            
-            self.entrada.delete(0, tk.END)
-        except ModeloLinguagemError as e:
-            self.chat_area.delete("end-2l", "end-1l")
-            self.tratar_erro("Erro no modelo de linguagem", e)
-        except ValueError as e:
-            self.chat_area.delete("end-2l", "end-1l")
-            self.tratar_erro("Erro de valor", e)
+            # Preserva o que o usuário tiver começado a digitar durante a resposta
+            if self.entrada.get().strip() == texto_usuario:
+                self.entrada.delete(0, tk.END)
         except Exception as e:
-            self.chat_area.delete("end-2l", "end-1l")
             self.tratar_erro("Erro inesperado", e)
 
     def modo_aprendizado(self) -> None:
@@ -264,14 +366,20 @@ class InterfaceUsuario:
             self.tratar_erro("Erro ao salvar histórico", e)
 
     def limpar_chat(self) -> None:
-        """Limpa a área de chat."""
+        """Limpa a área de chat e inicia uma nova conversa."""
         if messagebox.askyesno("Limpar Chat", "Tem certeza que deseja limpar o chat?"):
             self.chat_area.delete(1.0, tk.END)
+            self.modelo.limpar_conversa()
             self.inserir_mensagem("Gysin-IA: Chat limpo.")
 
     def fechar_aplicacao(self) -> None:
         """Fecha a aplicação de forma graciosa."""
         if messagebox.askokcancel("Sair", "Tem certeza que deseja sair?"):
+            try:
+                self.modelo.salvar_estado()
+            except ModeloLinguagemError as e:
+                self.logger.error("Erro ao salvar estado do modelo ao sair: %s", e)
+            self.orquestrador.encerrar()
             self.master.destroy()
 
 # Inicialização da aplicação
@@ -15,6 +15,7 @@ setup(
     name="gysin-ia",  # Nome do pacote
     version="0.1",  # Versão inicial do pacote
     packages=find_packages(),  # Localiza automaticamente os pacotes Python a serem incluídos
+    package_data={'core.language_model': ['dados/*.json']},  # Léxico de sentimento distribuído com o pacote
 
     # Lista de dependências necessárias para a execução do pacote
     install_requires=[
@@ -22,6 +23,8 @@ setup(
         'textblob',    # Biblioteca para processamento de texto e análise de sentimento
         'networkx',    # Biblioteca para criação e manipulação de grafos
         'matplotlib',  # Biblioteca para criação de gráficos e visualizações
+        'numpy',       # Biblioteca para computação numérica (classificador de sentimento)
+        'scipy',       # Matrizes esparsas para o sumarizador baseado em grafo
     ],
 
     # Configurações extras, como pacotes adicionais para desenvolvimento
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_analise_compacta
+
+Este módulo contém testes unitários para a classe AnaliseCompacta, verificando a compatibilidade com o
+dicionário devolvido por processar_texto e a ida e volta da forma codificada.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestAnaliseCompacta
+
+Dependências:
+    - unittest
+    - spacy
+    - core.language_model.analise_compacta
+"""
+
+import json
+import unittest
+from spacy.tokens import Doc
+from spacy.vocab import Vocab
+from core.language_model.analise_compacta import AnaliseCompacta
+from utils.exceptions import ModeloLinguagemError
+
+class TestAnaliseCompacta(unittest.TestCase):
+    def setUp(self):
+        """Constrói um Doc anotado manualmente, sem depender de um modelo treinado."""
+        self.doc = Doc(
+            Vocab(),
+            words=["O", "Stefano", "mora", "em", "Zurique", "."],
+            pos=["DET", "PROPN", "VERB", "ADP", "PROPN", "PUNCT"],
+            ents=["O", "B-PER", "O", "O", "B-LOC", "O"]
+        )
+        self.analise = AnaliseCompacta.de_doc(self.doc)
+
+    def test_compatibilidade_com_dicionario(self):
+        """Testa se a análise se comporta como o dicionário devolvido anteriormente por processar_texto."""
+        self.assertEqual(set(self.analise), {"entidades", "tokens", "substantivos", "verbos"})
+        self.assertEqual(self.analise["tokens"], [token.text for token in self.doc])
+        self.assertEqual(self.analise["entidades"], ["Stefano", "Zurique"])
+        self.assertEqual(self.analise["verbos"], ["mora"])
+        self.assertEqual(self.analise["substantivos"], [])
+        self.assertEqual(self.analise.entidades_posicoes, [(2, 9, "PER"), (18, 25, "LOC")])
+        with self.assertRaises(KeyError):
+            self.analise["inexistente"]
+
+    def test_codificar_e_decodificar(self):
+        """Testa a ida e volta da forma armazenada e se ela é menor que as listas de strings."""
+        dados = self.analise.codificar()
+        recuperada = AnaliseCompacta.decodificar(self.doc.text, json.loads(json.dumps(dados)))
+
+        self.assertEqual(recuperada, self.analise)
+        self.assertEqual(recuperada.entidades_posicoes, self.analise.entidades_posicoes)
+        self.assertLess(len(json.dumps(dados)), len(json.dumps(self.analise.como_dicionario())))
+
+        with self.assertRaises(ModeloLinguagemError):
+            AnaliseCompacta.decodificar("texto", {"formato": 99})
+
+    def test_deslocamento(self):
+        """Testa se as posições de um bloco são relativas ao documento de origem."""
+        bloco = AnaliseCompacta.de_doc(self.doc, deslocamento=100)
+        self.assertEqual((bloco.inicio, bloco.fim), (100, 100 + len(self.doc.text)))
+        self.assertEqual(bloco.entidades_posicoes[0], (102, 109, "PER"))
+
+if __name__ == '__main__':
+    unittest.main()
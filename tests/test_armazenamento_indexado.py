@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_armazenamento_indexado
+
+Este módulo contém testes para o ArmazenamentoIndexado, para o conversor do memoria.json e para o backend
+'indexado' do GerenciadorMemoria, verificando a decodificação sob demanda, a busca com colisões de CRC-32, a
+reprodução do log de alterações, a reescrita da tabela, a seção de expirações, a leitura de tabelas da primeira
+versão do formato e a conversão pela linha de comando.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestArmazenamentoIndexado
+    - TestConversor
+    - TestGerenciadorMemoriaIndexado
+
+Dependências:
+    - unittest
+    - core.armazenamento.indexado
+    - core.memoria
+"""
+
+import contextlib
+import io
+import json
+import os
+import struct
+import tempfile
+import threading
+import unittest
+import zlib
+from unittest.mock import patch
+from core.armazenamento import indexado
+from core.armazenamento.indexado import ArmazenamentoIndexado, converter_json
+from core.memoria import GerenciadorMemoria
+from utils.exceptions import MemoriaError
+
+class TestArmazenamentoIndexado(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "memoria.gysidx")
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def criar(self, dados):
+        arquivo_json = os.path.join(self.pasta.name, "memoria.json")
+        with open(arquivo_json, "w") as f:
+            json.dump(dados, f)
+        converter_json(arquivo_json, self.caminho)
+
+    def test_leitura_sob_demanda(self):
+        """Testa se abrir a tabela não decodifica valores e se cada leitura decodifica apenas o valor pedido."""
+        self.criar({f"chave{i}": {"texto": f"valor {i}", "ç": [i]} for i in range(1000)})
+        with patch.object(indexado.json, "loads", wraps=json.loads) as loads:
+            armazenamento = ArmazenamentoIndexado(self.caminho)
+            self.assertEqual(len(armazenamento), 1000)
+            self.assertEqual(loads.call_count, 0)
+            self.assertEqual(armazenamento.obter("chave500"), {"texto": "valor 500", "ç": [500]})
+            self.assertIsNone(armazenamento.obter("chave1000"))
+            self.assertIn("chave999", armazenamento)
+            self.assertEqual(loads.call_count, 1)
+        self.assertEqual(armazenamento.chave_mais_antiga(), "chave0")
+        self.assertEqual(armazenamento.chaves()[-1], "chave999")
+        armazenamento.fechar()
+
+    def test_colisao_de_crc(self):
+        """Testa se chaves com o mesmo CRC-32 são distinguidas pela comparação das chaves."""
+        colidentes = ["a02552f76dbdf5fd", "670009b22c087272"]
+        self.assertEqual(zlib.crc32(colidentes[0].encode()), zlib.crc32(colidentes[1].encode()))
+        self.criar({colidentes[0]: 1, "outra": 2, colidentes[1]: 3})
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        self.assertEqual([armazenamento.obter(c) for c in colidentes], [1, 3])
+        self.assertIsNone(armazenamento.obter("ausente"))
+        armazenamento.fechar()
+
+    def test_alteracoes_e_reabertura(self):
+        """Testa se as alterações sobre a tabela são reproduzidas ao reabrir, preservando a ordem das chaves."""
+        self.criar({"a": 1, "b": 2, "c": 3})
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        armazenamento.gravar("b", "dois")
+        armazenamento.remover("a")
+        armazenamento.gravar("d", 4)
+        armazenamento.remover("c")
+        armazenamento.gravar("c", "de novo")
+        self.assertFalse(armazenamento.remover("a"))
+        esperado = [("b", "dois"), ("d", 4), ("c", "de novo")]
+        self.assertEqual(list(armazenamento.itens()), esperado)
+        self.assertEqual(len(armazenamento), 3)
+        armazenamento.fechar()
+
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        self.assertEqual(list(armazenamento.itens()), esperado)
+        self.assertEqual(list(armazenamento.itens_codificados()), [("b", '"dois"'), ("d", "4"), ("c", '"de novo"')])
+        armazenamento.limpar()
+        armazenamento.gravar("a", "após limpar")
+        armazenamento.fechar()
+
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        self.assertEqual(dict(armazenamento.itens()), {"a": "após limpar"})
+        self.assertNotIn("b", armazenamento)
+        armazenamento.fechar()
+
+    def test_compactacao(self):
+        """
+        Testa se a reescrita em segundo plano preserva o estado e as alterações feitas durante ela, esvazia o log e
+        não afeta uma iteração em andamento.
+        """
+        self.criar({f"chave{i}": i for i in range(100)})
+        armazenamento = ArmazenamentoIndexado(self.caminho, fsync_lote=0, minimo_compactacao=2048)
+        iteracao = armazenamento.itens()
+        self.assertEqual(next(iteracao), ("chave0", 0))
+        for i in range(300):
+            armazenamento.gravar(f"chave{i % 150}", -i)
+        armazenamento.remover("chave0")
+        armazenamento._aguardar_compactacao()
+        self.assertGreater(armazenamento.estatisticas()["compactacoes"], 0)
+        self.assertEqual(next(iteracao), ("chave1", 1))
+        esperado = {f"chave{i}": -(150 + i) for i in range(1, 150)}
+        self.assertEqual(dict(armazenamento.itens()), esperado)
+
+        escritor = threading.Thread(target=lambda: [armazenamento.gravar(f"nova{i}", i) for i in range(500)])
+        escritor.start()
+        armazenamento.compactar()
+        escritor.join()
+        armazenamento.remover("chave1")
+        armazenamento._aguardar_compactacao()
+        del esperado["chave1"]
+        esperado.update({f"nova{i}": i for i in range(500)})
+        self.assertEqual(dict(armazenamento.itens()), esperado)
+        armazenamento.compactar()
+        self.assertEqual(armazenamento.estatisticas()["bytes_alteracoes"], os.path.getsize(self.caminho + ".log"))
+        armazenamento.fechar()
+        self.assertEqual(dict(ArmazenamentoIndexado(self.caminho).itens()), esperado)
+        self.assertFalse(os.path.exists(self.caminho + ".tmp"))
+        self.assertFalse(os.path.exists(self.caminho + ".log.tmp"))
+
+    def test_gravacao_nao_espera_a_reescrita(self):
+        """Testa se as gravações e leituras continuam enquanto a tabela é reescrita em segundo plano."""
+        self.criar({f"chave{i}": i for i in range(100)})
+        armazenamento = ArmazenamentoIndexado(self.caminho, fsync_lote=0, fracao_compactacao=1e-6, minimo_compactacao=1)
+        liberar = threading.Event()
+        original = indexado._escrever_tabela
+
+        def escrever_devagar(arquivo, itens):
+            liberar.wait(5)
+            return original(arquivo, itens)
+
+        with patch.object(indexado, "_escrever_tabela", escrever_devagar):
+            armazenamento.gravar("a", 1)
+            self.assertIsNotNone(armazenamento._pendentes)
+            armazenamento.gravar("b", 2)
+            armazenamento.remover("chave5")
+            self.assertEqual(armazenamento.obter("b"), 2)
+            liberar.set()
+            armazenamento._aguardar_compactacao()
+        self.assertEqual(armazenamento.estatisticas()["compactacoes"], 1)
+        self.assertEqual(armazenamento.obter("a"), 1)
+        self.assertNotIn("chave5", armazenamento)
+        armazenamento.fechar()
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        self.assertEqual((armazenamento.obter("b"), len(armazenamento)), (2, 101))
+        armazenamento.fechar()
+
+    def test_registro_incompleto(self):
+        """Testa se um registro final cortado no log de alterações é descartado."""
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        armazenamento.gravar("a", "completo")
+        armazenamento.gravar("b", "cortado")
+        armazenamento.fechar()
+        with open(self.caminho + ".log", "r+b") as f:
+            f.truncate(os.path.getsize(self.caminho + ".log") - 3)
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        self.assertEqual(armazenamento.chaves(), ["a"])
+        armazenamento.fechar()
+
+    def test_tabela_da_primeira_versao(self):
+        """Testa se uma tabela sem a seção de expirações é lida e se a reescrita a converte."""
+        registros = b""
+        posicoes, hashes = [], []
+        for chave, texto in (("a", '{"__expira_em__": 5.0, "valor": 1}'), ("b", "2")):
+            posicoes.append(32 + len(registros))
+            hashes.append(zlib.crc32(chave.encode()))
+            registros += struct.pack("<II", len(chave), len(texto)) + chave.encode() + texto.encode()
+        fim_registros = 32 + len(registros)
+        inicio_indice = (fim_registros + 7) // 8 * 8
+        ordem = sorted(range(2), key=lambda i: hashes[i])
+        with open(self.caminho, "wb") as f:
+            f.write(struct.pack("<8sQQQ", indexado.ASSINATURA_V1, 2, fim_registros, inicio_indice) + registros
+                    + bytes(inicio_indice - fim_registros))
+            f.write(b"".join(struct.pack("<Q", posicoes[i]) for i in ordem))
+            f.write(b"".join(struct.pack("<I", hashes[i]) for i in ordem))
+
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        self.assertEqual(list(armazenamento.itens()), [("a", {"__expira_em__": 5.0, "valor": 1}), ("b", 2)])
+        self.assertEqual(list(armazenamento.expiracoes()), [("a", 5.0)])
+        armazenamento.compactar()
+        with open(self.caminho, "rb") as f:
+            self.assertEqual(f.read(8), indexado.ASSINATURA)
+        self.assertEqual(list(armazenamento.expiracoes()), [("a", 5.0)])
+        self.assertEqual(armazenamento.obter("b"), 2)
+        armazenamento.fechar()
+
+    def test_arquivo_invalido(self):
+        """Testa se um arquivo de outro formato é rejeitado."""
+        with open(self.caminho, "w") as f:
+            f.write("{}" * 100)
+        with self.assertRaises(MemoriaError):
+            ArmazenamentoIndexado(self.caminho)
+
+    def test_fechado(self):
+        """Testa se operações após o fechamento são rejeitadas."""
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        armazenamento.fechar()
+        with self.assertRaises(MemoriaError):
+            armazenamento.gravar("a", 1)
+        with self.assertRaises(MemoriaError):
+            armazenamento.obter("a")
+
+class TestConversor(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.arquivo_json = os.path.join(self.pasta.name, "memoria.json")
+        self.caminho = os.path.join(self.pasta.name, "memoria.gysidx")
+        with open(self.arquivo_json, "w") as f:
+            json.dump({"nome_usuario": "João", "contador_aprendizado": 2, "vazio": None}, f)
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def executar(self, *argumentos):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return indexado.main([self.arquivo_json, self.caminho, *argumentos])
+
+    def test_linha_de_comando(self):
+        """Testa a conversão, a recusa em sobrescrever sem --substituir e a remoção do log antigo."""
+        self.assertEqual(self.executar(), 0)
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        self.assertEqual(list(armazenamento.itens()),
+                         [("nome_usuario", "João"), ("contador_aprendizado", 2), ("vazio", None)])
+        armazenamento.gravar("alteracao", 1)
+        armazenamento.fechar()
+
+        self.assertEqual(self.executar(), 1)
+        self.assertEqual(self.executar("--substituir"), 0)
+        self.assertFalse(os.path.exists(self.caminho + ".log"))
+        armazenamento = ArmazenamentoIndexado(self.caminho)
+        self.assertNotIn("alteracao", armazenamento)
+        armazenamento.fechar()
+
+    def test_json_invalido(self):
+        """Testa se um arquivo que não contém um objeto JSON é rejeitado."""
+        with open(self.arquivo_json, "w") as f:
+            json.dump([1, 2], f)
+        with self.assertRaises(MemoriaError):
+            converter_json(self.arquivo_json, self.caminho)
+        self.assertFalse(os.path.exists(self.caminho))
+
+class TestGerenciadorMemoriaIndexado(unittest.TestCase):
+    def test_abertura_sem_decodificar(self):
+        """
+        Testa se o gerenciador abre a memória lendo as expirações da seção da tabela e do log, sem percorrer os
+        registros, e se, com orçamento, os tamanhos são lidos sem decodificar os valores.
+        """
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "memoria.gysidx")
+            memoria = GerenciadorMemoria(caminho, backend="indexado", orcamento_bytes=10000)
+            for i in range(50):
+                memoria.adicionar_informacao(f"chave{i}", {"i": i})
+            memoria.adicionar_informacao("temporaria", "x", ttl=3600)
+            memoria.armazenamento.compactar()
+            memoria.adicionar_informacao("no_log", "y", ttl=3600)
+            bytes_totais = memoria.estatisticas()["bytes"]
+            memoria.fechar()
+
+            with patch("json.loads", wraps=json.loads) as loads, \
+                    patch.object(indexado._Tabela, "percorrer", side_effect=AssertionError):
+                memoria = GerenciadorMemoria(caminho, backend="indexado", tamanho_maximo=0, orcamento_bytes=0)
+                # A seção de expirações e o valor gravado no log
+                self.assertEqual(loads.call_count, 2)
+                self.assertEqual(memoria.estatisticas()["com_expiracao"], 2)
+                self.assertEqual(memoria.obter_informacao("chave7"), {"i": 7})
+            memoria.fechar()
+
+            with patch("json.loads", wraps=json.loads) as loads:
+                memoria = GerenciadorMemoria(caminho, backend="indexado", orcamento_bytes=10000)
+                self.assertEqual(loads.call_count, 2)
+            self.assertEqual(memoria.estatisticas()["bytes"], bytes_totais)
+            memoria.fechar()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_armazenamento_log
+
+Este módulo contém testes para o ArmazenamentoLog e para o backend 'log' do GerenciadorMemoria, verificando a
+reprodução do log ao reabrir, o descarte de um registro final incompleto, a compactação (inclusive com escritas
+simultâneas) e o fsync em lotes.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestArmazenamentoLog
+    - TestGerenciadorMemoriaLog
+
+Dependências:
+    - unittest
+    - core.armazenamento.log
+    - core.memoria
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from core.armazenamento.log import ArmazenamentoLog
+from core.memoria import GerenciadorMemoria
+from utils.exceptions import MemoriaError
+
+class TestArmazenamentoLog(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "memoria.log")
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def test_reproducao(self):
+        """Testa se gravações, remoções e limpezas são reproduzidas ao reabrir o log."""
+        log = ArmazenamentoLog(self.caminho)
+        log.gravar("a", 1)
+        log.gravar("b", {"lista": [1, 2], "texto": "olá"})
+        log.limpar()
+        log.gravar("c", "três")
+        log.gravar("d", None)
+        log.gravar("c", "3")
+        log.remover("d")
+        self.assertFalse(log.remover("inexistente"))
+        log.fechar()
+
+        log = ArmazenamentoLog(self.caminho)
+        self.assertEqual(dict(log.itens()), {"c": "3"})
+        log.gravar("b", {"lista": [1, 2], "texto": "olá"})
+        log.fechar()
+        self.assertEqual(ArmazenamentoLog(self.caminho).obter("b"), {"lista": [1, 2], "texto": "olá"})
+
+    def test_registro_incompleto(self):
+        """Testa se um registro final cortado é descartado e o log continua utilizável."""
+        log = ArmazenamentoLog(self.caminho)
+        log.gravar("a", "completo")
+        log.gravar("b", "cortado")
+        log.fechar()
+        with open(self.caminho, "r+b") as f:
+            f.truncate(os.path.getsize(self.caminho) - 3)
+
+        log = ArmazenamentoLog(self.caminho)
+        self.assertEqual(log.chaves(), ["a"])
+        log.gravar("c", "depois")
+        log.fechar()
+        self.assertEqual(ArmazenamentoLog(self.caminho).chaves(), ["a", "c"])
+
+    def test_arquivo_invalido(self):
+        """Testa se um arquivo de outro formato é rejeitado."""
+        with open(self.caminho, "w") as f:
+            f.write("{}")
+        with self.assertRaises(MemoriaError):
+            ArmazenamentoLog(self.caminho)
+
+    def test_valor_nao_serializavel(self):
+        """Testa se um valor que não pode ser gravado não altera o estado."""
+        log = ArmazenamentoLog(self.caminho)
+        with self.assertRaises(MemoriaError):
+            log.gravar("a", object())
+        self.assertNotIn("a", log)
+        log.fechar()
+
+    def test_compactacao(self):
+        """Testa se a compactação em segundo plano reduz o log e preserva as escritas feitas durante ela."""
+        log = ArmazenamentoLog(self.caminho, fsync_lote=0, minimo_compactacao=4096)
+        for i in range(2000):
+            log.gravar(f"chave{i % 10}", i)
+        log._aguardar_compactacao()
+        estatisticas = log.estatisticas()
+        self.assertGreater(estatisticas["compactacoes"], 0)
+        # Sem compactação, os 2000 registros ocupariam cerca de 46 KB
+        self.assertLess(estatisticas["bytes_totais"], 20000)
+        self.assertEqual(estatisticas["bytes_totais"], os.path.getsize(self.caminho))
+
+        escritor = threading.Thread(target=lambda: [log.gravar(f"nova{i}", i) for i in range(500)])
+        escritor.start()
+        log.compactar()
+        escritor.join()
+        log.fechar()
+
+        esperado = {f"chave{i}": 1990 + i for i in range(10)}
+        esperado.update({f"nova{i}": i for i in range(500)})
+        self.assertEqual(dict(ArmazenamentoLog(self.caminho).itens()), esperado)
+
+    def test_fsync_em_lotes(self):
+        """Testa se o fsync é feito uma vez a cada fsync_lote registros."""
+        log = ArmazenamentoLog(self.caminho, fsync_lote=10)
+        with patch("core.armazenamento.log.os.fsync") as fsync:
+            for i in range(25):
+                log.gravar(str(i), i)
+            self.assertEqual(fsync.call_count, 2)
+            log.fechar()
+            self.assertEqual(fsync.call_count, 3)
+
+    def test_fechado(self):
+        """Testa se escritas após o fechamento são rejeitadas."""
+        log = ArmazenamentoLog(self.caminho)
+        log.fechar()
+        with self.assertRaises(MemoriaError):
+            log.gravar("a", 1)
+
+class TestGerenciadorMemoriaLog(unittest.TestCase):
+    def test_persistencia(self):
+        """Testa se o backend 'log' persiste as informações, o descarte e a limpeza."""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "memoria.log")
+            memoria = GerenciadorMemoria(caminho, backend="log")
+            memoria.tamanho_maximo = 2
+            for chave in ("a", "b", "c"):
+                memoria.adicionar_informacao(chave, chave.upper())
+            memoria.fechar()
+
+            memoria = GerenciadorMemoria(caminho, backend="log")
+            self.assertEqual(memoria.listar_chaves(), ["b", "c"])
+            self.assertEqual(memoria.obter_informacao("c"), "C")
+            memoria.limpar_memoria()
+            memoria.fechar()
+            self.assertEqual(GerenciadorMemoria(caminho, backend="log").tamanho_memoria(), 0)
+
+    def test_backend_invalido(self):
+        """Testa se um backend desconhecido é rejeitado."""
+        with self.assertRaises(ValueError):
+            GerenciadorMemoria(backend="xml")
+
+if __name__ == '__main__':
+    unittest.main()
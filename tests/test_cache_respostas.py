@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_cache_respostas
+
+Este módulo contém testes unitários para a classe CacheRespostas e para seu uso pela ChatGPTIntegration,
+verificando acertos em memória e em disco, expiração, descarte por tamanho, persistência e o desvio do cache.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestCacheRespostas
+    - TestChatGPTIntegrationCache
+
+Dependências:
+    - unittest
+    - unittest.mock
+    - core.cache_respostas
+    - core.chatgpt_integration
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from core.cache_respostas import CacheRespostas, gerar_chave
+from core.chatgpt_integration import ChatGPTIntegration, MODEL_ENGINE
+
+class TestCacheRespostas(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "cache.sqlite3")
+        self.cache = CacheRespostas(self.caminho, tamanho_memoria=2, tamanho_maximo=3, ttl=60)
+
+    def tearDown(self):
+        self.cache.fechar()
+        self.pasta.cleanup()
+
+    def test_gerar_chave(self):
+        """Testa se a chave depende do modelo, de max_tokens e das mensagens."""
+        mensagens = [{"role": "user", "content": "Olá"}]
+        chave = gerar_chave("modelo", 150, mensagens)
+        self.assertEqual(chave, gerar_chave("modelo", 150, [{"content": "Olá", "role": "user"}]))
+        self.assertNotEqual(chave, gerar_chave("modelo", 50, mensagens))
+        self.assertNotEqual(chave, gerar_chave("outro", 150, mensagens))
+
+    def test_acertos_memoria_e_disco(self):
+        """Testa se entradas descartadas da memória continuam disponíveis em disco."""
+        for i in range(3):
+            self.cache.armazenar(f"chave{i}", f"resposta{i}")
+        self.assertEqual(self.cache.obter("chave2"), "resposta2")
+        self.assertEqual(self.cache.obter("chave0"), "resposta0")
+        self.assertIsNone(self.cache.obter("inexistente"))
+
+        estatisticas = self.cache.estatisticas()
+        self.assertEqual(estatisticas["acertos_memoria"], 1)
+        self.assertEqual(estatisticas["acertos_disco"], 1)
+        self.assertEqual(estatisticas["falhas"], 1)
+        self.assertAlmostEqual(estatisticas["taxa_acerto"], 2 / 3)
+        self.assertEqual(estatisticas["tamanho_memoria"], 2)
+
+    def test_expiracao(self):
+        """Testa se respostas expiradas não são devolvidas."""
+        with patch("core.cache_respostas.time.time", return_value=1000.0):
+            self.cache.armazenar("chave", "resposta")
+        with patch("core.cache_respostas.time.time", return_value=1059.0):
+            self.assertEqual(self.cache.obter("chave"), "resposta")
+        with patch("core.cache_respostas.time.time", return_value=1061.0):
+            self.assertIsNone(self.cache.obter("chave"))
+        self.assertEqual(self.cache.estatisticas()["tamanho_disco"], 0)
+
+    def test_descarte_por_tamanho(self):
+        """Testa se a entrada menos recentemente usada é descartada do disco ao ultrapassar o limite."""
+        for i, instante in enumerate((1000.0, 1001.0, 1002.0)):
+            with patch("core.cache_respostas.time.time", return_value=instante):
+                self.cache.armazenar(f"chave{i}", f"resposta{i}")
+        with patch("core.cache_respostas.time.time", return_value=1003.0):
+            self.cache._memoria.clear()
+            self.assertEqual(self.cache.obter("chave0"), "resposta0")
+            self.cache.armazenar("chave3", "resposta3")
+            self.cache._memoria.clear()
+            self.assertEqual(self.cache.estatisticas()["tamanho_disco"], 3)
+            self.assertIsNone(self.cache.obter("chave1"))
+            self.assertEqual(self.cache.obter("chave0"), "resposta0")
+
+    def test_persistencia(self):
+        """Testa se as respostas sobrevivem à reabertura do cache."""
+        self.cache.armazenar("chave", "resposta")
+        self.cache.fechar()
+        self.cache = CacheRespostas(self.caminho, ttl=60)
+        self.assertEqual(self.cache.obter("chave"), "resposta")
+
+    def test_limpar(self):
+        """Testa se limpar remove as respostas em memória e em disco."""
+        self.cache.armazenar("chave", "resposta")
+        self.cache.limpar()
+        self.assertIsNone(self.cache.obter("chave"))
+        self.assertEqual(self.cache.estatisticas()["tamanho_disco"], 0)
+
+class TestChatGPTIntegrationCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = CacheRespostas(None)
+        self.chatgpt = ChatGPTIntegration("fake_api_key", cache=self.cache)
+        self.chatgpt.client = MagicMock()
+        resposta = MagicMock()
+        resposta.choices[0].message.content = "Resposta da API"
+        self.chatgpt.client.chat.completions.create.return_value = resposta
+
+    def test_resposta_repetida_usa_cache(self):
+        """Testa se um prompt repetido não chama a API novamente."""
+        self.assertEqual(self.chatgpt.gerar_resposta("Olá"), "Resposta da API")
+        self.assertEqual(self.chatgpt.gerar_resposta("Olá"), "Resposta da API")
+        self.chatgpt.client.chat.completions.create.assert_called_once()
+        chave = gerar_chave(MODEL_ENGINE, 150, [{"role": "user", "content": "Olá"}])
+        self.assertEqual(self.cache.obter(chave), "Resposta da API")
+
+    def test_max_tokens_diferente_nao_usa_cache(self):
+        """Testa se max_tokens faz parte da chave do cache."""
+        self.chatgpt.gerar_resposta("Olá")
+        self.chatgpt.gerar_resposta("Olá", max_tokens=50)
+        self.assertEqual(self.chatgpt.client.chat.completions.create.call_count, 2)
+
+    def test_desvio_do_cache(self):
+        """Testa se usar_cache=False sempre chama a API."""
+        self.chatgpt.gerar_resposta("Olá")
+        self.chatgpt.gerar_resposta("Olá", usar_cache=False)
+        self.assertEqual(self.chatgpt.client.chat.completions.create.call_count, 2)
+
+    def test_falha_do_cache_nao_interrompe(self):
+        """Testa se um erro do cache é ignorado e a API é chamada normalmente."""
+        self.chatgpt.cache = MagicMock()
+        self.chatgpt.cache.obter.side_effect = RuntimeError("disco indisponível")
+        self.assertEqual(self.chatgpt.gerar_resposta("Olá"), "Resposta da API")
+
+if __name__ == '__main__':
+    unittest.main()
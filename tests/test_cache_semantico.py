@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_cache_semantico
+
+Este módulo contém testes unitários para a classe CacheSemantico e para seu uso pela ChatGPTIntegration,
+verificando o reconhecimento de paráfrases, a rejeição de prompts parecidos com outro sentido, a separação por
+contexto e por números e a substituição das entradas mais antigas.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestCacheSemantico
+    - TestChatGPTIntegrationCacheSemantico
+
+Dependências:
+    - unittest
+    - unittest.mock
+    - core.cache_semantico
+    - core.chatgpt_integration
+"""
+
+import unittest
+from unittest.mock import MagicMock
+from core.cache_semantico import CacheSemantico, forma_canonica
+from core.chatgpt_integration import ChatGPTIntegration
+
+class TestCacheSemantico(unittest.TestCase):
+    def setUp(self):
+        self.cache = CacheSemantico()
+
+    def test_forma_canonica(self):
+        """Testa se a forma canônica ignora maiúsculas, acentos, pontuação e palavras funcionais."""
+        self.assertEqual(forma_canonica("Qual é a capital da França?"), "qual capital franca")
+        self.assertEqual(forma_canonica("qual a capital da frança"), "qual capital franca")
+        self.assertEqual(forma_canonica("?!"), "")
+
+    def test_parafrase(self):
+        """Testa se uma paráfrase próxima é respondida e um prompt diferente não."""
+        self.cache.armazenar("Qual é a capital da França?", "Paris")
+        self.assertEqual(self.cache.obter("qual a capital da frança"), "Paris")
+        self.assertIsNone(self.cache.obter("Qual é a capital da Itália?"))
+
+        estatisticas = self.cache.estatisticas()
+        self.assertEqual(estatisticas["acertos"], 1)
+        self.assertEqual(estatisticas["falhas"], 1)
+        self.assertEqual(estatisticas["tamanho"], 1)
+
+    def test_numeros_diferentes(self):
+        """Testa se prompts que diferem apenas nos números não são considerados equivalentes."""
+        self.cache.armazenar("Quanto é 2 + 2?", "4")
+        self.assertEqual(self.cache.obter("quanto é 2 + 2"), "4")
+        self.assertIsNone(self.cache.obter("Quanto é 2 + 3?"))
+
+    def test_prompts_parecidos_com_outro_sentido(self):
+        """Testa se prompts quase iguais, mas com outros termos ou outra ordem, não se equivalem."""
+        pares = [("Como converter uma string em inteiro em Python?", "Como converter um inteiro em string em Python?"),
+                 ("Python é melhor que Java?", "Java é melhor que Python?"),
+                 ("Traduza para o inglês a frase: eu gosto de café",
+                  "Traduza para o inglês a frase: eu gosto de chá")]
+        for armazenado, consultado in pares:
+            with self.subTest(consultado=consultado):
+                self.cache.armazenar(armazenado, "resposta")
+                self.assertIsNone(self.cache.obter(consultado))
+                self.assertEqual(self.cache.obter(armazenado), "resposta")
+
+    def test_contextos(self):
+        """Testa se entradas de contextos diferentes não se misturam."""
+        self.cache.armazenar("Qual é a capital da França?", "Paris", ("modelo", 150))
+        self.assertIsNone(self.cache.obter("Qual é a capital da França?", ("modelo", 50)))
+        self.assertEqual(self.cache.obter("Qual é a capital da França?", ("modelo", 150)), "Paris")
+
+    def test_substituicao_das_mais_antigas(self):
+        """Testa se, ao atingir o tamanho máximo, a entrada mais antiga é substituída."""
+        cache = CacheSemantico(tamanho_maximo=2)
+        cache.armazenar("Qual é a capital da França?", "Paris")
+        cache.armazenar("Quem escreveu Dom Casmurro?", "Machado de Assis")
+        cache.armazenar("O que é fotossíntese?", "Um processo das plantas")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.obter("Qual é a capital da França?"))
+        self.assertEqual(cache.obter("Quem escreveu Dom Casmurro?"), "Machado de Assis")
+
+    def test_reescrita_renova_a_entrada(self):
+        """Testa se armazenar de novo um prompt equivalente substitui a resposta sem ocupar outra entrada."""
+        cache = CacheSemantico(tamanho_maximo=2)
+        cache.armazenar("Qual é a capital da França?", "Paris")
+        cache.armazenar("Quem escreveu Dom Casmurro?", "Machado de Assis")
+        cache.armazenar("qual a capital da frança", "Paris, França")
+        cache.armazenar("O que é fotossíntese?", "Um processo das plantas")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.obter("Qual é a capital da França?"), "Paris, França")
+        self.assertIsNone(cache.obter("Quem escreveu Dom Casmurro?"))
+
+class TestChatGPTIntegrationCacheSemantico(unittest.TestCase):
+    def test_parafrase_nao_chama_api(self):
+        """Testa se uma paráfrase é respondida pelo cache semântico sem chamar a API."""
+        chatgpt = ChatGPTIntegration("fake_api_key", cache_semantico=CacheSemantico())
+        chatgpt.client = MagicMock()
+        resposta = MagicMock()
+        resposta.choices[0].message.content = "Paris"
+        chatgpt.client.chat.completions.create.return_value = resposta
+
+        self.assertEqual(chatgpt.gerar_resposta("Qual é a capital da França?"), "Paris")
+        self.assertEqual(chatgpt.gerar_resposta("qual a capital da frança"), "Paris")
+        chatgpt.client.chat.completions.create.assert_called_once()
+        chatgpt.gerar_resposta("qual a capital da frança", usar_cache=False)
+        self.assertEqual(chatgpt.client.chat.completions.create.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
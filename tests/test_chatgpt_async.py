@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_chatgpt_async
+
+Este módulo contém testes para a interface assíncrona da ChatGPTIntegration, executados contra um servidor
+HTTP local que imita o endpoint de chat completions da OpenAI. Os testes verificam a ordem dos resultados,
+os erros por item, o limite de concorrência e o ganho de tempo da geração em paralelo.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ServidorChatFalso
+    - TestChatGPTAsync
+
+Dependências:
+    - unittest
+    - http.server
+    - core.chatgpt_integration
+    - config.config
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from config.config import Config
+from core.chatgpt_integration import ChatGPTIntegration
+from utils.exceptions import ChatGPTIntegrationError
+
+ATRASO_SEGUNDOS = 0.2
+
+class ServidorChatFalso(ThreadingHTTPServer):
+    """
+    Servidor local que responde a /v1/chat/completions após um atraso fixo. Cada item de falhas_planejadas,
+    um par (status, cabeçalhos), faz uma requisição falhar com esse status, na ordem de chegada. Com
+    keep_alive=True, as conexões são mantidas abertas entre requisições (HTTP/1.1).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, atraso: float = ATRASO_SEGUNDOS, keep_alive: bool = False):
+        super().__init__(("127.0.0.1", 0), _ManipuladorChatKeepAlive if keep_alive else _ManipuladorChat)
+        self.atraso = atraso
+        self.falhas_planejadas = deque()
+        self.lock = threading.Lock()
+        self.ativas = 0
+        self.maximo_ativas = 0
+        self.requisicoes = 0
+        self.conexoes = 0
+        self.autorizacoes = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+class _ManipuladorChat(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.conexoes += 1
+
+    def _responder(self, status: int, corpo: dict, cabecalhos: dict = None):
+        dados = json.dumps(corpo).encode("utf-8")
+        self.send_response(status)
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def do_POST(self):
+        servidor = self.server
+        requisicao = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = requisicao["messages"][-1]["content"]
+        with servidor.lock:
+            servidor.requisicoes += 1
+            servidor.autorizacoes.append(self.headers.get("Authorization"))
+            servidor.ativas += 1
+            servidor.maximo_ativas = max(servidor.maximo_ativas, servidor.ativas)
+            falha = servidor.falhas_planejadas.popleft() if servidor.falhas_planejadas else None
+        try:
+            time.sleep(servidor.atraso)
+        finally:
+            with servidor.lock:
+                servidor.ativas -= 1
+
+        if falha is not None:
+            status, cabecalhos = falha
+            self._responder(status, {"error": {"message": "falha planejada", "type": "server_error"}}, cabecalhos)
+            return
+        if prompt == "erro":
+            self._responder(400, {"error": {"message": "requisição inválida", "type": "invalid_request_error"}})
+            return
+        self._responder(200, {
+            "id": "chatcmpl-teste", "object": "chat.completion", "created": 0, "model": requisicao["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": f"Resposta: {prompt}"}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        })
+
+class _ManipuladorChatKeepAlive(_ManipuladorChat):
+    protocol_version = "HTTP/1.1"
+
+class TestChatGPTAsync(unittest.TestCase):
+    def setUp(self):
+        self.servidor = ServidorChatFalso()
+        threading.Thread(target=self.servidor.serve_forever, args=(0.05,), daemon=True).start()
+        self.patcher = patch.object(Config, "OPENAI_BASE_URL", self.servidor.url)
+        self.patcher.start()
+        self.chatgpt = ChatGPTIntegration("fake_api_key")
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def test_gerar_resposta_async(self):
+        """Testa uma chamada assíncrona isolada."""
+        resposta = asyncio.run(self.chatgpt.gerar_resposta_async("Olá"))
+        self.assertEqual(resposta, "Resposta: Olá")
+
+    def test_lote_ordem_e_erros(self):
+        """Testa se os resultados seguem a ordem dos prompts e se os erros são reportados por item."""
+        prompts = ["um", "erro", "três", ""]
+        resultados = self.chatgpt.gerar_respostas_lote(prompts, concorrencia=4)
+
+        self.assertEqual([r["resposta"] for r in resultados], ["Resposta: um", None, "Resposta: três", None])
+        self.assertIsInstance(resultados[1]["erro"], ChatGPTIntegrationError)
+        self.assertIsInstance(resultados[3]["erro"], ValueError)
+        self.assertIsNone(resultados[0]["erro"])
+
+    def test_lote_paralelo(self):
+        """Testa se o tempo total se aproxima da latência de uma requisição e se a concorrência é limitada."""
+        prompts = [f"pergunta {i}" for i in range(12)]
+        inicio = time.perf_counter()
+        resultados = self.chatgpt.gerar_respostas_lote(prompts, concorrencia=6)
+        duracao = time.perf_counter() - inicio
+
+        self.assertEqual([r["resposta"] for r in resultados], [f"Resposta: {p}" for p in prompts])
+        self.assertLessEqual(self.servidor.maximo_ativas, 6)
+        # Sequencialmente seriam 12 * ATRASO_SEGUNDOS; com 6 simultâneas, cerca de 2 * ATRASO_SEGUNDOS
+        self.assertLess(duracao, 6 * ATRASO_SEGUNDOS)
+
+    def test_concorrencia_invalida(self):
+        """Testa a validação do parâmetro concorrencia."""
+        with self.assertRaises(ValueError):
+            self.chatgpt.gerar_respostas_lote(["um"], concorrencia=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -53,6 +53,32 @@ class TestChatGPTIntegration(unittest.TestCase):
         with self.assertRaises(ChatGPTIntegrationError):
             self.chatgpt.gerar_resposta("Olá, como você está?")
 
+    @staticmethod
+    def _chunk(conteudo):
+        """Cria um fragmento de resposta em streaming com o conteúdo informado."""
+        chunk = MagicMock()
+        chunk.choices[0].delta.content = conteudo
+        return chunk
+
+    def test_gerar_resposta_stream(self):
+        """Testa se gerar_resposta_stream devolve os trechos à medida que chegam e usa stream=True."""
+        self.chatgpt.client = MagicMock()
+        self.chatgpt.client.chat.completions.create.return_value = iter(
+            [self._chunk(" Olá"), self._chunk(None), self._chunk(", tudo"), self._chunk(" bem!")])
+
+        trechos = list(self.chatgpt.gerar_resposta_stream("Olá, como você está?"))
+        self.assertEqual(trechos, ["Olá", ", tudo", " bem!"])
+        self.assertTrue(self.chatgpt.client.chat.completions.create.call_args.kwargs["stream"])
+
+    def test_gerar_resposta_stream_erros(self):
+        """Testa a validação imediata dos parâmetros e o tratamento de respostas vazias."""
+        with self.assertRaises(ValueError):
+            self.chatgpt.gerar_resposta_stream("")
+        self.chatgpt.client = MagicMock()
+        self.chatgpt.client.chat.completions.create.return_value = iter([self._chunk("  ")])
+        with self.assertRaises(ChatGPTIntegrationError):
+            list(self.chatgpt.gerar_resposta_stream("Teste"))
+
 @patch('openai.Completion.create')
 def test_gerar_resposta_diferentes_entradas(self, mock_create):
     """Testa gerar_resposta com diferentes tipos de entrada."""
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_classificador_sentimento
+
+Este módulo contém testes unitários para a classe ClassificadorSentimento, verificando o treinamento
+incremental, a predição e a persistência do estado.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestClassificadorSentimento
+
+Dependências:
+    - unittest
+    - numpy
+    - core.language_model.classificador_sentimento
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.language_model.classificador_sentimento import ClassificadorSentimento
+
+EXEMPLOS = [
+    ("adorei o atendimento", "positivo"),
+    ("o atendimento foi incrível", "positivo"),
+    ("detestei o atendimento", "negativo"),
+    ("o produto chegou quebrado", "negativo"),
+    ("o pedido foi entregue hoje", "neutro"),
+]
+
+class TestClassificadorSentimento(unittest.TestCase):
+    def setUp(self):
+        """Treina um classificador pequeno para os testes."""
+        self.classificador = ClassificadorSentimento.reconstruir(EXEMPLOS, dimensao=2 ** 12, contador_aprendizado=5)
+
+    def test_prever(self):
+        """Testa se o classificador aprende com os exemplos fornecidos."""
+        self.assertEqual(self.classificador.prever("adorei")[0], "positivo")
+        self.assertEqual(self.classificador.prever("chegou quebrado")[0], "negativo")
+        probabilidades = self.classificador.prever_probabilidades("atendimento")
+        self.assertAlmostEqual(sum(probabilidades.values()), 1.0)
+
+    def test_atualizacao_incremental(self):
+        """Testa se um novo feedback altera a predição e se classes desconhecidas são rejeitadas."""
+        for _ in range(3):
+            self.classificador.atualizar("que dia lindo", "positivo")
+        self.assertEqual(self.classificador.prever("dia lindo")[0], "positivo")
+        self.assertEqual(self.classificador.total_exemplos, 8)
+        self.assertTrue(self.classificador.pronto(5))
+
+        with self.assertRaises(ValueError):
+            self.classificador.atualizar("texto", "ironico")
+
+    def test_salvar_e_carregar(self):
+        """Testa se o estado salvo é recuperado integralmente."""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "classificador.npz")
+            self.assertEqual(self.classificador.pendentes, 5)
+            self.classificador.salvar(caminho)
+            self.assertEqual(self.classificador.pendentes, 0)
+            carregado = ClassificadorSentimento.carregar(caminho)
+
+        np.testing.assert_array_equal(carregado.contagens, self.classificador.contagens)
+        self.assertEqual(carregado.contador_aprendizado, 5)
+        self.assertEqual(carregado.pendentes, 0)
+        carregado.contador_aprendizado += 1
+        self.assertEqual(carregado.pendentes, 1)
+        self.assertEqual(carregado.prever("adorei"), self.classificador.prever("adorei"))
+        self.assertIsNone(ClassificadorSentimento.carregar(caminho))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_cliente_http
+
+Este módulo contém testes para os clientes HTTP compartilhados e para a troca de chave da API sem recriar o
+pool de conexões, verificados contra o servidor HTTP local que imita a API da OpenAI.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestClienteHttp
+
+Dependências:
+    - unittest
+    - core.cliente_http
+    - core.chatgpt_integration
+    - tests.test_chatgpt_async
+"""
+
+import threading
+import unittest
+from unittest.mock import patch
+from config.config import Config
+from core.chatgpt_integration import ChatGPTIntegration
+from core.cliente_http import executar_async, fechar_cliente_http, fechar_cliente_http_async, obter_cliente_http
+from tests.test_chatgpt_async import ServidorChatFalso
+
+class TestClienteHttp(unittest.TestCase):
+    def setUp(self):
+        self.servidor = ServidorChatFalso(atraso=0, keep_alive=True)
+        threading.Thread(target=self.servidor.serve_forever, args=(0.05,), daemon=True).start()
+        self.patcher = patch.object(Config, "OPENAI_BASE_URL", self.servidor.url)
+        self.patcher.start()
+        # Começa sem conexões abertas com servidores de outros testes
+        fechar_cliente_http()
+
+    def tearDown(self):
+        fechar_cliente_http()
+        self.patcher.stop()
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def test_cliente_compartilhado(self):
+        """Testa se instâncias diferentes usam o mesmo cliente HTTP."""
+        primeira = ChatGPTIntegration("chave_1")
+        segunda = ChatGPTIntegration("chave_2")
+        self.assertIs(primeira.client._client, obter_cliente_http())
+        self.assertIs(segunda.client._client, obter_cliente_http())
+
+        primeira.gerar_resposta("um")
+        segunda.gerar_resposta("dois")
+        self.assertEqual(self.servidor.conexoes, 1)
+
+    def test_troca_de_chave_mantem_conexoes(self):
+        """Testa se a nova chave é usada nas chamadas seguintes sem abrir novas conexões."""
+        chatgpt = ChatGPTIntegration("chave_antiga")
+        cliente_http = chatgpt.client._client
+        chatgpt.gerar_resposta("um")
+
+        chatgpt.atualizar_api_key("chave_nova")
+        self.assertIs(chatgpt.client._client, cliente_http)
+        self.assertEqual(chatgpt.api_key, "chave_nova")
+        chatgpt.gerar_resposta("dois")
+
+        self.assertEqual(self.servidor.autorizacoes, ["Bearer chave_antiga", "Bearer chave_nova"])
+        self.assertEqual(self.servidor.conexoes, 1)
+
+    def test_lotes_reaproveitam_conexoes(self):
+        """Testa se lotes seguidos, antes e depois de uma troca de chave, usam a mesma conexão assíncrona."""
+        chatgpt = ChatGPTIntegration("chave_antiga")
+        chatgpt.gerar_respostas_lote(["um"])
+        chatgpt.gerar_respostas_lote(["dois"])
+        chatgpt.atualizar_api_key("chave_nova")
+        resultados = chatgpt.gerar_respostas_lote(["três"])
+
+        self.assertEqual(resultados[0]["resposta"], "Resposta: três")
+        self.assertEqual(self.servidor.autorizacoes, ["Bearer chave_antiga"] * 2 + ["Bearer chave_nova"])
+        self.assertEqual(self.servidor.conexoes, 1)
+
+    def test_recriado_apos_fechar(self):
+        """Testa se um novo cliente é criado depois que o compartilhado é fechado."""
+        cliente = obter_cliente_http()
+        fechar_cliente_http()
+        self.assertTrue(cliente.is_closed)
+        self.assertIsNot(obter_cliente_http(), cliente)
+
+    def test_cliente_async_recriado_apos_fechar(self):
+        """Testa se o cliente assíncrono do laço é reaproveitado e recriado quando o cliente HTTP é fechado."""
+        chatgpt = ChatGPTIntegration("chave")
+
+        async def clientes():
+            primeiro, repetido = chatgpt.client_async, chatgpt.client_async
+            await fechar_cliente_http_async()
+            return primeiro, repetido, chatgpt.client_async
+
+        primeiro, repetido, novo = executar_async(clientes())
+        self.assertIs(repetido, primeiro)
+        self.assertIsNot(novo, primeiro)
+        self.assertEqual(executar_async(chatgpt.gerar_resposta_async("um")), "Resposta: um")
+
+if __name__ == '__main__':
+    unittest.main()
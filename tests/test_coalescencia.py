@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_coalescencia
+
+Este módulo contém testes para o Coalescedor e o CoalescedorAsync e para a coalescência de requisições
+idênticas na ChatGPTIntegration, verificada contra o servidor HTTP local que imita a API da OpenAI.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestCoalescedor
+    - TestCoalescedorAsync
+    - TestCoalescenciaChatGPT
+
+Dependências:
+    - unittest
+    - core.coalescencia
+    - core.chatgpt_integration
+    - tests.test_chatgpt_async
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from config.config import Config
+from core.chatgpt_integration import ChatGPTIntegration
+from core.coalescencia import Coalescedor, CoalescedorAsync
+from tests.test_chatgpt_async import ServidorChatFalso
+
+class TestCoalescedor(unittest.TestCase):
+    def test_chamadas_simultaneas_executam_uma_vez(self):
+        """Testa se threads com a mesma chave compartilham uma única execução."""
+        coalescedor = Coalescedor()
+        execucoes = []
+
+        def lenta():
+            execucoes.append(1)
+            time.sleep(0.2)
+            return "resultado"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            resultados = list(executor.map(lambda _: coalescedor.executar("chave", lenta), range(5)))
+
+        self.assertEqual(resultados, ["resultado"] * 5)
+        self.assertEqual(len(execucoes), 1)
+        self.assertEqual(coalescedor.estatisticas(), {"executadas": 1, "coalescidas": 4, "em_andamento": 0})
+
+    def test_excecao_repassada(self):
+        """Testa se a exceção da execução é levantada para todas as chamadas coalescidas."""
+        coalescedor = Coalescedor()
+        iniciou = threading.Event()
+
+        def falha():
+            iniciou.set()
+            time.sleep(0.1)
+            raise RuntimeError("falhou")
+
+        erros = []
+
+        def chamar():
+            try:
+                coalescedor.executar("chave", falha)
+            except RuntimeError as e:
+                erros.append(e)
+
+        lider = threading.Thread(target=chamar)
+        lider.start()
+        iniciou.wait()
+        seguidor = threading.Thread(target=chamar)
+        seguidor.start()
+        lider.join()
+        seguidor.join()
+        self.assertEqual(len(erros), 2)
+        self.assertIs(erros[0], erros[1])
+
+    def test_chamadas_sequenciais_nao_coalescem(self):
+        """Testa se uma chamada concluída não é reaproveitada."""
+        coalescedor = Coalescedor()
+        self.assertEqual(coalescedor.executar("chave", lambda: 1), 1)
+        self.assertEqual(coalescedor.executar("chave", lambda: 2), 2)
+        self.assertEqual(coalescedor.estatisticas()["coalescidas"], 0)
+
+class TestCoalescedorAsync(unittest.TestCase):
+    def test_gather(self):
+        """Testa se corrotinas com a mesma chave compartilham uma única execução."""
+        coalescedor = CoalescedorAsync()
+        execucoes = []
+
+        async def lenta(valor):
+            execucoes.append(valor)
+            await asyncio.sleep(0.05)
+            return valor
+
+        async def principal():
+            return await asyncio.gather(*(coalescedor.executar(chave, lambda c=chave: lenta(c))
+                                          for chave in ("a", "a", "b", "a")))
+
+        self.assertEqual(asyncio.run(principal()), ["a", "a", "b", "a"])
+        self.assertEqual(sorted(execucoes), ["a", "b"])
+        self.assertEqual(coalescedor.estatisticas(), {"executadas": 2, "coalescidas": 2, "em_andamento": 0})
+
+    def test_cancelamento_nao_afeta_outros(self):
+        """Testa se cancelar uma chamada coalescida não cancela as demais."""
+        coalescedor = CoalescedorAsync()
+
+        async def principal():
+            primeira = asyncio.ensure_future(coalescedor.executar("a", lambda: asyncio.sleep(0.05, "ok")))
+            segunda = asyncio.ensure_future(coalescedor.executar("a", lambda: asyncio.sleep(0.05, "outro")))
+            await asyncio.sleep(0)
+            primeira.cancel()
+            return await segunda
+
+        self.assertEqual(asyncio.run(principal()), "ok")
+
+class TestCoalescenciaChatGPT(unittest.TestCase):
+    def setUp(self):
+        self.servidor = ServidorChatFalso()
+        threading.Thread(target=self.servidor.serve_forever, args=(0.05,), daemon=True).start()
+        self.patcher = patch.object(Config, "OPENAI_BASE_URL", self.servidor.url)
+        self.patcher.start()
+        self.chatgpt = ChatGPTIntegration("fake_api_key")
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def test_threads(self):
+        """Testa se prompts idênticos enviados por várias threads geram uma única requisição."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            respostas = list(executor.map(lambda _: self.chatgpt.gerar_resposta("Olá"), range(4)))
+        self.assertEqual(respostas, ["Resposta: Olá"] * 4)
+        self.assertEqual(self.servidor.requisicoes, 1)
+        self.assertEqual(self.chatgpt.estatisticas_coalescencia()["sincrono"]["coalescidas"], 3)
+
+    def test_lote(self):
+        """Testa se prompts repetidos em um lote geram uma requisição por prompt distinto."""
+        resultados = self.chatgpt.gerar_respostas_lote(["um", "dois", "um", "um"], concorrencia=4)
+        self.assertEqual([r["resposta"] for r in resultados],
+                         ["Resposta: um", "Resposta: dois", "Resposta: um", "Resposta: um"])
+        self.assertEqual(self.servidor.requisicoes, 2)
+
+    def test_parametros_diferentes_nao_coalescem(self):
+        """Testa se o mesmo prompt com max_tokens diferentes gera requisições separadas."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda n: self.chatgpt.gerar_resposta("Olá", max_tokens=n), (10, 20)))
+        self.assertEqual(self.servidor.requisicoes, 2)
+
+if __name__ == '__main__':
+    unittest.main()
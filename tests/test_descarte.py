@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_descarte
+
+Este módulo contém testes para as políticas de descarte (FIFO, LRU e LFU) e para o índice de expiração usados
+pelo GerenciadorMemoria.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestDescarteFIFO
+    - TestDescarteLRU
+    - TestDescarteLFU
+    - TestIndiceExpiracao
+
+Dependências:
+    - unittest
+    - core.armazenamento.descarte
+"""
+
+import unittest
+from core.armazenamento.descarte import DescarteFIFO, DescarteLFU, DescarteLRU, IndiceExpiracao, criar_politica
+
+class TestDescarteFIFO(unittest.TestCase):
+    def test_ordem_de_gravacao(self):
+        """Testa se a vítima é a chave gravada primeiro, independentemente de acessos e sobrescritas."""
+        politica = DescarteFIFO()
+        for chave in ("a", "b", "c"):
+            politica.registrar_gravacao(chave)
+        politica.registrar_acesso("a")
+        politica.registrar_gravacao("a")
+        self.assertEqual(politica.vitima(), "a")
+        self.assertEqual(politica.vitima(excluir="a"), "b")
+        politica.remover("a")
+        self.assertEqual(politica.vitima(), "b")
+        self.assertEqual(len(politica), 2)
+
+    def test_criar_politica(self):
+        """Testa a criação pelo nome e a rejeição de uma política desconhecida."""
+        self.assertIsInstance(criar_politica("lfu"), DescarteLFU)
+        with self.assertRaises(ValueError):
+            criar_politica("aleatoria")
+
+class TestDescarteLRU(unittest.TestCase):
+    def test_recencia(self):
+        """Testa se leituras e gravações tornam a chave a mais recente."""
+        politica = DescarteLRU()
+        for chave in ("a", "b", "c"):
+            politica.registrar_gravacao(chave)
+        politica.registrar_acesso("a")
+        self.assertEqual(politica.vitima(), "b")
+        politica.registrar_gravacao("b")
+        self.assertEqual(politica.vitima(), "c")
+        politica.registrar_acesso("inexistente")
+        self.assertEqual(len(politica), 3)
+        politica.limpar()
+        self.assertIsNone(politica.vitima())
+
+class TestDescarteLFU(unittest.TestCase):
+    def test_frequencia_e_empate(self):
+        """Testa se a vítima é a menos usada e, entre as igualmente usadas, a usada há mais tempo."""
+        politica = DescarteLFU()
+        for chave in ("a", "b", "c"):
+            politica.registrar_gravacao(chave)
+        politica.registrar_acesso("a")
+        politica.registrar_acesso("a")
+        politica.registrar_acesso("b")
+        politica.registrar_acesso("c")
+        self.assertEqual(politica.frequencia("a"), 3)
+        # b e c foram usadas duas vezes; b, há mais tempo
+        self.assertEqual(politica.vitima(), "b")
+        self.assertEqual(politica.vitima(excluir="b"), "c")
+
+        politica.remover("b")
+        politica.remover("c")
+        self.assertEqual(politica.vitima(), "a")
+        politica.registrar_gravacao("d")
+        self.assertEqual(politica.vitima(), "d")
+        self.assertEqual(list(politica._candidatas()), ["d", "a"])
+        self.assertEqual(politica.frequencia("b"), 0)
+
+    def test_remocao_de_grupos_vazios(self):
+        """Testa se a lista de grupos permanece consistente após muitas promoções e remoções."""
+        politica = DescarteLFU()
+        for i in range(50):
+            politica.registrar_gravacao(str(i))
+            for _ in range(i % 5):
+                politica.registrar_acesso(str(i))
+        ordem = list(politica._candidatas())
+        self.assertEqual(ordem, sorted(ordem, key=lambda chave: int(chave) % 5))
+        for chave in ordem[:-1]:
+            politica.remover(chave)
+        self.assertEqual(list(politica._candidatas()), ordem[-1:])
+        self.assertEqual(len(politica), 1)
+
+class TestIndiceExpiracao(unittest.TestCase):
+    def test_expiracao(self):
+        """Testa a retirada em ordem de expiração, ignorando expirações substituídas ou removidas."""
+        indice = IndiceExpiracao()
+        indice.definir("a", 10)
+        indice.definir("b", 5)
+        indice.definir("c", 7)
+        indice.definir("a", 20)
+        indice.remover("c")
+        self.assertEqual(indice.retirar_expiradas(4), [])
+        self.assertEqual(indice.retirar_expiradas(15), ["b"])
+        self.assertEqual(indice.obter("a"), 20)
+        self.assertEqual(indice.retirar_expiradas(25), ["a"])
+        self.assertEqual(len(indice), 0)
+
+    def test_reconstrucao_do_heap(self):
+        """Testa se redefinições repetidas não fazem o heap crescer indefinidamente."""
+        indice = IndiceExpiracao()
+        for i in range(10000):
+            indice.definir("a", i)
+        self.assertLess(len(indice._heap), 100)
+        self.assertEqual(indice.retirar_expiradas(10000), ["a"])
+
+if __name__ == '__main__':
+    unittest.main()
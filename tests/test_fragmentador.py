@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_fragmentador
+
+Este módulo contém testes unitários para a função fragmentar, verificando o tamanho dos blocos, a preferência
+por fronteiras de parágrafo e sentença e a correção dos deslocamentos.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestFragmentador
+
+Dependências:
+    - unittest
+    - core.language_model.fragmentador
+"""
+
+import os
+import tempfile
+import unittest
+from core.language_model.fragmentador import fragmentar
+
+PARAGRAFO = "O gato dormiu no sofá. Depois acordou com fome!\n\n"
+
+class TestFragmentador(unittest.TestCase):
+    def verificar_blocos(self, texto, blocos, tamanho_maximo):
+        """Verifica se os blocos reconstroem o texto e se os deslocamentos apontam para cada bloco."""
+        self.assertEqual("".join(bloco for bloco, _ in blocos), texto)
+        for bloco, deslocamento in blocos:
+            self.assertLessEqual(len(bloco), tamanho_maximo)
+            self.assertEqual(texto[deslocamento:deslocamento + len(bloco)], bloco)
+
+    def test_corte_em_paragrafos(self):
+        """Testa se os blocos terminam em fronteiras de parágrafo quando possível."""
+        texto = PARAGRAFO * 20
+        blocos = list(fragmentar(iter([texto[:333], texto[333:]]), 120))
+        self.verificar_blocos(texto, blocos, 120)
+        self.assertTrue(all(bloco.endswith("\n\n") for bloco, _ in blocos))
+
+    def test_corte_em_sentencas_e_forcado(self):
+        """Testa o corte em sentenças e o corte forçado de textos sem fronteiras."""
+        texto = "Uma frase curta. " * 30 + "x" * 250
+        blocos = list(fragmentar([texto], 100))
+        self.verificar_blocos(texto, blocos, 100)
+        self.assertTrue(blocos[0][0].endswith(". "))
+
+    def test_pedacos_pequenos(self):
+        """Testa se o resto de um pedaço é combinado com os seguintes, com os mesmos cortes de uma única leitura."""
+        texto = (PARAGRAFO + "Sem fronteira " * 9) * 15
+        pedacos = [texto[i:i + 7] for i in range(0, len(texto), 7)]
+        blocos = list(fragmentar(pedacos, 90))
+        self.verificar_blocos(texto, blocos, 90)
+        self.assertEqual(blocos, list(fragmentar([texto], 90)))
+
+    def test_arquivo(self):
+        """Testa a leitura incremental a partir de um caminho de arquivo."""
+        texto = PARAGRAFO * 5
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False) as f:
+            f.write(texto)
+        try:
+            self.verificar_blocos(texto, list(fragmentar(f.name, 60)), 60)
+        finally:
+            os.remove(f.name)
+
+        with self.assertRaises(ValueError):
+            list(fragmentar([texto], 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_frequencia_documentos
+
+Este módulo contém testes unitários para a classe TabelaFrequenciaDocumentos, verificando a contagem
+incremental de frequência de documentos, o ranqueamento por TF-IDF e a persistência.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestTabelaFrequenciaDocumentos
+
+Dependências:
+    - unittest
+    - core.language_model.frequencia_documentos
+"""
+
+import os
+import tempfile
+import unittest
+from core.language_model.frequencia_documentos import TabelaFrequenciaDocumentos
+
+class TestTabelaFrequenciaDocumentos(unittest.TestCase):
+    def setUp(self):
+        """Registra um pequeno corpus para os testes."""
+        self.tabela = TabelaFrequenciaDocumentos()
+        self.tabela.registrar(["python", "linguagem", "python"])
+        self.tabela.registrar(["python", "dados"])
+        self.tabela.registrar(["gato", "sofá"])
+
+    def test_registrar(self):
+        """Testa se cada documento conta uma vez por termo distinto."""
+        self.assertEqual(self.tabela.n_documentos, 3)
+        self.assertEqual(self.tabela.frequencia("python"), 2)
+        self.assertEqual(self.tabela.frequencia("inexistente"), 0)
+        self.assertEqual(len(self.tabela), 5)
+
+    def test_ranquear(self):
+        """Testa se termos raros no corpus são favorecidos em relação aos comuns."""
+        ranking = self.tabela.ranquear(["python", "dados", "dados"], top_k=2)
+        self.assertEqual([termo for termo, _ in ranking], ["dados", "python"])
+        self.assertEqual(len(self.tabela.ranquear(["python", "dados"], top_k=1)), 1)
+        self.assertEqual(self.tabela.ranquear([]), [])
+        with self.assertRaises(ValueError):
+            self.tabela.ranquear(["python"], top_k=0)
+
+    def test_salvar_e_carregar(self):
+        """Testa se a tabela salva é recuperada integralmente."""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "frequencias.npz")
+            self.tabela.salvar(caminho)
+            carregada = TabelaFrequenciaDocumentos.carregar(caminho)
+
+        self.assertEqual(self.tabela.pendentes, 0)
+        self.assertEqual(carregada.n_documentos, 3)
+        self.assertEqual(carregada.frequencia("sofá"), 1)
+        self.assertEqual(carregada.ranquear(["python", "gato"]), self.tabela.ranquear(["python", "gato"]))
+
+if __name__ == '__main__':
+    unittest.main()
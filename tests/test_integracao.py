@@ -10,6 +10,7 @@ Autor: Stefano Gysin - StefanoGysin@hotmail.com
 Data: 2024-10-15 04:28:38 (Zurich)
 """
 
+import time
 import pytest
 import tkinter as tk
 from unittest.mock import patch
@@ -47,6 +48,11 @@ class TestIntegracao:
         texto = "O dia está ótimo para programar em Python!"
         self.interface.entrada.insert(0, texto)
         self.interface.processar_entrada()
+        # A resposta é gerada em segundo plano; processa os eventos até que ela seja exibida
+        prazo = time.monotonic() + 30
+        while self.interface.processando and time.monotonic() < prazo:
+            tk_root.update()
+            time.sleep(0.01)
         tk_root.update()
         
         output = self.interface.chat_area.get("1.0", tk.END)
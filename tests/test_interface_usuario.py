@@ -18,6 +18,7 @@ Dependências:
     - interface.interface_usuario
 """
 
+import time
 import unittest
 import tkinter as tk
 from tkinter import scrolledtext
@@ -57,7 +58,17 @@ class TestInterfaceUsuario(unittest.TestCase):
         self.assertIsInstance(self.app.botao_aprender, tk.Button)
         self.assertIsInstance(self.app.botao_limpar, tk.Button)
 
-    @patch('core.language_model.modelo_linguagem.ModeloLinguagem.gerar_resposta_chatgpt')
+    def aguardar_resposta(self, limite: float = 5.0):
+        """
+        Processa os eventos do Tkinter até que a resposta gerada em segundo plano seja exibida.
+        """
+        prazo = time.monotonic() + limite
+        while self.app.processando and time.monotonic() < prazo:
+            self.root.update()
+            time.sleep(0.01)
+        self.assertFalse(self.app.processando, "A resposta não foi concluída a tempo")
+
+    @patch('core.language_model.modelo_linguagem.ModeloLinguagem.gerar_resposta_chatgpt_stream')
     @patch('core.language_model.modelo_linguagem.ModeloLinguagem.analisar_sentimento')
     @patch('core.language_model.modelo_linguagem.ModeloLinguagem.processar_texto')
     def test_processar_entrada_com_chatgpt(self, mock_processar, mock_sentimento, mock_chatgpt):
@@ -72,11 +83,12 @@ class TestInterfaceUsuario(unittest.TestCase):
             'verbos': ['é']
         }
         mock_sentimento.return_value = "positivo"
-        mock_chatgpt.return_value = PYTHON_RESPONSE
+        mock_chatgpt.return_value = iter(["Python é uma ", "ótima linguagem ", "de programação!"])
 
         # Simula a entrada do usuário e processa
         self.app.entrada.insert(0, PYTHON_QUERY)
         self.app.processar_entrada()
+        self.aguardar_resposta()
 
         # Obtém e verifica a saída gerada no chat
         output = self.app.chat_area.get("1.0", tk.END)
@@ -85,6 +97,7 @@ class TestInterfaceUsuario(unittest.TestCase):
         self.assertIn("1 substantivos", output)
         self.assertIn("1 verbos", output)
         self.assertIn("O sentimento do texto parece ser positivo", output)
+        self.assertNotIn("Processando...", output)
 
         # Verifica se os métodos mock foram chamados corretamente
         mock_processar.assert_called_once_with(PYTHON_QUERY)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_lexico_sentimento
+
+Este módulo contém testes unitários para a classe LexicoSentimento, verificando o casamento por token,
+as expressões de várias palavras, a negação, a construção "nem ... nem" e os intensificadores.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestLexicoSentimento
+
+Dependências:
+    - unittest
+    - core.language_model.lexico_sentimento
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from core.language_model.lexico_sentimento import LexicoSentimento, tokenizar
+from utils.exceptions import ModeloLinguagemError
+
+class TestLexicoSentimento(unittest.TestCase):
+    def setUp(self):
+        """Compila um léxico pequeno para os testes."""
+        self.lexico = LexicoSentimento(
+            termos={"bom": 1.0, "ruim": -1.0, "ótimo": 2.0, "perda de tempo": -2.0},
+            negadores=["não"],
+            intensificadores={"muito": 2.0}
+        )
+
+    def test_tokenizar_normaliza_acentos(self):
+        """Testa se a tokenização remove acentos e caixa."""
+        self.assertEqual(tokenizar("Ótimo, MUITO bom!"), ["otimo", "muito", "bom"])
+
+    def test_casamento_por_token(self):
+        """Testa se termos não casam como substrings de outras palavras."""
+        self.assertEqual(self.lexico.classificar("O bombeiro chegou"), "neutro")
+        self.assertEqual(self.lexico.classificar("O dia está otimo"), "positivo")
+
+    def test_expressao_negacao_e_intensificador(self):
+        """Testa expressões de várias palavras, negação e intensificadores."""
+        self.assertEqual(self.lexico.pontuar("Foi uma perda de tempo"), -2.0)
+        self.assertEqual(self.lexico.pontuar("Não foi bom"), -1.0)
+        self.assertEqual(self.lexico.pontuar("Foi muito bom"), 2.0)
+        self.assertEqual(self.lexico.pontuar("Não. Foi bom"), 1.0)
+
+    def test_termo_que_contem_negacao(self):
+        """Testa se um negador anterior não inverte um termo que já começa por um negador."""
+        lexico = LexicoSentimento(termos={"bom": 1.0, "nada bom": -2.0}, negadores=["não", "nada"])
+        self.assertEqual(lexico.pontuar("O serviço não foi nada bom"), -2.0)
+        self.assertEqual(lexico.pontuar("Não foi bom"), -1.0)
+        self.assertEqual(lexico.classificar("O serviço não foi nada bom"), "negativo")
+
+    def test_nem_nem(self):
+        """Testa a construção correlativa: membros de polaridades opostas se anulam; de mesma polaridade, somam."""
+        lexico = LexicoSentimento(termos={"bom": 1.0, "ruim": -2.0, "bonito": 2.0, "útil": 1.0, "ótimo": 3.0},
+                                  negadores=["não", "nem"])
+        self.assertEqual(lexico.pontuar("nem bom nem ruim"), 0.0)
+        self.assertEqual(lexico.pontuar("Não é nem bom nem ruim"), 0.0)
+        self.assertEqual(lexico.pontuar("Nem bonito nem útil"), -3.0)
+        self.assertEqual(lexico.pontuar("Nem bom nem ruim, mas ótimo"), 3.0)
+        self.assertEqual(lexico.pontuar("Não gostei, nem é bom"), -1.0)
+
+    def test_carregar_arquivo(self):
+        """Testa o carregamento do léxico padrão e de um arquivo inválido."""
+        self.assertGreater(len(LexicoSentimento.carregar()), 0)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"negadores": []}, f)
+        try:
+            with self.assertRaises(ModeloLinguagemError):
+                LexicoSentimento.carregar(f.name)
+        finally:
+            os.remove(f.name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_memoria
+
+Este módulo contém testes para o GerenciadorMemoria e para os backends de armazenamento. O mesmo conjunto de
+testes é executado sobre cada backend (JSON, log, SQLite, SQL via SQLAlchemy, este último contra um banco
+SQLite local, e tabela indexada), verificando leitura, gravação, remoção, ordem das chaves e persistência ao reabrir. Também são
+testados os limites do gerenciador: políticas de descarte, tempo de vida, orçamento de bytes e chaves fixas, e
+a reabertura de uma memória maior que os limites.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ContratoArmazenamento
+    - TestArmazenamentoJson
+    - TestArmazenamentoJsonEscritaAtrasada
+    - TestEscritaJson
+    - TestArmazenamentoLog
+    - TestArmazenamentoSQLite
+    - TestArmazenamentoSQL
+    - TestArmazenamentoIndexado
+    - TestGerenciadorMemoria
+    - TestDescarteGerenciador
+
+Dependências:
+    - unittest
+    - core.memoria
+    - core.armazenamento
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from config.config import Config
+from core.armazenamento import arquivo_json
+from core.armazenamento.arquivo_json import ArmazenamentoJson
+from core.armazenamento.indexado import ArmazenamentoIndexado
+from core.armazenamento.log import ArmazenamentoLog
+from core.armazenamento.sql import ArmazenamentoSQL
+from core.armazenamento.sqlite import ArmazenamentoSQLite
+from core.memoria import GerenciadorMemoria, criar_armazenamento
+from utils.exceptions import MemoriaError
+
+class ContratoArmazenamento:
+    """Testes comuns a todos os backends; as subclasses definem abrir()."""
+
+    def abrir(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.armazenamento = self.abrir()
+
+    def tearDown(self):
+        self.armazenamento.fechar()
+        self.pasta.cleanup()
+
+    def reabrir(self):
+        self.armazenamento.fechar()
+        self.armazenamento = self.abrir()
+
+    def test_operacoes(self):
+        """Testa gravação, leitura, sobrescrita, remoção e limpeza."""
+        self.armazenamento.gravar("nome", "João")
+        self.armazenamento.gravar("dados", {"idade": 30, "gostos": ["café", "xadrez"]})
+        self.assertEqual(self.armazenamento.obter("nome"), "João")
+        self.assertEqual(self.armazenamento.obter("dados"), {"idade": 30, "gostos": ["café", "xadrez"]})
+        self.assertIsNone(self.armazenamento.obter("inexistente"))
+        self.assertEqual(self.armazenamento.obter("inexistente", 0), 0)
+        self.assertIn("nome", self.armazenamento)
+        self.assertNotIn("inexistente", self.armazenamento)
+
+        self.armazenamento.gravar("nome", "Maria")
+        self.assertEqual(self.armazenamento.obter("nome"), "Maria")
+        self.assertEqual(len(self.armazenamento), 2)
+
+        self.assertTrue(self.armazenamento.remover("nome"))
+        self.assertFalse(self.armazenamento.remover("nome"))
+        self.assertEqual(len(self.armazenamento), 1)
+
+        self.armazenamento.limpar()
+        self.assertEqual(len(self.armazenamento), 0)
+        self.assertIsNone(self.armazenamento.chave_mais_antiga())
+
+    def test_ordem_das_chaves(self):
+        """Testa se a ordem é a de primeira gravação, mesmo após sobrescritas."""
+        for chave in ("c", "a", "b"):
+            self.armazenamento.gravar(chave, chave)
+        self.armazenamento.gravar("c", "de novo")
+        self.assertEqual(self.armazenamento.chaves(), ["c", "a", "b"])
+        self.assertEqual(self.armazenamento.chave_mais_antiga(), "c")
+        self.assertEqual(list(self.armazenamento.itens()), [("c", "de novo"), ("a", "a"), ("b", "b")])
+        self.assertEqual(self.armazenamento.chaves_recentes(2), ["a", "b"])
+        self.assertEqual(self.armazenamento.chaves_recentes(5), ["c", "a", "b"])
+        self.assertEqual(self.armazenamento.chaves_recentes(0), [])
+
+    def test_persistencia(self):
+        """Testa se o conteúdo é preservado ao reabrir."""
+        self.armazenamento.gravar("a", 1)
+        self.armazenamento.gravar("b", [1.5, None, True])
+        self.armazenamento.remover("a")
+        self.reabrir()
+        self.assertEqual(dict(self.armazenamento.itens()), {"b": [1.5, None, True]})
+        self.assertEqual(len(self.armazenamento), 1)
+
+    def test_valor_nao_serializavel(self):
+        """Testa se um valor que não pode ser gravado é rejeitado sem alterar o conteúdo."""
+        with self.assertRaises(MemoriaError):
+            self.armazenamento.gravar("a", object())
+        self.assertNotIn("a", self.armazenamento)
+        self.assertEqual(len(self.armazenamento), 0)
+
+class TestArmazenamentoJson(ContratoArmazenamento, unittest.TestCase):
+    def abrir(self):
+        return ArmazenamentoJson(os.path.join(self.pasta.name, "memoria.json"))
+
+class TestArmazenamentoJsonEscritaAtrasada(ContratoArmazenamento, unittest.TestCase):
+    def abrir(self):
+        return ArmazenamentoJson(os.path.join(self.pasta.name, "memoria.json"), escrita_atrasada=True)
+
+class TestEscritaJson(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "memoria.json")
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def _ler_arquivo(self):
+        with open(self.caminho) as f:
+            return json.load(f)
+
+    def _aguardar_gravacao(self, armazenamento, limite=2.0):
+        fim = time.monotonic() + limite
+        while armazenamento.pendente and time.monotonic() < fim:
+            time.sleep(0.01)
+        return not armazenamento.pendente
+
+    def test_falha_preserva_arquivo(self):
+        """Testa se uma falha durante a gravação mantém o arquivo anterior intacto e sem temporários."""
+        armazenamento = ArmazenamentoJson(self.caminho)
+        armazenamento.gravar("a", 1)
+        with patch("core.armazenamento.arquivo_json.os.replace", side_effect=OSError("disco cheio")):
+            with self.assertRaises(MemoriaError):
+                armazenamento.gravar("b", 2)
+        self.assertEqual(self._ler_arquivo(), {"a": 1})
+        self.assertEqual(os.listdir(self.pasta.name), ["memoria.json"])
+        self.assertTrue(armazenamento.pendente)
+
+        armazenamento.sincronizar()
+        self.assertEqual(self._ler_arquivo(), {"a": 1, "b": 2})
+
+    def test_escrita_atrasada_por_intervalo(self):
+        """Testa se as alterações são agrupadas e gravadas em segundo plano após o intervalo."""
+        armazenamento = ArmazenamentoJson(self.caminho, escrita_atrasada=True, intervalo=0.2)
+        with patch.object(arquivo_json, "_gravar_atomicamente", wraps=arquivo_json._gravar_atomicamente) as gravacao:
+            for i in range(10):
+                armazenamento.gravar(f"chave{i}", i)
+            self.assertFalse(os.path.exists(self.caminho))
+            self.assertTrue(self._aguardar_gravacao(armazenamento))
+            self.assertEqual(gravacao.call_count, 1)
+        self.assertEqual(len(self._ler_arquivo()), 10)
+        armazenamento.fechar()
+
+    def test_escrita_atrasada_por_quantidade(self):
+        """Testa se o número máximo de alterações pendentes antecipa a gravação."""
+        armazenamento = ArmazenamentoJson(self.caminho, escrita_atrasada=True, intervalo=60, max_pendentes=3)
+        for i in range(3):
+            armazenamento.gravar(f"chave{i}", i)
+        self.assertTrue(self._aguardar_gravacao(armazenamento))
+        self.assertEqual(self._ler_arquivo(), {"chave0": 0, "chave1": 1, "chave2": 2})
+        armazenamento.fechar()
+
+    def test_sincronizar_e_fechar(self):
+        """Testa se sincronizar() e fechar() gravam as pendências sem esperar o intervalo."""
+        armazenamento = ArmazenamentoJson(self.caminho, escrita_atrasada=True, intervalo=60)
+        armazenamento.gravar("a", 1)
+        armazenamento.sincronizar()
+        self.assertEqual(self._ler_arquivo(), {"a": 1})
+        armazenamento.remover("a")
+        armazenamento.gravar("b", 2)
+        armazenamento.fechar()
+        self.assertEqual(self._ler_arquivo(), {"b": 2})
+
+        # Após o fechamento, as alterações voltam a ser gravadas imediatamente
+        armazenamento.gravar("c", 3)
+        self.assertEqual(self._ler_arquivo(), {"b": 2, "c": 3})
+
+class TestArmazenamentoLog(ContratoArmazenamento, unittest.TestCase):
+    def abrir(self):
+        return ArmazenamentoLog(os.path.join(self.pasta.name, "memoria.log"))
+
+class TestArmazenamentoSQLite(ContratoArmazenamento, unittest.TestCase):
+    def abrir(self):
+        return ArmazenamentoSQLite(os.path.join(self.pasta.name, "memoria.sqlite3"))
+
+class TestArmazenamentoSQL(ContratoArmazenamento, unittest.TestCase):
+    def abrir(self):
+        return ArmazenamentoSQL("sqlite:///" + os.path.join(self.pasta.name, "memoria_sql.sqlite3"))
+
+class TestArmazenamentoIndexado(ContratoArmazenamento, unittest.TestCase):
+    def abrir(self):
+        return ArmazenamentoIndexado(os.path.join(self.pasta.name, "memoria.gysidx"))
+
+class TestGerenciadorMemoria(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "memoria.sqlite3")
+        self.memoria = GerenciadorMemoria(self.caminho, backend="sqlite")
+
+    def tearDown(self):
+        self.memoria.fechar()
+        self.pasta.cleanup()
+
+    def test_descarte_do_mais_antigo(self):
+        """Testa se, no limite de tamanho, a informação mais antiga é descartada."""
+        self.memoria.tamanho_maximo = 3
+        for i in range(5):
+            self.memoria.adicionar_informacao(f"chave{i}", i)
+        self.assertEqual(self.memoria.listar_chaves(), ["chave2", "chave3", "chave4"])
+        self.assertEqual(self.memoria.tamanho_memoria(), 3)
+
+    def test_consultas_e_backup(self):
+        """Testa as consultas e o backup em JSON."""
+        self.memoria.adicionar_informacao("nome_usuario", "João")
+        self.memoria.adicionar_informacao("preferencias", {"tema": "escuro"})
+        self.assertEqual(self.memoria.obter_informacao("nome_usuario"), "João")
+        self.assertEqual(self.memoria.obter_todas_informacoes(),
+                         {"nome_usuario": "João", "preferencias": {"tema": "escuro"}})
+
+        arquivo_backup = os.path.join(self.pasta.name, "backup.json")
+        self.memoria.backup_memoria(arquivo_backup)
+        with open(arquivo_backup) as f:
+            self.assertEqual(json.load(f), self.memoria.obter_todas_informacoes())
+
+        self.memoria.limpar_memoria()
+        self.assertEqual(self.memoria.tamanho_memoria(), 0)
+        self.memoria.backup_memoria(arquivo_backup)
+        with open(arquivo_backup) as f:
+            self.assertEqual(json.load(f), {})
+
+    def test_armazenamento_injetado(self):
+        """Testa se um armazenamento já aberto, mesmo vazio, é usado no lugar do backend."""
+        armazenamento = ArmazenamentoJson(os.path.join(self.pasta.name, "outra.json"))
+        memoria = GerenciadorMemoria(armazenamento=armazenamento)
+        self.assertIs(memoria.armazenamento, armazenamento)
+
+    def test_backends(self):
+        """Testa a criação de cada backend e a rejeição de um backend desconhecido."""
+        tipos = {"json": ArmazenamentoJson, "log": ArmazenamentoLog, "sqlite": ArmazenamentoSQLite,
+                 "indexado": ArmazenamentoIndexado}
+        for backend, tipo in tipos.items():
+            armazenamento = criar_armazenamento(backend, os.path.join(self.pasta.name, f"memoria_{backend}"))
+            self.assertIsInstance(armazenamento, tipo)
+            armazenamento.fechar()
+        armazenamento = criar_armazenamento("sql", "sqlite:///" + os.path.join(self.pasta.name, "sql.sqlite3"))
+        self.assertIsInstance(armazenamento, ArmazenamentoSQL)
+        armazenamento.fechar()
+        with self.assertRaises(ValueError):
+            criar_armazenamento("xml")
+
+class TestDescarteGerenciador(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "memoria.log")
+        self.memorias = []
+
+    def tearDown(self):
+        for memoria in self.memorias:
+            memoria.fechar()
+        self.pasta.cleanup()
+
+    def abrir(self, **parametros):
+        parametros.setdefault("tamanho_maximo", 0)
+        parametros.setdefault("orcamento_bytes", 0)
+        parametros.setdefault("ttl_padrao", 0)
+        parametros.setdefault("chaves_fixas", ())
+        memoria = GerenciadorMemoria(self.caminho, backend="log", **parametros)
+        self.memorias.append(memoria)
+        return memoria
+
+    def test_lru(self):
+        """Testa se a leitura por obter_informacao protege a chave do descarte, exceto sem registrar_acesso."""
+        memoria = self.abrir(politica="lru", tamanho_maximo=3)
+        for chave in ("a", "b", "c"):
+            memoria.adicionar_informacao(chave, chave)
+        memoria.obter_informacao("a")
+        memoria.obter_informacao("b", registrar_acesso=False)
+        memoria.adicionar_informacao("d", "d")
+        self.assertEqual(sorted(memoria.listar_chaves()), ["a", "c", "d"])
+
+    def test_lfu(self):
+        """Testa se a informação menos usada é a descartada."""
+        memoria = self.abrir(politica="lfu", tamanho_maximo=3)
+        for chave in ("a", "b", "c"):
+            memoria.adicionar_informacao(chave, chave)
+        for _ in range(3):
+            memoria.obter_informacao("a")
+        memoria.obter_informacao("c")
+        memoria.adicionar_informacao("d", "d")
+        self.assertEqual(sorted(memoria.listar_chaves()), ["a", "c", "d"])
+        # Sobrescrever uma chave conta como uso e nunca a descarta
+        memoria.adicionar_informacao("d", "de novo")
+        self.assertEqual(memoria.tamanho_memoria(), 3)
+
+    def test_chaves_fixas(self):
+        """Testa se chaves fixas nunca são descartadas, mesmo que o limite seja excedido."""
+        memoria = self.abrir(politica="fifo", tamanho_maximo=2, chaves_fixas={"contador_aprendizado"})
+        memoria.adicionar_informacao("contador_aprendizado", 1)
+        for i in range(5):
+            memoria.adicionar_informacao(f"chave{i}", i)
+        self.assertEqual(memoria.listar_chaves(), ["contador_aprendizado", "chave4"])
+
+        memoria = self.abrir(politica="fifo", tamanho_maximo=1, chaves_fixas={"x", "y"})
+        memoria.limpar_memoria()
+        memoria.adicionar_informacao("x", 1)
+        memoria.adicionar_informacao("y", 2)
+        self.assertEqual(memoria.tamanho_memoria(), 2)
+
+    def test_ttl(self):
+        """Testa a expiração por chave, o ttl padrão e a persistência da expiração ao reabrir."""
+        memoria = self.abrir(ttl_padrao=60, chaves_fixas={"fixa"})
+        memoria.adicionar_informacao("curta", {"x": 1}, ttl=0.05)
+        memoria.adicionar_informacao("padrao", 2)
+        memoria.adicionar_informacao("permanente", 3, ttl=0)
+        memoria.adicionar_informacao("fixa", 4)
+        self.assertEqual(memoria.obter_informacao("curta"), {"x": 1})
+        self.assertEqual(memoria.estatisticas()["com_expiracao"], 2)
+        self.assertEqual(memoria.obter_todas_informacoes(),
+                         {"curta": {"x": 1}, "padrao": 2, "permanente": 3, "fixa": 4})
+        with self.assertRaises(ValueError):
+            memoria.adicionar_informacao("negativa", 1, ttl=-1)
+
+        time.sleep(0.1)
+        self.assertIsNone(memoria.obter_informacao("curta"))
+        self.assertEqual(memoria.tamanho_memoria(), 3)
+
+        memoria.adicionar_informacao("curta", 1, ttl=0.05)
+        memoria.fechar()
+        self.memorias.remove(memoria)
+        time.sleep(0.1)
+        memoria = self.abrir()
+        self.assertEqual(memoria.obter_todas_informacoes(), {"padrao": 2, "permanente": 3, "fixa": 4})
+        self.assertEqual(memoria.estatisticas()["com_expiracao"], 1)
+
+    def test_orcamento_bytes(self):
+        """Testa se o orçamento considera o tamanho codificado e descarta até a nova informação caber."""
+        memoria = self.abrir(politica="fifo", orcamento_bytes=30)
+        memoria.adicionar_informacao("a", "x" * 8)  # 10 bytes em JSON
+        memoria.adicionar_informacao("b", "ç" * 4)  # 10 bytes em UTF-8
+        memoria.adicionar_informacao("c", "x" * 8)
+        self.assertEqual(memoria.estatisticas()["bytes"], 30)
+        memoria.adicionar_informacao("d", "x" * 18)
+        self.assertEqual(memoria.listar_chaves(), ["c", "d"])
+        self.assertEqual(memoria.estatisticas()["bytes"], 30)
+
+        with self.assertRaises(MemoriaError):
+            memoria.adicionar_informacao("e", "x" * 40)
+        self.assertEqual(memoria.listar_chaves(), ["c", "d"])
+
+        # Ao reabrir, os tamanhos são recalculados
+        memoria.fechar()
+        self.memorias.remove(memoria)
+        self.assertEqual(self.abrir(orcamento_bytes=30).estatisticas()["bytes"], 30)
+
+    def test_reabertura_acima_do_limite(self):
+        """Testa se reabrir com um limite menor descarta o excedente aos poucos, avisando uma única vez."""
+        memoria = self.abrir()
+        for i in range(100):
+            memoria.adicionar_informacao(f"chave{i}", i)
+        memoria.fechar()
+        self.memorias.remove(memoria)
+
+        memoria = self.abrir(politica="lru", tamanho_maximo=10)
+        with patch.object(Config, "MEMORIA_DESCARTES_POR_GRAVACAO", 4):
+            with self.assertLogs("memoria", "WARNING") as registros:
+                memoria.adicionar_informacao("nova", 1)
+            self.assertEqual(memoria.tamanho_memoria(), 97)
+            self.assertEqual(memoria.listar_chaves()[:2], ["chave4", "chave5"])
+            memoria.adicionar_informacao("outra", 2)
+            self.assertEqual(memoria.tamanho_memoria(), 94)
+        self.assertEqual(len(registros.records), 1)
+
+    def test_chaves_anteriores_descartadas_primeiro(self):
+        """Testa se, ao reabrir, as chaves não usadas desde a abertura são descartadas primeiro, em ordem."""
+        memoria = self.abrir()
+        for chave in ("a", "b", "c"):
+            memoria.adicionar_informacao(chave, chave)
+        memoria.fechar()
+        self.memorias.remove(memoria)
+
+        memoria = self.abrir(politica="lru", tamanho_maximo=3)
+        memoria.obter_informacao("a")
+        self.assertIsNone(memoria.obter_informacao("ausente"))
+        memoria.adicionar_informacao("d", "d")
+        self.assertEqual(sorted(memoria.listar_chaves()), ["a", "c", "d"])
+        memoria.adicionar_informacao("e", "e")
+        memoria.adicionar_informacao("f", "f")
+        self.assertEqual(sorted(memoria.listar_chaves()), ["d", "e", "f"])
+        memoria.fechar()
+        self.memorias.remove(memoria)
+
+        # Na política 'fifo', uma leitura não protege a chave
+        memoria = self.abrir(politica="fifo", tamanho_maximo=3)
+        memoria.obter_informacao("d")
+        memoria.adicionar_informacao("g", "g")
+        self.assertEqual(memoria.listar_chaves(), ["e", "f", "g"])
+
+    def test_abertura_sem_ler_valores(self):
+        """Testa se a abertura sobre um backend em disco lê apenas as expirações e não limita as informações."""
+        caminho = os.path.join(self.pasta.name, "memoria.sqlite3")
+        memoria = GerenciadorMemoria(caminho, backend="sqlite", ttl_padrao=0, chaves_fixas=())
+        for i in range(20):
+            memoria.adicionar_informacao(f"chave{i}", {"i": i}, ttl=3600 if i % 10 == 0 else 0)
+        memoria.fechar()
+
+        with patch.object(ArmazenamentoSQLite, "itens", side_effect=AssertionError), \
+                patch.object(ArmazenamentoSQLite, "itens_codificados", side_effect=AssertionError), \
+                patch.object(ArmazenamentoSQLite, "chaves", side_effect=AssertionError):
+            memoria = GerenciadorMemoria(caminho, backend="sqlite", ttl_padrao=0, chaves_fixas=())
+            self.memorias.append(memoria)
+            self.assertEqual(memoria.estatisticas()["com_expiracao"], 2)
+            memoria.adicionar_informacao("nova", 1)
+        self.assertEqual(memoria.tamanho_maximo, Config.MEMORIA_TAMANHO_MAXIMO_DISCO)
+        self.assertEqual(memoria.tamanho_memoria(), 21)
+        memoria = GerenciadorMemoria(self.caminho, backend="log")
+        self.memorias.append(memoria)
+        self.assertEqual(memoria.tamanho_maximo, Config.MEMORIA_TAMANHO_MAXIMO)
+
+    def test_chaves_recentes(self):
+        """Testa se as chaves recentes combinam as anteriores à sessão com as gravadas nela, sem as descartadas."""
+        memoria = self.abrir()
+        for chave in ("a", "b", "c", "d"):
+            memoria.adicionar_informacao(chave, chave)
+        memoria.fechar()
+        self.memorias.remove(memoria)
+
+        memoria = self.abrir(politica="fifo", tamanho_maximo=4)
+        memoria.adicionar_informacao("b", "de novo")
+        memoria.adicionar_informacao("e", "e")
+        self.assertEqual(memoria.chaves_recentes(10), ["c", "d", "b", "e"])
+        self.assertEqual(memoria.chaves_recentes(2), ["b", "e"])
+        with patch.object(Config, "MEMORIA_CHAVES_RECENTES", 3):
+            memoria.adicionar_informacao("f", "f")
+        self.assertEqual(memoria.chaves_recentes(10), ["b", "e", "f"])
+        memoria.limpar_memoria()
+        self.assertEqual(memoria.chaves_recentes(10), [])
+
+    def test_parametros_invalidos(self):
+        """Testa a rejeição de uma política desconhecida e de limites negativos."""
+        with self.assertRaises(ValueError):
+            self.abrir(politica="aleatoria")
+        with self.assertRaises(ValueError):
+            self.abrir(tamanho_maximo=-1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -47,6 +47,38 @@ class TestModeloLinguagem(unittest.TestCase):
         self.assertIn("gato", resultado["substantivos"])
         self.assertIn("pulou", resultado["verbos"])
 
+    def test_cache_analises(self):
+        """Testa se o mesmo texto é processado pelo pipeline apenas uma vez entre os diferentes métodos."""
+        texto = "O gato preto pulou sobre o muro alto."
+        self.modelo.processar_texto(texto)
+        self.modelo.extrair_palavras_chave(texto)
+        self.modelo.resumir_texto(texto)
+
+        estatisticas = self.modelo.estatisticas_cache_analises()
+        self.assertEqual(estatisticas["falhas"], 1)
+        self.assertEqual(estatisticas["acertos"], 2)
+        self.assertEqual(estatisticas["tamanho"], 1)
+
+    def test_processar_textos_lote(self):
+        """Testa se o processamento em lote devolve os mesmos resultados do processamento individual, em ordem."""
+        textos = ["O gato preto pulou sobre o muro alto.", "O cachorro dormiu no jardim."]
+        resultados = self.modelo.processar_textos(iter(textos), batch_size=1)
+
+        self.assertNotIsInstance(resultados, list)
+        self.assertEqual(list(resultados), [self.modelo.processar_texto(texto) for texto in textos])
+        self.assertEqual(list(self.modelo.extrair_palavras_chave_lote(textos)),
+                         [self.modelo.extrair_palavras_chave(texto) for texto in textos])
+
+        with self.assertRaises(ModeloLinguagemError):
+            list(self.modelo.processar_textos(["texto", ""]))
+
+    @patch('core.language_model.modelo_linguagem.spacy.load')
+    def test_carregamento_preguicoso(self, mock_load):
+        """Testa se o modelo do spaCy só é carregado quando uma operação que precisa dele é chamada."""
+        modelo = ModeloLinguagem(chatgpt_api_key="fake_api_key_for_testing")
+        modelo.analisar_sentimento("O dia está ótimo!")
+        mock_load.assert_not_called()
+
     def test_analisar_sentimento(self):
         """Testa a análise de sentimentos para diferentes tipos de texto."""
         texto_positivo = "O dia está ótimo!"
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_orquestrador
+
+Este módulo contém testes para o OrquestradorRequisicao, verificando que a resposta do ChatGPT e as análises
+locais são executadas ao mesmo tempo e que os erros de cada parte são repassados.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - ModeloLento
+    - TestOrquestradorRequisicao
+
+Dependências:
+    - unittest
+    - core.orquestrador
+"""
+
+import time
+import unittest
+from core.orquestrador import OrquestradorRequisicao
+from utils.exceptions import ModeloLinguagemError
+
+ATRASO_SEGUNDOS = 0.3
+
+class ModeloLento:
+    """Substituto do ModeloLinguagem em que a resposta e a análise do texto demoram ATRASO_SEGUNDOS cada."""
+
+    def __init__(self, erro_resposta: bool = False, erro_analise: bool = False):
+        self.erro_resposta = erro_resposta
+        self.erro_analise = erro_analise
+
+    def gerar_resposta_chatgpt_stream(self, texto):
+        yield "Olá"
+        time.sleep(ATRASO_SEGUNDOS)
+        if self.erro_resposta:
+            raise ModeloLinguagemError("Erro ao gerar resposta ChatGPT")
+        yield ", tudo bem?"
+
+    def processar_texto(self, texto):
+        time.sleep(ATRASO_SEGUNDOS)
+        if self.erro_analise:
+            raise ModeloLinguagemError("Erro ao processar texto")
+        return {"entidades": [], "substantivos": ["texto"], "verbos": []}
+
+    def analisar_sentimento(self, texto):
+        return "neutro"
+
+class TestOrquestradorRequisicao(unittest.TestCase):
+    def setUp(self):
+        self.orquestrador = OrquestradorRequisicao(ModeloLento())
+
+    def tearDown(self):
+        self.orquestrador.encerrar()
+
+    def test_execucao_simultanea(self):
+        """Testa se a latência total se aproxima da maior das partes, e não da soma."""
+        inicio = time.perf_counter()
+        resultado = self.orquestrador.processar("Oi")
+        duracao = time.perf_counter() - inicio
+
+        self.assertEqual(resultado["resposta"], "Olá, tudo bem?")
+        self.assertEqual(resultado["analise"]["substantivos"], ["texto"])
+        self.assertEqual(resultado["sentimento"], "neutro")
+        self.assertLess(duracao, 1.6 * ATRASO_SEGUNDOS)
+
+    def test_trechos_e_analise(self):
+        """Testa o uso em streaming: os trechos chegam antes de a análise ser aguardada."""
+        requisicao = self.orquestrador.iniciar("Oi")
+        self.assertEqual(list(requisicao.trechos()), ["Olá", ", tudo bem?"])
+        analise, sentimento = requisicao.analise(timeout=1)
+        self.assertEqual(sentimento, "neutro")
+
+    def test_erros(self):
+        """Testa se os erros da resposta e da análise são repassados."""
+        self.orquestrador.modelo = ModeloLento(erro_resposta=True)
+        with self.assertRaises(ModeloLinguagemError):
+            self.orquestrador.processar("Oi")
+        self.orquestrador.modelo = ModeloLento(erro_analise=True)
+        with self.assertRaises(ModeloLinguagemError):
+            self.orquestrador.processar("Oi")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_processamento_lote
+
+Este módulo contém testes para o ProcessadorLote, verificando os resultados gravados, o registro de erros por
+item, a retomada de uma execução interrompida a partir do checkpoint e as estatísticas devolvidas.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - AnaliseFalsa
+    - ModeloFalso
+    - TestProcessadorLote
+
+Dependências:
+    - unittest
+    - core.processamento_lote
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from core.processamento_lote import SUFIXO_CHECKPOINT, ProcessadorLote
+from utils.exceptions import ModeloLinguagemError
+
+class AnaliseFalsa:
+    """Substituto de AnaliseDocumento em que cada palavra é uma sentença."""
+
+    def __init__(self, texto):
+        self.sentencas = texto.split()
+        self.palavras_chave = [palavra for palavra in self.sentencas if len(palavra) > 3]
+
+    def compacta(self):
+        return self
+
+    def como_dicionario(self):
+        return {"tokens": self.sentencas}
+
+class ModeloFalso:
+    """Substituto do ModeloLinguagem que registra os textos analisados."""
+
+    def __init__(self, interromper_apos=None):
+        self.interromper_apos = interromper_apos
+        self.analisados = []
+        self.respondidos = []
+
+    def analisar_documentos(self, textos, batch_size=None, n_process=None):
+        for texto in textos:
+            if self.interromper_apos is not None and len(self.analisados) >= self.interromper_apos:
+                raise KeyboardInterrupt
+            self.analisados.append(texto)
+            yield AnaliseFalsa(texto)
+
+    def resumir_analise(self, analise, num_sentencas=3, modo="primeiras"):
+        return " ".join(analise.sentencas[:num_sentencas])
+
+    def analisar_sentimento(self, texto):
+        if "ruim" in texto:
+            raise ValueError("falha no sentimento")
+        return "neutro"
+
+    def gerar_respostas_chatgpt_lote(self, textos, concorrencia=None):
+        self.respondidos.extend(textos)
+        return [{"resposta": f"eco: {texto}", "erro": None} if "erro" not in texto
+                else {"resposta": None, "erro": ModeloLinguagemError("falha na API")} for texto in textos]
+
+class TestProcessadorLote(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.entrada = os.path.join(self.diretorio.name, "entrada.jsonl")
+        self.saida = os.path.join(self.diretorio.name, "saida.jsonl")
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def _escrever_entrada(self, linhas):
+        with open(self.entrada, "w", encoding="utf-8") as f:
+            for linha in linhas:
+                f.write((linha if isinstance(linha, str) else json.dumps(linha, ensure_ascii=False)) + "\n")
+
+    def _ler_saida(self):
+        with open(self.saida, "r", encoding="utf-8") as f:
+            return [json.loads(linha) for linha in f]
+
+    def test_resultados_e_erros(self):
+        """Testa os resultados de cada operação e os erros registrados por item."""
+        self._escrever_entrada([
+            {"id": "a", "texto": "Olá mundo inteiro"},
+            {"id": "b", "texto": "texto ruim", "operacoes": ["sentimento", "resposta"]},
+            "{não é json",
+            "",
+            {"id": "c", "texto": "   "},
+            {"id": "d", "texto": "pedido com erro", "operacoes": ["resposta", "traduzir"]},
+        ])
+        modelo = ModeloFalso()
+        estatisticas = ProcessadorLote(modelo, ("analise", "palavras_chave", "resumo"), tamanho_bloco=2,
+                                       num_sentencas=2).executar(self.entrada, self.saida)
+        registros = self._ler_saida()
+
+        self.assertEqual([r["linha"] for r in registros], [1, 2, 3, 5, 6])
+        self.assertEqual(registros[0]["id"], "a")
+        self.assertEqual(registros[0]["resultados"], {
+            "analise": {"tokens": ["Olá", "mundo", "inteiro"]},
+            "palavras_chave": ["mundo", "inteiro"],
+            "resumo": "Olá mundo",
+        })
+        self.assertEqual(registros[0]["erros"], {})
+        self.assertEqual(registros[1]["resultados"], {"resposta": "eco: texto ruim"})
+        self.assertIn("sentimento", registros[1]["erros"])
+        self.assertIn("entrada", registros[2]["erros"])
+        self.assertIn("entrada", registros[3]["erros"])
+        self.assertIn("resposta", registros[4]["erros"])
+        self.assertIn("operacoes", registros[4]["erros"])
+        self.assertEqual(modelo.analisados, ["Olá mundo inteiro"])
+        self.assertEqual(modelo.respondidos, ["texto ruim", "pedido com erro"])
+
+        self.assertEqual(estatisticas["itens"], 5)
+        self.assertEqual(estatisticas["itens_com_erro"], 4)
+        self.assertEqual(estatisticas["erros_por_operacao"],
+                         {"sentimento": 1, "entrada": 2, "resposta": 1, "operacoes": 1})
+        self.assertGreater(estatisticas["itens_por_segundo"], 0)
+        self.assertFalse(os.path.exists(self.saida + SUFIXO_CHECKPOINT))
+
+    def test_retomada(self):
+        """Testa se uma execução interrompida continua do último checkpoint, sem repetir nem perder itens."""
+        self._escrever_entrada([{"id": i, "texto": f"texto {i}"} for i in range(10)])
+
+        with self.assertRaises(KeyboardInterrupt):
+            ProcessadorLote(ModeloFalso(interromper_apos=5), ("analise",), tamanho_bloco=3).executar(
+                self.entrada, self.saida)
+        self.assertTrue(os.path.exists(self.saida + SUFIXO_CHECKPOINT))
+        self.assertEqual(len(self._ler_saida()), 3)
+
+        modelo = ModeloFalso()
+        estatisticas = ProcessadorLote(modelo, ("analise",), tamanho_bloco=3).executar(self.entrada, self.saida)
+        self.assertEqual(modelo.analisados, [f"texto {i}" for i in range(3, 10)])
+        self.assertEqual(estatisticas["linha_inicial"], 4)
+        self.assertEqual(estatisticas["itens"], 7)
+        self.assertEqual([r["id"] for r in self._ler_saida()], list(range(10)))
+        self.assertEqual([r["linha"] for r in self._ler_saida()], list(range(1, 11)))
+        self.assertFalse(os.path.exists(self.saida + SUFIXO_CHECKPOINT))
+
+    def test_reiniciar(self):
+        """Testa se retomar=False ignora o checkpoint e recria a saída."""
+        self._escrever_entrada([{"id": i, "texto": f"texto {i}"} for i in range(4)])
+        with self.assertRaises(KeyboardInterrupt):
+            ProcessadorLote(ModeloFalso(interromper_apos=2), ("analise",), tamanho_bloco=2).executar(
+                self.entrada, self.saida)
+
+        modelo = ModeloFalso()
+        ProcessadorLote(modelo, ("analise",), tamanho_bloco=2).executar(self.entrada, self.saida, retomar=False)
+        self.assertEqual(len(modelo.analisados), 4)
+        self.assertEqual([r["id"] for r in self._ler_saida()], list(range(4)))
+
+    def test_operacoes_invalidas(self):
+        """Testa a validação dos parâmetros."""
+        with self.assertRaises(ValueError):
+            ProcessadorLote(ModeloFalso(), ("traduzir",))
+        with self.assertRaises(ValueError):
+            ProcessadorLote(ModeloFalso(), tamanho_bloco=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_resiliencia
+
+Este módulo contém testes para o limitador de taxa, a política de retentativa, o disjuntor e o
+ExecutorResiliente, incluindo chamadas reais do cliente da OpenAI contra um servidor HTTP local que
+simula erros 429 e 5xx.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - RelogioFalso
+    - TestLimitadorTaxa
+    - TestPoliticaRetentativa
+    - TestDisjuntorCircuito
+    - TestExecutorResiliente
+
+Dependências:
+    - unittest
+    - core.resiliencia
+    - core.chatgpt_integration
+    - tests.test_chatgpt_async
+"""
+
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from config.config import Config
+from core.chatgpt_integration import ChatGPTIntegration
+from core.resiliencia import (DisjuntorCircuito, ExecutorResiliente, LimitadorTaxa, PoliticaRetentativa,
+                              estimar_tokens)
+from utils.exceptions import ChatGPTIntegrationError, CircuitoAbertoError
+from tests.test_chatgpt_async import ServidorChatFalso
+
+class RelogioFalso:
+    """Relógio controlado pelo teste."""
+
+    def __init__(self):
+        self.agora = 1000.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+class TestLimitadorTaxa(unittest.TestCase):
+    def test_requisicoes_por_minuto(self):
+        """Testa se o balde de requisições esvazia e é reposto proporcionalmente ao tempo."""
+        relogio = RelogioFalso()
+        limitador = LimitadorTaxa(requisicoes_por_minuto=2, tokens_por_minuto=0, relogio=relogio)
+        self.assertEqual(limitador._reservar(0), 0)
+        self.assertEqual(limitador._reservar(0), 0)
+        self.assertAlmostEqual(limitador._reservar(0), 30.0)
+        relogio.agora += 30
+        self.assertEqual(limitador._reservar(0), 0)
+
+    def test_tokens_por_minuto(self):
+        """Testa se o limite de tokens é respeitado e se pedidos maiores que a capacidade não esperam para sempre."""
+        relogio = RelogioFalso()
+        limitador = LimitadorTaxa(requisicoes_por_minuto=0, tokens_por_minuto=600, relogio=relogio)
+        self.assertEqual(limitador._reservar(500), 0)
+        self.assertAlmostEqual(limitador._reservar(200), 10.0)
+        relogio.agora += 60
+        self.assertEqual(limitador._reservar(1000), 0)
+
+    def test_estimar_tokens(self):
+        """Testa a estimativa de tokens de uma requisição."""
+        self.assertEqual(estimar_tokens([{"role": "user", "content": "a" * 40}], 150), 160)
+
+class TestPoliticaRetentativa(unittest.TestCase):
+    def test_retry_after(self):
+        """Testa a leitura dos cabeçalhos retry-after-ms e Retry-After."""
+        politica = PoliticaRetentativa(espera_maxima=10)
+        erro = SimpleNamespace(response=SimpleNamespace(headers={"retry-after": "3"}))
+        self.assertEqual(politica.espera(1, erro), 3.0)
+        erro = SimpleNamespace(response=SimpleNamespace(headers={"retry-after-ms": "250"}))
+        self.assertEqual(politica.espera(1, erro), 0.25)
+        erro = SimpleNamespace(response=SimpleNamespace(headers={"retry-after": "120"}))
+        self.assertEqual(politica.espera(1, erro), 10.0)
+
+    def test_espera_exponencial(self):
+        """Testa se a espera sem Retry-After fica entre 0 e o teto exponencial."""
+        politica = PoliticaRetentativa(espera_base=0.5, espera_maxima=3)
+        for tentativa, teto in ((1, 0.5), (2, 1.0), (3, 2.0), (6, 3.0)):
+            for _ in range(20):
+                self.assertTrue(0 <= politica.espera(tentativa, ValueError()) <= teto)
+
+    def test_erros_nao_transitorios(self):
+        """Testa se erros genéricos não são retentados."""
+        self.assertFalse(PoliticaRetentativa.transitorio(ValueError("x")))
+
+class TestDisjuntorCircuito(unittest.TestCase):
+    def test_ciclo_de_estados(self):
+        """Testa a abertura após falhas, a chamada de teste e o fechamento."""
+        relogio = RelogioFalso()
+        disjuntor = DisjuntorCircuito(limiar_falhas=2, tempo_recuperacao=10, relogio=relogio)
+        disjuntor.registrar_falha()
+        disjuntor.verificar()
+        disjuntor.registrar_falha()
+        self.assertEqual(disjuntor.estado, DisjuntorCircuito.ABERTO)
+        with self.assertRaises(CircuitoAbertoError):
+            disjuntor.verificar()
+
+        relogio.agora += 10
+        self.assertEqual(disjuntor.estado, DisjuntorCircuito.MEIO_ABERTO)
+        disjuntor.verificar()
+        with self.assertRaises(CircuitoAbertoError):
+            disjuntor.verificar()
+        disjuntor.registrar_falha()
+        self.assertEqual(disjuntor.estado, DisjuntorCircuito.ABERTO)
+
+        relogio.agora += 10
+        disjuntor.verificar()
+        disjuntor.registrar_sucesso()
+        self.assertEqual(disjuntor.estado, DisjuntorCircuito.FECHADO)
+
+    def test_chamada_de_teste_cancelada(self):
+        """Testa se a chamada de teste cancelada ou interrompida é liberada para a chamada seguinte."""
+        relogio = RelogioFalso()
+        disjuntor = DisjuntorCircuito(limiar_falhas=1, tempo_recuperacao=10, relogio=relogio)
+        executor = ExecutorResiliente(disjuntor=disjuntor)
+        disjuntor.registrar_falha()
+        relogio.agora += 10
+
+        async def cancelar_e_repetir():
+            iniciada = asyncio.Event()
+
+            async def chamada_lenta():
+                iniciada.set()
+                await asyncio.sleep(60)
+
+            tarefa = asyncio.create_task(executor.executar_async(chamada_lenta))
+            await iniciada.wait()
+            tarefa.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await tarefa
+            self.assertEqual(disjuntor.estado, DisjuntorCircuito.MEIO_ABERTO)
+            return await executor.executar_async(lambda: asyncio.sleep(0, "ok"))
+
+        self.assertEqual(asyncio.run(cancelar_e_repetir()), "ok")
+        self.assertEqual(disjuntor.estado, DisjuntorCircuito.FECHADO)
+
+        def interromper():
+            raise KeyboardInterrupt
+
+        disjuntor.registrar_falha()
+        relogio.agora += 10
+        with self.assertRaises(KeyboardInterrupt):
+            executor.executar(interromper)
+        self.assertEqual(executor.executar(lambda: "ok"), "ok")
+        self.assertEqual(executor.estatisticas()["rejeicoes_circuito"], 0)
+
+class TestExecutorResiliente(unittest.TestCase):
+    def setUp(self):
+        self.servidor = ServidorChatFalso(atraso=0)
+        threading.Thread(target=self.servidor.serve_forever, args=(0.05,), daemon=True).start()
+        self.patcher = patch.object(Config, "OPENAI_BASE_URL", self.servidor.url)
+        self.patcher.start()
+        self.esperas = []
+        self.executor = ExecutorResiliente(
+            limitador=LimitadorTaxa(1000, 0),
+            politica=PoliticaRetentativa(max_tentativas=3, espera_base=0.01, espera_maxima=1),
+            disjuntor=DisjuntorCircuito(limiar_falhas=3, tempo_recuperacao=60),
+            dormir=self.esperas.append)
+        self.chatgpt = ChatGPTIntegration("fake_api_key", resiliencia=self.executor)
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def test_retentativa_com_retry_after(self):
+        """Testa se 429 e 503 são retentados, respeitando Retry-After, até a resposta ser obtida."""
+        self.servidor.falhas_planejadas.extend([(429, {"Retry-After": "0.5"}), (503, {})])
+        self.assertEqual(self.chatgpt.gerar_resposta("Olá"), "Resposta: Olá")
+        self.assertEqual(self.servidor.requisicoes, 3)
+        self.assertEqual(self.esperas[0], 0.5)
+
+        estatisticas = self.chatgpt.estatisticas_resiliencia()
+        self.assertEqual(estatisticas["chamadas"], 1)
+        self.assertEqual(estatisticas["retentativas"], 2)
+        self.assertEqual(estatisticas["sucessos"], 1)
+        self.assertEqual(estatisticas["estado_circuito"], DisjuntorCircuito.FECHADO)
+
+    def test_erro_nao_transitorio_nao_retentado(self):
+        """Testa se um erro 400 falha na primeira tentativa."""
+        with self.assertRaises(ChatGPTIntegrationError):
+            self.chatgpt.gerar_resposta("erro")
+        self.assertEqual(self.servidor.requisicoes, 1)
+        self.assertEqual(self.executor.estatisticas()["falhas"], 1)
+
+    def test_disjuntor_falha_rapido(self):
+        """Testa se, após falhas transitórias seguidas, as chamadas são rejeitadas sem chegar ao servidor."""
+        self.servidor.falhas_planejadas.extend([(500, {})] * 3)
+        with self.assertRaises(ChatGPTIntegrationError):
+            self.chatgpt.gerar_resposta("Olá")
+        self.assertEqual(self.servidor.requisicoes, 3)
+
+        with self.assertRaises(CircuitoAbertoError):
+            self.chatgpt.gerar_resposta("Olá de novo")
+        self.assertEqual(self.servidor.requisicoes, 3)
+        self.assertEqual(self.executor.estatisticas()["rejeicoes_circuito"], 1)
+
+    def test_lote_com_falhas_transitorias(self):
+        """Testa se as retentativas também se aplicam ao caminho assíncrono."""
+        self.servidor.falhas_planejadas.extend([(429, {"retry-after-ms": "10"})])
+        resultados = self.chatgpt.gerar_respostas_lote(["um", "dois"], concorrencia=2)
+        self.assertEqual([r["resposta"] for r in resultados], ["Resposta: um", "Resposta: dois"])
+        self.assertEqual(self.executor.estatisticas()["retentativas"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_sessao_conversa
+
+Este módulo contém testes para a SessaoConversa: o limite de tokens das requisições em conversas longas,
+o resumo dos turnos antigos, a inclusão de informações da memória e o registro dos turnos em streaming.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestSessaoConversa
+
+Dependências:
+    - unittest
+    - unittest.mock
+    - numpy
+    - core.sessao_conversa
+    - core.chatgpt_integration
+    - core.memoria
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import numpy as np
+from core.cache_respostas import CacheRespostas
+from core.cache_semantico import CacheSemantico
+from core.chatgpt_integration import ChatGPTIntegration
+from core.memoria import GerenciadorMemoria
+from core.sessao_conversa import ResumidorExtrativo, SessaoConversa, estimar_tokens_mensagens, vetorizar
+from utils.exceptions import ChatGPTIntegrationError
+
+class TestSessaoConversa(unittest.TestCase):
+    def setUp(self):
+        self.chatgpt = MagicMock(spec=ChatGPTIntegration)
+        self.sessao = SessaoConversa(self.chatgpt, orcamento_tokens=600, max_tokens_resposta=100,
+                                     tokens_resumo=100, tokens_fatos=50)
+
+    def conversar(self, turnos: int):
+        for i in range(turnos):
+            self.sessao.registrar_turno(f"Pergunta número {i} sobre o tema {i % 7}. Mais detalhes aqui.",
+                                        f"Resposta número {i}. O tema {i % 7} é interessante. " * 3)
+
+    def test_orcamento_respeitado(self):
+        """Testa se o tamanho da requisição fica limitado em uma conversa longa."""
+        prompt = "Qual foi o primeiro tema?"
+        for _ in range(20):
+            self.conversar(10)
+            contexto = self.sessao.montar_contexto(prompt)
+            tokens = estimar_tokens_mensagens(contexto + [{"content": prompt}])
+            self.assertLessEqual(tokens, 600 - 100)
+            self.assertEqual(tokens, self.sessao.tokens_ultima_requisicao)
+
+        estatisticas = self.sessao.estatisticas()
+        self.assertGreater(estatisticas["turnos_resumidos"], 150)
+        self.assertLessEqual(estatisticas["tokens_resumo"], 100)
+        self.assertEqual(contexto[0]["role"], "system")
+        self.assertIn("Resumo da conversa", contexto[0]["content"])
+        # Os turnos mantidos são os mais recentes, na ordem original
+        self.assertEqual(contexto[-2]["content"], "Pergunta número 9 sobre o tema 2. Mais detalhes aqui.")
+        self.assertEqual([m["role"] for m in contexto[1:3]], ["user", "assistant"])
+
+    def test_conversa_curta_sem_resumo(self):
+        """Testa se turnos que cabem no orçamento são enviados sem resumo."""
+        self.conversar(2)
+        contexto = self.sessao.montar_contexto("E agora?")
+        self.assertEqual([m["role"] for m in contexto], ["user", "assistant", "user", "assistant"])
+        self.assertEqual(self.sessao.resumo, "")
+
+    def test_resumo_calculado_so_ao_incorporar_turnos(self):
+        """Testa se o resumo é reaproveitado entre requisições e recalculado apenas quando turnos saem do histórico."""
+        resumidor = MagicMock(wraps=ResumidorExtrativo())
+        self.sessao.resumidor = resumidor
+        self.conversar(30)
+        self.sessao.montar_contexto("Primeira")
+        self.sessao.montar_contexto("Segunda")
+        self.assertEqual(resumidor.resumir.call_count, 1)
+
+    def test_vetorizar(self):
+        """Testa se os vetores são normalizados e ignoram maiúsculas, acentos e pontuação."""
+        vetor = vetorizar("Qual é a capital da França?")
+        self.assertAlmostEqual(float(np.linalg.norm(vetor)), 1.0, places=5)
+        np.testing.assert_allclose(vetor, vetorizar("qual e a capital da franca"))
+        self.assertFalse(vetorizar("?!").any())
+
+    def test_fatos_da_memoria(self):
+        """Testa se apenas as informações relacionadas ao prompt são incluídas."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            memoria = GerenciadorMemoria(os.path.join(diretorio, "memoria.json"))
+            memoria.adicionar_informacao("linguagem_favorita", "A linguagem favorita do usuário é Python")
+            memoria.adicionar_informacao("cidade", "Mora em Zurique")
+            memoria.adicionar_informacao("contador_aprendizado", 3)
+            sessao = SessaoConversa(self.chatgpt, memoria, orcamento_tokens=600, max_tokens_resposta=100,
+                                    tokens_resumo=100, tokens_fatos=50)
+
+            contexto = sessao.montar_contexto("Qual é a minha linguagem favorita?")
+            self.assertEqual(len(contexto), 1)
+            self.assertIn("linguagem_favorita: A linguagem favorita do usuário é Python", contexto[0]["content"])
+            self.assertNotIn("Zurique", contexto[0]["content"])
+            self.assertNotIn("contador_aprendizado", contexto[0]["content"])
+            self.assertEqual(sessao.montar_contexto("Bom dia"), [])
+            memoria.fechar()
+
+    def test_fatos_limitados_aos_recentes(self):
+        """Testa se apenas as informações gravadas há menos tempo são consultadas, sem percorrer a memória."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            memoria = GerenciadorMemoria(os.path.join(diretorio, "memoria.json"))
+            memoria.adicionar_informacao("linguagem_favorita", "A linguagem favorita do usuário é Python")
+            for i in range(5):
+                memoria.adicionar_informacao(f"cidade{i}", f"Visitou a cidade número {i}")
+            sessao = SessaoConversa(self.chatgpt, memoria, orcamento_tokens=600, max_tokens_resposta=100,
+                                    tokens_resumo=100, tokens_fatos=50, max_fatos=3)
+
+            with patch.object(memoria, "listar_chaves", side_effect=AssertionError):
+                self.assertEqual(sessao.montar_contexto("Qual é a minha linguagem favorita?"), [])
+                self.assertEqual(sorted(sessao._vetores_fatos), ["cidade2", "cidade3", "cidade4"])
+                memoria.adicionar_informacao("linguagem_favorita", "A linguagem favorita do usuário é Python")
+                contexto = sessao.montar_contexto("Qual é a minha linguagem favorita?")
+            self.assertIn("linguagem_favorita", contexto[0]["content"])
+            self.assertEqual(len(sessao._vetores_fatos), 3)
+            memoria.fechar()
+
+    def test_stream_registra_turno(self):
+        """Testa se o turno é registrado ao fim do stream e descartado em caso de erro."""
+        self.chatgpt.gerar_resposta_stream.return_value = iter(["Olá", ", tudo bem!"])
+        self.assertEqual("".join(self.sessao.gerar_resposta_stream("Oi")), "Olá, tudo bem!")
+        self.assertEqual(list(self.sessao.turnos[-1]), ["Oi", "Olá, tudo bem!"])
+
+        def falha():
+            yield "Parcial"
+            raise ChatGPTIntegrationError("falhou")
+
+        self.chatgpt.gerar_resposta_stream.return_value = falha()
+        with self.assertRaises(ChatGPTIntegrationError):
+            list(self.sessao.gerar_resposta_stream("De novo"))
+        self.assertEqual(len(self.sessao.turnos), 1)
+
+        contexto = self.chatgpt.gerar_resposta_stream.call_args.kwargs["contexto"]
+        self.assertEqual(contexto, [{"role": "user", "content": "Oi"},
+                                    {"role": "assistant", "content": "Olá, tudo bem!"}])
+
+    def test_contexto_enviado_a_api(self):
+        """Testa se ChatGPTIntegration envia o contexto antes do prompt e separa as respostas em cache por contexto."""
+        chatgpt = ChatGPTIntegration("fake_api_key", cache=CacheRespostas(None), cache_semantico=CacheSemantico())
+        chatgpt.client = MagicMock()
+        chatgpt.client.chat.completions.create.return_value.choices[0].message.content = "Resposta"
+        parametros = dict(orcamento_tokens=600, max_tokens_resposta=100, tokens_resumo=100, tokens_fatos=50)
+        sessao = SessaoConversa(chatgpt, **parametros)
+        sessao.gerar_resposta("Oi")
+        sessao.gerar_resposta("Oi")
+
+        mensagens = chatgpt.client.chat.completions.create.call_args.kwargs["messages"]
+        self.assertEqual([m["role"] for m in mensagens], ["user", "assistant", "user"])
+        self.assertEqual(chatgpt.client.chat.completions.create.call_count, 2)
+
+        # Em uma nova conversa, sem contexto, a primeira resposta vem do cache
+        SessaoConversa(chatgpt, **parametros).gerar_resposta("Oi")
+        self.assertEqual(chatgpt.client.chat.completions.create.call_count, 2)
+
+    def test_orcamento_invalido(self):
+        """Testa a validação do orçamento."""
+        with self.assertRaises(ValueError):
+            SessaoConversa(self.chatgpt, orcamento_tokens=500, max_tokens_resposta=200, tokens_resumo=200,
+                           tokens_fatos=100)
+
+if __name__ == '__main__':
+    unittest.main()
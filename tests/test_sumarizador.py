@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo: test_sumarizador
+
+Este módulo contém testes unitários para a classe SumarizadorGrafo, verificando a pontuação por centralidade,
+a seleção de sentenças em ordem original e o processamento em blocos.
+
+Autor: Stefano Gysin - StefanoGysin@hotmail.com
+Data: 2026-10-16 (horário de Zurique)
+
+Classes:
+    - TestSumarizadorGrafo
+
+Dependências:
+    - unittest
+    - core.language_model.sumarizador
+"""
+
+import unittest
+from core.language_model.sumarizador import SumarizadorGrafo
+
+SENTENCAS = [
+    ["python", "linguagem", "programacao"],
+    ["python", "linguagem", "popular", "programacao"],
+    ["gato", "dormir", "sofa"],
+    ["python", "programacao", "dados"],
+    ["chover", "amanha"],
+]
+
+class TestSumarizadorGrafo(unittest.TestCase):
+    def test_selecionar_sentencas_centrais(self):
+        """Testa se as sentenças mais conectadas são escolhidas, na ordem original."""
+        sumarizador = SumarizadorGrafo(dimensao=2 ** 10)
+        pontuacoes = sumarizador.pontuar(SENTENCAS)
+
+        self.assertAlmostEqual(pontuacoes.sum(), len(SENTENCAS))
+        self.assertGreater(pontuacoes[1], pontuacoes[2])
+        self.assertEqual(sumarizador.selecionar(SENTENCAS, 2), [0, 1])
+        self.assertEqual(sumarizador.selecionar(SENTENCAS, 10), [0, 1, 2, 3, 4])
+
+    def test_processamento_em_blocos(self):
+        """Testa se o processamento em blocos devolve uma pontuação por sentença."""
+        sumarizador = SumarizadorGrafo(dimensao=2 ** 10, tamanho_bloco=2)
+        self.assertEqual(len(sumarizador.pontuar(SENTENCAS)), len(SENTENCAS))
+        self.assertEqual(len(sumarizador.selecionar(SENTENCAS * 3, 4)), 4)
+        self.assertEqual(len(sumarizador.pontuar([])), 0)
+
+    def test_parametros_invalidos(self):
+        """Testa a validação dos parâmetros."""
+        with self.assertRaises(ValueError):
+            SumarizadorGrafo(amortecimento=1.5)
+        with self.assertRaises(ValueError):
+            SumarizadorGrafo(tamanho_bloco=-1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,4 +18,8 @@ class InterfaceUsuarioError(GYSINIAException):
 
 class ChatGPTIntegrationError(GYSINIAException):
     """Exceção levantada para erros relacionados à integração com o ChatGPT"""
+    pass
+
+class CircuitoAbertoError(ChatGPTIntegrationError):
+    """Exceção levantada quando o disjuntor rejeita uma chamada à API porque o serviço está instável"""
     pass
\ No newline at end of file
@@ -1,10 +1,68 @@
 ﻿# utils/logger.py
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
+import queue
+import threading
+from typing import Dict, List, Optional
+from config.config import Config
 
-def configurar_logger(nome_logger: str, nivel: int = logging.INFO) -> logging.Logger:
+class _RoteadorHandlers(logging.Handler):
+    """
+    Manipulador executado na thread do QueueListener que entrega cada registro aos manipuladores
+    de arquivo e console do logger que o originou.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handlers: Dict[str, List[logging.Handler]] = {}
+
+    def registrar(self, nome_logger: str, handlers: List[logging.Handler]):
+        self._handlers[nome_logger] = handlers
+
+    def fechar_handlers(self):
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                handler.close()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Registros de loggers filhos (ex.: "modelo_linguagem.lote") vão para os manipuladores do pai
+        nome = record.name
+        while nome not in self._handlers and "." in nome:
+            nome = nome.rsplit(".", 1)[0]
+        for handler in self._handlers.get(nome, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord):
+        self.handle(record)
+
+# Fila e thread únicas compartilhadas por todos os loggers: a escrita em arquivo e console não bloqueia quem loga
+_fila: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_roteador = _RoteadorHandlers()
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+def _nivel_configurado() -> int:
+    """Converte Config.LOG_LEVEL (ex.: 'INFO', 'DEBUG') no nível numérico correspondente."""
+    nivel = logging.getLevelName(str(Config.LOG_LEVEL).upper())
+    return nivel if isinstance(nivel, int) else logging.INFO
+
+def encerrar_logging():
+    """Para a thread de escrita depois de gravar todos os registros pendentes. Registrada com atexit."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            _roteador.fechar_handlers()
+
+def configurar_logger(nome_logger: str, nivel: Optional[int] = None) -> logging.Logger:
+    if nivel is None:
+        nivel = _nivel_configurado()
     logger = logging.getLogger(nome_logger)
     logger.setLevel(nivel)
 
@@ -31,15 +89,22 @@ def configurar_logger(nome_logger: str, nivel: int = logging.INFO) -> logging.Lo
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        # Adiciona os manipuladores ao logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Os manipuladores reais rodam na thread do QueueListener; o logger só enfileira os registros
+        global _listener
+        with _lock:
+            _roteador.registrar(nome_logger, [file_handler, console_handler])
+            if _listener is None:
+                _listener = QueueListener(_fila, _roteador)
+                _listener.start()
+        logger.addHandler(QueueHandler(_fila))
 
     return logger
 
+atexit.register(encerrar_logging)
+
 if __name__ == "__main__":
     # Teste básico
     logger = configurar_logger("teste")
     logger.info("Este é um log de informação")
     logger.warning("Este é um log de aviso")
-    logger.error("Este é um log de erro")
\ No newline at end of file
+    logger.error("Este é um log de erro")